@@ -0,0 +1,292 @@
+import gzip
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import numpy as np
+from model.rules import FarkleRules
+from state.turn_columns import TURN_COLUMNS, turn_columns
+
+
+# Compteurs agrégés, par siège comme par joueur
+AGGREGATE_FIELDS = ('turns', 'farkles', 'banked_turns', 'banked_total', 'inherited_gained',
+                    'inherited_lost', 'entries', 'entry_turns_total', 'games', 'wins')
+
+MAX_SEATS = 8
+
+
+def iter_records(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Parcourt les sources de parties et produit leur contenu JSON brut (une partie par élément)
+
+    - Dossier : toutes les sauvegardes *.json et *.json.gz qu'il contient (saves/ par exemple)
+    - Fichier .jsonl : sortie de simulation, une partie par ligne
+    - Fichier .json ou .json.gz : une sauvegarde
+
+    Une même partie est souvent sauvegardée plusieurs fois (sauvegardes automatiques, copies) :
+    seule la sauvegarde la plus avancée est produite (voir _distinct_saves), pour que ses tours
+    ne soient comptés qu'une fois.
+    """
+    sources = []  # (sortie de simulation, chemins), dans l'ordre des sources
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                sources.append((False, sorted(entry.path for entry in entries
+                                              if entry.name.endswith(('.json', '.json.gz')) and entry.is_file())))
+        else:
+            sources.append((path.endswith('.jsonl'), [path]))
+    distinct = _distinct_saves([filepath for is_jsonl, filepaths in sources if not is_jsonl for filepath in filepaths])
+
+    for is_jsonl, filepaths in sources:
+        if is_jsonl:
+            with open(filepaths[0], 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield line
+            continue
+        for filepath in filepaths:
+            if filepath in distinct:
+                distinct.discard(filepath)  # Un fichier donné deux fois n'est lu qu'une fois
+                yield _read_text(filepath)
+
+
+def _read_text(filepath: str) -> str:
+    if filepath.endswith('.gz'):
+        with gzip.open(filepath, 'rt', encoding='utf-8') as f:
+            return f.read()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _distinct_saves(filepaths: List[str]) -> Set[str]:
+    """
+    Sauvegardes à analyser : une par partie, la plus avancée
+
+    Les sauvegardes d'une même partie ont la même graine et les mêmes joueurs, et l'historique
+    de chacune prolonge celui des précédentes : une sauvegarde dont l'historique est le début de
+    celui d'une autre est écartée. Deux historiques qui divergent sont deux parties, gardées
+    toutes les deux. Les sauvegardes sans historique (ou illisibles, pour que l'erreur remonte
+    à l'analyse) sont gardées telles quelles.
+    """
+    distinct = set()
+    games: Dict[tuple, List[Tuple[str, str]]] = {}  # (graine, joueurs) -> [(historique, chemin)]
+    for filepath in filepaths:
+        try:
+            replay = json.loads(_read_text(filepath)).get('replay')
+        except (OSError, EOFError, ValueError):
+            distinct.add(filepath)
+            continue
+        if not replay or replay.get('seed') is None:
+            distinct.add(filepath)
+            continue
+        # Historique sans le crochet final : celui d'une sauvegarde antérieure en est un préfixe
+        actions = json.dumps(replay['actions'], separators=(',', ':'))[:-1]
+        games.setdefault((replay['seed'], tuple(replay['players'])), []).append((actions, filepath))
+
+    for saves in games.values():
+        kept: List[str] = []
+        for actions, filepath in sorted(saves, key=lambda save: -len(save[0])):
+            if not any(longer.startswith(actions) for longer in kept):
+                kept.append(actions)
+                distinct.add(filepath)
+    return distinct
+
+
+def iter_chunks(records: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Regroupe les parties par paquets de chunk_size"""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _record_turns(data: Dict[str, Any], rules_cache: Dict[str, FarkleRules]) -> Optional[Dict[str, Any]]:
+    """
+    Colonnes par tour d'une partie : celles écrites avec la partie, sinon calculées depuis ses décisions
+
+    Returns:
+        Colonnes (voir state.turn_columns), ou None pour une partie sans historique
+    """
+    turns = data.get('turns')
+    if turns is not None:
+        return turns
+    replay_data = data.get('replay')
+    if not replay_data or replay_data.get('seed') is None:
+        return None
+    # Sauvegardes et sorties plus anciennes, sans colonnes : un passage sur les décisions, sans rejouer les lancés
+    rules_key = repr(sorted((replay_data.get('rules') or {}).items()))
+    if rules_key not in rules_cache:
+        rules_cache[rules_key] = FarkleRules.from_dict(replay_data.get('rules'))
+    return turn_columns(replay_data['actions'], len(replay_data['players']), rules_cache[rules_key])
+
+
+def aggregate_chunk(records: List[str]) -> Dict[str, Any]:
+    """
+    Analyse un paquet de parties : colonnes numpy par tour, puis agrégats par siège et par joueur
+
+    Les colonnes par tour sont lues telles qu'écrites par simulate (calculées depuis les décisions
+    pour les sauvegardes) et mises bout à bout ; aucune partie n'est rejouée. Exécutée dans un processus de travail,
+    elle ne renvoie que les agrégats (quelques centaines d'entiers).
+    """
+    player_ids: Dict[str, int] = {}
+    rules_cache: Dict[str, FarkleRules] = {}
+    columns: Dict[str, list] = {field: [] for field in TURN_COLUMNS}
+    game_players: List[List[int]] = []  # Joueur de chaque siège, par partie
+    turn_counts: List[int] = []
+    winners: List[int] = []
+    skipped = 0
+
+    for record in records:
+        data = json.loads(record)
+        turns = _record_turns(data, rules_cache)
+        if turns is None:
+            skipped += 1  # Sauvegarde sans historique (antérieure à la version 1.7)
+            continue
+        for field in TURN_COLUMNS:
+            columns[field].extend(turns[field])
+        game_players.append([player_ids.setdefault(name, len(player_ids)) for name in data['replay']['players']])
+        turn_counts.append(len(turns['seat']))
+        winners.append(turns['winner'])
+
+    arrays = {field: np.asarray(values, dtype=np.int64) for field, values in columns.items()}
+    # Joueur de chaque tour : siège du tour lu dans la table des joueurs de sa partie
+    players = np.full((len(game_players), MAX_SEATS), -1, dtype=np.int64)
+    for game_index, seats in enumerate(game_players):
+        players[game_index, :len(seats)] = seats
+    game_of_turn = np.repeat(np.arange(len(game_players)), turn_counts)
+    arrays['player'] = players[game_of_turn, arrays['seat']]
+    winners = np.asarray(winners, dtype=np.int64)
+
+    num_players = len(player_ids)
+    seat_ids = np.where(players >= 0, np.arange(MAX_SEATS), -1)
+    by_seat = _aggregate(arrays, arrays['seat'], MAX_SEATS, seat_ids, winners)
+    by_player = _aggregate(arrays, arrays['player'], num_players, players, winners)
+    names = sorted(player_ids, key=player_ids.get)
+
+    return {
+        'games': len(winners),
+        'turns': len(arrays['seat']),
+        'skipped': skipped,
+        'by_seat': by_seat,
+        'by_player': {name: by_player[:, index] for index, name in enumerate(names)},
+    }
+
+
+def _aggregate(arrays: Dict[str, np.ndarray], keys: np.ndarray, size: int,
+               game_keys: np.ndarray, winners: np.ndarray) -> np.ndarray:
+    """
+    Calcule les compteurs AGGREGATE_FIELDS (une ligne par compteur, une colonne par clé)
+
+    Args:
+        arrays: Colonnes par tour
+        keys: Clé (siège ou joueur) de chaque tour
+        size: Nombre de clés
+        game_keys: Clé de chaque siège, par partie (-1 pour un siège vide)
+        winners: Siège du gagnant de chaque partie (-1 si elle n'est pas terminée)
+    """
+    result = np.zeros((len(AGGREGATE_FIELDS), size), dtype=np.int64)
+    if size == 0:
+        return result
+
+    def count(values, weights=None):
+        return np.bincount(values, weights=weights, minlength=size)[:size].astype(np.int64)
+
+    stopped = 1 - arrays['farkle']
+    result[0] = count(keys)
+    result[1] = count(keys, arrays['farkle'])
+    result[2] = count(keys, stopped)
+    result[3] = count(keys, arrays['banked'])
+    result[4] = count(keys, arrays['inherited_gained'])
+    result[5] = count(keys, arrays['inherited_lost'])
+    result[6] = count(keys, arrays['entered'])
+    result[7] = count(keys, arrays['entered'] * arrays['player_turn'])
+
+    # Parties terminées jouées et gagnées
+    finished = winners >= 0
+    played = game_keys[finished]
+    result[8] = count(played[played >= 0])
+    result[9] = count(played[np.arange(len(played)), winners[finished]])
+    return result
+
+
+def merge(total: Dict[str, Any], partial: Dict[str, Any]) -> Dict[str, Any]:
+    """Fusionne les agrégats d'un paquet dans le total"""
+    if not total:
+        return partial
+    total['games'] += partial['games']
+    total['turns'] += partial['turns']
+    total['skipped'] += partial['skipped']
+    total['by_seat'] = total['by_seat'] + partial['by_seat']
+    for name, counters in partial['by_player'].items():
+        if name in total['by_player']:
+            total['by_player'][name] = total['by_player'][name] + counters
+        else:
+            total['by_player'][name] = counters
+    return total
+
+
+def analyze(paths: Iterable[str], chunk_size: int = 1000, workers: int = None) -> Dict[str, Any]:
+    """
+    Analyse toutes les parties des sources données, par paquets (mémoire constante)
+
+    Args:
+        paths: Dossiers de sauvegardes, sauvegardes .json ou sorties de simulation .jsonl
+        chunk_size: Nombre de parties par paquet
+        workers: Nombre de processus (1 = dans le processus courant)
+    """
+    chunks = iter_chunks(iter_records(paths), chunk_size)
+    total: Dict[str, Any] = {}
+
+    if workers == 1:
+        for chunk in chunks:
+            total = merge(total, aggregate_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Au plus quelques paquets en vol, pour que la mémoire reste constante
+            pending = []
+            max_pending = (workers or os.cpu_count() or 1) * 2
+            for chunk in chunks:
+                pending.append(executor.submit(aggregate_chunk, chunk))
+                if len(pending) >= max_pending:
+                    total = merge(total, pending.pop(0).result())
+            for future in pending:
+                total = merge(total, future.result())
+
+    return report(total)
+
+
+def _rates(counters: np.ndarray) -> Dict[str, Any]:
+    """Transforme les compteurs d'une clé en statistiques lisibles"""
+    values = dict(zip(AGGREGATE_FIELDS, (int(value) for value in counters)))
+
+    def ratio(numerator: str, denominator: str):
+        return values[numerator] / values[denominator] if values[denominator] else None
+
+    return {
+        'turns': values['turns'],
+        'games': values['games'],
+        'farkle_rate': ratio('farkles', 'turns'),
+        'average_banked_turn': ratio('banked_total', 'banked_turns'),
+        'inherited_gained': values['inherited_gained'],
+        'inherited_lost': values['inherited_lost'],
+        'average_turns_to_enter': ratio('entry_turns_total', 'entries'),
+        'win_rate': ratio('wins', 'games'),
+    }
+
+
+def report(total: Dict[str, Any]) -> Dict[str, Any]:
+    """Rapport final : statistiques par siège et par joueur"""
+    if not total:
+        return {'games': 0, 'turns': 0, 'skipped': 0, 'by_seat': {}, 'by_player': {}}
+    by_seat = total['by_seat']
+    return {
+        'games': total['games'],
+        'turns': total['turns'],
+        'skipped': total['skipped'],
+        'by_seat': {seat + 1: _rates(by_seat[:, seat]) for seat in range(MAX_SEATS) if by_seat[0, seat]},
+        'by_player': {name: _rates(counters) for name, counters in sorted(total['by_player'].items())},
+    }
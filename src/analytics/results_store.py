@@ -0,0 +1,237 @@
+import json
+import os
+from typing import Any, Dict, List, Tuple
+import numpy as np
+
+
+MAX_SEATS = 8
+STORE_VERSION = 1
+
+# Une partie simulée : enregistrement de taille fixe
+GAME_DTYPE = np.dtype([
+    ('seed', '<i8'),
+    ('turn_count', '<i4'),
+    ('num_players', 'i1'),
+    ('winner', 'i1'),  # Siège du gagnant, -1 si la partie n'est pas terminée
+    ('final_scores', '<i4', (MAX_SEATS,)),
+    ('trace_offset', '<i8'),  # Position de la trace de la partie dans traces.bin
+    ('trace_length', '<i4'),
+])
+
+# Un tour joué : score total du joueur après son tour
+TRACE_DTYPE = np.dtype([
+    ('turn', '<i4'),
+    ('seat', 'i1'),
+    ('total_score', '<i4'),
+])
+
+GAMES_FILE = 'games.bin'
+TRACES_FILE = 'traces.bin'
+META_FILE = 'meta.json'
+
+
+class ResultsWriter:
+    """
+    Écrit des résultats de simulation en enregistrements binaires de taille fixe
+
+    Les enregistrements sont accumulés par paquets de chunk_size parties puis ajoutés
+    en fin de fichier : la mémoire reste constante quelle que soit la taille de la simulation.
+    Après chaque ajout, meta.json est réécrit avec le nombre d'enregistrements des fichiers.
+
+    Un magasin existant est repris à sa suite. Un enregistrement partiel en fin de fichier
+    (écriture interrompue) est d'abord retiré : sans cela, tout ce qui serait ajouté ensuite
+    serait décalé et illisible.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 65536):
+        self.path = path
+        self.chunk_size = chunk_size
+        os.makedirs(path, exist_ok=True)
+        _check_meta(path)
+
+        self.games_path = os.path.join(path, GAMES_FILE)
+        self.traces_path = os.path.join(path, TRACES_FILE)
+        # On reprend à la suite d'un magasin existant, sur des enregistrements entiers
+        self.stored_games = _truncate_records(self.games_path, GAME_DTYPE)
+        self.trace_offset = _truncate_records(self.traces_path, TRACE_DTYPE)
+        _write_meta(path, self.stored_games, self.trace_offset)
+        self.games = np.zeros(chunk_size, dtype=GAME_DTYPE)
+        self.game_count = 0
+        self.traces: List[Tuple[int, int, int]] = []
+
+    def append(self, seed: int, turn_count: int, final_scores: List[int], winner: int,
+               trace: List[Tuple[int, int, int]] = None):
+        """
+        Ajoute une partie
+
+        Args:
+            seed: Graine de la partie
+            turn_count: Nombre de tours de table
+            final_scores: Score final de chaque siège
+            winner: Siège du gagnant (-1 si aucun)
+            trace: Liste de (tour, siège, score total après le tour)
+        """
+        trace = trace or []
+        record = self.games[self.game_count]
+        record['seed'] = seed
+        record['turn_count'] = turn_count
+        record['num_players'] = len(final_scores)
+        record['winner'] = winner
+        record['final_scores'][:len(final_scores)] = final_scores
+        record['final_scores'][len(final_scores):] = 0
+        record['trace_offset'] = self.trace_offset + len(self.traces)
+        record['trace_length'] = len(trace)
+        self.traces.extend(trace)
+        self.game_count += 1
+
+        if self.game_count >= self.chunk_size:
+            self.flush()
+
+    def append_game(self, game, trace: List[Tuple[int, int, int]] = None):
+        """Ajoute une partie terminée (FarkleGame)"""
+        winner = game.players.index(game.winner) if game.winner else -1
+        self.append(game.seed, game.turn_count, [player.total_score for player in game.players], winner, trace)
+
+    def append_batch(self, seeds: np.ndarray, turn_counts: np.ndarray, final_scores: np.ndarray,
+                     winners: np.ndarray):
+        """Ajoute un lot de parties sans trace (sortie du moteur vectorisé), directement en colonnes"""
+        self.flush()
+        records = np.zeros(len(seeds), dtype=GAME_DTYPE)
+        records['seed'] = seeds
+        records['turn_count'] = turn_counts
+        records['num_players'] = final_scores.shape[1]
+        records['winner'] = winners
+        records['final_scores'][:, :final_scores.shape[1]] = final_scores
+        records['trace_offset'] = self.trace_offset
+        with open(self.games_path, 'ab') as f:
+            records.tofile(f)
+        self.stored_games += len(records)
+        _write_meta(self.path, self.stored_games, self.trace_offset)
+
+    def flush(self):
+        """Ajoute le paquet en cours à la fin des fichiers (les traces d'abord, puis les parties)"""
+        if not self.traces and not self.game_count:
+            return
+        if self.traces:
+            with open(self.traces_path, 'ab') as f:
+                np.array(self.traces, dtype=TRACE_DTYPE).tofile(f)
+            self.trace_offset += len(self.traces)
+            self.traces = []
+        if self.game_count:
+            with open(self.games_path, 'ab') as f:
+                self.games[:self.game_count].tofile(f)
+            self.stored_games += self.game_count
+            self.game_count = 0
+        _write_meta(self.path, self.stored_games, self.trace_offset)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ResultsStore:
+    """
+    Lecture d'un magasin de résultats : les fichiers sont projetés en mémoire (memmap)
+    et exposés directement comme tableaux numpy, sans étape de lecture ni copie
+
+    Seuls les enregistrements comptés dans meta.json sont lus : un ajout en cours (ou interrompu
+    avant la mise à jour de meta.json) n'est pas visible.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        meta_path = os.path.join(path, META_FILE)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"Magasin de résultats non trouvé: {path}")
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != STORE_VERSION:
+            raise ValueError(f"Version de magasin non supportée: {meta.get('version')}")
+
+        self.games = _open_memmap(os.path.join(path, GAMES_FILE), GAME_DTYPE, meta.get('games'))
+        self.traces = _open_memmap(os.path.join(path, TRACES_FILE), TRACE_DTYPE, meta.get('traces'))
+
+    def __len__(self):
+        return len(self.games)
+
+    def trace(self, game_index: int) -> np.ndarray:
+        """Trace des scores d'une partie (vue sur le fichier, sans copie)"""
+        record = self.games[game_index]
+        offset = int(record['trace_offset'])
+        return self.traces[offset:offset + int(record['trace_length'])]
+
+    def summary(self) -> Dict[str, Any]:
+        """Statistiques globales : parties, tours moyens, taux de victoire par siège"""
+        games = self.games
+        if len(games) == 0:
+            return {'games': 0}
+        finished = games[games['winner'] >= 0]
+        num_players = games['num_players']
+        seats_played = np.array([(num_players > seat).sum() for seat in range(MAX_SEATS)])
+        wins = np.bincount(finished['winner'].astype(np.int64), minlength=MAX_SEATS)
+        return {
+            'games': int(len(games)),
+            'finished_games': int(len(finished)),
+            'average_turn_count': float(games['turn_count'].mean()),
+            'average_winning_score': float(finished['final_scores'][np.arange(len(finished)), finished['winner']].mean())
+            if len(finished) else None,
+            'win_rate_by_seat': {seat + 1: float(wins[seat] / seats_played[seat])
+                                 for seat in range(MAX_SEATS) if seats_played[seat]},
+            'traced_turns': int(len(self.traces)),
+        }
+
+
+def _record_count(filepath: str, dtype: np.dtype) -> int:
+    """Nombre d'enregistrements complets d'un fichier (un enregistrement partiel est ignoré)"""
+    if not os.path.exists(filepath):
+        return 0
+    return os.path.getsize(filepath) // dtype.itemsize
+
+
+def _truncate_records(filepath: str, dtype: np.dtype) -> int:
+    """Retire l'enregistrement partiel en fin de fichier, s'il y en a un ; retourne le nombre d'enregistrements"""
+    count = _record_count(filepath, dtype)
+    if os.path.exists(filepath) and os.path.getsize(filepath) != count * dtype.itemsize:
+        with open(filepath, 'r+b') as f:
+            f.truncate(count * dtype.itemsize)
+    return count
+
+
+def _open_memmap(filepath: str, dtype: np.dtype, count: int = None) -> np.ndarray:
+    """Projection des enregistrements complets du fichier, limitée à count (magasins sans compte : tous)"""
+    available = _record_count(filepath, dtype)
+    count = available if count is None else min(count, available)
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(filepath, dtype=dtype, mode='r', shape=(count,))
+
+
+def _check_meta(path: str):
+    """Refuse de compléter un magasin d'un autre format"""
+    meta_path = os.path.join(path, META_FILE)
+    if not os.path.exists(meta_path):
+        return
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        version = json.load(f).get('version')
+    if version != STORE_VERSION:
+        raise ValueError(f"Version de magasin non supportée: {version}")
+
+
+def _write_meta(path: str, game_count: int, trace_count: int):
+    """Écrit meta.json (format et nombre d'enregistrements) en remplaçant l'ancien d'un seul coup"""
+    meta_path = os.path.join(path, META_FILE)
+    temp_path = meta_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': STORE_VERSION,
+            'game_dtype': GAME_DTYPE.descr,
+            'trace_dtype': TRACE_DTYPE.descr,
+            'games': game_count,
+            'traces': trace_count,
+        }, f, indent=2)
+    os.replace(temp_path, meta_path)
@@ -0,0 +1,461 @@
+import asyncio
+import base64
+import json
+import os
+import socket
+import tempfile
+import time
+from collections import deque
+from multiprocessing import Process
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from model.rules import FarkleRules
+
+
+DEFAULT_PORT = 8770
+# Parties par lot : assez pour amortir l'aller-retour réseau, assez peu pour qu'un lot perdu coûte peu
+BATCH_SIZE = 1000
+# Un lot non rendu dans ce délai est redistribué (travailleur bloqué ou machine injoignable)
+LEASE_TIMEOUT = 120.0
+# Distributions d'un même lot avant de l'abandonner (erreurs à répétition)
+MAX_ATTEMPTS = 5
+PROGRESS_INTERVAL = 2.0
+
+
+class SimulationConfig:
+    """
+    Une configuration d'un balayage : joueurs, stratégie de chaque siège, règles et parties à simuler
+
+    Stratégies (une par siège) :
+    - {'bank_at': 350}         stratégie à seuil (threshold_policy)
+    - {'table': 'chemin.bin'}  table sauvegardée (TableStrategy.save), envoyée aux travailleurs
+    """
+
+    def __init__(self, name: str, strategies: List[Dict[str, Any]], games: int, seed: int = 0,
+                 rules: Dict[str, Any] = None, max_turns: int = 1000):
+        if not 2 <= len(strategies) <= 8:
+            raise ValueError("Le nombre de joueurs doit être entre 2 et 8")
+        for spec in strategies:
+            if ('bank_at' in spec) == ('table' in spec):
+                raise ValueError(f"Stratégie invalide (bank_at ou table attendu): {spec}")
+        self.name = name
+        self.strategies = [dict(spec) for spec in strategies]
+        self.games = games
+        self.seed = seed
+        self.rules = rules
+        self.max_turns = max_turns
+
+    @property
+    def players(self) -> int:
+        return len(self.strategies)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], base_dir: str = '.') -> 'SimulationConfig':
+        """Configuration d'un fichier de balayage (chemins des tables relatifs au fichier)"""
+        strategies = []
+        for spec in data['strategies']:
+            spec = dict(spec)
+            if 'table' in spec:
+                spec['table'] = os.path.join(base_dir, spec['table'])
+            strategies.append(spec)
+        return cls(data.get('name', ''), strategies, int(data['games']), int(data.get('seed', 0)),
+                   data.get('rules'), int(data.get('max_turns', 1000)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'name': self.name, 'strategies': self.strategies, 'games': self.games, 'seed': self.seed,
+                'rules': self.rules, 'max_turns': self.max_turns}
+
+    def to_wire(self) -> Dict[str, Any]:
+        """Configuration envoyée aux travailleurs : les tables y sont incluses (base64)"""
+        strategies = []
+        for spec in self.strategies:
+            if 'table' in spec:
+                with open(spec['table'], 'rb') as f:
+                    spec = {'table_data': base64.b64encode(f.read()).decode('ascii')}
+            strategies.append(spec)
+        return {'strategies': strategies, 'rules': self.rules, 'max_turns': self.max_turns}
+
+
+def build_strategies(wire: Dict[str, Any]) -> Tuple[list, FarkleRules]:
+    """Stratégies et règles d'une configuration reçue par un travailleur"""
+    from bot.strategy import TableStrategy, threshold_policy
+    rules = FarkleRules.from_dict(wire.get('rules'))
+    strategies = []
+    cache = {}
+    for spec in wire['strategies']:
+        key = json.dumps(spec, sort_keys=True)
+        if key not in cache:
+            if 'bank_at' in spec:
+                cache[key] = TableStrategy.from_callable(threshold_policy(int(spec['bank_at'])), rules=rules)
+            else:
+                # TableStrategy se charge depuis un fichier
+                handle, path = tempfile.mkstemp(suffix='.bin', prefix='farkle_strategy_')
+                try:
+                    with os.fdopen(handle, 'wb') as f:
+                        f.write(base64.b64decode(spec['table_data']))
+                    cache[key] = TableStrategy.load(path)
+                finally:
+                    os.remove(path)
+        strategies.append(cache[key])
+    return strategies, rules
+
+
+def empty_aggregate(players: int) -> Dict[str, Any]:
+    """Agrégat partiel vide : uniquement des sommes, fusionnables dans n'importe quel ordre"""
+    return {
+        'games': 0,
+        'finished_games': 0,
+        'turn_count_total': 0,
+        'winning_score_total': 0,
+        'wins_by_seat': [0] * players,
+        'score_total_by_seat': [0] * players,
+    }
+
+
+def merge_aggregates(total: Dict[str, Any], part: Dict[str, Any]) -> Dict[str, Any]:
+    """Ajoute un agrégat partiel à un agrégat (modifié sur place et retourné)"""
+    for field in ('games', 'finished_games', 'turn_count_total', 'winning_score_total'):
+        total[field] += part[field]
+    for field in ('wins_by_seat', 'score_total_by_seat'):
+        total[field] = [a + b for a, b in zip(total[field], part[field])]
+    return total
+
+
+def summarize(aggregate: Dict[str, Any]) -> Dict[str, Any]:
+    """Statistiques d'un agrégat, mêmes noms que ResultsStore.summary"""
+    games, finished = aggregate['games'], aggregate['finished_games']
+    if not games:
+        return {'games': 0}
+    return {
+        'games': games,
+        'finished_games': finished,
+        'average_turn_count': aggregate['turn_count_total'] / games,
+        'average_winning_score': aggregate['winning_score_total'] / finished if finished else None,
+        'win_rate_by_seat': {seat + 1: wins / games for seat, wins in enumerate(aggregate['wins_by_seat'])},
+        'average_score_by_seat': {seat + 1: total / games
+                                  for seat, total in enumerate(aggregate['score_total_by_seat'])},
+    }
+
+
+def run_batch(strategies: list, rules: FarkleRules, seed_start: int, count: int,
+              max_turns: int = 1000) -> Dict[str, Any]:
+    """Simule les parties de graines seed_start à seed_start + count - 1 et retourne leur agrégat"""
+    from bot.simulation import simulate_game
+    names = [f"Bot {index + 1}" for index in range(len(strategies))]
+    aggregate = empty_aggregate(len(strategies))
+    wins, scores = aggregate['wins_by_seat'], aggregate['score_total_by_seat']
+    for seed in range(seed_start, seed_start + count):
+        game = simulate_game(names, strategies, seed, rules, max_turns)
+        aggregate['games'] += 1
+        aggregate['turn_count_total'] += game.turn_count
+        for seat, player in enumerate(game.players):
+            scores[seat] += player.total_score
+        if game.winner is not None:
+            winner = game.players.index(game.winner)
+            aggregate['finished_games'] += 1
+            aggregate['winning_score_total'] += game.winner.total_score
+            wins[winner] += 1
+    return aggregate
+
+
+class Batch:
+    """Plage de graines d'une configuration, distribuée à un travailleur à la fois"""
+
+    def __init__(self, batch_id: int, config_index: int, seed_start: int, count: int):
+        self.id = batch_id
+        self.config_index = config_index
+        self.seed_start = seed_start
+        self.count = count
+        self.attempts = 0
+        self.deadline = 0.0
+        self.connection = None  # Connexion qui détient le lot
+        self.error = None
+
+
+class Coordinator:
+    """
+    Coordinateur d'un balayage : découpe chaque configuration en lots de graines et les distribue
+
+    Les travailleurs se connectent en TCP (une requête JSON par ligne, comme service.game_service) :
+    - hello  {'worker': nom}
+    - lease  -> {'batch': {...}, 'config': {...}} (configuration jointe au premier lot qui l'utilise),
+                {'wait': secondes} si tous les lots restants sont distribués, {'done': True} à la fin
+    - result {'batch': id, 'aggregate': {...}}
+    - failed {'batch': id, 'error': message}
+    - status -> avancement
+
+    Un lot est redistribué si son travailleur se déconnecte, le signale en échec ou ne l'a pas rendu
+    après lease_timeout secondes ; après max_attempts distributions il est abandonné. Seul le premier
+    résultat d'un lot est fusionné : les agrégats ne dépendent donc pas du découpage ni des relances,
+    et sont identiques à ceux d'une simulation sur une seule machine avec les mêmes graines.
+    """
+
+    def __init__(self, configs: List[SimulationConfig], batch_size: int = BATCH_SIZE,
+                 lease_timeout: float = LEASE_TIMEOUT, max_attempts: int = MAX_ATTEMPTS,
+                 progress: Callable[[Dict[str, Any]], None] = None):
+        if batch_size < 1:
+            raise ValueError("La taille des lots doit être positive")
+        self.configs = configs
+        self.wires = [config.to_wire() for config in configs]
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.progress = progress
+        self.batches: Dict[int, Batch] = {}
+        for config_index, config in enumerate(configs):
+            for start in range(0, config.games, batch_size):
+                batch = Batch(len(self.batches), config_index, config.seed + start, min(batch_size, config.games - start))
+                self.batches[batch.id] = batch
+        self.pending = deque(self.batches.values())
+        self.leased: Dict[int, Batch] = {}
+        self.completed = set()
+        self.failed: Dict[int, Batch] = {}
+        self.retries = 0
+        self.aggregates = [empty_aggregate(config.players) for config in configs]
+        self.workers: Dict[str, Dict[str, int]] = {}
+        self.started = time.time()
+        self.finished_at = None
+        self._finished = None  # asyncio.Event, créé par serve()
+
+    @property
+    def finished(self) -> bool:
+        return not self.pending and not self.leased
+
+    def games_done(self) -> int:
+        return sum(aggregate['games'] for aggregate in self.aggregates)
+
+    def status(self) -> Dict[str, Any]:
+        """Avancement : lots et parties terminés, débit, travailleurs, relances"""
+        elapsed = (self.finished_at or time.time()) - self.started
+        games = self.games_done()
+        return {
+            'batches_total': len(self.batches),
+            'batches_completed': len(self.completed),
+            'batches_leased': len(self.leased),
+            'batches_failed': len(self.failed),
+            'games_completed': games,
+            'games_total': sum(config.games for config in self.configs),
+            'retries': self.retries,
+            'workers': len(self.workers),
+            'elapsed_s': elapsed,
+            'games_per_s': games / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def report(self) -> Dict[str, Any]:
+        """Rapport final : agrégats et statistiques par configuration, lots abandonnés, travailleurs"""
+        return {
+            'configs': [dict(config.to_dict(), aggregate=aggregate, summary=summarize(aggregate))
+                        for config, aggregate in zip(self.configs, self.aggregates)],
+            'failed_batches': [{'config': batch.config_index, 'seed_start': batch.seed_start, 'count': batch.count,
+                                'attempts': batch.attempts, 'error': batch.error}
+                               for batch in self.failed.values()],
+            'workers': self.workers,
+            'status': self.status(),
+        }
+
+    def _requeue(self, batch: Batch, error: str):
+        """Remet un lot perdu en file (en tête : il bloque la fin du balayage), ou l'abandonne"""
+        self.leased.pop(batch.id, None)
+        if batch.connection is not None:
+            batch.connection['leases'].discard(batch.id)
+        batch.connection = None
+        batch.error = error
+        if batch.attempts >= self.max_attempts:
+            self.failed[batch.id] = batch
+        else:
+            self.retries += 1
+            self.pending.appendleft(batch)
+        self._check_finished()
+
+    def _expire_leases(self):
+        now = time.time()
+        for batch in [batch for batch in self.leased.values() if batch.deadline < now]:
+            self._requeue(batch, f"Délai dépassé ({self.lease_timeout:.0f} s)")
+
+    def _check_finished(self):
+        if self.finished and self.finished_at is None:
+            self.finished_at = time.time()
+            if self._finished is not None:
+                self._finished.set()
+
+    def handle(self, request: Dict[str, Any], connection: Dict[str, Any]) -> Dict[str, Any]:
+        """Traite une requête d'un travailleur (connection : état de sa connexion)"""
+        op = request.get('op')
+        if op == 'hello':
+            connection['worker'] = str(request.get('worker') or f"travailleur {len(self.workers) + 1}")
+            self.workers.setdefault(connection['worker'], {'batches': 0, 'games': 0})
+            return {'ok': True}
+        if op == 'lease':
+            self._expire_leases()
+            if not self.pending:
+                return {'ok': True, 'done': True} if self.finished else {'ok': True, 'wait': 0.5}
+            batch = self.pending.popleft()
+            batch.attempts += 1
+            batch.deadline = time.time() + self.lease_timeout
+            batch.connection = connection
+            self.leased[batch.id] = batch
+            connection['leases'].add(batch.id)
+            response = {'ok': True, 'batch': {'id': batch.id, 'config': batch.config_index,
+                                              'seed_start': batch.seed_start, 'count': batch.count}}
+            if batch.config_index not in connection['configs']:
+                connection['configs'].add(batch.config_index)
+                response['config'] = self.wires[batch.config_index]
+            return response
+        if op == 'result':
+            batch = self.batches.get(request.get('batch'))
+            if batch is None:
+                return {'ok': False, 'error': f"Lot inconnu: {request.get('batch')}"}
+            if batch.id in self.completed:
+                return {'ok': True, 'duplicate': True}
+            merge_aggregates(self.aggregates[batch.config_index], request['aggregate'])
+            self.completed.add(batch.id)
+            self.leased.pop(batch.id, None)
+            self.failed.pop(batch.id, None)
+            if batch.connection is None and batch in self.pending:
+                self.pending.remove(batch)  # Rendu par le travailleur qu'on croyait perdu, après sa remise en file
+            connection['leases'].discard(batch.id)
+            worker = self.workers.setdefault(connection.get('worker', '?'), {'batches': 0, 'games': 0})
+            worker['batches'] += 1
+            worker['games'] += batch.count
+            self._check_finished()
+            return {'ok': True}
+        if op == 'failed':
+            batch = self.leased.get(request.get('batch'))
+            if batch is not None and batch.connection is connection:
+                # La configuration est renvoyée avec le prochain lot : l'échec vient peut-être de sa construction
+                connection['configs'].discard(batch.config_index)
+                self._requeue(batch, str(request.get('error')))
+            return {'ok': True}
+        if op == 'status':
+            return dict(self.status(), ok=True)
+        return {'ok': False, 'error': f"Opération inconnue: {op}"}
+
+    def disconnected(self, connection: Dict[str, Any]):
+        """Connexion perdue : ses lots en cours sont redistribués"""
+        for batch_id in list(connection['leases']):
+            batch = self.leased.get(batch_id)
+            if batch is not None:
+                self._requeue(batch, f"Connexion perdue ({connection.get('worker', '?')})")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = {'leases': set(), 'configs': set()}
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = self.handle(json.loads(line), connection)
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                    response = {'ok': False, 'error': f"Requête invalide: {e}"}
+                writer.write(json.dumps(response, separators=(',', ':')).encode('utf-8') + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # Travailleur parti, ou balayage terminé alors qu'il était encore connecté
+        finally:
+            self.disconnected(connection)
+            writer.close()
+
+    async def _report_progress(self):
+        while True:
+            await asyncio.sleep(PROGRESS_INTERVAL)
+            self._expire_leases()
+            if self.progress is not None:
+                self.progress(self.status())
+
+    async def serve(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT, ready=None) -> Dict[str, Any]:
+        """Distribue les lots jusqu'à ce qu'ils soient tous terminés (ou abandonnés) et retourne le rapport"""
+        self._finished = asyncio.Event()
+        self._check_finished()
+        server = await asyncio.start_server(self._handle_connection, host, port, limit=1 << 24)
+        if ready is not None:
+            ready.set()
+        reporter = asyncio.create_task(self._report_progress())
+        try:
+            async with server:
+                await self._finished.wait()
+                # Laisser les travailleurs en attente apprendre que le balayage est terminé
+                await asyncio.sleep(min(1.0, PROGRESS_INTERVAL))
+        finally:
+            reporter.cancel()
+        if self.progress is not None:
+            self.progress(self.status())
+        return self.report()
+
+    def run(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT, ready=None) -> Dict[str, Any]:
+        return asyncio.run(self.serve(host, port, ready))
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """'hôte:port' (ou ':port', ou 'hôte') -> (hôte, port)"""
+    host, _, port = address.rpartition(':') if ':' in address else (address, '', '')
+    return host or '127.0.0.1', int(port) if port else DEFAULT_PORT
+
+
+def run_worker(address: str, name: str = None, connect_timeout: float = 30.0) -> int:
+    """
+    Travailleur : demande des lots au coordinateur, les simule et renvoie leurs agrégats
+
+    Args:
+        address: Adresse du coordinateur (hôte:port)
+        name: Nom du travailleur dans le rapport (machine et processus par défaut)
+        connect_timeout: Durée pendant laquelle la connexion est retentée (coordinateur pas encore prêt)
+
+    Returns:
+        Nombre de lots simulés
+    """
+    host, port = parse_address(address)
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    deadline = time.time() + connect_timeout
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            if time.time() >= deadline:
+                raise
+            time.sleep(0.2)
+
+    configs: Dict[int, Tuple[list, FarkleRules, int]] = {}
+    done = 0
+    with sock, sock.makefile('rwb') as stream:
+        def call(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            stream.write(json.dumps(request, separators=(',', ':')).encode('utf-8') + b'\n')
+            stream.flush()
+            line = stream.readline()
+            return json.loads(line) if line else None
+
+        try:
+            call({'op': 'hello', 'worker': name})
+            while True:
+                response = call({'op': 'lease'})
+                if response is None or response.get('done'):
+                    break
+                if 'wait' in response:
+                    time.sleep(response['wait'])
+                    continue
+                batch = response['batch']
+                try:
+                    if 'config' in response:
+                        strategies, rules = build_strategies(response['config'])
+                        configs[batch['config']] = (strategies, rules, int(response['config'].get('max_turns', 1000)))
+                    strategies, rules, max_turns = configs[batch['config']]
+                    aggregate = run_batch(strategies, rules, batch['seed_start'], batch['count'], max_turns)
+                except Exception as e:
+                    call({'op': 'failed', 'batch': batch['id'], 'error': f"{type(e).__name__}: {e}"})
+                    continue
+                if call({'op': 'result', 'batch': batch['id'], 'aggregate': aggregate}) is None:
+                    break
+                done += 1
+        except (ConnectionError, OSError):
+            pass  # Coordinateur arrêté : ses lots non rendus sont redistribués par ailleurs
+    return done
+
+
+def run_workers(address: str, processes: int = None, name: str = None, connect_timeout: float = 30.0) -> List[Process]:
+    """Lance des travailleurs dans des processus séparés (un par cœur par défaut) et retourne les processus"""
+    processes = processes or os.cpu_count() or 1
+    prefix = name or socket.gethostname()
+    workers = [Process(target=run_worker, args=(address, f"{prefix}-{index + 1}", connect_timeout), daemon=True)
+               for index in range(processes)]
+    for worker in workers:
+        worker.start()
+    return workers
@@ -0,0 +1,197 @@
+from collections import Counter
+from math import factorial
+from typing import Any, Dict, List, Tuple
+from model.rules import FarkleRules, DEFAULT_RULES, all_multisets
+from bot.strategy import DecisionState, Decision, Strategy
+
+
+# Un solveur par barème : les tables de probabilités sont partagées entre les parties
+_SOLVERS: Dict[tuple, 'EndgameSolver'] = {}
+
+
+def roll_probability(multiset: Tuple[int, ...]) -> float:
+    """Probabilité d'obtenir ce lancé (multi-ensemble) avec len(multiset) dés"""
+    arrangements = factorial(len(multiset))
+    for count in Counter(multiset).values():
+        arrangements //= factorial(count)
+    return arrangements / 6 ** len(multiset)
+
+
+class EndgameSolver:
+    """
+    Solveur exact du dernier tour
+
+    Pendant le dernier tour, chaque joueur restant n'a plus qu'un tour à jouer : la seule
+    question est de cumuler au moins un score donné avant de faire Farkle. La probabilité
+    optimale de l'atteindre ne dépend que du déficit restant et du nombre de dés à lancer ;
+    elle est calculée exactement (énumération de tous les lancés, sans échantillonnage) et
+    mémorisée dans une table (déficit, dés) remplie du plus petit au plus grand déficit.
+    """
+
+    def __init__(self, rules: FarkleRules = None):
+        self.rules = rules or DEFAULT_RULES
+
+        # Tous les scores sont multiples de ce pas : un déficit est arrondi au pas supérieur
+        self.step = self.rules.score_step()
+
+        # Pour chaque nombre de dés, les lancés regroupés par options utiles (score, dés restants)
+        self.roll_options = {num_dice: self._group_rolls(num_dice) for num_dice in range(1, 7)}
+        self.table: List[List[float]] = []
+
+    def _group_rolls(self, num_dice: int) -> List[Tuple[float, Tuple[Tuple[int, int], ...]]]:
+        """
+        Regroupe les lancés de num_dice dés ayant les mêmes options
+
+        Pour un même nombre de dés restants, seule la combinaison au plus haut score est utile :
+        la probabilité de gagner décroît avec le déficit.
+        """
+        groups: Dict[tuple, float] = {}
+        for multiset in all_multisets(num_dice):
+            if len(multiset) != num_dice:
+                continue
+            best_by_dice: Dict[int, int] = {}
+            for score, _, next_dice in self.rules.lookup_keeps(multiset):
+                best_by_dice[next_dice] = max(best_by_dice.get(next_dice, 0), score // self.step)
+            options = tuple(sorted(best_by_dice.items(), key=lambda item: (-item[1], item[0])))
+            groups[options] = groups.get(options, 0.0) + roll_probability(multiset)
+        # Les Farkle (aucune option) ne rapportent rien
+        return [(probability, tuple((steps, next_dice) for next_dice, steps in options))
+                for options, probability in groups.items() if options]
+
+    def _extend(self, max_steps: int):
+        """Remplit la table jusqu'au déficit max_steps * step"""
+        table = self.table
+        for steps in range(len(table), max_steps + 1):
+            row = [1.0] + [0.0] * 6
+            for num_dice in range(1, 7):
+                probability = 0.0
+                for roll_probability_, options in self.roll_options[num_dice]:
+                    best = 0.0
+                    for score_steps, next_dice in options:
+                        value = 1.0 if score_steps >= steps else table[steps - score_steps][next_dice]
+                        if value > best:
+                            best = value
+                            if best == 1.0:
+                                break
+                    probability += roll_probability_ * best
+                row[num_dice] = probability
+            table.append(row)
+
+    def deficit_steps(self, deficit: int) -> int:
+        """Déficit exprimé en pas de score, arrondi au supérieur (0 si déjà atteint)"""
+        if deficit <= 0:
+            return 0
+        return -(-deficit // self.step)
+
+    def win_probability(self, deficit: int, dice: int) -> float:
+        """
+        Probabilité optimale de cumuler au moins deficit points avant un Farkle
+
+        Args:
+            deficit: Points encore nécessaires (0 ou moins : il suffit de ne pas faire Farkle au lancé imposé)
+            dice: Nombre de dés à lancer (0 = hot dice, 6 dés)
+        """
+        steps = self.deficit_steps(deficit)
+        if steps >= len(self.table):
+            self._extend(steps)
+        return self.table[steps][dice or 6]
+
+    def best_keep(self, deficit: int, roll: List[int]) -> Tuple[int, float]:
+        """
+        Meilleure combinaison à garder pour combler un déficit, après un lancé
+
+        Returns:
+            Tuple (index dans get_possible_actions, probabilité de gagner en la gardant)
+        """
+        best_index, best_probability = 0, -1.0
+        for index, (score, _, next_dice) in enumerate(self.rules.lookup_keeps(roll)):
+            remaining = deficit - score
+            if remaining <= 0:
+                return index, 1.0
+            probability = self.win_probability(remaining, next_dice)
+            if probability > best_probability:
+                best_index, best_probability = index, probability
+        return best_index, max(best_probability, 0.0)
+
+    def required_turn_score(self, game) -> int:
+        """
+        Score minimum que le joueur actuel doit garder ce tour pour passer en tête
+
+        En cas d'égalité, le gagnant est le premier joueur à ce score dans l'ordre des sièges.
+        Un joueur pas encore sur le plateau doit aussi atteindre le seuil d'entrée.
+        """
+        current_index = game.current_player_index
+        current_player = game.players[current_index]
+        leader_score, leader_index = max((player.total_score, -index)
+                                         for index, player in enumerate(game.players) if index != current_index)
+        needed = leader_score - current_player.total_score + (0 if current_index < -leader_index else 1)
+        if needed <= 0:
+            return 0
+        if not current_player.is_on_board:
+            needed = max(needed, game.rules.entry_threshold)
+        return needed
+
+    def analyze(self, game) -> Dict[str, Any]:
+        """
+        Analyse la position du joueur actuel pendant le dernier tour (avant son prochain lancé)
+
+        Le score hérité (piggy-back) est compté s'il sera récupéré au prochain lancé,
+        c'est-à-dire si le joueur est sur le plateau.
+        """
+        current_player = game.get_current_player()
+        required = self.required_turn_score(game)
+        inherited = game.turn_score_to_transfer if current_player.is_on_board else 0
+        deficit = required - current_player.turn_score - inherited
+        dice = game.get_remaining_dice_count()
+
+        if required == 0:
+            probability = 1.0
+        elif deficit <= 0 and game.can_stop_turn():
+            probability = 1.0
+        else:
+            probability = self.win_probability(deficit, dice)
+
+        return {
+            'required_turn_score': required,
+            'deficit': max(deficit, 0),
+            'dice': dice or 6,
+            'inherited_score': inherited,
+            'is_on_board': current_player.is_on_board,
+            'win_probability': probability,
+        }
+
+
+def get_solver(rules: FarkleRules = None) -> EndgameSolver:
+    """Retourne le solveur (mémorisé) correspondant au barème des règles"""
+    rules = rules or DEFAULT_RULES
+    key = rules.scoring_key()
+    if key not in _SOLVERS:
+        _SOLVERS[key] = EndgameSolver(rules)
+    return _SOLVERS[key]
+
+
+class EndgameStrategy(Strategy):
+    """
+    Joue le dernier tour de façon optimale avec le solveur exact, et délègue
+    le reste de la partie à une autre stratégie
+    """
+
+    def __init__(self, fallback: Strategy, rules: FarkleRules = None):
+        self.fallback = fallback
+        self.solver = get_solver(rules)
+        self.name = f'endgame+{fallback.name}'
+
+    def decide(self, state: DecisionState) -> Decision:
+        return self.fallback.decide(state)
+
+    def choose(self, game, inherited_score: int = 0) -> Decision:
+        if not game.final_round_started:
+            return self.fallback.choose(game, inherited_score)
+
+        current_player = game.get_current_player()
+        required = self.solver.required_turn_score(game)
+        deficit = required - current_player.turn_score
+        keep_index, _ = self.solver.best_keep(deficit, game.last_dice_roll)
+        score, _ = self.solver.rules.lookup_combinations(game.last_dice_roll)[keep_index]
+        # Stopper dès que le score nécessaire est atteint, le tour suivant n'existe pas
+        return keep_index, current_player.turn_score + score >= required
@@ -0,0 +1,359 @@
+import json
+import struct
+from multiprocessing import Pool, shared_memory
+from typing import Any, Callable, Dict, List, Tuple
+import numpy as np
+from model.rules import FarkleRules, DEFAULT_RULES, all_multisets
+from bot.endgame import EndgameStrategy, get_solver, roll_probability
+from bot.strategy import Decision, DecisionState, Strategy
+
+
+MAGIC = b'FKFG'
+FORMAT_VERSION = 1
+
+# Itérations de politique au plus par paire d'états couplés par le Farkle
+MAX_POLICY_ITERATIONS = 50
+TOLERANCE = 1e-12
+
+# Noyau et table partagée d'un processus de travail (voir _init_worker)
+_WORKER: Dict[str, Any] = {}
+
+
+class LevelKernel:
+    """
+    Calcul vectorisé des états d'un niveau de score
+
+    Un état est (siège, mon score, score adverse, score du tour, dés à lancer), scores en pas
+    de score, juste avant un lancé. Être sur le plateau équivaut à avoir un score non nul, et
+    le score à transférer laissé par l'adversaire est déjà compté dans le score du tour
+    (récupéré au premier lancé par un joueur sur le plateau). Le siège ne sert qu'à départager
+    une égalité à la fin du dernier tour (le premier siège l'emporte, comme dans FarkleGame).
+
+    Après un stop, la partie passe à un niveau (somme des deux scores) strictement supérieur ;
+    après un Farkle, elle passe à l'état symétrique du même niveau (adversaire au lancé, 6 dés).
+    Les niveaux sont donc calculés du plus haut au plus bas, et dans un niveau chaque paire
+    d'états symétriques est résolue exactement par itération de politique : à politique fixée,
+    la valeur est affine en la valeur du Farkle, et le point fixe de la paire se calcule directement.
+    """
+
+    def __init__(self, rules: FarkleRules = None):
+        self.rules = rules or DEFAULT_RULES
+        self.step = self.rules.score_step()
+        self.size = -(-self.rules.target_score // self.step)  # Scores (et scores de tour) modélisés
+        self.entry = -(-self.rules.entry_threshold // self.step)
+        self.piggy_back = self.rules.piggy_back_enabled
+
+        # Lancés regroupés par options (pas de score, dés restants) : mêmes options, même valeur
+        groups: Dict[Tuple[int, tuple], float] = {}
+        self.farkle = np.zeros(6)
+        for multiset in all_multisets():
+            num_dice = len(multiset)
+            options = tuple(sorted({(score // self.step, next_dice)
+                                    for score, _, next_dice in self.rules.lookup_keeps(multiset)}))
+            if options:
+                groups[(num_dice, options)] = groups.get((num_dice, options), 0.0) + roll_probability(multiset)
+            else:
+                self.farkle[num_dice - 1] += roll_probability(multiset)
+
+        option_steps, option_dice, group_starts = [], [], []
+        self.group_matrix = np.zeros((len(groups), 6))  # Probabilité de chaque groupe, par nombre de dés lancés
+        for group, ((num_dice, options), probability) in enumerate(groups.items()):
+            group_starts.append(len(option_steps))
+            self.group_matrix[group, num_dice - 1] = probability
+            for score_steps, next_dice in options:
+                option_steps.append(score_steps)
+                option_dice.append(next_dice - 1)
+        self.option_steps = np.array(option_steps)
+        self.option_dice = np.array(option_dice)
+        self.group_starts = np.array(group_starts)
+        self.option_group = np.repeat(np.arange(len(groups)), np.diff(group_starts + [len(option_steps)]))
+        self.width = self.size + int(self.option_steps.max())  # Scores de tour atteignables en un lancé
+
+        # Dernier tour : probabilité de cumuler un déficit (en pas) avant un Farkle, par dés
+        solver = get_solver(self.rules)
+        max_deficit = 2 * self.size + self.width + self.entry + 1
+        solver.win_probability(max_deficit * self.step, 6)
+        self.endgame = np.array(solver.table)[:max_deficit + 1, 1:]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Forme de la table : siège, mon score, score adverse, score du tour, dés (1-6)"""
+        return 2, self.size, self.size, self.size, 6
+
+    def stop_values(self, table: np.ndarray, seat, me, opponent, turn, dice):
+        """
+        Probabilité de gagner en stoppant avec le score de tour turn et dice dés laissés (0-based)
+
+        Tous les arguments sont des tableaux compatibles par diffusion. L'adversaire hérite du
+        score du tour s'il est sur le plateau ; si le stop atteint le score cible, il ne lui
+        reste que le dernier tour, évalué par le solveur exact du dernier tour.
+        """
+        banked = me + turn
+        inherited = np.where((opponent > 0) & self.piggy_back, turn, 0)
+        following = 1.0 - table[1 - seat, opponent, np.minimum(banked, self.size - 1),
+                                np.minimum(inherited, self.size - 1), dice]
+        # Le premier siège gagne les égalités : l'adversaire au second siège doit faire mieux
+        required = banked - opponent + (seat == 0)
+        required = np.where(opponent > 0, required, np.maximum(required, self.entry))
+        deficit = np.clip(required - inherited, 0, len(self.endgame) - 1)
+        final = 1.0 - self.endgame[deficit, dice]
+        return np.where(banked >= self.size, final, following)
+
+    def solve_units(self, table: np.ndarray, level: int, units: List[int]):
+        """
+        Calcule les paires d'états (0, a, level - a) / (1, level - a, a) pour a dans units
+
+        Les niveaux supérieurs doivent être calculés ; les valeurs sont écrites dans table.
+        """
+        units = np.asarray(units, dtype=np.int64)
+        count = len(units)
+        seat = np.concatenate([np.zeros(count, dtype=np.int64), np.ones(count, dtype=np.int64)])
+        me = np.concatenate([units, level - units])
+        opponent = np.concatenate([level - units, units])
+        partner = np.concatenate([np.arange(count) + count, np.arange(count)])
+        states = len(seat)
+
+        turns = np.arange(self.width)
+        stop = self.stop_values(table, seat[:, None, None], me[:, None, None], opponent[:, None, None],
+                                turns[None, :, None], np.arange(6)[None, None, :])
+        # Un joueur pas encore sur le plateau ne peut stopper qu'à partir du seuil d'entrée
+        allowed = (me[:, None] > 0) | (turns[None, :] >= self.entry)
+
+        steps, dice, starts, group = self.option_steps, self.option_dice, self.group_starts, self.option_group
+        farkle_value = np.full(states, 0.5)
+        for _ in range(MAX_POLICY_ITERATIONS):
+            # Valeur affine en la valeur du Farkle : alpha + beta * farkle_value
+            alpha = np.zeros((states, self.width, 6))
+            beta = np.zeros((states, self.width, 6))
+            for turn in range(self.size - 1, -1, -1):
+                columns = turn + steps
+                # Au-delà du score de tour maximum modélisé, le joueur stoppe
+                keep_rolling = columns < self.size
+                continue_alpha = alpha[:, columns, dice]
+                continue_beta = beta[:, columns, dice]
+                continue_value = np.where(keep_rolling, continue_alpha + continue_beta * farkle_value[:, None],
+                                          -np.inf)
+                stop_value = stop[:, columns, dice]
+                stopping = allowed[:, columns] & (stop_value >= continue_value)
+                value = np.where(stopping, stop_value, continue_value)
+                value_beta = np.where(stopping, 0.0, continue_beta)
+
+                best = np.maximum.reduceat(value, starts, axis=1)
+                best_beta = np.maximum.reduceat(np.where(value == best[:, group], value_beta, -1.0), starts, axis=1)
+                row_beta = best_beta @ self.group_matrix + self.farkle
+                beta[:, turn] = row_beta
+                alpha[:, turn] = best @ self.group_matrix + (self.farkle - row_beta) * farkle_value[:, None]
+
+            # Point fixe de la paire : f = 1 - V_partenaire(début de tour, 6 dés)
+            own_alpha, own_beta = alpha[:, 0, 5], beta[:, 0, 5]
+            other_alpha, other_beta = own_alpha[partner], own_beta[partner]
+            updated = (1.0 - other_alpha - other_beta * (1.0 - own_alpha)) / (1.0 - other_beta * own_beta)
+            converged = np.max(np.abs(updated - farkle_value)) < TOLERANCE
+            farkle_value = updated
+            if converged:
+                break
+
+        values = alpha[:, :self.size] + beta[:, :self.size] * farkle_value[:, None, None]
+        table[seat, me, opponent] = values.astype(table.dtype)
+
+
+def _init_worker(shm_name: str, shape: Tuple[int, ...], rules: FarkleRules):
+    """Initialise un processus de travail : noyau compilé et vue sur la table partagée"""
+    memory = shared_memory.SharedMemory(name=shm_name)
+    _WORKER['memory'] = memory
+    _WORKER['table'] = np.ndarray(shape, dtype=np.float32, buffer=memory.buf)
+    _WORKER['kernel'] = LevelKernel(rules)
+
+
+def _solve_chunk(task: Tuple[int, List[int]]) -> int:
+    level, units = task
+    _WORKER['kernel'].solve_units(_WORKER['table'], level, units)
+    return len(units)
+
+
+class FullGameSolver:
+    """
+    Probabilité de gagner optimale d'une partie à deux joueurs, dans toutes les positions
+
+    La table couvre (siège, mon score, score adverse, score du tour, dés à lancer) juste avant
+    un lancé, hors dernier tour (résolu exactement par le solveur du dernier tour). Elle est
+    calculée par fronts de niveaux de score (somme des deux scores, du plus haut au plus bas) :
+    les paires d'états d'un niveau sont indépendantes et réparties entre processus de travail
+    qui écrivent dans une même table en mémoire partagée.
+
+    Le score du tour est limité au score cible : un joueur qui l'atteint en un seul tour stoppe.
+    """
+
+    def __init__(self, rules: FarkleRules = None, table: np.ndarray = None):
+        self.rules = rules or DEFAULT_RULES
+        self.kernel = LevelKernel(self.rules)
+        self.step = self.kernel.step
+        self.size = self.kernel.size
+        if table is not None and table.shape != self.kernel.shape:
+            raise ValueError(f"Forme de table invalide: {table.shape} (attendu {self.kernel.shape})")
+        self.table = table
+
+    def levels(self) -> List[Tuple[int, List[int]]]:
+        """Niveaux de score dans l'ordre de calcul, avec leurs paires d'états"""
+        return [(level, list(range(max(0, level - self.size + 1), min(level, self.size - 1) + 1)))
+                for level in range(2 * self.size - 2, -1, -1)]
+
+    def solve(self, workers: int = 1, chunk_size: int = 16,
+              progress: Callable[[int, int], None] = None) -> 'FullGameSolver':
+        """
+        Calcule toute la table
+
+        Args:
+            workers: Nombre de processus (1 = calcul dans le processus courant)
+            chunk_size: Paires d'états par tâche d'un processus
+            progress: Appelée avec (niveaux calculés, nombre de niveaux) après chaque niveau
+        """
+        shape = self.kernel.shape
+        levels = self.levels()
+        if workers <= 1:
+            self.table = np.zeros(shape, dtype=np.float32)
+            for done, (level, units) in enumerate(levels, 1):
+                self.kernel.solve_units(self.table, level, units)
+                if progress:
+                    progress(done, len(levels))
+            return self
+
+        memory = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 4)
+        try:
+            table = np.ndarray(shape, dtype=np.float32, buffer=memory.buf)
+            table[:] = 0.0
+            with Pool(workers, initializer=_init_worker, initargs=(memory.name, shape, self.rules)) as pool:
+                for done, (level, units) in enumerate(levels, 1):
+                    # Front d'onde : un niveau ne commence qu'une fois le précédent entièrement écrit
+                    size = max(1, min(chunk_size, -(-len(units) // workers)))
+                    pool.map(_solve_chunk, [(level, units[start:start + size])
+                                            for start in range(0, len(units), size)])
+                    if progress:
+                        progress(done, len(levels))
+            self.table = np.array(table)
+            del table
+        finally:
+            memory.close()
+            memory.unlink()
+        return self
+
+    def _require_table(self):
+        if self.table is None:
+            raise ValueError("Table non calculée : appelez solve() ou chargez une table")
+
+    def win_probability(self, my_score: int, opponent_score: int, turn_score: int = 0, dice: int = 6,
+                        first_seat: bool = True) -> float:
+        """
+        Probabilité de gagner du joueur qui va lancer les dés, en jouant de façon optimale
+
+        Args:
+            my_score: Score total du joueur (0 = pas encore sur le plateau)
+            opponent_score: Score total de l'adversaire
+            turn_score: Score du tour, score hérité compris s'il est récupéré
+            dice: Dés à lancer (0 = hot dice, 6 dés)
+            first_seat: Le joueur est au premier siège (il gagne les égalités)
+        """
+        self._require_table()
+        me, opponent = my_score // self.step, opponent_score // self.step
+        if me >= self.size or opponent >= self.size:
+            raise ValueError("Dernier tour en cours : utilisez le solveur du dernier tour")
+        turn = min(turn_score // self.step, self.size - 1)
+        return float(self.table[0 if first_seat else 1, me, opponent, turn, (dice or 6) - 1])
+
+    def _position(self, game) -> Tuple[int, int, int]:
+        if len(game.players) != 2:
+            raise ValueError("Le solveur de partie complète ne traite que les parties à deux joueurs")
+        if game.final_round_started:
+            raise ValueError("Dernier tour en cours : utilisez le solveur du dernier tour")
+        current = game.get_current_player()
+        opponent = game.players[1 - game.current_player_index]
+        return game.current_player_index, current.total_score // self.step, opponent.total_score // self.step
+
+    def analyze(self, game) -> Dict[str, Any]:
+        """Probabilité de gagner du joueur actuel avant son prochain lancé (score hérité compris)"""
+        self._position(game)
+        current = game.get_current_player()
+        inherited = game.turn_score_to_transfer if current.is_on_board and self.rules.piggy_back_enabled else 0
+        turn_score = current.turn_score + inherited
+        dice = game.get_remaining_dice_count()
+        return {
+            'turn_score': turn_score,
+            'dice': dice or 6,
+            'win_probability': self.win_probability(current.total_score,
+                                                    game.players[1 - game.current_player_index].total_score,
+                                                    turn_score, dice, game.current_player_index == 0),
+        }
+
+    def best_decision(self, game) -> Tuple[Decision, float]:
+        """
+        Meilleure décision après un lancé (combinaison gardée, stop) et probabilité de gagner associée
+        """
+        self._require_table()
+        seat, me, opponent = self._position(game)
+        turn = game.get_current_player().turn_score // self.step
+        roll = game.last_dice_roll
+        best, best_value = (0, False), -1.0
+        for index, (score, _, next_dice) in enumerate(self.rules.lookup_keeps(roll)):
+            after = turn + score // self.step
+            dice = next_dice - 1
+            if after < self.size:
+                value = float(self.table[seat, me, opponent, after, dice])
+                if value > best_value:
+                    best, best_value = (index, False), value
+            if me > 0 or after >= self.kernel.entry:
+                value = float(self.kernel.stop_values(self.table, seat, me, opponent, after, dice))
+                if value > best_value:
+                    best, best_value = (index, True), value
+        return best, best_value
+
+    def save(self, filepath: str) -> str:
+        """Sauvegarde la table (en-tête JSON + probabilités float32)"""
+        self._require_table()
+        header = json.dumps({
+            'version': FORMAT_VERSION,
+            'rules': self.rules.to_dict(),
+            'shape': list(self.table.shape),
+        }).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            f.write(np.ascontiguousarray(self.table, dtype='<f4').tobytes())
+        return filepath
+
+    @classmethod
+    def load(cls, filepath: str) -> 'FullGameSolver':
+        """Charge une table sauvegardée avec save() (projetée en mémoire, sans lecture complète)"""
+        with open(filepath, 'rb') as f:
+            if f.read(4) != MAGIC:
+                raise ValueError(f"Fichier de table invalide: {filepath}")
+            header_size, = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_size).decode('utf-8'))
+        table = np.memmap(filepath, dtype='<f4', mode='r', offset=8 + header_size, shape=tuple(header['shape']))
+        return cls(FarkleRules.from_dict(header['rules']), table)
+
+
+class FullGameStrategy(Strategy):
+    """
+    Joue les parties à deux joueurs de façon optimale avec la table du solveur de partie complète
+
+    Le dernier tour est joué par le solveur exact du dernier tour ; les autres parties
+    (plus de deux joueurs) sont déléguées à la stratégie de repli.
+    """
+
+    def __init__(self, solver: FullGameSolver, fallback: Strategy):
+        self.solver = solver
+        self.fallback = fallback
+        self.endgame = EndgameStrategy(fallback, solver.rules)
+        self.name = f'full-game+{fallback.name}'
+
+    def decide(self, state: DecisionState) -> Decision:
+        return self.fallback.decide(state)
+
+    def choose(self, game, inherited_score: int = 0) -> Decision:
+        if game.final_round_started:
+            return self.endgame.choose(game, inherited_score)
+        if len(game.players) != 2:
+            return self.fallback.choose(game, inherited_score)
+        decision, _ = self.solver.best_decision(game)
+        return decision
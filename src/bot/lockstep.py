@@ -0,0 +1,224 @@
+from typing import Dict, List, Sequence
+import numpy as np
+from model.rules import FarkleRules, DEFAULT_RULES
+from bot.strategy import MULTISETS, TableStrategy, UNKNOWN
+
+
+# Code d'un lancé à partir du nombre de dés par face : somme des comptes * 7^(face - 1)
+POWERS_OF_7 = 7 ** np.arange(6, dtype=np.int64)
+# Contribution de chaque dé au code (face 0 = dé non lancé)
+FACE_CODES = np.concatenate([[0], POWERS_OF_7])
+
+
+def _compile_tables(rules: FarkleRules):
+    """
+    Tables numpy du barème : multi-ensemble d'un code de lancé, et pour chaque multi-ensemble
+    le score et le nombre de dés de chaque combinaison (dans l'ordre de get_possible_actions)
+    """
+    code_to_multiset = np.zeros(7 ** 6, dtype=np.int32)
+    max_options = max(len(rules.lookup_combinations(multiset)) for multiset in MULTISETS)
+    num_options = np.zeros(len(MULTISETS), dtype=np.int64)
+    option_score = np.zeros((len(MULTISETS), max(max_options, 1)), dtype=np.int64)
+    option_dice = np.zeros((len(MULTISETS), max(max_options, 1)), dtype=np.int64)
+
+    for index, multiset in enumerate(MULTISETS):
+        code = sum(POWERS_OF_7[value - 1] for value in multiset)
+        code_to_multiset[code] = index
+        combinations = rules.lookup_combinations(multiset)
+        num_options[index] = len(combinations)
+        for option, (score, combo) in enumerate(combinations):
+            option_score[index, option] = score
+            option_dice[index, option] = len(combo)
+
+    return code_to_multiset, num_options, option_score, option_dice
+
+
+class LockstepEngine:
+    """
+    Moteur vectorisé : K parties de P joueurs avancent ensemble, une décision à la fois
+
+    L'état de chaque partie est stocké dans des tableaux numpy (scores, plateau, dés partagés,
+    score à transférer, joueur actuel, dernier tour). Un pas lance les dés de toutes les parties
+    en cours, les score par table, applique les décisions des stratégies en table puis gère
+    stop, Farkle, piggy-back, hot dice et dernier tour exactement comme FarkleGame.
+    """
+
+    def __init__(self, num_games: int, num_players: int, strategies: Sequence[TableStrategy],
+                 seed: int = None, rules: FarkleRules = None, max_turns: int = 1000):
+        if not 2 <= num_players <= 8:
+            raise ValueError("Le nombre de joueurs doit être entre 2 et 8")
+        if len(strategies) != num_players:
+            raise ValueError("Il faut une stratégie par joueur")
+        for strategy in strategies:
+            if not isinstance(strategy, TableStrategy):
+                raise TypeError("Le moteur vectorisé n'accepte que des stratégies en table (TableStrategy)")
+
+        self.rules = rules or DEFAULT_RULES
+        self.num_games = num_games
+        self.num_players = num_players
+        self.strategies = list(strategies)
+        self.max_turns = max_turns
+        self.rng = np.random.default_rng(seed)
+        (self.code_to_multiset, self.num_options,
+         self.option_score, self.option_dice) = _compile_tables(self.rules)
+
+        self.scores = np.zeros((num_games, num_players), dtype=np.int64)
+        self.on_board = np.zeros((num_games, num_players), dtype=bool)
+        self.turn_score = np.zeros(num_games, dtype=np.int64)
+        self.inherited = np.zeros(num_games, dtype=np.int64)  # Score hérité récupéré ce tour
+        self.dice_left = np.full(num_games, 6, dtype=np.int64)  # Dés partagés restants (0 = hot dice)
+        self.transfer = np.zeros(num_games, dtype=np.int64)  # Score à transférer (piggy-back)
+        self.current = np.zeros(num_games, dtype=np.int64)
+        self.turn_count = np.ones(num_games, dtype=np.int64)
+        self.final_started = np.zeros(num_games, dtype=bool)
+        self.final_remaining = np.zeros(num_games, dtype=np.int64)
+        self.game_over = np.zeros(num_games, dtype=bool)
+        self.winner = np.full(num_games, -1, dtype=np.int64)
+        self.steps = 0
+
+    def roll(self, games: np.ndarray, num_dice: np.ndarray) -> np.ndarray:
+        """Lance num_dice dés pour chaque partie de games (faces 1-6, 0 au-delà du nombre de dés)"""
+        faces = self.rng.integers(1, 7, size=(len(games), 6))
+        faces[np.arange(6) >= num_dice[:, None]] = 0
+        return faces
+
+    def _decide(self, games: np.ndarray, seats: np.ndarray, multisets: np.ndarray, turn: np.ndarray,
+                on_board: np.ndarray, inherited: np.ndarray):
+        """Décisions (combinaison gardée, stop) lues dans les tables des stratégies"""
+        scores = self.scores[games]
+        others = scores.copy()
+        others[np.arange(len(games)), seats] = np.iinfo(np.int64).min
+        gap = scores[np.arange(len(games)), seats] - others.max(axis=1)
+        final_round = self.final_started[games]
+
+        codes = np.zeros(len(games), dtype=np.int64)
+        groups: Dict[int, List[int]] = {}
+        for seat, strategy in enumerate(self.strategies):
+            groups.setdefault(id(strategy), []).append(seat)
+
+        for seat_list in groups.values():
+            strategy = self.strategies[seat_list[0]]
+            rows = np.flatnonzero(np.isin(seats, seat_list))
+            if rows.size == 0:
+                continue
+            encoder = strategy.encoder
+            turn_bucket = np.minimum(turn[rows] // encoder.turn_step, encoder.turn_buckets - 1)
+            transfer_bucket = np.where(inherited[rows] <= 0, 0,
+                                       np.minimum(1 + inherited[rows] // encoder.transfer_step,
+                                                  encoder.transfer_buckets - 1))
+            gap_bucket = np.clip(gap[rows] // encoder.gap_step + encoder.gap_offset, 0, encoder.gap_buckets - 1)
+            index = multisets[rows] * encoder.turn_buckets + turn_bucket
+            index = index * 2 + on_board[rows]
+            index = index * encoder.transfer_buckets + transfer_bucket
+            index = index * encoder.gap_buckets + gap_bucket
+            index = index * 2 + final_round[rows]
+
+            table = np.frombuffer(strategy.table, dtype=np.uint8)
+            row_codes = table[index].astype(np.int64)
+            unknown = row_codes == UNKNOWN
+            if unknown.any():
+                # États jamais vus : la stratégie source est appelée une fois par état
+                filled = {int(state): strategy._fill(int(state)) for state in np.unique(index[unknown])}
+                row_codes[unknown] = [filled[int(state)] for state in index[unknown]]
+            codes[rows] = row_codes
+
+        return codes >> 1, (codes & 1).astype(bool)
+
+    def step(self) -> int:
+        """
+        Avance toutes les parties en cours d'une décision (un lancé)
+
+        Returns:
+            Nombre de parties qui ont joué ce pas
+        """
+        games = np.flatnonzero(~self.game_over & (self.turn_count <= self.max_turns))
+        if games.size == 0:
+            return 0
+        self.steps += 1
+        seats = self.current[games]
+
+        # Hot dice : tous les dés sont relancés
+        num_dice = self.dice_left[games]
+        num_dice = np.where(num_dice == 0, 6, num_dice)
+
+        # Piggy-back : le score hérité n'est récupéré que par un joueur sur le plateau
+        on_board = self.on_board[games, seats]
+        transfer = self.transfer[games]
+        gained = np.where(on_board, transfer, 0)
+        turn = self.turn_score[games] + gained
+        inherited = np.where(transfer > 0, gained, self.inherited[games])
+        self.transfer[games] = 0
+
+        faces = self.roll(games, num_dice)
+        multisets = self.code_to_multiset[FACE_CODES[faces].sum(axis=1)]
+        num_options = self.num_options[multisets]
+        farkle = num_options == 0
+
+        keep = np.zeros(len(games), dtype=np.int64)
+        stop = np.zeros(len(games), dtype=bool)
+        playing = np.flatnonzero(~farkle)
+        if playing.size:
+            keep[playing], stop[playing] = self._decide(games[playing], seats[playing], multisets[playing],
+                                                        turn[playing], on_board[playing], inherited[playing])
+        # Comme FarkleGame.apply_decision : une combinaison inexistante est une erreur de la table
+        invalid = playing[keep[playing] >= num_options[playing]]
+        if invalid.size:
+            raise ValueError("Combinaisons invalides dans les décisions des tables : "
+                             + ', '.join(f"partie {int(games[index])} : n° {int(keep[index])} sur "
+                                         f"{int(num_options[index])}" for index in invalid[:10])
+                             + (f" (et {invalid.size - 10} autres)" if invalid.size > 10 else ''))
+
+        turn_after = turn + self.option_score[multisets, keep]
+        dice_after = num_dice - self.option_dice[multisets, keep]
+        can_stop = (~farkle & stop & (turn_after > 0)
+                    & (on_board | (turn_after >= self.rules.entry_threshold)))
+        continuing = ~farkle & ~can_stop
+
+        # Le joueur relance : le tour continue avec les dés restants
+        kept = games[continuing]
+        self.turn_score[kept] = turn_after[continuing]
+        self.inherited[kept] = inherited[continuing]
+        self.dice_left[kept] = dice_after[continuing]
+
+        # Stop : le score est gardé et transféré au joueur suivant, les dés restants sont partagés
+        stopped = games[can_stop]
+        stopped_seats = seats[can_stop]
+        stopped_turn = turn_after[can_stop]
+        self.scores[stopped, stopped_seats] += stopped_turn
+        self.on_board[stopped, stopped_seats] |= stopped_turn >= self.rules.entry_threshold
+        trigger = ~self.final_started[stopped] & (self.scores[stopped, stopped_seats] >= self.rules.target_score)
+        self.final_started[stopped[trigger]] = True
+        self.final_remaining[stopped[trigger]] = self.num_players - 1
+        self.transfer[stopped] = stopped_turn if self.rules.piggy_back_enabled else 0
+        self.dice_left[stopped] = dice_after[can_stop]
+
+        # Farkle : le tour et le score hérité sont perdus, les 6 dés sont remis en jeu
+        farkled = games[farkle]
+        self.transfer[farkled] = 0
+        self.dice_left[farkled] = 6
+
+        self._end_turn(np.concatenate([stopped, farkled]))
+        return len(games)
+
+    def _end_turn(self, games: np.ndarray):
+        """Fin de tour : fin de partie à l'issue du dernier tour, sinon joueur suivant"""
+        self.turn_score[games] = 0
+        self.inherited[games] = 0
+
+        over = self.final_started[games] & (self.final_remaining[games] <= 0)
+        finished = games[over]
+        self.game_over[finished] = True
+        # Le gagnant est le premier joueur au score le plus élevé, comme max() dans FarkleGame
+        self.winner[finished] = self.scores[finished].argmax(axis=1)
+
+        following = games[~over]
+        in_final = self.final_started[following] & (self.final_remaining[following] > 0)
+        self.final_remaining[following[in_final]] -= 1
+        self.current[following] = (self.current[following] + 1) % self.num_players
+        self.turn_count[following] += self.current[following] == 0
+
+    def run(self) -> 'LockstepEngine':
+        """Avance toutes les parties jusqu'à leur fin"""
+        while self.step():
+            pass
+        return self
@@ -0,0 +1,400 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from model.rules import FarkleRules, DEFAULT_RULES
+from bot.strategy import Decision, DecisionState, Strategy
+
+
+FACES = (1, 2, 3, 4, 5, 6)
+
+# Politique de simulation : score de tour à partir duquel stopper, selon les dés restants (0 = hot dice)
+ROLLOUT_STOP_AT = {0: 2500, 1: 300, 2: 300, 3: 400, 4: 600, 5: 2000, 6: 2500}
+
+
+class SimState:
+    """
+    État compact d'une partie pour la recherche, avec les transitions exactes du moteur
+
+    Dés partagés (dice_left), hot dice, Farkle, seuil d'entrée, piggy-back et dernier tour
+    sont reproduits comme dans FarkleGame ; les dés mis de côté ne comptent que par leur nombre.
+    """
+
+    __slots__ = ('rules', 'scores', 'on_board', 'current', 'turn_score', 'dice_left', 'transfer',
+                 'final_started', 'final_remaining', 'turn_count', 'game_over', 'winner', 'roll')
+
+    def __init__(self, rules: FarkleRules, scores: List[int], on_board: List[bool], current: int = 0,
+                 turn_score: int = 0, dice_left: int = 6, transfer: int = 0, final_started: bool = False,
+                 final_remaining: int = 0, turn_count: int = 1, roll: Tuple[int, ...] = None):
+        self.rules = rules
+        self.scores = scores
+        self.on_board = on_board
+        self.current = current
+        self.turn_score = turn_score
+        self.dice_left = dice_left  # Dés à lancer (0 = hot dice) ; après un lancé, dés du lancé
+        self.transfer = transfer
+        self.final_started = final_started
+        self.final_remaining = final_remaining
+        self.turn_count = turn_count
+        self.game_over = False
+        self.winner = -1
+        self.roll = roll  # Lancé en attente de décision (None avant le lancé)
+
+    @classmethod
+    def from_game(cls, game) -> 'SimState':
+        """État de la partie, juste après un lancé du joueur actuel"""
+        current_player = game.get_current_player()
+        return cls(game.rules, [player.total_score for player in game.players],
+                   [player.is_on_board for player in game.players], game.current_player_index,
+                   current_player.turn_score, len(game.last_dice_roll), game.turn_score_to_transfer,
+                   game.final_round_started, game.final_round_players_remaining, game.turn_count,
+                   tuple(sorted(game.last_dice_roll)) or None)
+
+    def copy(self) -> 'SimState':
+        state = SimState.__new__(SimState)
+        state.rules = self.rules
+        state.scores = list(self.scores)
+        state.on_board = list(self.on_board)
+        state.current = self.current
+        state.turn_score = self.turn_score
+        state.dice_left = self.dice_left
+        state.transfer = self.transfer
+        state.final_started = self.final_started
+        state.final_remaining = self.final_remaining
+        state.turn_count = self.turn_count
+        state.game_over = self.game_over
+        state.winner = self.winner
+        state.roll = self.roll
+        return state
+
+    def key(self) -> tuple:
+        """Clé de l'état (table de transposition, réutilisation de l'arbre)"""
+        return (tuple(self.scores), tuple(self.on_board), self.current, self.turn_score, self.dice_left,
+                self.transfer, self.final_started, self.final_remaining, self.roll)
+
+    def apply_roll(self, roll: Tuple[int, ...]) -> bool:
+        """
+        Applique un lancé (multi-ensemble trié de dice_left dés, 6 après un hot dice)
+
+        Returns:
+            True si le lancé est un Farkle (le tour est alors terminé)
+        """
+        if self.transfer > 0:
+            # Le score hérité n'est récupéré que par un joueur sur le plateau
+            if self.on_board[self.current]:
+                self.turn_score += self.transfer
+            self.transfer = 0
+        self.dice_left = len(roll)
+        if not self.rules.lookup_combinations(roll):
+            self.turn_score = 0
+            self.dice_left = 6
+            self._end_turn()
+            return True
+        self.roll = roll
+        return False
+
+    def options(self) -> List[Decision]:
+        """
+        Décisions distinctes après le lancé : (index de combinaison, stop)
+
+        Deux combinaisons de même score utilisant autant de dés mènent au même état :
+        seule la première est proposée.
+        """
+        decisions = []
+        seen = set()
+        on_board = self.on_board[self.current]
+        for index, (score, combo) in enumerate(self.rules.lookup_combinations(self.roll)):
+            signature = (score, len(combo))
+            if signature in seen:
+                continue
+            seen.add(signature)
+            decisions.append((index, False))
+            turn_score = self.turn_score + score
+            if on_board or turn_score >= self.rules.entry_threshold:
+                decisions.append((index, True))
+        return decisions
+
+    def apply_decision(self, keep_index: int, stop: bool):
+        """Garde une combinaison du lancé, puis stoppe si demandé et autorisé"""
+        combinations = self.rules.lookup_combinations(self.roll)
+        if not 0 <= keep_index < len(combinations):
+            raise ValueError(f"Combinaison n° {keep_index} invalide : {len(combinations)} combinaison(s) possible(s)")
+        score, combo = combinations[keep_index]
+        self.turn_score += score
+        self.dice_left -= len(combo)
+        self.roll = None
+        current = self.current
+        if stop and (self.on_board[current] or self.turn_score >= self.rules.entry_threshold):
+            self.scores[current] += self.turn_score
+            if self.turn_score >= self.rules.entry_threshold:
+                self.on_board[current] = True
+            if not self.final_started and self.scores[current] >= self.rules.target_score:
+                self.final_started = True
+                self.final_remaining = len(self.scores) - 1
+            self.transfer = self.turn_score if self.rules.piggy_back_enabled else 0
+            self.turn_score = 0
+            self._end_turn()
+
+    def _end_turn(self):
+        if self.final_started and self.final_remaining <= 0:
+            self.game_over = True
+            # Comme max() dans FarkleGame : le premier joueur au score le plus élevé gagne
+            self.winner = self.scores.index(max(self.scores))
+            return
+        if self.final_started:
+            self.final_remaining -= 1
+        self.current = (self.current + 1) % len(self.scores)
+        if self.current == 0:
+            self.turn_count += 1
+
+    def random_roll(self, rng: random.Random) -> Tuple[int, ...]:
+        return tuple(sorted(rng.choices(FACES, k=self.dice_left or 6)))
+
+    def rollout_decision(self) -> Decision:
+        """Politique de simulation rapide : meilleure combinaison, stop selon les dés restants et l'écart"""
+        score, combo = self.rules.lookup_combinations(self.roll)[0]
+        current = self.current
+        turn_score = self.turn_score + score
+        if not self.on_board[current] and turn_score < self.rules.entry_threshold:
+            return 0, False
+        if self.final_started:
+            # Dernier tour : il faut dépasser le meilleur adversaire
+            best = max(score_ for seat, score_ in enumerate(self.scores) if seat != current)
+            return 0, self.scores[current] + turn_score > best
+        return 0, turn_score >= ROLLOUT_STOP_AT[self.dice_left - len(combo)]
+
+
+class Node:
+    """
+    Nœud de l'arbre de recherche
+
+    Un nœud de décision (lancé en attente) a pour enfants les décisions possibles ; un nœud
+    de hasard (dés à lancer) a pour enfants les lancés déjà tirés. Chaque nœud cumule le
+    nombre de victoires de chaque joueur dans les simulations qui l'ont traversé.
+    """
+
+    __slots__ = ('state', 'children', 'visits', 'wins', 'untried')
+
+    def __init__(self, state: SimState):
+        self.state = state
+        self.children: Dict[object, 'Node'] = {}
+        self.visits = 0
+        self.wins = [0.0] * len(state.scores)
+        self.untried: Optional[List[Decision]] = state.options() if state.roll is not None else None
+
+    @property
+    def is_decision(self) -> bool:
+        return self.state.roll is not None
+
+
+class MCTSSearch:
+    """
+    Recherche arborescente Monte Carlo sur l'état multi-joueurs complet
+
+    Chaque joueur maximise sa propre probabilité de victoire (UCT sur son taux de victoires) ;
+    les lancés sont tirés au hasard (arbre en boucle ouverte sur les lancés) et les simulations
+    vont jusqu'à la fin de la partie, piggy-back et dernier tour compris.
+    """
+
+    def __init__(self, rules: FarkleRules = None, exploration: float = 1.0, seed: int = None,
+                 max_rollout_turns: int = 200):
+        self.rules = rules or DEFAULT_RULES
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.max_rollout_turns = max_rollout_turns
+        self.nodes: Dict[tuple, Node] = {}  # Nœuds de décision de l'arbre courant, par état
+        self.root: Optional[Node] = None
+
+    def set_root(self, state: SimState) -> bool:
+        """
+        Place la racine sur l'état donné, en réutilisant le sous-arbre correspondant s'il existe
+
+        Returns:
+            True si un sous-arbre de la recherche précédente a été réutilisé
+        """
+        node = self.nodes.get(state.key())
+        reused = node is not None
+        self.root = node if reused else Node(state)
+        # Table de transposition limitée au nouvel arbre : le reste est libéré
+        self.nodes = {}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.is_decision:
+                self.nodes[node.state.key()] = node
+            stack.extend(node.children.values())
+        return reused
+
+    def search(self, deadline: float, max_iterations: int = None) -> int:
+        """
+        Itère jusqu'à l'échéance (time.perf_counter()), retourne le nombre de simulations
+
+        Une simulation n'est lancée que si la durée moyenne des précédentes tient avant l'échéance.
+        """
+        iterations = 0
+        start = now = time.perf_counter()
+        while max_iterations is None or iterations < max_iterations:
+            average = (now - start) / iterations if iterations else 0.0
+            if now + average >= deadline:
+                break
+            self.iterate()
+            iterations += 1
+            now = time.perf_counter()
+        return iterations
+
+    def iterate(self):
+        """Une simulation : sélection, expansion, simulation et rétropropagation"""
+        node = self.root
+        path = [node]
+        while not node.state.game_over:
+            if node.is_decision:
+                if node.untried:
+                    decision = node.untried.pop(self.rng.randrange(len(node.untried)))
+                    state = node.state.copy()
+                    state.apply_decision(*decision)
+                    child = Node(state)
+                    node.children[decision] = child
+                    path.append(child)
+                    node = child
+                    break
+                node = self._select(node)
+            else:
+                # Hasard : un lancé est tiré, le nœud correspondant est créé à sa première apparition
+                roll = node.state.random_roll(self.rng)
+                child = node.children.get(roll)
+                if child is None:
+                    state = node.state.copy()
+                    state.apply_roll(roll)
+                    child = Node(state)
+                    node.children[roll] = child
+                    if child.is_decision:
+                        self.nodes.setdefault(state.key(), child)
+                    path.append(child)
+                    node = child
+                    break
+                node = child
+            path.append(node)
+
+        winner = self.rollout(node.state)
+        for visited in path:
+            visited.visits += 1
+            visited.wins[winner] += 1.0
+
+    def _select(self, node: Node) -> Node:
+        """UCT du point de vue du joueur qui décide"""
+        player = node.state.current
+        log_visits = math.log(node.visits or 1)
+        best, best_value = None, -1.0
+        for child in node.children.values():
+            value = (child.wins[player] / child.visits
+                     + self.exploration * math.sqrt(log_visits / child.visits)) if child.visits else float('inf')
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+    def rollout(self, state: SimState) -> int:
+        """Joue la partie jusqu'au bout avec la politique rapide, retourne le siège du gagnant"""
+        if state.game_over:
+            return state.winner
+        state = state.copy()
+        rng = self.rng
+        limit = state.turn_count + self.max_rollout_turns
+        while not state.game_over:
+            if state.turn_count > limit:
+                return state.scores.index(max(state.scores))
+            if state.roll is None:
+                if state.apply_roll(state.random_roll(rng)):
+                    continue
+            state.apply_decision(*state.rollout_decision())
+        return state.winner
+
+    def root_statistics(self) -> Dict[Decision, Tuple[int, float]]:
+        """Pour chaque décision de la racine : (visites, victoires du joueur qui décide)"""
+        player = self.root.state.current
+        return {decision: (child.visits, child.wins[player]) for decision, child in self.root.children.items()}
+
+
+def _search_worker(state: SimState, budget: float, seed: int, exploration: float) -> Dict[Decision, Tuple[int, float]]:
+    """Recherche indépendante dans un processus de travail (parallélisation à la racine)"""
+    search = MCTSSearch(state.rules, exploration, seed)
+    search.set_root(state)
+    search.search(time.perf_counter() + budget)
+    return search.root_statistics()
+
+
+class MCTSStrategy(Strategy):
+    """
+    Bot MCTS à temps borné
+
+    Chaque décision dispose de time_budget secondes (50 ms par défaut). L'arbre est conservé
+    d'une décision à l'autre : si l'état actuel y figure déjà, la recherche repart de ce sous-arbre.
+    Avec workers > 1, des recherches indépendantes tournent en parallèle dans d'autres processus
+    pendant le même budget et leurs statistiques de racine sont additionnées.
+    """
+
+    def __init__(self, time_budget: float = 0.05, workers: int = 1, exploration: float = 1.0,
+                 seed: int = None, rules: FarkleRules = None, name: str = 'mcts'):
+        self.time_budget = time_budget
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.exploration = exploration
+        self.seed_rng = random.Random(seed)
+        self.search = MCTSSearch(rules, exploration, self.seed_rng.getrandbits(32))
+        self.executor = ProcessPoolExecutor(max_workers=self.workers - 1) if self.workers > 1 else None
+        self.name = name
+        self.last_iterations = 0
+        self.last_reused = False
+
+    def decide(self, state: DecisionState) -> Decision:
+        # Sans la partie, pas d'état complet à explorer : meilleure combinaison, stop au seuil de simulation
+        score, combo = state.combinations[0]
+        minimum = ROLLOUT_STOP_AT[state.dice_count - len(combo)]
+        if not state.is_on_board:
+            minimum = max(minimum, state.rules.entry_threshold)
+        return 0, state.turn_score + score >= minimum
+
+    def choose(self, game, inherited_score: int = 0) -> Decision:
+        start = time.perf_counter()
+        # Petite marge pour la préparation et le choix final : le budget est une borne, pas une cible
+        deadline = start + self.time_budget * 0.95
+        state = SimState.from_game(game)
+        if self.search.rules is not game.rules:
+            self.search = MCTSSearch(game.rules, self.exploration, self.seed_rng.getrandbits(32))
+        self.last_reused = self.search.set_root(state)
+
+        options = self.search.root.state.options() if not self.search.root.children else None
+        if options is not None and len(options) == 1:
+            return options[0]
+
+        futures = []
+        if self.executor is not None:
+            # Marge pour l'envoi et le retour des statistiques
+            worker_budget = self.time_budget * 0.8
+            futures = [self.executor.submit(_search_worker, state, worker_budget, self.seed_rng.getrandbits(32),
+                                            self.exploration) for _ in range(self.workers - 1)]
+
+        self.last_iterations = self.search.search(deadline)
+        statistics = {decision: list(values) for decision, values in self.search.root_statistics().items()}
+        for future in futures:
+            try:
+                remote = future.result(timeout=max(deadline - time.perf_counter(), 0.0))
+            except Exception:
+                future.cancel()
+                continue
+            for decision, (visits, wins) in remote.items():
+                merged = statistics.setdefault(decision, [0, 0.0])
+                merged[0] += visits
+                merged[1] += wins
+
+        if not statistics:
+            return self.decide(DecisionState(state.roll, state.turn_score, state.on_board[state.current],
+                                             inherited_score, 0, state.final_started, game.rules))
+        # Décision la plus visitée (la plus robuste), à égalité la meilleure moyenne
+        return max(statistics, key=lambda decision: (statistics[decision][0],
+                                                     statistics[decision][1] / max(statistics[decision][0], 1)))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
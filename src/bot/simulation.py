@@ -0,0 +1,77 @@
+from typing import List, Sequence
+from model.game import FarkleGame
+from model.rules import FarkleRules
+from bot.strategy import Strategy
+
+
+def play_turn(game: FarkleGame, strategy: Strategy) -> bool:
+    """
+    Joue le tour du joueur actuel avec une stratégie, sans interaction
+
+    Returns:
+        True si le tour a été stoppé (score gardé), False en cas de Farkle
+    """
+    current_player = game.get_current_player()
+    # Le score hérité n'est récupéré que par un joueur sur le plateau, au premier lancé
+    inherited_score = game.turn_score_to_transfer if current_player.is_on_board else 0
+
+    while True:
+        game.roll_dice()
+        if game.is_farkle():
+            game.farkle()
+            return False
+
+        keep_index, stop = strategy.choose(game, inherited_score)
+        if game.apply_decision(keep_index, stop):
+            return True
+
+
+def simulate_game(player_names: List[str], strategies: Sequence[Strategy], seed: int = None,
+                  rules: FarkleRules = None, max_turns: int = 1000, trace: list = None) -> FarkleGame:
+    """
+    Simule une partie complète, une stratégie par siège
+
+    Args:
+        player_names: Noms des joueurs
+        strategies: Stratégie de chaque siège (dans l'ordre des joueurs)
+        seed: Graine aléatoire de la partie
+        rules: Variante de règles (règles par défaut sinon)
+        max_turns: Nombre maximum de tours de table (garde-fou pour les stratégies qui ne stoppent jamais)
+        trace: Liste complétée par (tour, siège, score total) après chaque tour joué (optionnel)
+
+    Returns:
+        La partie terminée
+    """
+    if len(strategies) != len(player_names):
+        raise ValueError("Il faut une stratégie par joueur")
+
+    game = FarkleGame(player_names, seed=seed, rules=rules)
+    while not game.game_over and game.turn_count <= max_turns:
+        seat, turn = game.current_player_index, game.turn_count
+        play_turn(game, strategies[seat])
+        if trace is not None:
+            trace.append((turn, seat, game.players[seat].total_score))
+    return game
+
+
+def simulate_games(num_games: int, player_names: List[str], strategies: Sequence[Strategy], seed: int = 0,
+                   rules: FarkleRules = None, max_turns: int = 1000):
+    """
+    Simule une série de parties, la partie i utilisant la graine seed + i
+
+    Returns:
+        Itérateur des parties terminées
+    """
+    for index in range(num_games):
+        yield simulate_game(player_names, strategies, seed + index, rules, max_turns)
+
+
+def game_record(game: FarkleGame) -> dict:
+    """Résumé d'une partie simulée : de quoi la rejouer, son résultat et ses tours en colonnes"""
+    return {
+        'replay': game.get_replay_data(),
+        'turns': game.get_turn_columns(),
+        'winner': game.winner.name if game.winner else None,
+        'final_scores': [player.total_score for player in game.players],
+        'turn_count': game.turn_count,
+    }
@@ -0,0 +1,318 @@
+import json
+import struct
+from typing import Callable, Dict, List, Tuple
+from model.rules import FarkleRules, DEFAULT_RULES, all_multisets
+
+
+# Index global de chaque lancé distinct (1 à 6 dés) : le nombre de dés restants est implicite
+MULTISETS = [()] + all_multisets()
+MULTISET_INDEX = {multiset: index for index, multiset in enumerate(MULTISETS)}
+
+# Une décision tient sur un octet : index de la combinaison gardée * 2 + stop
+UNKNOWN = 0xFF
+# Scores de tour distingués par défaut (au-delà, une seule tranche)
+TURN_SCORE_RANGE = 3000
+MAGIC = b'FKST'
+FORMAT_VERSION = 1
+
+Decision = Tuple[int, bool]
+
+
+class DecisionState:
+    """État de décision présenté à une stratégie, juste après un lancé"""
+
+    __slots__ = ('roll', 'turn_score', 'is_on_board', 'inherited_score', 'score_gap',
+                 'final_round', 'combinations', 'rules')
+
+    def __init__(self, roll: Tuple[int, ...], turn_score: int, is_on_board: bool, inherited_score: int,
+                 score_gap: int, final_round: bool, rules: FarkleRules = None):
+        self.roll = roll
+        self.turn_score = turn_score
+        self.is_on_board = is_on_board
+        self.inherited_score = inherited_score
+        self.score_gap = score_gap
+        self.final_round = final_round
+        self.rules = rules or DEFAULT_RULES
+        self.combinations = self.rules.lookup_combinations(roll)
+
+    @property
+    def dice_count(self) -> int:
+        """Nombre de dés lancés"""
+        return len(self.roll)
+
+    def __repr__(self):
+        return (f"DecisionState(roll={self.roll}, turn_score={self.turn_score}, is_on_board={self.is_on_board}, "
+                f"inherited_score={self.inherited_score}, score_gap={self.score_gap}, final_round={self.final_round})")
+
+
+def score_gap(game) -> int:
+    """Écart entre le joueur actuel et le meilleur adversaire (positif si le joueur mène)"""
+    current_player = game.get_current_player()
+    best_opponent = max((player.total_score for player in game.players if player is not current_player), default=0)
+    return current_player.total_score - best_opponent
+
+
+class Strategy:
+    """
+    Interface d'une stratégie de bot
+
+    Après chaque lancé, la stratégie choisit la combinaison à garder (index 0-based
+    dans get_possible_actions) et si le tour doit être stoppé ensuite.
+    """
+
+    name = 'strategy'
+
+    def decide(self, state: DecisionState) -> Decision:
+        """Retourne (index de la combinaison gardée, stopper après l'avoir gardée)"""
+        raise NotImplementedError
+
+    def choose(self, game, inherited_score: int = 0) -> Decision:
+        """Construit l'état de décision depuis la partie et appelle decide()"""
+        current_player = game.get_current_player()
+        state = DecisionState(tuple(sorted(game.last_dice_roll)), current_player.turn_score,
+                              current_player.is_on_board, inherited_score, score_gap(game),
+                              game.final_round_started, game.rules)
+        return self.decide(state)
+
+
+class CallableStrategy(Strategy):
+    """Stratégie définie par une fonction Python state -> (index, stop)"""
+
+    def __init__(self, function: Callable[[DecisionState], Decision], name: str = None):
+        self.function = function
+        self.name = name or getattr(function, '__name__', 'callable')
+
+    def decide(self, state: DecisionState) -> Decision:
+        return self.function(state)
+
+
+class StateEncoder:
+    """
+    Encode un état de décision en index de table
+
+    Dimensions: lancé (multi-ensemble, qui donne aussi les dés restants), tranche de score du tour,
+    sur le plateau, tranche de score hérité, tranche d'écart de score, dernier tour.
+
+    Par défaut, une tranche de score du tour par pas de score des règles (tout score de tour en
+    est un multiple) jusqu'à TURN_SCORE_RANGE : le score du tour est alors exact, et une table
+    reprend les décisions d'une stratégie qui dépend du score du tour au point près.
+    """
+
+    def __init__(self, turn_step: int = None, turn_buckets: int = None, transfer_step: int = 1000,
+                 transfer_buckets: int = 3, gap_step: int = 1000, gap_buckets: int = 9, rules: FarkleRules = None):
+        if turn_step is None:
+            turn_step = (rules or DEFAULT_RULES).score_step()
+        if turn_buckets is None:
+            turn_buckets = TURN_SCORE_RANGE // turn_step + 1
+        self.turn_step = turn_step
+        self.turn_buckets = turn_buckets
+        self.transfer_step = transfer_step
+        self.transfer_buckets = transfer_buckets
+        self.gap_step = gap_step
+        self.gap_buckets = gap_buckets
+        self.gap_offset = gap_buckets // 2
+        self.size = len(MULTISETS) * turn_buckets * 2 * transfer_buckets * gap_buckets * 2
+
+    def bucket_transfer(self, inherited_score: int) -> int:
+        """Tranche 0 = aucun score hérité, puis une tranche par transfer_step points"""
+        if inherited_score <= 0:
+            return 0
+        return min(1 + inherited_score // self.transfer_step, self.transfer_buckets - 1)
+
+    def encode(self, roll: Tuple[int, ...], turn_score: int, is_on_board: bool, inherited_score: int,
+               gap: int, final_round: bool) -> int:
+        """Retourne l'index de table de l'état (roll doit être trié)"""
+        turn_bucket = min(turn_score // self.turn_step, self.turn_buckets - 1)
+        gap_bucket = min(max(gap // self.gap_step + self.gap_offset, 0), self.gap_buckets - 1)
+        index = MULTISET_INDEX[roll]
+        index = index * self.turn_buckets + turn_bucket
+        index = index * 2 + is_on_board
+        index = index * self.transfer_buckets + self.bucket_transfer(inherited_score)
+        index = index * self.gap_buckets + gap_bucket
+        return index * 2 + final_round
+
+    def decode(self, index: int, rules: FarkleRules = None) -> DecisionState:
+        """Retourne l'état représentatif (borne basse de chaque tranche) d'un index de table"""
+        index, final_round = divmod(index, 2)
+        index, gap_bucket = divmod(index, self.gap_buckets)
+        index, transfer_bucket = divmod(index, self.transfer_buckets)
+        index, is_on_board = divmod(index, 2)
+        roll_index, turn_bucket = divmod(index, self.turn_buckets)
+        inherited_score = 0 if transfer_bucket == 0 else max((transfer_bucket - 1) * self.transfer_step, 1)
+        return DecisionState(MULTISETS[roll_index], turn_bucket * self.turn_step, bool(is_on_board),
+                             inherited_score, (gap_bucket - self.gap_offset) * self.gap_step,
+                             bool(final_round), rules)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            'turn_step': self.turn_step,
+            'turn_buckets': self.turn_buckets,
+            'transfer_step': self.transfer_step,
+            'transfer_buckets': self.transfer_buckets,
+            'gap_step': self.gap_step,
+            'gap_buckets': self.gap_buckets,
+        }
+
+
+class TableStrategy(Strategy):
+    """
+    Stratégie compacte : une table d'un octet par état encodé, décision en O(1)
+
+    Une table construite depuis une fonction est remplie à la demande (les réponses sont
+    mémorisées) ou entièrement avec enumerate_all(), puis peut être sauvegardée et rechargée.
+    """
+
+    def __init__(self, table: bytearray = None, encoder: StateEncoder = None, rules: FarkleRules = None,
+                 source: Callable[[DecisionState], Decision] = None, name: str = 'table'):
+        self.rules = rules or DEFAULT_RULES
+        self.encoder = encoder or StateEncoder(rules=self.rules)
+        self.table = table if table is not None else bytearray([UNKNOWN]) * self.encoder.size
+        if len(self.table) != self.encoder.size:
+            raise ValueError(f"Taille de table invalide: {len(self.table)} (attendu {self.encoder.size})")
+        self.source = source
+        self.name = name
+
+    @classmethod
+    def from_callable(cls, function: Callable[[DecisionState], Decision], encoder: StateEncoder = None,
+                      rules: FarkleRules = None, eager: bool = False, name: str = None,
+                      check_games: int = 0) -> 'TableStrategy':
+        """
+        Convertit une stratégie Python en table
+
+        Args:
+            function: Stratégie state -> (index, stop), appelée une seule fois par état encodé
+            eager: Énumère immédiatement tous les états (sinon remplissage à la demande)
+            check_games: Vérifie sur ce nombre de parties que la table décide comme la fonction
+                         (voir disagreements), ValueError sinon
+
+        Raises:
+            ValueError: La table ne reproduit pas la fonction (tranches trop larges pour elle)
+        """
+        strategy = cls(encoder=encoder, rules=rules, source=function,
+                       name=name or getattr(function, '__name__', 'table'))
+        if eager:
+            strategy.enumerate_all()
+        if check_games:
+            mismatches = strategy.disagreements(check_games)
+            if mismatches:
+                state, table_decision, expected = mismatches[0]
+                raise ValueError(f"La table ne reproduit pas la stratégie {strategy.name} : {len(mismatches)} "
+                                 f"décision(s) différente(s), par exemple {table_decision} au lieu de {expected} "
+                                 f"pour {state}")
+        return strategy
+
+    def _fill(self, index: int) -> int:
+        """Calcule et mémorise la décision d'un état encore inconnu"""
+        if self.source is None:
+            # Table chargée sans source : garder la meilleure combinaison et stopper dès que possible
+            return 1
+        state = self.encoder.decode(index, self.rules)
+        if not state.combinations:
+            # Lancé vide ou Farkle : aucune décision à prendre
+            code = 0
+        else:
+            keep_index, stop = self.source(state)
+            code = keep_index * 2 + bool(stop)
+        self.table[index] = code
+        return code
+
+    def disagreements(self, games: int = 100, players: int = 3,
+                      seed: int = 0) -> List[Tuple[DecisionState, Decision, Decision]]:
+        """
+        Compare la table à sa fonction source sur tous les états de décision de parties réelles
+
+        Les parties sont jouées par la fonction elle-même ; à chaque décision, l'état exact est
+        encodé et la décision de la table comparée à celle de la fonction.
+
+        Returns:
+            Liste de (état, décision de la table, décision de la fonction) pour chaque désaccord
+        """
+        if self.source is None:
+            raise ValueError("Table sans fonction source : rien à comparer")
+        from bot.simulation import simulate_game
+        checker = _SourceCheck(self)
+        names = [f"Joueur {index + 1}" for index in range(players)]
+        for index in range(games):
+            simulate_game(names, [checker] * players, seed + index, self.rules)
+        return checker.mismatches
+
+    def enumerate_all(self) -> int:
+        """Remplit tous les états inconnus, retourne le nombre d'états calculés"""
+        filled = 0
+        for index in range(self.encoder.size):
+            if self.table[index] == UNKNOWN:
+                self._fill(index)
+                filled += 1
+        return filled
+
+    def decide(self, state: DecisionState) -> Decision:
+        index = self.encoder.encode(state.roll, state.turn_score, state.is_on_board,
+                                    state.inherited_score, state.score_gap, state.final_round)
+        code = self.table[index]
+        if code == UNKNOWN:
+            code = self._fill(index)
+        return code >> 1, bool(code & 1)
+
+    def choose(self, game, inherited_score: int = 0) -> Decision:
+        # Chemin rapide : encodage direct depuis la partie, sans construire de DecisionState
+        current_player = game.get_current_player()
+        index = self.encoder.encode(tuple(sorted(game.last_dice_roll)), current_player.turn_score,
+                                    current_player.is_on_board, inherited_score, score_gap(game),
+                                    game.final_round_started)
+        code = self.table[index]
+        if code == UNKNOWN:
+            code = self._fill(index)
+        return code >> 1, bool(code & 1)
+
+    def save(self, filepath: str) -> str:
+        """Sauvegarde la table (en-tête JSON + un octet par état)"""
+        header = json.dumps({
+            'version': FORMAT_VERSION,
+            'name': self.name,
+            'encoder': self.encoder.to_dict(),
+            'rules': self.rules.to_dict(),
+        }).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            f.write(self.table)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath: str) -> 'TableStrategy':
+        """Charge une table sauvegardée avec save()"""
+        with open(filepath, 'rb') as f:
+            if f.read(4) != MAGIC:
+                raise ValueError(f"Fichier de stratégie invalide: {filepath}")
+            header_size, = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_size).decode('utf-8'))
+            table = bytearray(f.read())
+        return cls(table, StateEncoder(**header['encoder']), FarkleRules.from_dict(header['rules']),
+                   name=header.get('name', 'table'))
+
+
+class _SourceCheck(Strategy):
+    """Joue la fonction source d'une table et note les états où la table décide autrement"""
+
+    def __init__(self, table: TableStrategy):
+        self.table = table
+        self.mismatches: List[Tuple[DecisionState, Decision, Decision]] = []
+
+    def decide(self, state: DecisionState) -> Decision:
+        keep_index, stop = self.table.source(state)
+        expected = (keep_index, bool(stop))
+        decision = self.table.decide(state)
+        if decision != expected:
+            self.mismatches.append((state, decision, expected))
+        return expected
+
+
+def threshold_policy(bank_at: int = 350) -> Callable[[DecisionState], Decision]:
+    """Stratégie simple : garder la meilleure combinaison, stopper dès que le tour atteint bank_at points"""
+    def policy(state: DecisionState) -> Decision:
+        score, _ = state.combinations[0]
+        minimum = bank_at if state.is_on_board else max(bank_at, state.rules.entry_threshold)
+        return 0, state.turn_score + score >= minimum
+    policy.__name__ = f'threshold_{bank_at}'
+    return policy
@@ -0,0 +1,284 @@
+import hashlib
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from model.rules import FarkleRules, DEFAULT_RULES, all_multisets
+from bot.endgame import roll_probability
+from bot.strategy import MULTISETS, MULTISET_INDEX, UNKNOWN, DecisionState, Strategy, TableStrategy
+
+
+# Distributions déjà calculées, par (politique, règles, contexte du tour), les plus anciennes
+# utilisées étant oubliées au-delà de MAX_CACHED_DISTRIBUTIONS
+MAX_CACHED_DISTRIBUTIONS = 4096
+_DISTRIBUTIONS: 'OrderedDict[tuple, TurnDistribution]' = OrderedDict()
+# Stratégies sans empreinte stable : distributions rangées par instance, oubliées avec elle
+_INSTANCE_DISTRIBUTIONS: 'weakref.WeakKeyDictionary[Strategy, OrderedDict]' = weakref.WeakKeyDictionary()
+# Un modèle par règles : les lancés compilés sont partagés entre les politiques
+_MODELS: Dict[tuple, 'TurnModel'] = {}
+
+
+class TurnDistribution:
+    """
+    Distribution exacte du résultat d'un tour
+
+    joint[k, d] est la probabilité de stopper avec k * step points en laissant d dés
+    au joueur suivant (6 après un hot dice) ; joint[0, 6] est la probabilité de Farkle.
+    La masse des tours qui dépassent le score maximum modélisé est comptée dans truncated.
+    """
+
+    def __init__(self, joint: np.ndarray, step: int, truncated: float):
+        self.joint = joint
+        self.step = step
+        self.truncated = truncated
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        """Probabilité de chaque score banké (index k = k * step points, 0 = Farkle)"""
+        return self.joint.sum(axis=1)
+
+    @property
+    def scores(self) -> np.ndarray:
+        return np.arange(len(self.joint)) * self.step
+
+    @property
+    def farkle_probability(self) -> float:
+        return float(self.joint[0].sum())
+
+    def mean(self) -> float:
+        """Score banké moyen (Farkle = 0)"""
+        return float(self.probabilities @ self.scores)
+
+    def std(self) -> float:
+        probabilities = self.probabilities
+        mean = probabilities @ self.scores
+        return float(np.sqrt(max(probabilities @ self.scores ** 2 - mean ** 2, 0.0)))
+
+    def probability_at_least(self, score: int) -> float:
+        """Probabilité de banker au moins score points"""
+        start = max(-(-score // self.step), 0)
+        return float(self.probabilities[start:].sum())
+
+    def quantile(self, q: float) -> int:
+        """Plus petit score banké s dont la probabilité cumulée P(X <= s) atteint q"""
+        cumulative = np.cumsum(self.probabilities)
+        index = int(np.searchsorted(cumulative, q * cumulative[-1] - 1e-12))
+        return min(index, len(cumulative) - 1) * self.step
+
+    def dice_left(self) -> Dict[int, float]:
+        """Distribution du nombre de dés laissés au joueur suivant, après un stop"""
+        stopped = self.joint[1:].sum(axis=0)
+        return {dice: float(stopped[dice]) for dice in range(1, 7) if stopped[dice] > 0}
+
+    def to_dict(self) -> Dict[str, Any]:
+        probabilities = self.probabilities
+        return {
+            'farkle_probability': self.farkle_probability,
+            'mean': self.mean(),
+            'std': self.std(),
+            'truncated': self.truncated,
+            'quantiles': {str(q): self.quantile(q) for q in (0.25, 0.5, 0.75, 0.9, 0.99)},
+            'distribution': {int(score): float(probability)
+                             for score, probability in zip(self.scores, probabilities) if probability > 0},
+            'dice_left': self.dice_left(),
+        }
+
+
+class TurnModel:
+    """
+    Chaîne de Markov d'un tour de jeu
+
+    Un état est (score du tour, dés à lancer). Chaque lancé possible (multi-ensemble, avec sa
+    probabilité exacte) mène soit au Farkle, soit à un stop, soit à un nouvel état après la
+    combinaison gardée par la politique. Tout lancé qui score ajoute au moins un pas au score
+    du tour : la chaîne est acyclique et la masse de probabilité est propagée une seule fois,
+    par score croissant, sans échantillonnage.
+
+    Les règles du moteur sont reproduites exactement : dés partagés en début de tour,
+    hot dice (relance des 6 dés), Farkle, seuil d'entrée pour stopper, score hérité
+    récupéré au premier lancé par un joueur sur le plateau.
+    """
+
+    def __init__(self, rules: FarkleRules = None):
+        self.rules = rules or DEFAULT_RULES
+        self.step = self.rules.score_step()
+
+        # Pour chaque nombre de dés : (probabilité, index du lancé, [(pas de score, dés à relancer)])
+        self.rolls: Dict[int, List[Tuple[float, int, Tuple[Tuple[int, int], ...]]]] = {
+            num_dice: [] for num_dice in range(1, 7)
+        }
+        for multiset in all_multisets():
+            options = tuple((score // self.step, next_dice)
+                            for score, _, next_dice in self.rules.lookup_keeps(multiset))
+            self.rolls[len(multiset)].append((roll_probability(multiset), MULTISET_INDEX[multiset], options))
+
+    def _decision_reader(self, strategy: Strategy, is_on_board: bool, inherited_score: int,
+                         score_gap: int, final_round: bool):
+        """
+        Retourne une fonction (index du lancé, score du tour) -> code de décision
+
+        Pour une stratégie en table, la tranche de table du contexte est lue directement.
+        """
+        if isinstance(strategy, TableStrategy):
+            table = policy_slice(strategy, is_on_board, inherited_score, score_gap, final_round)
+            encoder = strategy.encoder
+
+            def read(roll_index: int, turn_score: int) -> int:
+                code = table[roll_index * encoder.turn_buckets
+                             + min(turn_score // encoder.turn_step, encoder.turn_buckets - 1)]
+                # Table chargée sans source : meilleure combinaison et stop dès que possible
+                return 1 if code == UNKNOWN else code
+            return read
+
+        def decide(roll_index: int, turn_score: int) -> int:
+            keep_index, stop = strategy.decide(DecisionState(MULTISETS[roll_index], turn_score, is_on_board,
+                                                             inherited_score, score_gap, final_round, self.rules))
+            return keep_index * 2 + bool(stop)
+        return decide
+
+    def distribution(self, strategy: Strategy, is_on_board: bool = True, inherited_score: int = 0,
+                     dice: int = 6, score_gap: int = 0, final_round: bool = False,
+                     max_turn_score: int = None) -> TurnDistribution:
+        """
+        Distribution exacte du score banké en un tour sous la politique strategy
+
+        Args:
+            strategy: Politique de décision (combinaison gardée et stop après chaque lancé)
+            is_on_board: Le joueur est-il sur le plateau en début de tour
+            inherited_score: Score à transférer laissé par le joueur précédent (piggy-back)
+            dice: Dés partagés laissés par le joueur précédent (0 = hot dice, 6 dés)
+            score_gap: Écart avec le meilleur adversaire, vu par la politique
+            final_round: Dernier tour en cours, vu par la politique
+            max_turn_score: Score de tour au-delà duquel la masse est comptée comme tronquée
+                            (score cible des règles par défaut)
+        """
+        # Le score hérité n'est récupéré qu'au premier lancé, par un joueur sur le plateau
+        inherited_score = inherited_score if is_on_board and self.rules.piggy_back_enabled else 0
+        max_steps = (max_turn_score or self.rules.target_score) // self.step
+        start_steps = inherited_score // self.step
+        entry_steps = -(-self.rules.entry_threshold // self.step)
+        read = self._decision_reader(strategy, is_on_board, inherited_score, score_gap, final_round)
+
+        joint = np.zeros((max_steps + 1, 7))
+        mass = np.zeros((max_steps + 1, 7))
+        truncated = 0.0
+        if start_steps > max_steps:
+            return TurnDistribution(joint, self.step, 1.0)
+        mass[start_steps, dice or 6] = 1.0
+
+        for steps in range(start_steps, max_steps + 1):
+            turn_score = steps * self.step
+            for num_dice in range(1, 7):
+                state_probability = mass[steps, num_dice]
+                if state_probability == 0.0:
+                    continue
+                for probability, roll_index, options in self.rolls[num_dice]:
+                    probability *= state_probability
+                    if not options:
+                        joint[0, 6] += probability  # Farkle : le tour est perdu, les 6 dés sont remis en jeu
+                        continue
+                    code = read(roll_index, turn_score)
+                    keep_index = code >> 1
+                    if keep_index >= len(options):
+                        # Comme FarkleGame.apply_decision : une combinaison inexistante est une erreur
+                        raise ValueError(f"Combinaison n° {keep_index} invalide : {len(options)} combinaison(s) "
+                                         f"possible(s) pour le lancé {MULTISETS[roll_index]}")
+                    score_steps, next_dice = options[keep_index]  # 6 dés après un hot dice
+                    next_steps = steps + score_steps
+                    can_stop = is_on_board or next_steps >= entry_steps
+                    if next_steps > max_steps:
+                        truncated += probability
+                    elif code & 1 and can_stop:
+                        joint[next_steps, next_dice] += probability
+                    else:
+                        mass[next_steps, next_dice] += probability
+
+        return TurnDistribution(joint, self.step, truncated)
+
+
+def policy_slice(strategy: TableStrategy, is_on_board: bool, inherited_score: int, score_gap: int,
+                 final_round: bool) -> bytes:
+    """
+    Tranche de la table d'une stratégie pour un contexte de tour (tous les lancés, tous les scores
+    de tour), remplie si nécessaire : seule partie de la table qui influence le tour
+    """
+    encoder = strategy.encoder
+    base = [encoder.encode((), turn_bucket * encoder.turn_step, is_on_board, inherited_score,
+                           score_gap, final_round) for turn_bucket in range(encoder.turn_buckets)]
+    # Écart entre deux lancés consécutifs dans l'index de table
+    stride = encoder.encode((1,), 0, is_on_board, inherited_score, score_gap, final_round) - base[0]
+    table = strategy.table
+    values = bytearray()
+    for roll_index in range(len(MULTISET_INDEX)):
+        for index in base:
+            index += roll_index * stride
+            if table[index] == UNKNOWN and strategy.source is not None:
+                strategy._fill(index)
+            values.append(table[index])
+    return bytes(values)
+
+
+def policy_hash(strategy: Strategy, is_on_board: bool, inherited_score: int, score_gap: int,
+                final_round: bool) -> Optional[str]:
+    """
+    Empreinte de la politique dans un contexte de tour
+
+    Pour une stratégie en table, l'empreinte porte sur les décisions elles-mêmes : deux tables
+    qui jouent ce contexte de la même façon partagent leur distribution. Les autres stratégies
+    n'ont pas d'empreinte stable (None) : leurs distributions sont mémorisées par instance.
+    """
+    if isinstance(strategy, TableStrategy):
+        digest = hashlib.sha1(repr(sorted(strategy.encoder.to_dict().items())).encode('utf-8'))
+        digest.update(policy_slice(strategy, is_on_board, inherited_score, score_gap, final_round))
+        return digest.hexdigest()
+    return None
+
+
+def get_turn_model(rules: FarkleRules = None) -> TurnModel:
+    """Retourne le modèle (mémorisé) correspondant aux règles"""
+    rules = rules or DEFAULT_RULES
+    key = _rules_key(rules)
+    if key not in _MODELS:
+        _MODELS[key] = TurnModel(rules)
+    return _MODELS[key]
+
+
+def turn_distribution(strategy: Strategy, rules: FarkleRules = None, is_on_board: bool = True,
+                      inherited_score: int = 0, dice: int = 6, score_gap: int = 0, final_round: bool = False,
+                      max_turn_score: int = None) -> TurnDistribution:
+    """
+    Distribution exacte d'un tour (voir TurnModel.distribution), mémorisée par empreinte de politique
+
+    Une stratégie sans empreinte (voir policy_hash) a son propre cache, attaché à l'instance :
+    une autre instance créée plus tard au même emplacement mémoire ne le retrouve pas.
+    """
+    model = get_turn_model(rules)
+    inherited_score = inherited_score if is_on_board and model.rules.piggy_back_enabled else 0
+    context = (_rules_key(model.rules), is_on_board, inherited_score, dice or 6, score_gap, final_round,
+               max_turn_score)
+    compute = lambda: model.distribution(strategy, is_on_board, inherited_score, dice, score_gap, final_round,
+                                         max_turn_score)
+    fingerprint = policy_hash(strategy, is_on_board, inherited_score, score_gap, final_round)
+    if fingerprint is not None:
+        return _cached(_DISTRIBUTIONS, (fingerprint,) + context, compute)
+    cache = _INSTANCE_DISTRIBUTIONS.get(strategy)
+    if cache is None:
+        cache = _INSTANCE_DISTRIBUTIONS[strategy] = OrderedDict()
+    return _cached(cache, context, compute)
+
+
+def _cached(cache: OrderedDict, key: tuple, compute: Callable[[], TurnDistribution]) -> TurnDistribution:
+    """Lecture d'un cache LRU : calcule et ajoute la valeur absente, oublie la plus ancienne au-delà de la limite"""
+    distribution = cache.get(key)
+    if distribution is not None:
+        cache.move_to_end(key)
+        return distribution
+    distribution = cache[key] = compute()
+    if len(cache) > MAX_CACHED_DISTRIBUTIONS:
+        cache.popitem(last=False)
+    return distribution
+
+
+def _rules_key(rules: FarkleRules) -> tuple:
+    """Paramètres des règles qui influencent un tour"""
+    return rules.scoring_key() + (rules.entry_threshold, rules.target_score, rules.piggy_back_enabled)
@@ -4,15 +4,86 @@ Farkle 10000 - Jeu de dés en Python
 Point d'entrée principal de l'application
 """
 
+import json
 import sys
+import click
+from model.rules import FarkleRules
 from view.cli import FarkleCLI
 
 
-def main():
-    """Fonction principale"""
+def load_rules(rules_file: str = None) -> FarkleRules:
+    """Charge une variante de règles depuis un fichier JSON (règles par défaut sinon)"""
+    if rules_file is None:
+        return None
+    with open(rules_file, 'r', encoding='utf-8') as f:
+        return FarkleRules.from_dict(json.load(f))
+
+
+def configure_saves(compress: bool, keep_last: int = None, max_mb: float = None, max_age_days: float = None):
+    """Réglages des sauvegardes pour toute la session (compression, politique de rétention)"""
+    from state.game_state import GameState, RetentionPolicy
+    GameState.COMPRESS = compress
+    try:
+        retention = RetentionPolicy(keep_last, None if max_mb is None else int(max_mb * 1024 * 1024), max_age_days)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    GameState.RETENTION = retention if retention.is_active() else None
+
+
+def start_profiling(ctx, output: str, interval_ms: float, max_overhead: float, clock: str, all_threads: bool):
+    """Profile toute la commande par échantillonnage (processus de travail compris), résumé en fin de commande"""
+    from perf.sampler import ProfileSession, top_functions
+    try:
+        session = ProfileSession(output, interval_ms / 1000, max_overhead, clock, all_threads)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    def report():
+        summary = session.stop()
+        samples = summary['samples']
+        click.echo(f"Profil: {samples['main']} échantillons du processus principal, {samples['workers']} de "
+                   f"{summary['worker_processes']} processus de travail (surcoût mesuré {summary['overhead']:.1%})",
+                   err=True)
+        count = sum(summary['stacks'].values())
+        for frame, own, total in top_functions(summary['stacks'], prefix=2 if all_threads else 1):
+            click.echo(f"  {own / count:6.1%} {total / count:6.1%}  {frame}", err=True)
+        click.echo(f"Piles repliées: {summary['collapsed']}, flamegraph: {summary['flamegraph']}", err=True)
+
+    session.start()
+    ctx.call_on_close(report)
+
+
+@click.group(invoke_without_command=True)
+@click.option('--rules', 'rules_file', type=click.Path(exists=True, dir_okay=False), default=None,
+              help="Fichier JSON décrivant une variante de règles (score cible, seuil d'entrée, barème...)")
+@click.option('--bot-time-ms', type=float, default=50.0, help="Temps de réflexion des ordinateurs par décision (ms)")
+@click.option('--bot-workers', type=int, default=1, help="Processus de recherche par ordinateur (0 = tous les cœurs)")
+@click.option('--compress-saves', is_flag=True, help="Écrit les sauvegardes compressées (.json.gz)")
+@click.option('--keep-saves', type=int, default=None, help="Sauvegardes automatiques conservées par partie")
+@click.option('--max-saves-mb', type=float, default=None, help="Taille maximale des sauvegardes automatiques (Mo)")
+@click.option('--max-save-age-days', type=float, default=None, help="Âge maximal des sauvegardes automatiques (jours)")
+@click.option('--profile', 'profile_file', type=click.Path(dir_okay=False), default=None,
+              help="Profile la commande par échantillonnage : piles repliées dans ce fichier, flamegraph .svg à côté")
+@click.option('--profile-interval-ms', type=float, default=10.0, help="Intervalle entre deux échantillons (ms)")
+@click.option('--profile-max-overhead', type=float, default=0.05,
+              help="Part maximale du temps consacrée à l'échantillonnage (0.05 = 5 %)")
+@click.option('--profile-clock', type=click.Choice(['cpu', 'wall']), default='cpu',
+              help="Temps processeur du thread principal (cpu) ou temps réel (wall)")
+@click.option('--profile-threads', is_flag=True, help="Échantillonne tous les threads (avec --profile-clock wall)")
+@click.pass_context
+def main(ctx, rules_file, bot_time_ms, bot_workers, compress_saves, keep_saves, max_saves_mb, max_save_age_days,
+         profile_file, profile_interval_ms, profile_max_overhead, profile_clock, profile_threads):
+    """Farkle 10000 - lance le jeu interactif si aucune commande n'est donnée"""
+    ctx.obj = {'rules': load_rules(rules_file)}
+    configure_saves(compress_saves, keep_saves, max_saves_mb, max_save_age_days)
+    if profile_file is not None:
+        start_profiling(ctx, profile_file, profile_interval_ms, profile_max_overhead, profile_clock, profile_threads)
+    if ctx.invoked_subcommand is not None:
+        return
+
     try:
         # Créer et lancer l'interface CLI
-        cli = FarkleCLI()
+        cli = FarkleCLI(rules=ctx.obj['rules'], bot_time_budget=bot_time_ms / 1000, bot_workers=bot_workers)
         cli.run()
     except KeyboardInterrupt:
         print("\n\nAu revoir et à bientôt. Au plaisir de vous retrouver vite chez Badger qui, on l'espère, incluera Malik comme Full Stack Engineer ;) !")
@@ -22,5 +93,456 @@ def main():
         sys.exit(1)
 
 
+@main.command()
+@click.argument('scripts', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option('--workers', '-w', type=int, default=None, help="Nombre de processus pour exécuter les scripts en parallèle")
+@click.option('--seed', type=int, default=None, help="Graine aléatoire initiale de chaque partie")
+@click.option('--no-status', is_flag=True, help="N'inclut pas l'état complet du jeu dans chaque transition")
+@click.option('--stop-on-error', is_flag=True, help="Arrête un script à la première commande en erreur")
+@click.pass_obj
+def batch(obj, scripts, workers, seed, no_status, stop_on_error):
+    """Exécute des scripts de commandes (ou l'entrée standard) sans interaction"""
+    from view.batch import FarkleBatch, run_script_files, write_transitions
+
+    include_status = not no_status
+    rules = obj['rules']
+    failed = False
+
+    if not scripts:
+        transitions = FarkleBatch(seed=seed, include_status=include_status, rules=rules).run(sys.stdin, stop_on_error)
+        for transition in transitions:
+            failed = failed or not transition['ok']
+            write_transitions([transition])
+    else:
+        for script, transitions in run_script_files(list(scripts), workers, seed, include_status, stop_on_error, rules):
+            failed = failed or not all(transition['ok'] for transition in transitions)
+            write_transitions(transitions, script=script if len(scripts) > 1 else None)
+
+    sys.exit(1 if failed else 0)
+
+
+@main.command()
+@click.argument('save')
+@click.option('--turn', type=int, default=None, help="Tour de table auquel se positionner")
+@click.option('--action', 'action_index', type=int, default=None, help="Nombre d'actions à rejouer")
+@click.option('--checkpoint-interval', type=int, default=10, help="Intervalle (en tours) entre deux points de reprise")
+def replay(save, turn, action_index, checkpoint_interval):
+    """Rejoue une partie sauvegardée et affiche son état au tour (ou à l'action) demandé"""
+    from state.replay import GameReplay
+
+    try:
+        game_replay = GameReplay.from_save(save, checkpoint_interval)
+        if turn is not None:
+            game = game_replay.seek_turn(turn)
+        elif action_index is not None:
+            game = game_replay.state_at(action_index)
+        else:
+            game = game_replay.final_state()
+    except (ValueError, FileNotFoundError) as e:
+        raise click.ClickException(str(e))
+
+    status = game.get_game_status()
+    status['action_index'] = len(game.action_log)
+    status['action_count'] = len(game_replay.actions)
+    click.echo(json.dumps(status, ensure_ascii=False, indent=2))
+
+
+@main.command()
+@click.option('--dir', 'save_dir', type=click.Path(file_okay=False), default=None, help="Dossier des sauvegardes (saves/ par défaut)")
+@click.option('--prune', is_flag=True, help="Applique la politique de rétention (--keep-saves, --max-saves-mb, --max-save-age-days)")
+@click.option('--sync-index', is_flag=True, help="Ajoute à l'index les sauvegardes copiées à la main et retire celles supprimées (seuls les fichiers inconnus sont lus)")
+@click.option('--rebuild-index', is_flag=True, help="Reconstruit l'index en relisant toutes les sauvegardes (fichiers modifiés à la main)")
+def saves(save_dir, prune, sync_index, rebuild_index):
+    """Liste les sauvegardes et leur taille, et applique la politique de rétention"""
+    from state.game_state import GameState
+
+    game_state = GameState(save_dir)
+    if rebuild_index:
+        game_state.index.rebuild()
+    elif sync_index:
+        added, removed = game_state.index.synchronize()
+        click.echo(f"Index : {added} sauvegarde(s) ajoutée(s), {removed} retirée(s)")
+    if prune:
+        if game_state.RETENTION is None:
+            raise click.UsageError("Aucune politique de rétention (--keep-saves, --max-saves-mb, --max-save-age-days)")
+        removed = game_state.prune()
+        click.echo(f"{len(removed)} sauvegarde(s) supprimée(s)")
+    for save in game_state.list_saves():
+        click.echo(f"{save['filename']:<40} {save['bytes']:>9} o  {save['saved_at']}  {', '.join(save['players'])}")
+    click.echo(f"Total: {game_state.disk_usage() / 1024:.1f} Ko")
+
+
+@main.command()
+@click.option('--dir', 'save_dir', type=click.Path(file_okay=False), default=None, help="Dossier des sauvegardes (saves/ par défaut)")
+@click.option('--metric', '-m', default='wins', help="Statistique du classement (wins, games, win_rate, average_score, best_turn, farkle_rate)")
+@click.option('--limit', '-n', type=int, default=10, help="Nombre de joueurs affichés")
+@click.option('--player', default=None, help="Affiche le profil complet d'un joueur (JSON)")
+@click.option('--rebuild', is_flag=True, help="Recalcule les profils depuis les parties terminées sauvegardées")
+def profiles(save_dir, metric, limit, player, rebuild):
+    """Classements de tous les temps et profils des joueurs"""
+    from state.game_state import GameState
+    from state.profiles import ProfileStore
+
+    save_dir = save_dir or GameState.SAVE_DIR
+    store = ProfileStore.for_directory(save_dir)
+    if rebuild:
+        click.echo(f"{store.rebuild_from_saves(save_dir)} partie(s) comptée(s)")
+    if player is not None:
+        profile = store.profile(player)
+        if profile is None:
+            raise click.ClickException(f"Joueur inconnu: {player}")
+        click.echo(json.dumps(profile, ensure_ascii=False, indent=2))
+        return
+    try:
+        entries = store.leaderboard(metric, limit)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    for entry in entries:
+        value = f"{entry['value']:.3f}" if isinstance(entry['value'], float) else str(entry['value'])
+        click.echo(f"{entry['rank']:>4}. {entry['name']:<24} {value:>12}  ({entry['games']} parties)")
+
+
+@main.command()
+@click.option('--games', '-n', type=int, default=1000, help="Nombre de parties à simuler")
+@click.option('--players', '-p', type=int, default=2, help="Nombre de joueurs (bots) par partie")
+@click.option('--bank-at', type=int, default=350, help="Score de tour à partir duquel les bots stoppent")
+@click.option('--seed', type=int, default=0, help="Graine de la première partie (la partie i utilise seed + i)")
+@click.option('--output', '-o', type=click.File('w', encoding='utf-8'), default='-', help="Fichier JSON Lines de sortie")
+@click.option('--store', type=click.Path(file_okay=False), default=None,
+              help="Dossier d'un magasin de résultats binaire (scores finaux, gagnants, traces) à la place du JSON")
+@click.option('--lockstep', is_flag=True,
+              help="Moteur vectorisé : les parties avancent par lots (nécessite --store, sans trace ni rejeu)")
+@click.option('--batch-size', type=int, default=100000, help="Nombre de parties par lot du moteur vectorisé")
+@click.pass_obj
+def simulate(obj, games, players, bank_at, seed, output, store, lockstep, batch_size):
+    """Simule des parties entre bots et écrit une partie par ligne (graine, décisions, résultat)"""
+    from bot.simulation import game_record, simulate_game
+    from bot.strategy import TableStrategy, threshold_policy
+
+    if not 2 <= players <= 8:
+        raise click.BadParameter("Le nombre de joueurs doit être entre 2 et 8", param_hint='--players')
+    try:
+        # Quelques parties de vérification : la table doit décider exactement comme le seuil
+        strategy = TableStrategy.from_callable(threshold_policy(bank_at), rules=obj['rules'], check_games=20)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--bank-at')
+    player_names = [f"Bot {index + 1}" for index in range(players)]
+    strategies = [strategy] * players
+
+    if lockstep:
+        import numpy as np
+        from analytics.results_store import ResultsWriter
+        from bot.lockstep import LockstepEngine
+
+        if store is None:
+            raise click.UsageError("--lockstep nécessite --store")
+        with ResultsWriter(store) as writer:
+            for batch_index, start in enumerate(range(0, games, batch_size)):
+                size = min(batch_size, games - start)
+                # Les parties d'un lot partagent un générateur : on enregistre la graine du lot
+                engine = LockstepEngine(size, players, strategies, seed + batch_index, obj['rules']).run()
+                writer.append_batch(np.full(size, seed + batch_index), engine.turn_count, engine.scores,
+                                    engine.winner)
+        return
+
+    if store is not None:
+        from analytics.results_store import ResultsWriter
+
+        with ResultsWriter(store) as writer:
+            for index in range(games):
+                trace = []
+                game = simulate_game(player_names, strategies, seed + index, obj['rules'], trace=trace)
+                writer.append_game(game, trace)
+        return
+
+    for index in range(games):
+        game = simulate_game(player_names, strategies, seed + index, obj['rules'])
+        output.write(json.dumps(game_record(game), separators=(',', ':')) + '\n')
+
+
+@main.command()
+@click.option('--sweep', 'sweep_file', type=click.Path(exists=True, dir_okay=False), default=None,
+              help="Fichier JSON des configurations à simuler (liste de {name, strategies, games, seed, rules})")
+@click.option('--games', '-n', type=int, default=100000, help="Parties par configuration")
+@click.option('--players', '-p', type=int, default=2, help="Nombre de joueurs par partie")
+@click.option('--bank-at', type=int, multiple=True, help="Seuil du siège 1, une configuration par valeur (répétable)")
+@click.option('--opponents-bank-at', type=int, default=350, help="Seuil des autres sièges")
+@click.option('--seed', type=int, default=0, help="Graine de la première partie de chaque configuration")
+@click.option('--batch-size', type=int, default=1000, help="Parties par lot distribué")
+@click.option('--host', default='127.0.0.1', help="Adresse d'écoute (0.0.0.0 pour des travailleurs distants)")
+@click.option('--port', type=int, default=8770, help="Port d'écoute")
+@click.option('--lease-timeout', type=float, default=120.0, help="Délai (s) avant de redistribuer un lot non rendu")
+@click.option('--max-attempts', type=int, default=5, help="Distributions d'un lot avant de l'abandonner")
+@click.option('--local-workers', type=int, default=0, help="Travailleurs lancés sur cette machine")
+@click.option('--output', '-o', type=click.File('w', encoding='utf-8'), default='-', help="Rapport JSON")
+@click.pass_obj
+def coordinate(obj, sweep_file, games, players, bank_at, opponents_bank_at, seed, batch_size, host, port,
+               lease_timeout, max_attempts, local_workers, output):
+    """Distribue un balayage de simulations à des travailleurs (commande worker) et fusionne leurs résultats"""
+    import os
+    from bot.distributed import Coordinator, SimulationConfig, run_workers
+
+    try:
+        if sweep_file is not None:
+            with open(sweep_file, 'r', encoding='utf-8') as f:
+                configs = [SimulationConfig.from_dict(data, os.path.dirname(os.path.abspath(sweep_file)))
+                           for data in json.load(f)]
+        else:
+            rules = obj['rules'].to_dict() if obj['rules'] else None
+            configs = [SimulationConfig(f"siège 1 à {value}", [{'bank_at': value}] + [{'bank_at': opponents_bank_at}] * (players - 1),
+                                        games, seed, rules)
+                       for value in (bank_at or (opponents_bank_at,))]
+        coordinator = Coordinator(configs, batch_size, lease_timeout, max_attempts, progress=lambda status: click.echo(
+            f"lots {status['batches_completed']}/{status['batches_total']}, "
+            f"{status['games_completed']}/{status['games_total']} parties, {status['games_per_s']:.0f} parties/s, "
+            f"{status['workers']} travailleur(s), {status['retries']} relance(s)", err=True))
+    except (ValueError, KeyError, OSError) as e:
+        raise click.ClickException(str(e))
+
+    workers = []
+    if local_workers:
+        workers = run_workers(f"127.0.0.1:{port}", local_workers, name='local')
+    report = coordinator.run(host, port)
+    for worker in workers:
+        worker.join(timeout=5)
+    json.dump(report, output, ensure_ascii=False, indent=2)
+    output.write('\n')
+    if report['failed_batches']:
+        click.echo(f"{len(report['failed_batches'])} lot(s) abandonné(s)", err=True)
+        sys.exit(1)
+
+
+@main.command()
+@click.argument('address', default='127.0.0.1:8770')
+@click.option('--processes', '-j', type=int, default=None, help="Processus de simulation (un par cœur par défaut)")
+@click.option('--name', default=None, help="Nom des travailleurs dans le rapport (nom de la machine par défaut)")
+@click.option('--connect-timeout', type=float, default=30.0, help="Durée (s) pendant laquelle la connexion est retentée")
+def worker(address, processes, name, connect_timeout):
+    """Travailleur de simulation : traite les lots d'un coordinateur (hôte:port) jusqu'à la fin du balayage"""
+    from bot.distributed import run_workers
+
+    for process in run_workers(address, processes, name, connect_timeout):
+        process.join()
+
+
+@main.command()
+@click.argument('store', type=click.Path(exists=True, file_okay=False))
+def results(store):
+    """Résumé d'un magasin de résultats de simulation (lecture directe, sans chargement)"""
+    from analytics.results_store import ResultsStore
+
+    click.echo(json.dumps(ResultsStore(store).summary(), indent=2))
+
+
+@main.command()
+@click.argument('paths', nargs=-1, type=click.Path(exists=True))
+@click.option('--chunk-size', type=int, default=1000, help="Nombre de parties analysées par paquet")
+@click.option('--workers', '-w', type=int, default=None, help="Nombre de processus d'analyse")
+def analytics(paths, chunk_size, workers):
+    """Statistiques par siège et par joueur sur les sauvegardes (saves/ par défaut) et sorties de simulation"""
+    from analytics.bulk import analyze
+    from state.game_state import GameState
+
+    report = analyze(paths or [GameState.SAVE_DIR], chunk_size, workers)
+    click.echo(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+@main.command('turn-distribution')
+@click.option('--bank-at', type=int, default=350, help="Score de tour à partir duquel le bot stoppe")
+@click.option('--strategy', 'strategy_file', type=click.Path(exists=True, dir_okay=False), default=None,
+              help="Table de stratégie sauvegardée (à la place de --bank-at)")
+@click.option('--off-board', is_flag=True, help="Le joueur n'est pas encore sur le plateau")
+@click.option('--inherited', type=int, default=0, help="Score à transférer laissé par le joueur précédent")
+@click.option('--dice', type=click.IntRange(0, 6), default=6, help="Dés laissés par le joueur précédent")
+@click.option('--max-turn-score', type=int, default=None, help="Score de tour maximum modélisé")
+@click.pass_obj
+def turn_distribution(obj, bank_at, strategy_file, off_board, inherited, dice, max_turn_score):
+    """Distribution exacte du score banké en un tour (chaîne de Markov, sans échantillonnage)"""
+    from bot.strategy import TableStrategy, threshold_policy
+    from bot.turn_model import turn_distribution as compute
+
+    if strategy_file is not None:
+        strategy = TableStrategy.load(strategy_file)
+    else:
+        strategy = TableStrategy.from_callable(threshold_policy(bank_at), rules=obj['rules'])
+    distribution = compute(strategy, obj['rules'], not off_board, inherited, dice,
+                           max_turn_score=max_turn_score)
+    click.echo(json.dumps(distribution.to_dict(), indent=2))
+
+
+@main.command('solve-game')
+@click.argument('output', type=click.Path(dir_okay=False))
+@click.option('--workers', '-w', type=int, default=1, help="Processus de calcul (table en mémoire partagée)")
+@click.option('--chunk-size', type=int, default=16, help="Paires d'états par tâche")
+@click.pass_obj
+def solve_game(obj, output, workers, chunk_size):
+    """Calcule la probabilité de gagner optimale de toutes les positions d'une partie à deux joueurs"""
+    import time
+    from bot.full_game import FullGameSolver
+
+    solver = FullGameSolver(obj['rules'])
+    click.echo(f"Table {solver.kernel.shape} ({solver.kernel.size} pas de {solver.step} points), "
+               f"{workers} processus", err=True)
+    start = time.perf_counter()
+
+    def progress(done, total):
+        if done % 10 == 0 or done == total:
+            click.echo(f"  niveaux {done}/{total} ({time.perf_counter() - start:.1f} s)", err=True)
+
+    solver.solve(workers, chunk_size, progress)
+    solver.save(output)
+    click.echo(f"Table sauvegardée: {output} (départ : {solver.win_probability(0, 0):.4f} au premier siège)")
+
+
+@main.command('game-odds')
+@click.argument('table', type=click.Path(exists=True, dir_okay=False))
+@click.option('--score', type=int, default=0, help="Score total du joueur qui va lancer")
+@click.option('--opponent', type=int, default=0, help="Score total de l'adversaire")
+@click.option('--turn', type=int, default=0, help="Score du tour (score hérité récupéré compris)")
+@click.option('--dice', type=click.IntRange(0, 6), default=6, help="Dés à lancer")
+@click.option('--second', is_flag=True, help="Le joueur est au second siège (il perd les égalités)")
+def game_odds(table, score, opponent, turn, dice, second):
+    """Probabilité de gagner optimale d'une position, lue dans une table de solve-game"""
+    from bot.full_game import FullGameSolver
+
+    solver = FullGameSolver.load(table)
+    click.echo(json.dumps({'win_probability': solver.win_probability(score, opponent, turn, dice, not second)}))
+
+
+@main.command()
+@click.option('--host', default='127.0.0.1', help="Adresse d'écoute")
+@click.option('--port', type=int, default=8765, help="Port d'écoute")
+@click.option('--save-dir', type=click.Path(file_okay=False), default=None, help="Dossier des sauvegardes du service")
+@click.option('--allow-forced-dice', is_flag=True,
+              help="Tests uniquement : accepte les lancés imposés par le client (champ 'dice' de roll)")
+@click.pass_obj
+def serve(obj, host, port, save_dir, allow_forced_dice):
+    """Sert le moteur de jeu sur une socket TCP locale (une requête JSON par ligne)"""
+    from service.game_service import run_server
+
+    click.echo(f"Service de jeu sur {host}:{port}", err=True)
+    if allow_forced_dice:
+        click.echo("Attention : les clients peuvent imposer leurs dés (--allow-forced-dice)", err=True)
+    run_server(host, port, save_dir, obj['rules'], allow_forced_dice=allow_forced_dice)
+
+
+@main.command()
+@click.option('--clients', '-c', type=int, default=1000, help="Nombre de clients simulés (une table chacun)")
+@click.option('--games', '-n', type=int, default=1, help="Parties jouées par client")
+@click.option('--players', '-p', type=click.IntRange(2, 8), default=2, help="Joueurs par table")
+@click.option('--target', default=None, help="Serveur cible 'hôte:port' (service dans le processus sinon)")
+@click.option('--spawn-server', is_flag=True, help="Démarre le serveur cible dans un processus séparé")
+@click.option('--threaded', is_flag=True, help="Service local : requêtes traitées dans un pool de threads")
+@click.option('--concurrency', type=int, default=None, help="Clients actifs en même temps (tous par défaut)")
+@click.option('--think-ms', type=float, default=0.0, help="Temps de réflexion moyen entre deux actions (ms)")
+@click.option('--save-every', type=int, default=10, help="Sauvegarde tous les N tours (0 = en fin de partie)")
+@click.option('--save-dir', type=click.Path(file_okay=False), default='loadtest_saves',
+              help="Dossier des sauvegardes du service")
+@click.option('--seed', type=int, default=None, help="Graine des clients et des parties")
+@click.option('--output', '-o', type=click.File('w', encoding='utf-8'), default='-', help="Fichier du rapport JSON")
+@click.pass_obj
+def loadtest(obj, clients, games, players, target, spawn_server, threaded, concurrency, think_ms, save_every,
+             save_dir, seed, output):
+    """Test de charge : clients simulés, débit et latences p50/p95/p99 par action (rapport JSON)"""
+    from perf.loadtest import run_load_test
+
+    report = run_load_test(clients, games, players, target, spawn_server, threaded, seed, think_ms / 1000,
+                           save_every, save_dir, concurrency, obj['rules'])
+    output.write(json.dumps(report, indent=2) + '\n')
+
+
+@main.command('bench-clone')
+@click.option('--positions', type=int, default=200, help="Nombre de positions de parties mesurées")
+@click.option('--players', '-p', type=click.IntRange(2, 8), default=3, help="Joueurs par partie")
+@click.option('--repeat', type=int, default=5, help="Passages par mesure (le meilleur est gardé)")
+@click.option('--seed', type=int, default=0, help="Graine des positions")
+@click.pass_obj
+def bench_clone(obj, positions, players, repeat, seed):
+    """Compare copie profonde et instantanés immuables (figer, brancher, restaurer, cloner une partie)"""
+    from perf.clone_bench import run_clone_benchmark
+
+    report = run_clone_benchmark(positions, players, repeat, seed, obj['rules'])
+    click.echo(f"{report['config']['positions']} positions, {players} joueurs")
+    click.echo(f"{'opération':<10} {'deepcopy (µs)':>14} {'instantané (µs)':>16} {'gain':>8}")
+    for operation, entry in report['operations'].items():
+        click.echo(f"{operation:<10} {entry['deepcopy_us']:>14.2f} {entry['snapshot_us']:>16.2f} "
+                   f"{entry['speedup']:>7.1f}x")
+
+
+@main.command('bench-contention')
+@click.option('--players', '-p', type=click.IntRange(2, 8), default=3, help="Joueurs de la partie partagée")
+@click.option('--agents', type=click.IntRange(1), default=2, help="Threads qui jouent chaque siège")
+@click.option('--readers', type=click.IntRange(0), default=4, help="Threads spectateurs")
+@click.option('--read-interval-ms', type=float, default=1.0, help="Pause entre deux lectures d'un spectateur (ms)")
+@click.option('--duration', type=float, default=2.0, help="Durée de la mesure par mode (secondes)")
+@click.option('--seed', type=int, default=0, help="Graine de la première partie")
+@click.pass_obj
+def bench_contention(obj, players, agents, readers, read_interval_ms, duration, seed):
+    """Joue une partie partagée entre plusieurs threads : lectures sans verrou ou sous le verrou de la partie"""
+    from perf.contention_bench import run_contention_benchmark
+
+    report = run_contention_benchmark(players, agents, readers, read_interval_ms / 1000, duration, seed=seed,
+                                      rules=obj['rules'])
+    click.echo(f"{players} joueurs, {agents} agents par siège, {readers} spectateurs, {duration:g} s par mode")
+    click.echo(f"{'mode':<8} {'actions/s':>10} {'lectures/s':>11} {'p50 (µs)':>9} {'p99 (µs)':>9} "
+               f"{'lect. p99 (µs)':>15} {'conflits':>9} {'refus':>6} {'parties':>8} {'incohérences':>13}")
+    violations = 0
+    for mode, entry in report['modes'].items():
+        click.echo(f"{mode:<8} {entry['actions_per_s']:>10.0f} {entry['reads_per_s']:>11.0f} {entry['p50_us']:>9.1f} "
+                   f"{entry['p99_us']:>9.1f} {entry['read_p99_us']:>15.1f} {entry['conflicts']:>9} "
+                   f"{entry['rejected']:>6} {entry['games']:>8} {entry['violations'] + entry['regressions']:>13}")
+        violations += entry['violations'] + entry['regressions']
+    if violations:
+        click.echo("État incohérent observé pendant la partie partagée", err=True)
+        sys.exit(1)
+
+
+@main.command('perf-gate')
+@click.option('--baseline', 'baseline_file', type=click.Path(dir_okay=False), default=None,
+              help="Fichier de baseline (src/perf/baseline.json par défaut)")
+@click.option('--update', is_flag=True, help="Enregistre les mesures comme nouvelle baseline au lieu de comparer")
+@click.option('--only', multiple=True, help="Ne mesure que cette charge de travail (répétable)")
+@click.option('--samples', type=int, default=50, help="Échantillons par charge de travail")
+@click.option('--sample-ms', type=float, default=50.0, help="Durée visée d'un échantillon (ms)")
+@click.option('--min-threshold', type=float, default=None, help="Écart relatif toléré au minimum (0.15 = 15 %)")
+@click.pass_obj
+def perf_gate(obj, baseline_file, update, only, samples, sample_ms, min_threshold):
+    """Mesure les charges de travail du moteur et échoue en cas de régression par rapport à la baseline"""
+    from perf.regression import (DEFAULT_BASELINE, MIN_THRESHOLD, compare, format_table, has_regression,
+                                 load_baseline, run_workloads, save_baseline)
+
+    baseline_file = baseline_file or DEFAULT_BASELINE
+    results = run_workloads(list(only) or None, samples, sample_ms / 1000, obj['rules'])
+    if update:
+        save_baseline(results, baseline_file)
+        click.echo(f"Baseline mise à jour: {baseline_file}")
+        return
+
+    baseline = load_baseline(baseline_file)
+    rows = compare(baseline['workloads'], results, MIN_THRESHOLD if min_threshold is None else min_threshold)
+    if rows:
+        click.echo(f"Vitesse de la machine (calibration): x{1 / rows[0]['machine_speed']:.2f} par rapport à la baseline")
+    click.echo(format_table(rows))
+    if has_regression(rows):
+        click.echo("Régression de performance détectée", err=True)
+        sys.exit(1)
+
+
+@main.command('opening-tables')
+@click.option('--check', is_flag=True, help="Vérifie seulement que le module est à jour (échoue sinon)")
+def opening_tables(check):
+    """Régénère les tables figées des lancés (model/opening_tables.py) après un changement du barème"""
+    from model.rules import FROZEN_TABLES_PATH, write_frozen_tables
+
+    up_to_date = write_frozen_tables(check=check)
+    if up_to_date:
+        click.echo(f"Tables à jour: {FROZEN_TABLES_PATH}")
+    elif check:
+        click.echo(f"Tables périmées, à régénérer avec « opening-tables »: {FROZEN_TABLES_PATH}", err=True)
+        sys.exit(1)
+    else:
+        click.echo(f"Tables régénérées: {FROZEN_TABLES_PATH}")
+
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
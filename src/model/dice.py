@@ -1,20 +1,57 @@
 import random
-from collections import Counter
-from typing import List, Tuple, Dict
+from typing import List, Tuple
+from model.rules import FarkleRules, DEFAULT_RULES
 
 
 class Dice:
     """Classe pour gérer les dés et les règles de scoring du Farkle"""
     
-    def __init__(self, num_dice: int = 6):
+    def __init__(self, num_dice: int = 6, seed: int = None):
         self.num_dice = num_dice
         self.dice_values = []
+        # Générateur propre à chaque jeu de dés, pour pouvoir rejouer une partie à partir de sa graine
+        self.rng = random.Random()
+        self.seed(seed)
         
-    def roll(self, num_dice: int = None) -> List[int]:
-        """Lance les dés"""
+    def seed(self, seed: int = None):
+        """Réinitialise le générateur aléatoire avec une graine donnée (tirée au hasard si absente)"""
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.seed_value = seed
+        self.draws = 0  # Nombre de dés tirés depuis la graine, pour repositionner le générateur
+        self.rng.seed(seed)
+        
+    def fast_forward(self, draws: int):
+        """Repositionne le générateur après draws dés tirés depuis la graine (reprise d'une sauvegarde)"""
+        self.rng.seed(self.seed_value)
+        randint = self.rng.randint
+        for _ in range(draws):
+            randint(1, 6)
+        self.draws = draws
+        
+    def roll(self, num_dice: int = None, forced_values: List[int] = None) -> List[int]:
+        """
+        Lance les dés
+        
+        Args:
+            num_dice: Nombre de dés à lancer (par défaut tous les dés)
+            forced_values: Résultat imposé du lancé (mode script, rejeu de rapports de bugs)
+        
+        Returns:
+            Valeurs des dés lancés
+        """
         if num_dice is None:
             num_dice = self.num_dice
-        self.dice_values = [random.randint(1, 6) for _ in range(num_dice)]
+        if forced_values is not None:
+            if len(forced_values) != num_dice:
+                raise ValueError(f"Le lancé imposé doit contenir {num_dice} dés, reçu {len(forced_values)}")
+            if any(value not in (1, 2, 3, 4, 5, 6) for value in forced_values):
+                raise ValueError(f"Valeurs de dés invalides: {forced_values}")
+            self.dice_values = list(forced_values)
+        else:
+            randint = self.rng.randint
+            self.dice_values = [randint(1, 6) for _ in range(num_dice)]
+            self.draws += num_dice
         return self.dice_values
     
     def get_dice_values(self) -> List[int]:
@@ -22,7 +59,7 @@ class Dice:
         return self.dice_values.copy()
     
     @staticmethod
-    def calculate_score(dice_values: List[int]) -> Tuple[int, List[int]]:
+    def calculate_score(dice_values: List[int], rules: FarkleRules = None) -> Tuple[int, List[int]]:
         """
         Calcule le score pour des dés donnés et retourne les dés utilisés pour le score
         
@@ -43,87 +80,21 @@ class Dice:
             - Les paires et les Straights valent 1000 points.
         Note : Trois d'une sorte doivent tous être lancés ensemble. Lancer un 1, puis un autre 1 et encore un 1 vaut 300. Lancer 3 1 d'un coup vaut 1000.
         
-        """
-        if not dice_values:
-            return 0, []
-        
-        # Vérifier d'abord les cas spéciaux (seulement si on a exactement 6 dés)
-        if len(dice_values) == 6:
-            # Vérifier le straight (1,2,3,4,5,6)
-            if sorted(dice_values) == [1, 2, 3, 4, 5, 6]:
-                return 1000, sorted(dice_values)
-            
-            # Vérifier les 3 paires (exemple : 22 33 44)
-            counter = Counter(dice_values)
-            if len(counter) == 3 and all(count == 2 for count in counter.values()):
-                return 1000, sorted(dice_values)
-        
-        counter = Counter(dice_values)
-        score = 0
-        used_dice = []
+        Le barème est celui des règles données (règles par défaut sinon), compilé en table
+        de correspondance par lancé trié : voir model.rules.FarkleRules.
         
-        # Traiter les groupes de 3 ou plus d'abord
-        for value, count in counter.items():
-            if count >= 3:
-                base_score = 1000 if value == 1 else value * 100
-                # Appliquer le multiplicateur correct : 3=1x, 4=2x, 5=4x, 6=8x (doubler à chaque fois)
-                multiplier = 2 ** (count - 3)
-                score += base_score * multiplier
-                used_dice.extend([value] * count)
-                
-        # Traiter les 1 et 5 restants (seulement s'ils n'ont pas été utilisés dans un groupe de 3+)
-        for value in [1, 5]:
-            remaining_count = counter[value] if counter[value] < 3 else 0
-            if remaining_count > 0:
-                if value == 1:
-                    score += remaining_count * 100
-                else:  # value == 5
-                    score += remaining_count * 50
-                used_dice.extend([value] * remaining_count)
-        
-        return score, sorted(used_dice)
+        """
+        return (rules or DEFAULT_RULES).calculate_score(dice_values)
     
     @staticmethod
-    def get_possible_combinations(dice_values: List[int]) -> List[Tuple[int, List[int]]]:
+    def get_possible_combinations(dice_values: List[int], rules: FarkleRules = None) -> List[Tuple[int, List[int]]]:
         """
-        Retourne toutes les combinaisons possibles de dés qui peuvent être conservés
+        Retourne toutes les combinaisons possibles de dés qui peuvent être conservés,
+        le plus haut score en premier pour suggérer les meilleures options
         """
-        if not dice_values:
-            return []
-        
-        combinations = []
-        counter = Counter(dice_values)
-        
-        # Génère toutes les combinaisons possibles de dés.
-        # Chaque nombre i de 1 à 2**len(dice_values) - 1 représente une combinaison unique.
-        # La représentation binaire de i indique quels dés sont inclus dans la combinaison.
-        # Exemple concret avec les dés [1, 2, 3] :
-        # i = 1 (binaire: 001) → combo = [1] (seulement le premier dé)
-        # i = 2 (binaire: 010) → combo = [2] (seulement le deuxième dé)
-        # i = 3 (binaire: 011) → combo = [1, 2] (premier et deuxième dés)
-        # i = 4 (binaire: 100) → combo = [3] (seulement le troisième dé)
-        # etc.
-        for i in range(1, 2**len(dice_values)):
-            combo = [dice_values[j] for j in range(len(dice_values)) if (i >> j) & 1]
-            
-            score, used_dice = Dice.calculate_score(combo)
-            if score > 0 and sorted(combo) == sorted(used_dice):
-                combinations.append((score, combo))
-        
-        # Supprimer les doublons et trier par score
-        unique_combinations = []
-        seen = set()
-        for score, combo in combinations:
-            # tuple, pour regrouper les dés, sorted pour n'avoir que des combinaisons uniques, 3 1 2 est identique à 1 2 3
-            combo_key = tuple(sorted(combo))
-            if combo_key not in seen:
-                seen.add(combo_key)
-                unique_combinations.append((score, combo))
-        # trier par score, le plus haut score en premier pour suggérer les meilleures options
-        return sorted(unique_combinations, reverse=True)
+        return (rules or DEFAULT_RULES).get_possible_combinations(dice_values)
     
     @staticmethod
-    def is_farkle(dice_values: List[int]) -> bool:
+    def is_farkle(dice_values: List[int], rules: FarkleRules = None) -> bool:
         """Vérifie si c'est un Farkle (aucun dé ne peut être conservé)"""
-        score, _ = Dice.calculate_score(dice_values)
-        return score == 0 
\ No newline at end of file
+        return (rules or DEFAULT_RULES).is_farkle(dice_values) 
\ No newline at end of file
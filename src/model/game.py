@@ -1,28 +1,69 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from model.player import Player
 from model.dice import Dice
+from model.rules import FarkleRules, DEFAULT_RULES
 from state.game_state import GameState
+from state.persistent import GameSnapshot
+from state.turn_columns import turn_columns
+
+
+# Nombre de changements d'état conservés pour les deltas (status_since)
+STATUS_LOG_SIZE = 512
 
 
 class FarkleGame:
     """Classe principale pour gérer une partie de Farkle"""
     
-    def __init__(self, player_names: List[str] = None):
+    # Champs de get_game_status, recalculés un par un quand une action a pu les modifier
+    STATUS_FIELDS = {
+        'current_player': lambda game: game.get_current_player().name if game.players else None,
+        'current_player_index': lambda game: game.current_player_index,
+        'turn_count': lambda game: game.turn_count,
+        'game_over': lambda game: game.game_over,
+        'winner': lambda game: game.winner.name if game.winner else None,
+        'last_dice_roll': lambda game: game.last_dice_roll.copy(),
+        'shared_banked_dice': lambda game: game.shared_banked_dice.copy(),
+        'remaining_dice_count': lambda game: game.get_remaining_dice_count(),
+        'last_player_banked': lambda game: game.last_player_banked,
+        'roll_pending': lambda game: game.roll_pending,
+        'turn_score_to_transfer': lambda game: game.turn_score_to_transfer,
+        'final_round_started': lambda game: game.final_round_started,
+        'final_round_triggerer': lambda game: game.final_round_triggerer.name if game.final_round_triggerer else None,
+        'final_round_players_remaining': lambda game: game.final_round_players_remaining,
+    }
+    
+    def __init__(self, player_names: List[str] = None, seed: int = None, rules: FarkleRules = None):
+        self.rules = rules or DEFAULT_RULES  # Variante de règles, compilée en tables de scoring
         self.players = []
         self.current_player_index = 0
-        self.dice = Dice()
+        self.dice = Dice(seed=seed)
+        self.seed = self.dice.seed_value  # Graine du début de partie, pour la rejouer
+        self.initial_player_names = []
+        self.action_log = []  # Décisions de la partie, dans l'ordre (voir state.replay)
         self.game_state = GameState()
+        self.profiles = None  # Profils des joueurs mis à jour en fin de partie (state.profiles.ProfileStore)
         self.game_over = False
         self.winner = None
         self.turn_count = 1
         self.last_dice_roll = []
         self.shared_banked_dice = []  # Dés mis de côté partagés entre les joueurs
         self.last_player_banked = False  # True si le joueur précédent a banké sans lancer depuis
+        self.roll_pending = False  # True entre un lancé et les dés gardés (ou le Farkle) : ni relance ni stop
         self.turn_score_to_transfer = 0  # Score du tour à transférer au joueur suivant (piggy-back)
         self.final_round_started = False  # True si le dernier tour a commencé
         self.final_round_triggerer = None  # Joueur qui a déclenché le dernier tour
         self.final_round_players_remaining = 0  # Nombre de joueurs restants à jouer dans le dernier tour
         
+        # État publié (get_game_status) : version croissante, champs à recalculer et journal des changements
+        self._version = 0
+        self._status = {}
+        self._dirty_fields = set()
+        self._dirty_players = set()
+        self._status_log: List[Tuple[int, object]] = []  # (version, champ ou index de joueur)
+        self._status_horizon = 0  # Plus ancienne version à partir de laquelle un delta est possible
+        self._delta_cache: Dict[int, dict] = {}
+        self._touch_all(new_players=True)
+        
         if player_names:
             self.setup_players(player_names)
     
@@ -32,16 +73,26 @@ class FarkleGame:
             raise ValueError("Le nombre de joueurs doit être entre 2 et 8")
         
         self.players = [Player(name) for name in player_names]
+        
+        # Une nouvelle partie repart d'une graine neuve si les dés ont déjà servi
+        if self.dice.draws:
+            self.dice.seed()
+        self.seed = self.dice.seed_value
+        self.initial_player_names = list(player_names)
+        self.action_log = []
+        
         self.current_player_index = 0
         self.game_over = False
         self.winner = None
         self.turn_count = 1
         self.shared_banked_dice = []
         self.last_player_banked = False
+        self.roll_pending = False
         self.turn_score_to_transfer = 0
         self.final_round_started = False
         self.final_round_triggerer = None
         self.final_round_players_remaining = 0
+        self._touch_all(new_players=True)
     
     def get_current_player(self) -> Player:
         """Retourne le joueur actuel"""
@@ -51,12 +102,30 @@ class FarkleGame:
         """Retourne le nombre de dés restants à lancer (partagé entre tous les joueurs)"""
         return 6 - len(self.shared_banked_dice)
     
-    def roll_dice(self) -> List[int]:
-        """Lance les dés pour le joueur actuel"""
-        remaining_dice = self.get_remaining_dice_count()
+    def roll_dice(self, forced_values: List[int] = None) -> List[int]:
+        """
+        Lance les dés pour le joueur actuel
+        
+        Args:
+            forced_values: Résultat imposé du lancé (optionnel, utilisé par le mode script)
         
-        if remaining_dice == 0:
+        Returns:
+            Valeurs des dés lancés
+
+        Raises:
+            ValueError: Le lancé précédent attend encore des dés gardés (ou le Farkle), ou lancé imposé invalide
+        """
+        if self.roll_pending:
+            raise ValueError("Il faut garder des dés du lancé actuel avant de relancer")
+        remaining_dice = self.get_remaining_dice_count()
+        hot_dice = remaining_dice == 0
+        if hot_dice:
             remaining_dice = 6  # Hot dice - relancer tous les dés
+        
+        # Lancer avant de modifier l'état : un lancé imposé invalide laisse la partie intacte
+        dice_values = self.dice.roll(remaining_dice, forced_values)
+        
+        if hot_dice:
             self.shared_banked_dice = []
         
         # Dès qu'un joueur lance les dés, il peut banker à nouveau
@@ -72,12 +141,21 @@ class FarkleGame:
             # Si le joueur n'est pas sur le plateau, il perd les points hérités
             self.turn_score_to_transfer = 0
         
-        self.last_dice_roll = self.dice.roll(remaining_dice)
+        self.last_dice_roll = dice_values
+        self.roll_pending = True
+        self.action_log.append(('R',) if forced_values is None else ('R', list(forced_values)))
+        self._touch('last_dice_roll', 'shared_banked_dice', 'remaining_dice_count', 'last_player_banked',
+                    'roll_pending', 'turn_score_to_transfer', player_index=self.current_player_index)
         return self.last_dice_roll
     
+    def reseed(self, seed: int):
+        """Réinitialise le générateur des dés en cours de partie (enregistré pour le rejeu)"""
+        self.dice.seed(seed)
+        self.action_log.append(('D', seed))
+    
     def get_possible_actions(self) -> List[Tuple[int, List[int]]]:
         """Retourne les actions possibles pour le lancé actuel"""
-        return Dice.get_possible_combinations(self.last_dice_roll)
+        return self.rules.get_possible_combinations(self.last_dice_roll)
     
     def bank_dice(self, dice_to_bank: List[int]) -> bool:
         """
@@ -87,12 +165,14 @@ class FarkleGame:
             dice_to_bank: Liste des dés à conserver
             
         Returns:
-            True si l'action est valide, False sinon
+            True si l'action est valide, False sinon (dont : aucun lancé n'attend de dés gardés)
         """
         current_player = self.get_current_player()
+        if not self.roll_pending:
+            return False
         
         # Vérifier que les dés peuvent être conservés
-        score, used_dice = Dice.calculate_score(dice_to_bank)
+        score, used_dice = self.rules.calculate_score(dice_to_bank)
         if score == 0 or sorted(dice_to_bank) != sorted(used_dice):
             return False
         
@@ -105,25 +185,57 @@ class FarkleGame:
                 return False
         
         # Conserver les dés au niveau du joueur ET au niveau du jeu
+        self.action_log.append(('K', list(dice_to_bank)))
         current_player.add_turn_score(score, dice_to_bank)
         self.shared_banked_dice.extend(dice_to_bank)
         
         # Retirer les dés conservés du lancé actuel
         for die in dice_to_bank:
             self.last_dice_roll.remove(die)
+        self.roll_pending = False
         
+        self._touch('last_dice_roll', 'shared_banked_dice', 'remaining_dice_count', 'roll_pending',
+                    player_index=self.current_player_index)
         return True
     
+    def apply_decision(self, keep_index: int, stop: bool) -> bool:
+        """
+        Applique une décision de bot : garde la combinaison n° keep_index de get_possible_actions
+        (0-based, même ordre), puis stoppe le tour si demandé et autorisé
+        
+        Returns:
+            True si le tour a été stoppé, False si le joueur doit relancer
+
+        Raises:
+            ValueError: keep_index ne désigne aucune combinaison du lancé, ou les dés n'ont pas
+                        pu être conservés
+        """
+        actions = self.rules.lookup_combinations(self.last_dice_roll)
+        if not 0 <= keep_index < len(actions):
+            raise ValueError(f"Combinaison n° {keep_index} invalide : {len(actions)} combinaison(s) possible(s) "
+                             f"pour le lancé {self.last_dice_roll}")
+        _, dice_to_bank = actions[keep_index]
+        if not self.bank_dice(list(dice_to_bank)):
+            raise ValueError(f"Impossible de conserver {list(dice_to_bank)} du lancé {self.last_dice_roll}")
+        
+        if stop and self.can_stop_turn():
+            return self.stop_turn()
+        return False
+    
     def can_stop_turn(self) -> bool:
         """Vérifie si le joueur actuel peut arrêter son tour (stop)"""
         current_player = self.get_current_player()
         
+        # Un lancé doit d'abord être joué : garder des dés (ou constater le Farkle)
+        if self.roll_pending:
+            return False
+        
         # Un joueur ne peut pas s'arrêter s'il n'a pas de dés conservés dans CE tour
         if current_player.turn_score == 0:
             return False
         
-        # Si le joueur n'est pas sur le plateau, il doit avoir au moins 800 points
-        if not current_player.is_on_board and current_player.turn_score < 800:
+        # Si le joueur n'est pas sur le plateau, il doit avoir au moins le seuil d'entrée (800 points)
+        if not current_player.is_on_board and current_player.turn_score < self.rules.entry_threshold:
             return False
         
         # Un joueur ne peut pas s'arrêter immédiatement après qu'un autre joueur ait banké sans lancer les dés
@@ -144,22 +256,24 @@ class FarkleGame:
         if not self.can_stop_turn():
             return False
         
+        self.action_log.append(('S',))
+        
         # Le joueur garde son score
         current_player.total_score += current_player.turn_score
         
-        # Si le joueur n'était pas sur le plateau et qu'il a fait 800+ points ce tour
-        if not current_player.is_on_board and current_player.turn_score >= 800:
+        # Si le joueur n'était pas sur le plateau et qu'il a atteint le seuil d'entrée ce tour
+        if not current_player.is_on_board and current_player.turn_score >= self.rules.entry_threshold:
             current_player.is_on_board = True
         
-        # Vérifier si le joueur a atteint 10,000 points et déclencher le dernier tour
-        if not self.final_round_started and current_player.total_score >= 10000:
+        # Vérifier si le joueur a atteint le score cible (10,000 points) et déclencher le dernier tour
+        if not self.final_round_started and current_player.total_score >= self.rules.target_score:
             self.final_round_started = True
             self.final_round_triggerer = current_player
             # Tous les autres joueurs doivent avoir leur tour (nombre total - 1)
             self.final_round_players_remaining = len(self.players) - 1
         
-        # Transférer le score du tour au joueur suivant
-        self.turn_score_to_transfer = current_player.turn_score
+        # Transférer le score du tour au joueur suivant (si la variante autorise le piggy-back)
+        self.turn_score_to_transfer = current_player.turn_score if self.rules.piggy_back_enabled else 0
         
         # Reset le tour du joueur actuel
         current_player.turn_score = 0
@@ -168,6 +282,8 @@ class FarkleGame:
         
         # Marquer qu'un joueur a "stoppé"
         self.last_player_banked = True
+        self._touch('last_player_banked', 'turn_score_to_transfer', 'final_round_started', 'final_round_triggerer',
+                    'final_round_players_remaining', player_index=self.current_player_index)
         
         # Vérifier si le jeu doit se terminer
         if self.should_end_game():
@@ -189,13 +305,17 @@ class FarkleGame:
         """Gère un Farkle (aucun dé ne peut être conservé)"""
         current_player = self.get_current_player()
         current_player.reset_turn()
+        self.action_log.append(('F',))
         
         # Reset les dés partagés - nouveau tour avec 6 dés
         self.shared_banked_dice = []
         self.last_player_banked = False
+        self.roll_pending = False
         
         # Perdre aussi le score transféré s'il y en a un
         self.turn_score_to_transfer = 0
+        self._touch('shared_banked_dice', 'remaining_dice_count', 'last_player_banked', 'roll_pending',
+                    'turn_score_to_transfer', player_index=self.current_player_index)
         
         # Vérifier si le jeu doit se terminer
         if self.should_end_game():
@@ -214,44 +334,153 @@ class FarkleGame:
         # Si on revient au premier joueur, incrémenter le tour
         if self.current_player_index == 0:
             self.turn_count += 1
+        self._touch('current_player', 'current_player_index', 'turn_count', 'final_round_players_remaining')
     
     def end_game(self):
         """Termine la partie et détermine le gagnant"""
         self.game_over = True
         # Le gagnant est le joueur avec le score le plus élevé
         self.winner = max(self.players, key=lambda p: p.total_score)
+        self._touch('game_over', 'winner')
+        if self.profiles is not None:
+            try:
+                self.profiles.record_game(self)
+            except OSError:
+                pass  # Les profils sont des statistiques : une erreur d'écriture n'empêche pas la fin de partie
     
     def is_farkle(self) -> bool:
         """Vérifie si le lancé actuel est un Farkle"""
-        return Dice.is_farkle(self.last_dice_roll)
+        return self.rules.is_farkle(self.last_dice_roll)
     
     def get_game_status(self) -> dict:
-        """Retourne l'état actuel du jeu"""
-        return {
-            'current_player': self.get_current_player().name,
-            'current_player_index': self.current_player_index,
-            'turn_count': self.turn_count,
-            'game_over': self.game_over,
-            'winner': self.winner.name if self.winner else None,
-            'players': [
-                {
+        """
+        Retourne l'état actuel du jeu
+        
+        Seuls les champs touchés depuis l'appel précédent sont recalculés ; les listes et les
+        entrées de joueurs renvoyées sont partagées entre les appels et ne doivent pas être modifiées.
+        """
+        self._refresh_status()
+        return dict(self._status)
+    
+    @property
+    def state_version(self) -> int:
+        """Version de l'état publié, croissante à chaque action"""
+        self._refresh_status()
+        return self._version
+    
+    def status_since(self, version: int) -> dict:
+        """
+        Retourne ce qui a changé dans get_game_status depuis une version donnée
+        
+        Le delta ne contient que les champs et les joueurs modifiés : son coût dépend du nombre
+        de changements, pas de la taille de la table. Les spectateurs à la même version
+        partagent le même delta (à ne pas modifier).
+        
+        Args:
+            version: Dernière version connue du spectateur (state_version au moment de sa lecture)
+            
+        Returns:
+            Dictionnaire {'version', 'full', 'changes': {champ: valeur}, 'players': {index: joueur}}.
+            full vaut True si la version est trop ancienne ou inconnue : changes et players sont alors complets.
+        """
+        self._refresh_status()
+        if version in self._delta_cache:
+            return self._delta_cache[version]
+        
+        if not self._status_horizon <= version <= self._version:
+            players = self._status['players']
+            changes = {field: value for field, value in self._status.items() if field != 'players'}
+            delta = {'version': self._version, 'full': True, 'changes': changes,
+                     'players': dict(enumerate(players))}
+        else:
+            changes, players = {}, {}
+            # Le journal est parcouru depuis la fin, jusqu'à la version du spectateur
+            for changed_version, key in reversed(self._status_log):
+                if changed_version <= version:
+                    break
+                if isinstance(key, int):
+                    players[key] = self._status['players'][key]
+                else:
+                    changes[key] = self._status[key]
+            delta = {'version': self._version, 'full': False, 'changes': changes, 'players': players}
+        
+        self._delta_cache[version] = delta
+        return delta
+    
+    @staticmethod
+    def apply_status_delta(status: dict, delta: dict) -> dict:
+        """Applique un delta de status_since à un état complet (copie de spectateur), retourne le nouvel état"""
+        if delta['full']:
+            status = dict(delta['changes'])
+            status['players'] = [delta['players'][index] for index in sorted(delta['players'])]
+        else:
+            status = dict(status)
+            status.update(delta['changes'])
+            if delta['players']:
+                status['players'] = list(status['players'])
+                for index, player in delta['players'].items():
+                    status['players'][index] = player
+        return status
+    
+    def _touch(self, *fields: str, player_index: int = None):
+        """Signale une action : nouvelle version, champs (et joueur) qui ont pu changer"""
+        self._version += 1
+        self._dirty_fields.update(fields)
+        if player_index is not None:
+            self._dirty_players.add(player_index)
+    
+    def _touch_all(self, new_players: bool = False):
+        """
+        Marque tout l'état comme modifié (nouvelle partie, chargement, remise à zéro)
+        
+        Args:
+            new_players: La liste des joueurs a été remplacée, les anciens deltas ne s'appliquent plus
+        """
+        self._touch(*self.STATUS_FIELDS)
+        self._dirty_players.update(range(len(self.players)))
+        if new_players:
+            # Même ordre de champs qu'auparavant : les joueurs suivent le gagnant
+            fields = list(self.STATUS_FIELDS)
+            self._status = dict.fromkeys(fields[:5])
+            self._status['players'] = [None] * len(self.players)
+            self._status.update(dict.fromkeys(fields[5:]))
+            self._status_log = []
+            self._status_horizon = self._version
+    
+    def _refresh_status(self):
+        """Recalcule les champs marqués et journalise ceux dont la valeur a réellement changé"""
+        if not self._dirty_fields and not self._dirty_players:
+            return
+        version = self._version
+        for field in self._dirty_fields:
+            value = self.STATUS_FIELDS[field](self)
+            if self._status[field] != value:
+                self._status[field] = value
+                self._status_log.append((version, field))
+        if self._dirty_players:
+            players = list(self._status['players'])
+            for index in self._dirty_players:
+                player = self.players[index]
+                entry = {
                     'name': player.name,
                     'total_score': player.total_score,
                     'turn_score': player.turn_score,
                     'banked_dice_count': len(player.banked_dice),
                     'is_on_board': player.is_on_board
                 }
-                for player in self.players
-            ],
-            'last_dice_roll': self.last_dice_roll,
-            'shared_banked_dice': self.shared_banked_dice,
-            'remaining_dice_count': self.get_remaining_dice_count(),
-            'last_player_banked': self.last_player_banked,
-            'turn_score_to_transfer': self.turn_score_to_transfer,
-            'final_round_started': self.final_round_started,
-            'final_round_triggerer': self.final_round_triggerer.name if self.final_round_triggerer else None,
-            'final_round_players_remaining': self.final_round_players_remaining
-        }
+                if players[index] != entry:
+                    players[index] = entry
+                    self._status_log.append((version, index))
+            self._status['players'] = players
+        self._dirty_fields.clear()
+        self._dirty_players.clear()
+        self._delta_cache.clear()
+        
+        # Journal borné : les spectateurs trop en retard reçoivent un état complet
+        if len(self._status_log) > STATUS_LOG_SIZE:
+            cutoff = self._status_log[len(self._status_log) // 2][0]
+            self._status_log = [entry for entry in self._status_log if entry[0] > cutoff]
+            self._status_horizon = cutoff
     
     def save_game(self, filename: str = None) -> str:
         """
@@ -273,12 +502,115 @@ class FarkleGame:
         Args:
             filename: Nom du fichier à charger
         """
-        data = self.game_state.load_game(filename)
+        self.load_game_data(self.game_state.load_game(filename))
+    
+    def load_game_data(self, data: dict):
+        """
+        Restaure la partie depuis des données exportées par GameState.export_game_data
+        
+        Args:
+            data: Données du jeu
+        """
         (self.players, self.current_player_index, self.game_over, 
          self.winner, self.turn_count, self.last_dice_roll,
          self.shared_banked_dice, self.last_player_banked, 
          self.turn_score_to_transfer, self.final_round_started,
-         self.final_round_triggerer, self.final_round_players_remaining) = self.game_state.import_game_data(data)
+         self.final_round_triggerer, self.final_round_players_remaining,
+         self.rules, replay_data, self.roll_pending) = self.game_state.import_game_data(data)
+        
+        # Reprendre l'historique et repositionner le générateur là où la partie s'était arrêtée.
+        # Sauvegarde sans historique (anciennes versions) : pas de graine, la partie ne peut pas
+        # être rejouée et son historique partiel n'est ni sauvegardé ni analysé
+        self.seed = replay_data['seed']
+        self.initial_player_names = replay_data['players']
+        self.action_log = replay_data['actions']
+        if replay_data['rng_seed'] is not None:
+            self.dice.seed(replay_data['rng_seed'])
+            self.dice.fast_forward(replay_data['rng_draws'])
+        self._touch_all(new_players=True)
+    
+    def snapshot(self, rng_state: bool = False) -> GameSnapshot:
+        """
+        Instantané immuable de la partie (voir state.persistent.GameSnapshot)
+        
+        Bien moins coûteux qu'une copie profonde : un enregistrement par joueur, l'historique
+        est partagé. À garder tel quel pour annuler, ou à faire évoluer avec GameSnapshot.apply.
+        
+        Args:
+            rng_state: Garde l'état complet du générateur (restauration sans rejouer les tirages)
+        """
+        return GameSnapshot.from_game(self, rng_state)
+    
+    def restore(self, snapshot: GameSnapshot):
+        """
+        Remet la partie dans l'état d'un instantané, générateur des dés compris
+        
+        Args:
+            snapshot: Instantané pris sur cette partie ou obtenu par GameSnapshot.apply
+        """
+        same_players = [player.name for player in self.players] == [player.name for player in snapshot.players]
+        self.rules = snapshot.rules
+        self.players = []
+        for record in snapshot.players:
+            player = Player(record.name)
+            player.total_score = record.total_score
+            player.turn_score = record.turn_score
+            player.banked_dice = list(record.banked_dice)
+            player.is_on_board = record.is_on_board
+            self.players.append(player)
+        self.current_player_index = snapshot.current_player_index
+        self.turn_count = snapshot.turn_count
+        self.game_over = snapshot.game_over
+        self.winner = None if snapshot.winner_index is None else self.players[snapshot.winner_index]
+        self.last_dice_roll = list(snapshot.last_dice_roll)
+        self.shared_banked_dice = list(snapshot.shared_banked_dice)
+        self.last_player_banked = snapshot.last_player_banked
+        self.roll_pending = snapshot.roll_pending
+        self.turn_score_to_transfer = snapshot.turn_score_to_transfer
+        self.final_round_started = snapshot.final_round_started
+        self.final_round_triggerer = (None if snapshot.final_round_triggerer_index is None
+                                      else self.players[snapshot.final_round_triggerer_index])
+        self.final_round_players_remaining = snapshot.final_round_players_remaining
+        self.seed = snapshot.seed
+        self.initial_player_names = list(snapshot.initial_player_names)
+        # Nouvelle liste : les instantanés qui partagent l'ancienne restent valides
+        self.action_log = snapshot.action_log
+        
+        # Repositionner le générateur : rien à faire s'il n'a pas bougé depuis l'instantané
+        if self.dice.seed_value != snapshot.dice_seed or self.dice.draws != snapshot.dice_draws:
+            if snapshot.rng_state is not None:
+                self.dice.seed_value = snapshot.dice_seed
+                self.dice.rng.setstate(snapshot.rng_state)
+                self.dice.draws = snapshot.dice_draws
+            else:
+                self.dice.seed(snapshot.dice_seed)
+                self.dice.fast_forward(snapshot.dice_draws)
+        
+        # Mêmes joueurs : les spectateurs reçoivent un delta, sinon un état complet
+        self._touch_all(new_players=not same_players)
+    
+    def __getstate__(self) -> dict:
+        """Copie (copy.deepcopy, pickle) sans les profils, comme clone : une copie ne compte pas dans les statistiques"""
+        state = dict(self.__dict__)
+        state['profiles'] = None
+        return state
+    
+    def clone(self) -> 'FarkleGame':
+        """Copie indépendante de la partie (analyse « et si »), sans copie profonde"""
+        return self.snapshot(rng_state=True).to_game(self.game_state)
+
+    def get_replay_data(self) -> dict:
+        """Retourne ce qu'il faut pour rejouer la partie : graine, joueurs, règles et décisions"""
+        return {
+            'seed': self.seed,
+            'players': list(self.initial_player_names),
+            'rules': self.rules.to_dict(),
+            'actions': [list(action) for action in self.action_log],
+        }
+    
+    def get_turn_columns(self) -> dict:
+        """Résumé de chaque tour joué, en colonnes (voir state.turn_columns) : enregistré avec la partie pour les analyses"""
+        return turn_columns(self.action_log, len(self.initial_player_names), self.rules)
     
     def get_leaderboard(self) -> List[Player]:
         """Retourne le classement des joueurs par score"""
@@ -305,7 +637,14 @@ class FarkleGame:
         self.last_dice_roll = []
         self.shared_banked_dice = []
         self.last_player_banked = False
+        self.roll_pending = False
         self.turn_score_to_transfer = 0
         self.final_round_started = False
         self.final_round_triggerer = None
-        self.final_round_players_remaining = 0 
\ No newline at end of file
+        self.final_round_players_remaining = 0
+        
+        # La partie recommence : nouvel historique, à partir d'une graine neuve
+        self.dice.seed()
+        self.seed = self.dice.seed_value
+        self.action_log = []
+        self._touch_all()
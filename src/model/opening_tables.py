@@ -0,0 +1,932 @@
+# Généré par « python main.py opening-tables » (model.rules.write_frozen_tables), ne pas modifier
+# Barème par défaut : pour chaque lancé trié de 1 à 6 dés (dont les 462 lancés de 6 dés), les
+# combinaisons conservables (score, dés gardés, dés à relancer, 6 après un hot dice) par score décroissant
+
+SCORING_KEY = (((1, 100), (5, 50)), ((1, 1000), (2, 200), (3, 300), (4, 400), (5, 500), (6, 600)), 2, 1000, 1000)
+
+KEEPS_TABLE = {
+    (): (),
+    (1,): ((100, (1,), 6),),
+    (2,): (),
+    (3,): (),
+    (4,): (),
+    (5,): ((50, (5,), 6),),
+    (6,): (),
+    (1, 1): ((200, (1, 1), 6), (100, (1,), 1)),
+    (1, 2): ((100, (1,), 1),),
+    (1, 3): ((100, (1,), 1),),
+    (1, 4): ((100, (1,), 1),),
+    (1, 5): ((150, (1, 5), 6), (100, (1,), 1), (50, (5,), 1)),
+    (1, 6): ((100, (1,), 1),),
+    (2, 2): (),
+    (2, 3): (),
+    (2, 4): (),
+    (2, 5): ((50, (5,), 1),),
+    (2, 6): (),
+    (3, 3): (),
+    (3, 4): (),
+    (3, 5): ((50, (5,), 1),),
+    (3, 6): (),
+    (4, 4): (),
+    (4, 5): ((50, (5,), 1),),
+    (4, 6): (),
+    (5, 5): ((100, (5, 5), 6), (50, (5,), 1)),
+    (5, 6): ((50, (5,), 1),),
+    (6, 6): (),
+    (1, 1, 1): ((1000, (1, 1, 1), 6), (200, (1, 1), 1), (100, (1,), 2)),
+    (1, 1, 2): ((200, (1, 1), 1), (100, (1,), 2)),
+    (1, 1, 3): ((200, (1, 1), 1), (100, (1,), 2)),
+    (1, 1, 4): ((200, (1, 1), 1), (100, (1,), 2)),
+    (1, 1, 5): ((250, (1, 1, 5), 6), (200, (1, 1), 1), (150, (1, 5), 1), (100, (1,), 2), (50, (5,), 2)),
+    (1, 1, 6): ((200, (1, 1), 1), (100, (1,), 2)),
+    (1, 2, 2): ((100, (1,), 2),),
+    (1, 2, 3): ((100, (1,), 2),),
+    (1, 2, 4): ((100, (1,), 2),),
+    (1, 2, 5): ((150, (1, 5), 1), (100, (1,), 2), (50, (5,), 2)),
+    (1, 2, 6): ((100, (1,), 2),),
+    (1, 3, 3): ((100, (1,), 2),),
+    (1, 3, 4): ((100, (1,), 2),),
+    (1, 3, 5): ((150, (1, 5), 1), (100, (1,), 2), (50, (5,), 2)),
+    (1, 3, 6): ((100, (1,), 2),),
+    (1, 4, 4): ((100, (1,), 2),),
+    (1, 4, 5): ((150, (1, 5), 1), (100, (1,), 2), (50, (5,), 2)),
+    (1, 4, 6): ((100, (1,), 2),),
+    (1, 5, 5): ((200, (1, 5, 5), 6), (150, (1, 5), 1), (100, (5, 5), 1), (100, (1,), 2), (50, (5,), 2)),
+    (1, 5, 6): ((150, (1, 5), 1), (100, (1,), 2), (50, (5,), 2)),
+    (1, 6, 6): ((100, (1,), 2),),
+    (2, 2, 2): ((200, (2, 2, 2), 6),),
+    (2, 2, 3): (),
+    (2, 2, 4): (),
+    (2, 2, 5): ((50, (5,), 2),),
+    (2, 2, 6): (),
+    (2, 3, 3): (),
+    (2, 3, 4): (),
+    (2, 3, 5): ((50, (5,), 2),),
+    (2, 3, 6): (),
+    (2, 4, 4): (),
+    (2, 4, 5): ((50, (5,), 2),),
+    (2, 4, 6): (),
+    (2, 5, 5): ((100, (5, 5), 1), (50, (5,), 2)),
+    (2, 5, 6): ((50, (5,), 2),),
+    (2, 6, 6): (),
+    (3, 3, 3): ((300, (3, 3, 3), 6),),
+    (3, 3, 4): (),
+    (3, 3, 5): ((50, (5,), 2),),
+    (3, 3, 6): (),
+    (3, 4, 4): (),
+    (3, 4, 5): ((50, (5,), 2),),
+    (3, 4, 6): (),
+    (3, 5, 5): ((100, (5, 5), 1), (50, (5,), 2)),
+    (3, 5, 6): ((50, (5,), 2),),
+    (3, 6, 6): (),
+    (4, 4, 4): ((400, (4, 4, 4), 6),),
+    (4, 4, 5): ((50, (5,), 2),),
+    (4, 4, 6): (),
+    (4, 5, 5): ((100, (5, 5), 1), (50, (5,), 2)),
+    (4, 5, 6): ((50, (5,), 2),),
+    (4, 6, 6): (),
+    (5, 5, 5): ((500, (5, 5, 5), 6), (100, (5, 5), 1), (50, (5,), 2)),
+    (5, 5, 6): ((100, (5, 5), 1), (50, (5,), 2)),
+    (5, 6, 6): ((50, (5,), 2),),
+    (6, 6, 6): ((600, (6, 6, 6), 6),),
+    (1, 1, 1, 1): ((2000, (1, 1, 1, 1), 6), (1000, (1, 1, 1), 1), (200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 1, 2): ((1000, (1, 1, 1), 1), (200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 1, 3): ((1000, (1, 1, 1), 1), (200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 1, 4): ((1000, (1, 1, 1), 1), (200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 1, 5): ((1050, (1, 1, 1, 5), 6), (1000, (1, 1, 1), 1), (250, (1, 1, 5), 1), (200, (1, 1), 2), (150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 1, 1, 6): ((1000, (1, 1, 1), 1), (200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 2, 2): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 2, 3): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 2, 4): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 2, 5): ((250, (1, 1, 5), 1), (200, (1, 1), 2), (150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 1, 2, 6): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 3, 3): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 3, 4): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 3, 5): ((250, (1, 1, 5), 1), (200, (1, 1), 2), (150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 1, 3, 6): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 4, 4): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 4, 5): ((250, (1, 1, 5), 1), (200, (1, 1), 2), (150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 1, 4, 6): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 1, 5, 5): ((300, (1, 1, 5, 5), 6), (250, (1, 1, 5), 1), (200, (1, 5, 5), 1), (200, (1, 1), 2), (150, (1, 5), 2), (100, (5, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 1, 5, 6): ((250, (1, 1, 5), 1), (200, (1, 1), 2), (150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 1, 6, 6): ((200, (1, 1), 2), (100, (1,), 3)),
+    (1, 2, 2, 2): ((300, (1, 2, 2, 2), 6), (200, (2, 2, 2), 1), (100, (1,), 3)),
+    (1, 2, 2, 3): ((100, (1,), 3),),
+    (1, 2, 2, 4): ((100, (1,), 3),),
+    (1, 2, 2, 5): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 2, 2, 6): ((100, (1,), 3),),
+    (1, 2, 3, 3): ((100, (1,), 3),),
+    (1, 2, 3, 4): ((100, (1,), 3),),
+    (1, 2, 3, 5): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 2, 3, 6): ((100, (1,), 3),),
+    (1, 2, 4, 4): ((100, (1,), 3),),
+    (1, 2, 4, 5): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 2, 4, 6): ((100, (1,), 3),),
+    (1, 2, 5, 5): ((200, (1, 5, 5), 1), (150, (1, 5), 2), (100, (5, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 2, 5, 6): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 2, 6, 6): ((100, (1,), 3),),
+    (1, 3, 3, 3): ((400, (1, 3, 3, 3), 6), (300, (3, 3, 3), 1), (100, (1,), 3)),
+    (1, 3, 3, 4): ((100, (1,), 3),),
+    (1, 3, 3, 5): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 3, 3, 6): ((100, (1,), 3),),
+    (1, 3, 4, 4): ((100, (1,), 3),),
+    (1, 3, 4, 5): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 3, 4, 6): ((100, (1,), 3),),
+    (1, 3, 5, 5): ((200, (1, 5, 5), 1), (150, (1, 5), 2), (100, (5, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 3, 5, 6): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 3, 6, 6): ((100, (1,), 3),),
+    (1, 4, 4, 4): ((500, (1, 4, 4, 4), 6), (400, (4, 4, 4), 1), (100, (1,), 3)),
+    (1, 4, 4, 5): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 4, 4, 6): ((100, (1,), 3),),
+    (1, 4, 5, 5): ((200, (1, 5, 5), 1), (150, (1, 5), 2), (100, (5, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 4, 5, 6): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 4, 6, 6): ((100, (1,), 3),),
+    (1, 5, 5, 5): ((600, (1, 5, 5, 5), 6), (500, (5, 5, 5), 1), (200, (1, 5, 5), 1), (150, (1, 5), 2), (100, (5, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 5, 5, 6): ((200, (1, 5, 5), 1), (150, (1, 5), 2), (100, (5, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 5, 6, 6): ((150, (1, 5), 2), (100, (1,), 3), (50, (5,), 3)),
+    (1, 6, 6, 6): ((700, (1, 6, 6, 6), 6), (600, (6, 6, 6), 1), (100, (1,), 3)),
+    (2, 2, 2, 2): ((400, (2, 2, 2, 2), 6), (200, (2, 2, 2), 1)),
+    (2, 2, 2, 3): ((200, (2, 2, 2), 1),),
+    (2, 2, 2, 4): ((200, (2, 2, 2), 1),),
+    (2, 2, 2, 5): ((250, (2, 2, 2, 5), 6), (200, (2, 2, 2), 1), (50, (5,), 3)),
+    (2, 2, 2, 6): ((200, (2, 2, 2), 1),),
+    (2, 2, 3, 3): (),
+    (2, 2, 3, 4): (),
+    (2, 2, 3, 5): ((50, (5,), 3),),
+    (2, 2, 3, 6): (),
+    (2, 2, 4, 4): (),
+    (2, 2, 4, 5): ((50, (5,), 3),),
+    (2, 2, 4, 6): (),
+    (2, 2, 5, 5): ((100, (5, 5), 2), (50, (5,), 3)),
+    (2, 2, 5, 6): ((50, (5,), 3),),
+    (2, 2, 6, 6): (),
+    (2, 3, 3, 3): ((300, (3, 3, 3), 1),),
+    (2, 3, 3, 4): (),
+    (2, 3, 3, 5): ((50, (5,), 3),),
+    (2, 3, 3, 6): (),
+    (2, 3, 4, 4): (),
+    (2, 3, 4, 5): ((50, (5,), 3),),
+    (2, 3, 4, 6): (),
+    (2, 3, 5, 5): ((100, (5, 5), 2), (50, (5,), 3)),
+    (2, 3, 5, 6): ((50, (5,), 3),),
+    (2, 3, 6, 6): (),
+    (2, 4, 4, 4): ((400, (4, 4, 4), 1),),
+    (2, 4, 4, 5): ((50, (5,), 3),),
+    (2, 4, 4, 6): (),
+    (2, 4, 5, 5): ((100, (5, 5), 2), (50, (5,), 3)),
+    (2, 4, 5, 6): ((50, (5,), 3),),
+    (2, 4, 6, 6): (),
+    (2, 5, 5, 5): ((500, (5, 5, 5), 1), (100, (5, 5), 2), (50, (5,), 3)),
+    (2, 5, 5, 6): ((100, (5, 5), 2), (50, (5,), 3)),
+    (2, 5, 6, 6): ((50, (5,), 3),),
+    (2, 6, 6, 6): ((600, (6, 6, 6), 1),),
+    (3, 3, 3, 3): ((600, (3, 3, 3, 3), 6), (300, (3, 3, 3), 1)),
+    (3, 3, 3, 4): ((300, (3, 3, 3), 1),),
+    (3, 3, 3, 5): ((350, (3, 3, 3, 5), 6), (300, (3, 3, 3), 1), (50, (5,), 3)),
+    (3, 3, 3, 6): ((300, (3, 3, 3), 1),),
+    (3, 3, 4, 4): (),
+    (3, 3, 4, 5): ((50, (5,), 3),),
+    (3, 3, 4, 6): (),
+    (3, 3, 5, 5): ((100, (5, 5), 2), (50, (5,), 3)),
+    (3, 3, 5, 6): ((50, (5,), 3),),
+    (3, 3, 6, 6): (),
+    (3, 4, 4, 4): ((400, (4, 4, 4), 1),),
+    (3, 4, 4, 5): ((50, (5,), 3),),
+    (3, 4, 4, 6): (),
+    (3, 4, 5, 5): ((100, (5, 5), 2), (50, (5,), 3)),
+    (3, 4, 5, 6): ((50, (5,), 3),),
+    (3, 4, 6, 6): (),
+    (3, 5, 5, 5): ((500, (5, 5, 5), 1), (100, (5, 5), 2), (50, (5,), 3)),
+    (3, 5, 5, 6): ((100, (5, 5), 2), (50, (5,), 3)),
+    (3, 5, 6, 6): ((50, (5,), 3),),
+    (3, 6, 6, 6): ((600, (6, 6, 6), 1),),
+    (4, 4, 4, 4): ((800, (4, 4, 4, 4), 6), (400, (4, 4, 4), 1)),
+    (4, 4, 4, 5): ((450, (4, 4, 4, 5), 6), (400, (4, 4, 4), 1), (50, (5,), 3)),
+    (4, 4, 4, 6): ((400, (4, 4, 4), 1),),
+    (4, 4, 5, 5): ((100, (5, 5), 2), (50, (5,), 3)),
+    (4, 4, 5, 6): ((50, (5,), 3),),
+    (4, 4, 6, 6): (),
+    (4, 5, 5, 5): ((500, (5, 5, 5), 1), (100, (5, 5), 2), (50, (5,), 3)),
+    (4, 5, 5, 6): ((100, (5, 5), 2), (50, (5,), 3)),
+    (4, 5, 6, 6): ((50, (5,), 3),),
+    (4, 6, 6, 6): ((600, (6, 6, 6), 1),),
+    (5, 5, 5, 5): ((1000, (5, 5, 5, 5), 6), (500, (5, 5, 5), 1), (100, (5, 5), 2), (50, (5,), 3)),
+    (5, 5, 5, 6): ((500, (5, 5, 5), 1), (100, (5, 5), 2), (50, (5,), 3)),
+    (5, 5, 6, 6): ((100, (5, 5), 2), (50, (5,), 3)),
+    (5, 6, 6, 6): ((650, (5, 6, 6, 6), 6), (600, (6, 6, 6), 1), (50, (5,), 3)),
+    (6, 6, 6, 6): ((1200, (6, 6, 6, 6), 6), (600, (6, 6, 6), 1)),
+    (1, 1, 1, 1, 1): ((4000, (1, 1, 1, 1, 1), 6), (2000, (1, 1, 1, 1), 1), (1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 1, 2): ((2000, (1, 1, 1, 1), 1), (1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 1, 3): ((2000, (1, 1, 1, 1), 1), (1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 1, 4): ((2000, (1, 1, 1, 1), 1), (1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 1, 5): ((2050, (1, 1, 1, 1, 5), 6), (2000, (1, 1, 1, 1), 1), (1050, (1, 1, 1, 5), 1), (1000, (1, 1, 1), 2), (250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 1, 1, 6): ((2000, (1, 1, 1, 1), 1), (1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 2, 2): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 2, 3): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 2, 4): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 2, 5): ((1050, (1, 1, 1, 5), 1), (1000, (1, 1, 1), 2), (250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 1, 2, 6): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 3, 3): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 3, 4): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 3, 5): ((1050, (1, 1, 1, 5), 1), (1000, (1, 1, 1), 2), (250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 1, 3, 6): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 4, 4): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 4, 5): ((1050, (1, 1, 1, 5), 1), (1000, (1, 1, 1), 2), (250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 1, 4, 6): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 1, 5, 5): ((1100, (1, 1, 1, 5, 5), 6), (1050, (1, 1, 1, 5), 1), (1000, (1, 1, 1), 2), (300, (1, 1, 5, 5), 1), (250, (1, 1, 5), 2), (200, (1, 5, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 1, 5, 6): ((1050, (1, 1, 1, 5), 1), (1000, (1, 1, 1), 2), (250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 1, 6, 6): ((1000, (1, 1, 1), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 2, 2): ((400, (1, 1, 2, 2, 2), 6), (300, (1, 2, 2, 2), 1), (200, (2, 2, 2), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 2, 3): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 2, 4): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 2, 5): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 2, 2, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 3, 3): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 3, 4): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 3, 5): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 2, 3, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 4, 4): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 4, 5): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 2, 4, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 2, 5, 5): ((300, (1, 1, 5, 5), 1), (250, (1, 1, 5), 2), (200, (1, 5, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 2, 5, 6): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 2, 6, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 3, 3, 3): ((500, (1, 1, 3, 3, 3), 6), (400, (1, 3, 3, 3), 1), (300, (3, 3, 3), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 3, 3, 4): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 3, 3, 5): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 3, 3, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 3, 4, 4): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 3, 4, 5): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 3, 4, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 3, 5, 5): ((300, (1, 1, 5, 5), 1), (250, (1, 1, 5), 2), (200, (1, 5, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 3, 5, 6): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 3, 6, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 4, 4, 4): ((600, (1, 1, 4, 4, 4), 6), (500, (1, 4, 4, 4), 1), (400, (4, 4, 4), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 4, 4, 5): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 4, 4, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 4, 5, 5): ((300, (1, 1, 5, 5), 1), (250, (1, 1, 5), 2), (200, (1, 5, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 4, 5, 6): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 4, 6, 6): ((200, (1, 1), 3), (100, (1,), 4)),
+    (1, 1, 5, 5, 5): ((700, (1, 1, 5, 5, 5), 6), (600, (1, 5, 5, 5), 1), (500, (5, 5, 5), 2), (300, (1, 1, 5, 5), 1), (250, (1, 1, 5), 2), (200, (1, 5, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 5, 5, 6): ((300, (1, 1, 5, 5), 1), (250, (1, 1, 5), 2), (200, (1, 5, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 5, 6, 6): ((250, (1, 1, 5), 2), (200, (1, 1), 3), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 1, 6, 6, 6): ((800, (1, 1, 6, 6, 6), 6), (700, (1, 6, 6, 6), 1), (600, (6, 6, 6), 2), (200, (1, 1), 3), (100, (1,), 4)),
+    (1, 2, 2, 2, 2): ((500, (1, 2, 2, 2, 2), 6), (400, (2, 2, 2, 2), 1), (300, (1, 2, 2, 2), 1), (200, (2, 2, 2), 2), (100, (1,), 4)),
+    (1, 2, 2, 2, 3): ((300, (1, 2, 2, 2), 1), (200, (2, 2, 2), 2), (100, (1,), 4)),
+    (1, 2, 2, 2, 4): ((300, (1, 2, 2, 2), 1), (200, (2, 2, 2), 2), (100, (1,), 4)),
+    (1, 2, 2, 2, 5): ((350, (1, 2, 2, 2, 5), 6), (300, (1, 2, 2, 2), 1), (250, (2, 2, 2, 5), 1), (200, (2, 2, 2), 2), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 2, 2, 6): ((300, (1, 2, 2, 2), 1), (200, (2, 2, 2), 2), (100, (1,), 4)),
+    (1, 2, 2, 3, 3): ((100, (1,), 4),),
+    (1, 2, 2, 3, 4): ((100, (1,), 4),),
+    (1, 2, 2, 3, 5): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 2, 3, 6): ((100, (1,), 4),),
+    (1, 2, 2, 4, 4): ((100, (1,), 4),),
+    (1, 2, 2, 4, 5): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 2, 4, 6): ((100, (1,), 4),),
+    (1, 2, 2, 5, 5): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 2, 5, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 2, 6, 6): ((100, (1,), 4),),
+    (1, 2, 3, 3, 3): ((400, (1, 3, 3, 3), 1), (300, (3, 3, 3), 2), (100, (1,), 4)),
+    (1, 2, 3, 3, 4): ((100, (1,), 4),),
+    (1, 2, 3, 3, 5): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 3, 3, 6): ((100, (1,), 4),),
+    (1, 2, 3, 4, 4): ((100, (1,), 4),),
+    (1, 2, 3, 4, 5): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 3, 4, 6): ((100, (1,), 4),),
+    (1, 2, 3, 5, 5): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 3, 5, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 3, 6, 6): ((100, (1,), 4),),
+    (1, 2, 4, 4, 4): ((500, (1, 4, 4, 4), 1), (400, (4, 4, 4), 2), (100, (1,), 4)),
+    (1, 2, 4, 4, 5): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 4, 4, 6): ((100, (1,), 4),),
+    (1, 2, 4, 5, 5): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 4, 5, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 4, 6, 6): ((100, (1,), 4),),
+    (1, 2, 5, 5, 5): ((600, (1, 5, 5, 5), 1), (500, (5, 5, 5), 2), (200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 5, 5, 6): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 5, 6, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 2, 6, 6, 6): ((700, (1, 6, 6, 6), 1), (600, (6, 6, 6), 2), (100, (1,), 4)),
+    (1, 3, 3, 3, 3): ((700, (1, 3, 3, 3, 3), 6), (600, (3, 3, 3, 3), 1), (400, (1, 3, 3, 3), 1), (300, (3, 3, 3), 2), (100, (1,), 4)),
+    (1, 3, 3, 3, 4): ((400, (1, 3, 3, 3), 1), (300, (3, 3, 3), 2), (100, (1,), 4)),
+    (1, 3, 3, 3, 5): ((450, (1, 3, 3, 3, 5), 6), (400, (1, 3, 3, 3), 1), (350, (3, 3, 3, 5), 1), (300, (3, 3, 3), 2), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 3, 3, 6): ((400, (1, 3, 3, 3), 1), (300, (3, 3, 3), 2), (100, (1,), 4)),
+    (1, 3, 3, 4, 4): ((100, (1,), 4),),
+    (1, 3, 3, 4, 5): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 3, 4, 6): ((100, (1,), 4),),
+    (1, 3, 3, 5, 5): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 3, 5, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 3, 6, 6): ((100, (1,), 4),),
+    (1, 3, 4, 4, 4): ((500, (1, 4, 4, 4), 1), (400, (4, 4, 4), 2), (100, (1,), 4)),
+    (1, 3, 4, 4, 5): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 4, 4, 6): ((100, (1,), 4),),
+    (1, 3, 4, 5, 5): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 4, 5, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 4, 6, 6): ((100, (1,), 4),),
+    (1, 3, 5, 5, 5): ((600, (1, 5, 5, 5), 1), (500, (5, 5, 5), 2), (200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 5, 5, 6): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 5, 6, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 3, 6, 6, 6): ((700, (1, 6, 6, 6), 1), (600, (6, 6, 6), 2), (100, (1,), 4)),
+    (1, 4, 4, 4, 4): ((900, (1, 4, 4, 4, 4), 6), (800, (4, 4, 4, 4), 1), (500, (1, 4, 4, 4), 1), (400, (4, 4, 4), 2), (100, (1,), 4)),
+    (1, 4, 4, 4, 5): ((550, (1, 4, 4, 4, 5), 6), (500, (1, 4, 4, 4), 1), (450, (4, 4, 4, 5), 1), (400, (4, 4, 4), 2), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 4, 4, 4, 6): ((500, (1, 4, 4, 4), 1), (400, (4, 4, 4), 2), (100, (1,), 4)),
+    (1, 4, 4, 5, 5): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 4, 4, 5, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 4, 4, 6, 6): ((100, (1,), 4),),
+    (1, 4, 5, 5, 5): ((600, (1, 5, 5, 5), 1), (500, (5, 5, 5), 2), (200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 4, 5, 5, 6): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 4, 5, 6, 6): ((150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 4, 6, 6, 6): ((700, (1, 6, 6, 6), 1), (600, (6, 6, 6), 2), (100, (1,), 4)),
+    (1, 5, 5, 5, 5): ((1100, (1, 5, 5, 5, 5), 6), (1000, (5, 5, 5, 5), 1), (600, (1, 5, 5, 5), 1), (500, (5, 5, 5), 2), (200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 5, 5, 5, 6): ((600, (1, 5, 5, 5), 1), (500, (5, 5, 5), 2), (200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 5, 5, 6, 6): ((200, (1, 5, 5), 2), (150, (1, 5), 3), (100, (5, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 5, 6, 6, 6): ((750, (1, 5, 6, 6, 6), 6), (700, (1, 6, 6, 6), 1), (650, (5, 6, 6, 6), 1), (600, (6, 6, 6), 2), (150, (1, 5), 3), (100, (1,), 4), (50, (5,), 4)),
+    (1, 6, 6, 6, 6): ((1300, (1, 6, 6, 6, 6), 6), (1200, (6, 6, 6, 6), 1), (700, (1, 6, 6, 6), 1), (600, (6, 6, 6), 2), (100, (1,), 4)),
+    (2, 2, 2, 2, 2): ((800, (2, 2, 2, 2, 2), 6), (400, (2, 2, 2, 2), 1), (200, (2, 2, 2), 2)),
+    (2, 2, 2, 2, 3): ((400, (2, 2, 2, 2), 1), (200, (2, 2, 2), 2)),
+    (2, 2, 2, 2, 4): ((400, (2, 2, 2, 2), 1), (200, (2, 2, 2), 2)),
+    (2, 2, 2, 2, 5): ((450, (2, 2, 2, 2, 5), 6), (400, (2, 2, 2, 2), 1), (250, (2, 2, 2, 5), 1), (200, (2, 2, 2), 2), (50, (5,), 4)),
+    (2, 2, 2, 2, 6): ((400, (2, 2, 2, 2), 1), (200, (2, 2, 2), 2)),
+    (2, 2, 2, 3, 3): ((200, (2, 2, 2), 2),),
+    (2, 2, 2, 3, 4): ((200, (2, 2, 2), 2),),
+    (2, 2, 2, 3, 5): ((250, (2, 2, 2, 5), 1), (200, (2, 2, 2), 2), (50, (5,), 4)),
+    (2, 2, 2, 3, 6): ((200, (2, 2, 2), 2),),
+    (2, 2, 2, 4, 4): ((200, (2, 2, 2), 2),),
+    (2, 2, 2, 4, 5): ((250, (2, 2, 2, 5), 1), (200, (2, 2, 2), 2), (50, (5,), 4)),
+    (2, 2, 2, 4, 6): ((200, (2, 2, 2), 2),),
+    (2, 2, 2, 5, 5): ((300, (2, 2, 2, 5, 5), 6), (250, (2, 2, 2, 5), 1), (200, (2, 2, 2), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (2, 2, 2, 5, 6): ((250, (2, 2, 2, 5), 1), (200, (2, 2, 2), 2), (50, (5,), 4)),
+    (2, 2, 2, 6, 6): ((200, (2, 2, 2), 2),),
+    (2, 2, 3, 3, 3): ((300, (3, 3, 3), 2),),
+    (2, 2, 3, 3, 4): (),
+    (2, 2, 3, 3, 5): ((50, (5,), 4),),
+    (2, 2, 3, 3, 6): (),
+    (2, 2, 3, 4, 4): (),
+    (2, 2, 3, 4, 5): ((50, (5,), 4),),
+    (2, 2, 3, 4, 6): (),
+    (2, 2, 3, 5, 5): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 2, 3, 5, 6): ((50, (5,), 4),),
+    (2, 2, 3, 6, 6): (),
+    (2, 2, 4, 4, 4): ((400, (4, 4, 4), 2),),
+    (2, 2, 4, 4, 5): ((50, (5,), 4),),
+    (2, 2, 4, 4, 6): (),
+    (2, 2, 4, 5, 5): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 2, 4, 5, 6): ((50, (5,), 4),),
+    (2, 2, 4, 6, 6): (),
+    (2, 2, 5, 5, 5): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (2, 2, 5, 5, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 2, 5, 6, 6): ((50, (5,), 4),),
+    (2, 2, 6, 6, 6): ((600, (6, 6, 6), 2),),
+    (2, 3, 3, 3, 3): ((600, (3, 3, 3, 3), 1), (300, (3, 3, 3), 2)),
+    (2, 3, 3, 3, 4): ((300, (3, 3, 3), 2),),
+    (2, 3, 3, 3, 5): ((350, (3, 3, 3, 5), 1), (300, (3, 3, 3), 2), (50, (5,), 4)),
+    (2, 3, 3, 3, 6): ((300, (3, 3, 3), 2),),
+    (2, 3, 3, 4, 4): (),
+    (2, 3, 3, 4, 5): ((50, (5,), 4),),
+    (2, 3, 3, 4, 6): (),
+    (2, 3, 3, 5, 5): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 3, 3, 5, 6): ((50, (5,), 4),),
+    (2, 3, 3, 6, 6): (),
+    (2, 3, 4, 4, 4): ((400, (4, 4, 4), 2),),
+    (2, 3, 4, 4, 5): ((50, (5,), 4),),
+    (2, 3, 4, 4, 6): (),
+    (2, 3, 4, 5, 5): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 3, 4, 5, 6): ((50, (5,), 4),),
+    (2, 3, 4, 6, 6): (),
+    (2, 3, 5, 5, 5): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (2, 3, 5, 5, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 3, 5, 6, 6): ((50, (5,), 4),),
+    (2, 3, 6, 6, 6): ((600, (6, 6, 6), 2),),
+    (2, 4, 4, 4, 4): ((800, (4, 4, 4, 4), 1), (400, (4, 4, 4), 2)),
+    (2, 4, 4, 4, 5): ((450, (4, 4, 4, 5), 1), (400, (4, 4, 4), 2), (50, (5,), 4)),
+    (2, 4, 4, 4, 6): ((400, (4, 4, 4), 2),),
+    (2, 4, 4, 5, 5): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 4, 4, 5, 6): ((50, (5,), 4),),
+    (2, 4, 4, 6, 6): (),
+    (2, 4, 5, 5, 5): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (2, 4, 5, 5, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 4, 5, 6, 6): ((50, (5,), 4),),
+    (2, 4, 6, 6, 6): ((600, (6, 6, 6), 2),),
+    (2, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 1), (500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (2, 5, 5, 5, 6): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (2, 5, 5, 6, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (2, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 1), (600, (6, 6, 6), 2), (50, (5,), 4)),
+    (2, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 1), (600, (6, 6, 6), 2)),
+    (3, 3, 3, 3, 3): ((1200, (3, 3, 3, 3, 3), 6), (600, (3, 3, 3, 3), 1), (300, (3, 3, 3), 2)),
+    (3, 3, 3, 3, 4): ((600, (3, 3, 3, 3), 1), (300, (3, 3, 3), 2)),
+    (3, 3, 3, 3, 5): ((650, (3, 3, 3, 3, 5), 6), (600, (3, 3, 3, 3), 1), (350, (3, 3, 3, 5), 1), (300, (3, 3, 3), 2), (50, (5,), 4)),
+    (3, 3, 3, 3, 6): ((600, (3, 3, 3, 3), 1), (300, (3, 3, 3), 2)),
+    (3, 3, 3, 4, 4): ((300, (3, 3, 3), 2),),
+    (3, 3, 3, 4, 5): ((350, (3, 3, 3, 5), 1), (300, (3, 3, 3), 2), (50, (5,), 4)),
+    (3, 3, 3, 4, 6): ((300, (3, 3, 3), 2),),
+    (3, 3, 3, 5, 5): ((400, (3, 3, 3, 5, 5), 6), (350, (3, 3, 3, 5), 1), (300, (3, 3, 3), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (3, 3, 3, 5, 6): ((350, (3, 3, 3, 5), 1), (300, (3, 3, 3), 2), (50, (5,), 4)),
+    (3, 3, 3, 6, 6): ((300, (3, 3, 3), 2),),
+    (3, 3, 4, 4, 4): ((400, (4, 4, 4), 2),),
+    (3, 3, 4, 4, 5): ((50, (5,), 4),),
+    (3, 3, 4, 4, 6): (),
+    (3, 3, 4, 5, 5): ((100, (5, 5), 3), (50, (5,), 4)),
+    (3, 3, 4, 5, 6): ((50, (5,), 4),),
+    (3, 3, 4, 6, 6): (),
+    (3, 3, 5, 5, 5): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (3, 3, 5, 5, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (3, 3, 5, 6, 6): ((50, (5,), 4),),
+    (3, 3, 6, 6, 6): ((600, (6, 6, 6), 2),),
+    (3, 4, 4, 4, 4): ((800, (4, 4, 4, 4), 1), (400, (4, 4, 4), 2)),
+    (3, 4, 4, 4, 5): ((450, (4, 4, 4, 5), 1), (400, (4, 4, 4), 2), (50, (5,), 4)),
+    (3, 4, 4, 4, 6): ((400, (4, 4, 4), 2),),
+    (3, 4, 4, 5, 5): ((100, (5, 5), 3), (50, (5,), 4)),
+    (3, 4, 4, 5, 6): ((50, (5,), 4),),
+    (3, 4, 4, 6, 6): (),
+    (3, 4, 5, 5, 5): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (3, 4, 5, 5, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (3, 4, 5, 6, 6): ((50, (5,), 4),),
+    (3, 4, 6, 6, 6): ((600, (6, 6, 6), 2),),
+    (3, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 1), (500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (3, 5, 5, 5, 6): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (3, 5, 5, 6, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (3, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 1), (600, (6, 6, 6), 2), (50, (5,), 4)),
+    (3, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 1), (600, (6, 6, 6), 2)),
+    (4, 4, 4, 4, 4): ((1600, (4, 4, 4, 4, 4), 6), (800, (4, 4, 4, 4), 1), (400, (4, 4, 4), 2)),
+    (4, 4, 4, 4, 5): ((850, (4, 4, 4, 4, 5), 6), (800, (4, 4, 4, 4), 1), (450, (4, 4, 4, 5), 1), (400, (4, 4, 4), 2), (50, (5,), 4)),
+    (4, 4, 4, 4, 6): ((800, (4, 4, 4, 4), 1), (400, (4, 4, 4), 2)),
+    (4, 4, 4, 5, 5): ((500, (4, 4, 4, 5, 5), 6), (450, (4, 4, 4, 5), 1), (400, (4, 4, 4), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (4, 4, 4, 5, 6): ((450, (4, 4, 4, 5), 1), (400, (4, 4, 4), 2), (50, (5,), 4)),
+    (4, 4, 4, 6, 6): ((400, (4, 4, 4), 2),),
+    (4, 4, 5, 5, 5): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (4, 4, 5, 5, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (4, 4, 5, 6, 6): ((50, (5,), 4),),
+    (4, 4, 6, 6, 6): ((600, (6, 6, 6), 2),),
+    (4, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 1), (500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (4, 5, 5, 5, 6): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (4, 5, 5, 6, 6): ((100, (5, 5), 3), (50, (5,), 4)),
+    (4, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 1), (600, (6, 6, 6), 2), (50, (5,), 4)),
+    (4, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 1), (600, (6, 6, 6), 2)),
+    (5, 5, 5, 5, 5): ((2000, (5, 5, 5, 5, 5), 6), (1000, (5, 5, 5, 5), 1), (500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (5, 5, 5, 5, 6): ((1000, (5, 5, 5, 5), 1), (500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (5, 5, 5, 6, 6): ((500, (5, 5, 5), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (5, 5, 6, 6, 6): ((700, (5, 5, 6, 6, 6), 6), (650, (5, 6, 6, 6), 1), (600, (6, 6, 6), 2), (100, (5, 5), 3), (50, (5,), 4)),
+    (5, 6, 6, 6, 6): ((1250, (5, 6, 6, 6, 6), 6), (1200, (6, 6, 6, 6), 1), (650, (5, 6, 6, 6), 1), (600, (6, 6, 6), 2), (50, (5,), 4)),
+    (6, 6, 6, 6, 6): ((2400, (6, 6, 6, 6, 6), 6), (1200, (6, 6, 6, 6), 1), (600, (6, 6, 6), 2)),
+    (1, 1, 1, 1, 1, 1): ((8000, (1, 1, 1, 1, 1, 1), 6), (4000, (1, 1, 1, 1, 1), 1), (2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 1, 2): ((4000, (1, 1, 1, 1, 1), 1), (2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 1, 3): ((4000, (1, 1, 1, 1, 1), 1), (2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 1, 4): ((4000, (1, 1, 1, 1, 1), 1), (2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 1, 5): ((4050, (1, 1, 1, 1, 1, 5), 6), (4000, (1, 1, 1, 1, 1), 1), (2050, (1, 1, 1, 1, 5), 1), (2000, (1, 1, 1, 1), 2), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 1, 1, 6): ((4000, (1, 1, 1, 1, 1), 1), (2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 2, 2): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 2, 3): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 2, 4): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 2, 5): ((2050, (1, 1, 1, 1, 5), 1), (2000, (1, 1, 1, 1), 2), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 1, 2, 6): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 3, 3): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 3, 4): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 3, 5): ((2050, (1, 1, 1, 1, 5), 1), (2000, (1, 1, 1, 1), 2), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 1, 3, 6): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 4, 4): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 4, 5): ((2050, (1, 1, 1, 1, 5), 1), (2000, (1, 1, 1, 1), 2), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 1, 4, 6): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 1, 5, 5): ((2100, (1, 1, 1, 1, 5, 5), 6), (2050, (1, 1, 1, 1, 5), 1), (2000, (1, 1, 1, 1), 2), (1100, (1, 1, 1, 5, 5), 1), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 1, 5, 6): ((2050, (1, 1, 1, 1, 5), 1), (2000, (1, 1, 1, 1), 2), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 1, 6, 6): ((2000, (1, 1, 1, 1), 2), (1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 2, 2): ((1200, (1, 1, 1, 2, 2, 2), 6), (1000, (1, 1, 1), 3), (400, (1, 1, 2, 2, 2), 1), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 2, 3): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 2, 4): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 2, 5): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 2, 2, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 3, 3): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 3, 4): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 3, 5): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 2, 3, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 4, 4): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 4, 5): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 2, 4, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 2, 5, 5): ((1100, (1, 1, 1, 5, 5), 1), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 2, 5, 6): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 2, 6, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 3, 3, 3): ((1300, (1, 1, 1, 3, 3, 3), 6), (1000, (1, 1, 1), 3), (500, (1, 1, 3, 3, 3), 1), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 3, 3, 4): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 3, 3, 5): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 3, 3, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 3, 4, 4): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 3, 4, 5): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 3, 4, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 3, 5, 5): ((1100, (1, 1, 1, 5, 5), 1), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 3, 5, 6): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 3, 6, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 4, 4, 4): ((1400, (1, 1, 1, 4, 4, 4), 6), (1000, (1, 1, 1), 3), (600, (1, 1, 4, 4, 4), 1), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 4, 4, 5): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 4, 4, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 4, 5, 5): ((1100, (1, 1, 1, 5, 5), 1), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 4, 5, 6): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 4, 6, 6): ((1000, (1, 1, 1), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 1, 5, 5, 5): ((1500, (1, 1, 1, 5, 5, 5), 6), (1100, (1, 1, 1, 5, 5), 1), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (700, (1, 1, 5, 5, 5), 1), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 5, 5, 6): ((1100, (1, 1, 1, 5, 5), 1), (1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 5, 6, 6): ((1050, (1, 1, 1, 5), 2), (1000, (1, 1, 1), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 1, 6, 6, 6): ((1600, (1, 1, 1, 6, 6, 6), 6), (1000, (1, 1, 1), 3), (800, (1, 1, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 2, 2): ((600, (1, 1, 2, 2, 2, 2), 6), (500, (1, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (400, (1, 1, 2, 2, 2), 1), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 2, 3): ((400, (1, 1, 2, 2, 2), 1), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 2, 4): ((400, (1, 1, 2, 2, 2), 1), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 2, 5): ((450, (1, 1, 2, 2, 2, 5), 6), (400, (1, 1, 2, 2, 2), 1), (350, (1, 2, 2, 2, 5), 1), (300, (1, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (250, (1, 1, 5), 3), (200, (2, 2, 2), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 2, 2, 6): ((400, (1, 1, 2, 2, 2), 1), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 3, 3): ((1000, (1, 1, 2, 2, 3, 3), 6), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 3, 4): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 3, 5): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 2, 3, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 4, 4): ((1000, (1, 1, 2, 2, 4, 4), 6), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 4, 5): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 2, 4, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 2, 5, 5): ((1000, (1, 1, 2, 2, 5, 5), 6), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 2, 5, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 2, 6, 6): ((1000, (1, 1, 2, 2, 6, 6), 6), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 3, 3, 3): ((500, (1, 1, 3, 3, 3), 1), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 3, 3, 4): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 3, 3, 5): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 3, 3, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 3, 4, 4): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 3, 4, 5): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 3, 4, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 3, 5, 5): ((300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 3, 5, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 3, 6, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 4, 4, 4): ((600, (1, 1, 4, 4, 4), 1), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 4, 4, 5): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 4, 4, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 4, 5, 5): ((300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 4, 5, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 4, 6, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 2, 5, 5, 5): ((700, (1, 1, 5, 5, 5), 1), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 5, 5, 6): ((300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 5, 6, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 2, 6, 6, 6): ((800, (1, 1, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 3, 3, 3): ((800, (1, 1, 3, 3, 3, 3), 6), (700, (1, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (500, (1, 1, 3, 3, 3), 1), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 3, 3, 4): ((500, (1, 1, 3, 3, 3), 1), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 3, 3, 5): ((550, (1, 1, 3, 3, 3, 5), 6), (500, (1, 1, 3, 3, 3), 1), (450, (1, 3, 3, 3, 5), 1), (400, (1, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 3, 3, 6): ((500, (1, 1, 3, 3, 3), 1), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 3, 4, 4): ((1000, (1, 1, 3, 3, 4, 4), 6), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 3, 4, 5): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 3, 4, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 3, 5, 5): ((1000, (1, 1, 3, 3, 5, 5), 6), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 3, 5, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 3, 6, 6): ((1000, (1, 1, 3, 3, 6, 6), 6), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 4, 4, 4): ((600, (1, 1, 4, 4, 4), 1), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 4, 4, 5): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 4, 4, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 4, 5, 5): ((300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 4, 5, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 4, 6, 6): ((200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 3, 5, 5, 5): ((700, (1, 1, 5, 5, 5), 1), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 5, 5, 6): ((300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 5, 6, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 3, 6, 6, 6): ((800, (1, 1, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 4, 4, 4, 4): ((1000, (1, 1, 4, 4, 4, 4), 6), (900, (1, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (600, (1, 1, 4, 4, 4), 1), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 4, 4, 4, 5): ((650, (1, 1, 4, 4, 4, 5), 6), (600, (1, 1, 4, 4, 4), 1), (550, (1, 4, 4, 4, 5), 1), (500, (1, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 4, 4, 4, 6): ((600, (1, 1, 4, 4, 4), 1), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 4, 4, 5, 5): ((1000, (1, 1, 4, 4, 5, 5), 6), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 4, 4, 5, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 4, 4, 6, 6): ((1000, (1, 1, 4, 4, 6, 6), 6), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 4, 5, 5, 5): ((700, (1, 1, 5, 5, 5), 1), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 4, 5, 5, 6): ((300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 4, 5, 6, 6): ((250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 4, 6, 6, 6): ((800, (1, 1, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 1, 5, 5, 5, 5): ((1200, (1, 1, 5, 5, 5, 5), 6), (1100, (1, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (700, (1, 1, 5, 5, 5), 1), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 5, 5, 5, 6): ((700, (1, 1, 5, 5, 5), 1), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 5, 5, 6, 6): ((1000, (1, 1, 5, 5, 6, 6), 6), (300, (1, 1, 5, 5), 2), (250, (1, 1, 5), 3), (200, (1, 5, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 5, 6, 6, 6): ((850, (1, 1, 5, 6, 6, 6), 6), (800, (1, 1, 6, 6, 6), 1), (750, (1, 5, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (250, (1, 1, 5), 3), (200, (1, 1), 4), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 1, 6, 6, 6, 6): ((1400, (1, 1, 6, 6, 6, 6), 6), (1300, (1, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (800, (1, 1, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (200, (1, 1), 4), (100, (1,), 5)),
+    (1, 2, 2, 2, 2, 2): ((900, (1, 2, 2, 2, 2, 2), 6), (800, (2, 2, 2, 2, 2), 1), (500, (1, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 2, 3): ((500, (1, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 2, 4): ((500, (1, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 2, 5): ((550, (1, 2, 2, 2, 2, 5), 6), (500, (1, 2, 2, 2, 2), 1), (450, (2, 2, 2, 2, 5), 1), (400, (2, 2, 2, 2), 2), (350, (1, 2, 2, 2, 5), 1), (300, (1, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 2, 2, 6): ((500, (1, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 3, 3): ((300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 3, 4): ((300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 3, 5): ((350, (1, 2, 2, 2, 5), 1), (300, (1, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 2, 3, 6): ((300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 4, 4): ((300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 4, 5): ((350, (1, 2, 2, 2, 5), 1), (300, (1, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 2, 4, 6): ((300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 2, 5, 5): ((400, (1, 2, 2, 2, 5, 5), 6), (350, (1, 2, 2, 2, 5), 1), (300, (2, 2, 2, 5, 5), 1), (300, (1, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 2, 5, 6): ((350, (1, 2, 2, 2, 5), 1), (300, (1, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 2, 6, 6): ((300, (1, 2, 2, 2), 2), (200, (2, 2, 2), 3), (100, (1,), 5)),
+    (1, 2, 2, 3, 3, 3): ((400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 2, 2, 3, 3, 4): ((100, (1,), 5),),
+    (1, 2, 2, 3, 3, 5): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 3, 3, 6): ((100, (1,), 5),),
+    (1, 2, 2, 3, 4, 4): ((100, (1,), 5),),
+    (1, 2, 2, 3, 4, 5): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 3, 4, 6): ((100, (1,), 5),),
+    (1, 2, 2, 3, 5, 5): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 3, 5, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 3, 6, 6): ((100, (1,), 5),),
+    (1, 2, 2, 4, 4, 4): ((500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 2, 2, 4, 4, 5): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 4, 4, 6): ((100, (1,), 5),),
+    (1, 2, 2, 4, 5, 5): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 4, 5, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 4, 6, 6): ((100, (1,), 5),),
+    (1, 2, 2, 5, 5, 5): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 5, 5, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 5, 6, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 2, 6, 6, 6): ((700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 2, 3, 3, 3, 3): ((700, (1, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 2, 3, 3, 3, 4): ((400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 2, 3, 3, 3, 5): ((450, (1, 3, 3, 3, 5), 1), (400, (1, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 3, 3, 6): ((400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 2, 3, 3, 4, 4): ((100, (1,), 5),),
+    (1, 2, 3, 3, 4, 5): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 3, 4, 6): ((100, (1,), 5),),
+    (1, 2, 3, 3, 5, 5): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 3, 5, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 3, 6, 6): ((100, (1,), 5),),
+    (1, 2, 3, 4, 4, 4): ((500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 2, 3, 4, 4, 5): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 4, 4, 6): ((100, (1,), 5),),
+    (1, 2, 3, 4, 5, 5): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 4, 5, 6): ((1000, (1, 2, 3, 4, 5, 6), 6), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 4, 6, 6): ((100, (1,), 5),),
+    (1, 2, 3, 5, 5, 5): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 5, 5, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 5, 6, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 3, 6, 6, 6): ((700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 2, 4, 4, 4, 4): ((900, (1, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 2, 4, 4, 4, 5): ((550, (1, 4, 4, 4, 5), 1), (500, (1, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 4, 4, 4, 6): ((500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 2, 4, 4, 5, 5): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 4, 4, 5, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 4, 4, 6, 6): ((100, (1,), 5),),
+    (1, 2, 4, 5, 5, 5): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 4, 5, 5, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 4, 5, 6, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 4, 6, 6, 6): ((700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 2, 5, 5, 5, 5): ((1100, (1, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 5, 5, 5, 6): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 5, 5, 6, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 5, 6, 6, 6): ((750, (1, 5, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 2, 6, 6, 6, 6): ((1300, (1, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 3, 3, 3, 3, 3): ((1300, (1, 3, 3, 3, 3, 3), 6), (1200, (3, 3, 3, 3, 3), 1), (700, (1, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 3, 3, 3, 3, 4): ((700, (1, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 3, 3, 3, 3, 5): ((750, (1, 3, 3, 3, 3, 5), 6), (700, (1, 3, 3, 3, 3), 1), (650, (3, 3, 3, 3, 5), 1), (600, (3, 3, 3, 3), 2), (450, (1, 3, 3, 3, 5), 1), (400, (1, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 3, 3, 6): ((700, (1, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 3, 3, 3, 4, 4): ((400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 3, 3, 3, 4, 5): ((450, (1, 3, 3, 3, 5), 1), (400, (1, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 3, 4, 6): ((400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 3, 3, 3, 5, 5): ((500, (1, 3, 3, 3, 5, 5), 6), (450, (1, 3, 3, 3, 5), 1), (400, (3, 3, 3, 5, 5), 1), (400, (1, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 3, 5, 6): ((450, (1, 3, 3, 3, 5), 1), (400, (1, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 3, 6, 6): ((400, (1, 3, 3, 3), 2), (300, (3, 3, 3), 3), (100, (1,), 5)),
+    (1, 3, 3, 4, 4, 4): ((500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 3, 3, 4, 4, 5): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 4, 4, 6): ((100, (1,), 5),),
+    (1, 3, 3, 4, 5, 5): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 4, 5, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 4, 6, 6): ((100, (1,), 5),),
+    (1, 3, 3, 5, 5, 5): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 5, 5, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 5, 6, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 3, 6, 6, 6): ((700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 3, 4, 4, 4, 4): ((900, (1, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 3, 4, 4, 4, 5): ((550, (1, 4, 4, 4, 5), 1), (500, (1, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 4, 4, 4, 6): ((500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 3, 4, 4, 5, 5): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 4, 4, 5, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 4, 4, 6, 6): ((100, (1,), 5),),
+    (1, 3, 4, 5, 5, 5): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 4, 5, 5, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 4, 5, 6, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 4, 6, 6, 6): ((700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 3, 5, 5, 5, 5): ((1100, (1, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 5, 5, 5, 6): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 5, 5, 6, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 5, 6, 6, 6): ((750, (1, 5, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 3, 6, 6, 6, 6): ((1300, (1, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 4, 4, 4, 4, 4): ((1700, (1, 4, 4, 4, 4, 4), 6), (1600, (4, 4, 4, 4, 4), 1), (900, (1, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 4, 4, 4, 4, 5): ((950, (1, 4, 4, 4, 4, 5), 6), (900, (1, 4, 4, 4, 4), 1), (850, (4, 4, 4, 4, 5), 1), (800, (4, 4, 4, 4), 2), (550, (1, 4, 4, 4, 5), 1), (500, (1, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 4, 4, 4, 6): ((900, (1, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 4, 4, 4, 5, 5): ((600, (1, 4, 4, 4, 5, 5), 6), (550, (1, 4, 4, 4, 5), 1), (500, (4, 4, 4, 5, 5), 1), (500, (1, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 4, 4, 5, 6): ((550, (1, 4, 4, 4, 5), 1), (500, (1, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 4, 4, 6, 6): ((500, (1, 4, 4, 4), 2), (400, (4, 4, 4), 3), (100, (1,), 5)),
+    (1, 4, 4, 5, 5, 5): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 4, 5, 5, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 4, 5, 6, 6): ((150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 4, 6, 6, 6): ((700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 4, 5, 5, 5, 5): ((1100, (1, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 5, 5, 5, 6): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 5, 5, 6, 6): ((200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 5, 6, 6, 6): ((750, (1, 5, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 4, 6, 6, 6, 6): ((1300, (1, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (1, 5, 5, 5, 5, 5): ((2100, (1, 5, 5, 5, 5, 5), 6), (2000, (5, 5, 5, 5, 5), 1), (1100, (1, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 5, 5, 5, 5, 6): ((1100, (1, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 5, 5, 5, 6, 6): ((600, (1, 5, 5, 5), 2), (500, (5, 5, 5), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 5, 5, 6, 6, 6): ((800, (1, 5, 5, 6, 6, 6), 6), (750, (1, 5, 6, 6, 6), 1), (700, (5, 5, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (200, (1, 5, 5), 3), (150, (1, 5), 4), (100, (5, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 5, 6, 6, 6, 6): ((1350, (1, 5, 6, 6, 6, 6), 6), (1300, (1, 6, 6, 6, 6), 1), (1250, (5, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (750, (1, 5, 6, 6, 6), 1), (700, (1, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (150, (1, 5), 4), (100, (1,), 5), (50, (5,), 5)),
+    (1, 6, 6, 6, 6, 6): ((2500, (1, 6, 6, 6, 6, 6), 6), (2400, (6, 6, 6, 6, 6), 1), (1300, (1, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (700, (1, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (1,), 5)),
+    (2, 2, 2, 2, 2, 2): ((1600, (2, 2, 2, 2, 2, 2), 6), (800, (2, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 2, 3): ((800, (2, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 2, 4): ((800, (2, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 2, 5): ((850, (2, 2, 2, 2, 2, 5), 6), (800, (2, 2, 2, 2, 2), 1), (450, (2, 2, 2, 2, 5), 1), (400, (2, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 2, 2, 6): ((800, (2, 2, 2, 2, 2), 1), (400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 3, 3): ((400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 3, 4): ((400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 3, 5): ((450, (2, 2, 2, 2, 5), 1), (400, (2, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 2, 3, 6): ((400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 4, 4): ((400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 4, 5): ((450, (2, 2, 2, 2, 5), 1), (400, (2, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 2, 4, 6): ((400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 2, 5, 5): ((500, (2, 2, 2, 2, 5, 5), 6), (450, (2, 2, 2, 2, 5), 1), (400, (2, 2, 2, 2), 2), (300, (2, 2, 2, 5, 5), 1), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 2, 2, 5, 6): ((450, (2, 2, 2, 2, 5), 1), (400, (2, 2, 2, 2), 2), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 2, 6, 6): ((400, (2, 2, 2, 2), 2), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 3, 3, 3): ((500, (2, 2, 2, 3, 3, 3), 6), (300, (3, 3, 3), 3), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 3, 3, 4): ((200, (2, 2, 2), 3),),
+    (2, 2, 2, 3, 3, 5): ((250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 3, 3, 6): ((200, (2, 2, 2), 3),),
+    (2, 2, 2, 3, 4, 4): ((200, (2, 2, 2), 3),),
+    (2, 2, 2, 3, 4, 5): ((250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 3, 4, 6): ((200, (2, 2, 2), 3),),
+    (2, 2, 2, 3, 5, 5): ((300, (2, 2, 2, 5, 5), 1), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 2, 3, 5, 6): ((250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 3, 6, 6): ((200, (2, 2, 2), 3),),
+    (2, 2, 2, 4, 4, 4): ((600, (2, 2, 2, 4, 4, 4), 6), (400, (4, 4, 4), 3), (200, (2, 2, 2), 3)),
+    (2, 2, 2, 4, 4, 5): ((250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 4, 4, 6): ((200, (2, 2, 2), 3),),
+    (2, 2, 2, 4, 5, 5): ((300, (2, 2, 2, 5, 5), 1), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 2, 4, 5, 6): ((250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 4, 6, 6): ((200, (2, 2, 2), 3),),
+    (2, 2, 2, 5, 5, 5): ((700, (2, 2, 2, 5, 5, 5), 6), (500, (5, 5, 5), 3), (300, (2, 2, 2, 5, 5), 1), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 2, 5, 5, 6): ((300, (2, 2, 2, 5, 5), 1), (250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 2, 5, 6, 6): ((250, (2, 2, 2, 5), 2), (200, (2, 2, 2), 3), (50, (5,), 5)),
+    (2, 2, 2, 6, 6, 6): ((800, (2, 2, 2, 6, 6, 6), 6), (600, (6, 6, 6), 3), (200, (2, 2, 2), 3)),
+    (2, 2, 3, 3, 3, 3): ((600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (2, 2, 3, 3, 3, 4): ((300, (3, 3, 3), 3),),
+    (2, 2, 3, 3, 3, 5): ((350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (2, 2, 3, 3, 3, 6): ((300, (3, 3, 3), 3),),
+    (2, 2, 3, 3, 4, 4): ((1000, (2, 2, 3, 3, 4, 4), 6),),
+    (2, 2, 3, 3, 4, 5): ((50, (5,), 5),),
+    (2, 2, 3, 3, 4, 6): (),
+    (2, 2, 3, 3, 5, 5): ((1000, (2, 2, 3, 3, 5, 5), 6), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 3, 3, 5, 6): ((50, (5,), 5),),
+    (2, 2, 3, 3, 6, 6): ((1000, (2, 2, 3, 3, 6, 6), 6),),
+    (2, 2, 3, 4, 4, 4): ((400, (4, 4, 4), 3),),
+    (2, 2, 3, 4, 4, 5): ((50, (5,), 5),),
+    (2, 2, 3, 4, 4, 6): (),
+    (2, 2, 3, 4, 5, 5): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 3, 4, 5, 6): ((50, (5,), 5),),
+    (2, 2, 3, 4, 6, 6): (),
+    (2, 2, 3, 5, 5, 5): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 3, 5, 5, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 3, 5, 6, 6): ((50, (5,), 5),),
+    (2, 2, 3, 6, 6, 6): ((600, (6, 6, 6), 3),),
+    (2, 2, 4, 4, 4, 4): ((800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (2, 2, 4, 4, 4, 5): ((450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (2, 2, 4, 4, 4, 6): ((400, (4, 4, 4), 3),),
+    (2, 2, 4, 4, 5, 5): ((1000, (2, 2, 4, 4, 5, 5), 6), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 4, 4, 5, 6): ((50, (5,), 5),),
+    (2, 2, 4, 4, 6, 6): ((1000, (2, 2, 4, 4, 6, 6), 6),),
+    (2, 2, 4, 5, 5, 5): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 4, 5, 5, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 4, 5, 6, 6): ((50, (5,), 5),),
+    (2, 2, 4, 6, 6, 6): ((600, (6, 6, 6), 3),),
+    (2, 2, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 5, 5, 5, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 5, 5, 6, 6): ((1000, (2, 2, 5, 5, 6, 6), 6), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 2, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (2, 2, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (2, 3, 3, 3, 3, 3): ((1200, (3, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (2, 3, 3, 3, 3, 4): ((600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (2, 3, 3, 3, 3, 5): ((650, (3, 3, 3, 3, 5), 1), (600, (3, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (2, 3, 3, 3, 3, 6): ((600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (2, 3, 3, 3, 4, 4): ((300, (3, 3, 3), 3),),
+    (2, 3, 3, 3, 4, 5): ((350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (2, 3, 3, 3, 4, 6): ((300, (3, 3, 3), 3),),
+    (2, 3, 3, 3, 5, 5): ((400, (3, 3, 3, 5, 5), 1), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 3, 3, 5, 6): ((350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (2, 3, 3, 3, 6, 6): ((300, (3, 3, 3), 3),),
+    (2, 3, 3, 4, 4, 4): ((400, (4, 4, 4), 3),),
+    (2, 3, 3, 4, 4, 5): ((50, (5,), 5),),
+    (2, 3, 3, 4, 4, 6): (),
+    (2, 3, 3, 4, 5, 5): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 3, 4, 5, 6): ((50, (5,), 5),),
+    (2, 3, 3, 4, 6, 6): (),
+    (2, 3, 3, 5, 5, 5): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 3, 5, 5, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 3, 5, 6, 6): ((50, (5,), 5),),
+    (2, 3, 3, 6, 6, 6): ((600, (6, 6, 6), 3),),
+    (2, 3, 4, 4, 4, 4): ((800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (2, 3, 4, 4, 4, 5): ((450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (2, 3, 4, 4, 4, 6): ((400, (4, 4, 4), 3),),
+    (2, 3, 4, 4, 5, 5): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 4, 4, 5, 6): ((50, (5,), 5),),
+    (2, 3, 4, 4, 6, 6): (),
+    (2, 3, 4, 5, 5, 5): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 4, 5, 5, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 4, 5, 6, 6): ((50, (5,), 5),),
+    (2, 3, 4, 6, 6, 6): ((600, (6, 6, 6), 3),),
+    (2, 3, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 5, 5, 5, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 5, 5, 6, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 3, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (2, 3, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (2, 4, 4, 4, 4, 4): ((1600, (4, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (2, 4, 4, 4, 4, 5): ((850, (4, 4, 4, 4, 5), 1), (800, (4, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (2, 4, 4, 4, 4, 6): ((800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (2, 4, 4, 4, 5, 5): ((500, (4, 4, 4, 5, 5), 1), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 4, 4, 4, 5, 6): ((450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (2, 4, 4, 4, 6, 6): ((400, (4, 4, 4), 3),),
+    (2, 4, 4, 5, 5, 5): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 4, 4, 5, 5, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 4, 4, 5, 6, 6): ((50, (5,), 5),),
+    (2, 4, 4, 6, 6, 6): ((600, (6, 6, 6), 3),),
+    (2, 4, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 4, 5, 5, 5, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 4, 5, 5, 6, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (2, 4, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (2, 4, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (2, 5, 5, 5, 5, 5): ((2000, (5, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 5, 5, 5, 5, 6): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 5, 5, 5, 6, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 5, 5, 6, 6, 6): ((700, (5, 5, 6, 6, 6), 1), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (2, 5, 6, 6, 6, 6): ((1250, (5, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (2, 6, 6, 6, 6, 6): ((2400, (6, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (3, 3, 3, 3, 3, 3): ((2400, (3, 3, 3, 3, 3, 3), 6), (1200, (3, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (3, 3, 3, 3, 3, 4): ((1200, (3, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (3, 3, 3, 3, 3, 5): ((1250, (3, 3, 3, 3, 3, 5), 6), (1200, (3, 3, 3, 3, 3), 1), (650, (3, 3, 3, 3, 5), 1), (600, (3, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (3, 3, 3, 3, 3, 6): ((1200, (3, 3, 3, 3, 3), 1), (600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (3, 3, 3, 3, 4, 4): ((600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (3, 3, 3, 3, 4, 5): ((650, (3, 3, 3, 3, 5), 1), (600, (3, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (3, 3, 3, 3, 4, 6): ((600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (3, 3, 3, 3, 5, 5): ((700, (3, 3, 3, 3, 5, 5), 6), (650, (3, 3, 3, 3, 5), 1), (600, (3, 3, 3, 3), 2), (400, (3, 3, 3, 5, 5), 1), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 3, 3, 5, 6): ((650, (3, 3, 3, 3, 5), 1), (600, (3, 3, 3, 3), 2), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (3, 3, 3, 3, 6, 6): ((600, (3, 3, 3, 3), 2), (300, (3, 3, 3), 3)),
+    (3, 3, 3, 4, 4, 4): ((700, (3, 3, 3, 4, 4, 4), 6), (400, (4, 4, 4), 3), (300, (3, 3, 3), 3)),
+    (3, 3, 3, 4, 4, 5): ((350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (3, 3, 3, 4, 4, 6): ((300, (3, 3, 3), 3),),
+    (3, 3, 3, 4, 5, 5): ((400, (3, 3, 3, 5, 5), 1), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 3, 4, 5, 6): ((350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (3, 3, 3, 4, 6, 6): ((300, (3, 3, 3), 3),),
+    (3, 3, 3, 5, 5, 5): ((800, (3, 3, 3, 5, 5, 5), 6), (500, (5, 5, 5), 3), (400, (3, 3, 3, 5, 5), 1), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 3, 5, 5, 6): ((400, (3, 3, 3, 5, 5), 1), (350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 3, 5, 6, 6): ((350, (3, 3, 3, 5), 2), (300, (3, 3, 3), 3), (50, (5,), 5)),
+    (3, 3, 3, 6, 6, 6): ((900, (3, 3, 3, 6, 6, 6), 6), (600, (6, 6, 6), 3), (300, (3, 3, 3), 3)),
+    (3, 3, 4, 4, 4, 4): ((800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (3, 3, 4, 4, 4, 5): ((450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (3, 3, 4, 4, 4, 6): ((400, (4, 4, 4), 3),),
+    (3, 3, 4, 4, 5, 5): ((1000, (3, 3, 4, 4, 5, 5), 6), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 4, 4, 5, 6): ((50, (5,), 5),),
+    (3, 3, 4, 4, 6, 6): ((1000, (3, 3, 4, 4, 6, 6), 6),),
+    (3, 3, 4, 5, 5, 5): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 4, 5, 5, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 4, 5, 6, 6): ((50, (5,), 5),),
+    (3, 3, 4, 6, 6, 6): ((600, (6, 6, 6), 3),),
+    (3, 3, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 5, 5, 5, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 5, 5, 6, 6): ((1000, (3, 3, 5, 5, 6, 6), 6), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 3, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (3, 3, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (3, 4, 4, 4, 4, 4): ((1600, (4, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (3, 4, 4, 4, 4, 5): ((850, (4, 4, 4, 4, 5), 1), (800, (4, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (3, 4, 4, 4, 4, 6): ((800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (3, 4, 4, 4, 5, 5): ((500, (4, 4, 4, 5, 5), 1), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 4, 4, 4, 5, 6): ((450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (3, 4, 4, 4, 6, 6): ((400, (4, 4, 4), 3),),
+    (3, 4, 4, 5, 5, 5): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 4, 4, 5, 5, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (3, 4, 4, 5, 6, 6): ((50, (5,), 5),),
+    (3, 4, 4, 6, 6, 6): ((600, (6, 6, 6), 3),),
+    (3, 4, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 4, 5, 5, 5, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 4, 5, 5, 6, 6): ((100, (5, 5), 4), (50, (5,), 5)),
+    (3, 4, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (3, 4, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (3, 5, 5, 5, 5, 5): ((2000, (5, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 5, 5, 5, 5, 6): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 5, 5, 5, 6, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 5, 5, 6, 6, 6): ((700, (5, 5, 6, 6, 6), 1), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (3, 5, 6, 6, 6, 6): ((1250, (5, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (3, 6, 6, 6, 6, 6): ((2400, (6, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (4, 4, 4, 4, 4, 4): ((3200, (4, 4, 4, 4, 4, 4), 6), (1600, (4, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (4, 4, 4, 4, 4, 5): ((1650, (4, 4, 4, 4, 4, 5), 6), (1600, (4, 4, 4, 4, 4), 1), (850, (4, 4, 4, 4, 5), 1), (800, (4, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (4, 4, 4, 4, 4, 6): ((1600, (4, 4, 4, 4, 4), 1), (800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (4, 4, 4, 4, 5, 5): ((900, (4, 4, 4, 4, 5, 5), 6), (850, (4, 4, 4, 4, 5), 1), (800, (4, 4, 4, 4), 2), (500, (4, 4, 4, 5, 5), 1), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 4, 4, 4, 5, 6): ((850, (4, 4, 4, 4, 5), 1), (800, (4, 4, 4, 4), 2), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (4, 4, 4, 4, 6, 6): ((800, (4, 4, 4, 4), 2), (400, (4, 4, 4), 3)),
+    (4, 4, 4, 5, 5, 5): ((900, (4, 4, 4, 5, 5, 5), 6), (500, (5, 5, 5), 3), (500, (4, 4, 4, 5, 5), 1), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 4, 4, 5, 5, 6): ((500, (4, 4, 4, 5, 5), 1), (450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 4, 4, 5, 6, 6): ((450, (4, 4, 4, 5), 2), (400, (4, 4, 4), 3), (50, (5,), 5)),
+    (4, 4, 4, 6, 6, 6): ((1000, (4, 4, 4, 6, 6, 6), 6), (600, (6, 6, 6), 3), (400, (4, 4, 4), 3)),
+    (4, 4, 5, 5, 5, 5): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 4, 5, 5, 5, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 4, 5, 5, 6, 6): ((1000, (4, 4, 5, 5, 6, 6), 6), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 4, 5, 6, 6, 6): ((650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (4, 4, 6, 6, 6, 6): ((1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (4, 5, 5, 5, 5, 5): ((2000, (5, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 5, 5, 5, 5, 6): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 5, 5, 5, 6, 6): ((500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 5, 5, 6, 6, 6): ((700, (5, 5, 6, 6, 6), 1), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (4, 5, 6, 6, 6, 6): ((1250, (5, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (4, 6, 6, 6, 6, 6): ((2400, (6, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+    (5, 5, 5, 5, 5, 5): ((4000, (5, 5, 5, 5, 5, 5), 6), (2000, (5, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (5, 5, 5, 5, 5, 6): ((2000, (5, 5, 5, 5, 5), 1), (1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (5, 5, 5, 5, 6, 6): ((1000, (5, 5, 5, 5), 2), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (5, 5, 5, 6, 6, 6): ((1100, (5, 5, 5, 6, 6, 6), 6), (700, (5, 5, 6, 6, 6), 1), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (500, (5, 5, 5), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (5, 5, 6, 6, 6, 6): ((1300, (5, 5, 6, 6, 6, 6), 6), (1250, (5, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (700, (5, 5, 6, 6, 6), 1), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (100, (5, 5), 4), (50, (5,), 5)),
+    (5, 6, 6, 6, 6, 6): ((2450, (5, 6, 6, 6, 6, 6), 6), (2400, (6, 6, 6, 6, 6), 1), (1250, (5, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (650, (5, 6, 6, 6), 2), (600, (6, 6, 6), 3), (50, (5,), 5)),
+    (6, 6, 6, 6, 6, 6): ((4800, (6, 6, 6, 6, 6, 6), 6), (2400, (6, 6, 6, 6, 6), 1), (1200, (6, 6, 6, 6), 2), (600, (6, 6, 6), 3)),
+}
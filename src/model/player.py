@@ -9,7 +9,7 @@ class Player:
         self.total_score = 0
         self.turn_score = 0
         self.banked_dice = []
-        self.is_on_board = False  # Joueur doit faire au moins 800 points pour être "sur le plateau"
+        self.is_on_board = False  # Joueur doit faire au moins le seuil d'entrée (800 points) pour être "sur le plateau"
         
     def add_turn_score(self, score: int, dice_used: List[int]):
         """Ajoute des points au score du tour actuel"""
@@ -25,12 +25,12 @@ class Player:
         """Retourne le nombre de dés restants à lancer"""
         return 6 - len(self.banked_dice)
     
-    def can_win(self) -> bool:
-        """Vérifie si le joueur peut gagner (score total >= 10000)"""
+    def can_win(self, target_score: int = 10000) -> bool:
+        """Vérifie si le joueur peut gagner (score total >= score cible, 10000 par défaut)"""
         # Un joueur ne peut gagner que s'il est sur le plateau
         if not self.is_on_board:
             return False
-        return self.total_score >= 10000
+        return self.total_score >= target_score
     
     def __str__(self):
         return f"{self.name}: {self.total_score} points (tour: {self.turn_score})"
@@ -0,0 +1,305 @@
+import os
+from collections import Counter
+from itertools import combinations_with_replacement, product
+from math import gcd
+from typing import Any, Dict, List, Tuple
+
+
+# Cache des tables compilées, partagé entre toutes les règles ayant le même barème
+_COMPILED_TABLES: Dict[tuple, Tuple[dict, dict, dict]] = {}
+
+# Tables du barème par défaut figées dans un module généré (voir write_frozen_tables) :
+# importer les règles ne recalcule rien, les variantes sont compilées à la construction
+FROZEN_TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_tables.py')
+
+
+def all_multisets(max_dice: int = 6) -> List[Tuple[int, ...]]:
+    """Retourne tous les lancés distincts (multi-ensembles triés) de 1 à max_dice dés"""
+    multisets = []
+    for num_dice in range(1, max_dice + 1):
+        multisets.extend(combinations_with_replacement(range(1, 7), num_dice))
+    return multisets
+
+
+def _frozen_tables(key: tuple):
+    """
+    Tables figées du module généré si elles correspondent à ce barème, None sinon
+
+    Le module ne contient que les choix de chaque lancé : les combinaisons en sont extraites,
+    et le score d'un lancé est celui de sa meilleure combinaison (tous ses dés qui comptent).
+    """
+    try:
+        from model import opening_tables
+    except ImportError:
+        return None
+    if opening_tables.SCORING_KEY != key:
+        return None
+    keeps_table = opening_tables.KEEPS_TABLE
+    score_table = {multiset: (keeps[0][0], keeps[0][1]) if keeps else (0, ())
+                   for multiset, keeps in keeps_table.items()}
+    combinations_table = {multiset: tuple((score, combo) for score, combo, _ in keeps)
+                          for multiset, keeps in keeps_table.items()}
+    return score_table, combinations_table, keeps_table
+
+class FarkleRules:
+    """
+    Règles d'une variante du Farkle (score cible, seuil d'entrée, barème, options)
+
+    Le barème est compilé une seule fois en tables de correspondance indexées par
+    le lancé trié : le moteur y lit directement scores et combinaisons possibles,
+    une variante est donc aussi rapide que les règles par défaut. Les tables du
+    barème par défaut sont lues dans un module généré (model/opening_tables.py).
+    """
+
+    DEFAULT_SINGLE_SCORES = {1: 100, 5: 50}
+    DEFAULT_TRIPLE_SCORES = {1: 1000, 2: 200, 3: 300, 4: 400, 5: 500, 6: 600}
+
+    def __init__(self, target_score: int = 10000, entry_threshold: int = 800,
+                 single_scores: Dict[int, int] = None, triple_scores: Dict[int, int] = None,
+                 extra_dice_multiplier: int = 2, straight_score: int = 1000,
+                 three_pairs_score: int = 1000, straight_enabled: bool = True,
+                 three_pairs_enabled: bool = True, piggy_back_enabled: bool = True):
+        self.target_score = target_score
+        self.entry_threshold = entry_threshold
+        self.single_scores = dict(single_scores if single_scores is not None else self.DEFAULT_SINGLE_SCORES)
+        self.triple_scores = dict(triple_scores if triple_scores is not None else self.DEFAULT_TRIPLE_SCORES)
+        self.extra_dice_multiplier = extra_dice_multiplier
+        self.straight_score = straight_score
+        self.three_pairs_score = three_pairs_score
+        self.straight_enabled = straight_enabled
+        self.three_pairs_enabled = three_pairs_enabled
+        self.piggy_back_enabled = piggy_back_enabled
+
+        self.score_table, self.combinations_table, self.keeps_table = self._compile()
+
+    def scoring_key(self) -> tuple:
+        """Clé identifiant le barème (les paramètres qui influencent le score d'un lancé)"""
+        return (
+            tuple(sorted(self.single_scores.items())),
+            tuple(sorted(self.triple_scores.items())),
+            self.extra_dice_multiplier,
+            self.straight_score if self.straight_enabled else None,
+            self.three_pairs_score if self.three_pairs_enabled else None,
+        )
+
+    def _compile(self) -> Tuple[dict, dict, dict]:
+        """Compile le barème en tables de scores, de combinaisons et de dés restants, pour chaque lancé de 1 à 6 dés"""
+        key = self.scoring_key()
+        if key in _COMPILED_TABLES:
+            return _COMPILED_TABLES[key]
+
+        frozen = _frozen_tables(key)
+        if frozen is not None:
+            _COMPILED_TABLES[key] = frozen
+            return frozen
+
+        score_table = {(): (0, ())}
+        for multiset in all_multisets():
+            score_table[multiset] = self.compute_score(multiset)
+
+        combinations_table = {(): ()}
+        for multiset in all_multisets():
+            combinations_table[multiset] = self._compute_combinations(multiset, score_table.__getitem__)
+
+        keeps_table = {multiset: self._compute_keeps(multiset, combinations)
+                       for multiset, combinations in combinations_table.items()}
+
+        _COMPILED_TABLES[key] = (score_table, combinations_table, keeps_table)
+        return score_table, combinations_table, keeps_table
+
+    def compute_score(self, dice_values) -> Tuple[int, Tuple[int, ...]]:
+        """
+        Calcule le score d'un lancé sans passer par les tables (utilisé pour les compiler)
+
+        Returns:
+            Tuple (score, dés utilisés triés)
+        """
+        if not dice_values:
+            return 0, ()
+
+        counter = Counter(dice_values)
+
+        # Cas spéciaux, seulement avec exactement 6 dés
+        if len(dice_values) == 6:
+            if self.straight_enabled and sorted(dice_values) == [1, 2, 3, 4, 5, 6]:
+                return self.straight_score, tuple(sorted(dice_values))
+            if self.three_pairs_enabled and len(counter) == 3 and all(count == 2 for count in counter.values()):
+                return self.three_pairs_score, tuple(sorted(dice_values))
+
+        score = 0
+        used_dice = []
+
+        # Groupes de 3 ou plus, le montant est multiplié pour chaque dé au-delà de trois
+        for value, count in counter.items():
+            if count >= 3:
+                score += self.triple_scores.get(value, 0) * self.extra_dice_multiplier ** (count - 3)
+                used_dice.extend([value] * count)
+
+        # Dés isolés qui rapportent des points (s'ils ne font pas partie d'un groupe)
+        for value, points in self.single_scores.items():
+            remaining_count = counter[value] if counter[value] < 3 else 0
+            if remaining_count > 0 and points > 0:
+                score += remaining_count * points
+                used_dice.extend([value] * remaining_count)
+
+        return score, tuple(sorted(used_dice))
+
+    @staticmethod
+    def _compute_combinations(multiset: Tuple[int, ...], score_function) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+        """Énumère les sous-ensembles distincts d'un lancé dont tous les dés rapportent des points"""
+        counter = Counter(multiset)
+        values = sorted(counter)
+        combinations = []
+        for counts in product(*(range(counter[value] + 1) for value in values)):
+            combo = tuple(value for value, count in zip(values, counts) for _ in range(count))
+            if not combo:
+                continue
+            score, used_dice = score_function(combo)
+            if score > 0 and combo == used_dice:
+                combinations.append((score, combo))
+        # Le plus haut score en premier pour suggérer les meilleures options
+        return tuple(sorted(combinations, reverse=True))
+
+    @staticmethod
+    def _compute_keeps(multiset: Tuple[int, ...], combinations) -> Tuple[Tuple[int, Tuple[int, ...], int], ...]:
+        """Ajoute à chaque combinaison le nombre de dés à relancer ensuite (6 après un hot dice)"""
+        return tuple((score, combo, len(multiset) - len(combo) or 6) for score, combo in combinations)
+
+    def calculate_score(self, dice_values: List[int]) -> Tuple[int, List[int]]:
+        """Retourne le score d'un lancé et les dés utilisés (lecture directe dans la table)"""
+        entry = self.score_table.get(tuple(sorted(dice_values)))
+        if entry is None:
+            entry = self.compute_score(dice_values)
+        return entry[0], list(entry[1])
+
+    def lookup_combinations(self, dice_values: List[int]) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+        """Retourne les combinaisons compilées d'un lancé, sans copie (tuples immuables)"""
+        key = tuple(sorted(dice_values))
+        entry = self.combinations_table.get(key)
+        if entry is None:
+            entry = self._compute_combinations(key, self.compute_score)
+        return entry
+
+    def lookup_keeps(self, dice_values) -> Tuple[Tuple[int, Tuple[int, ...], int], ...]:
+        """
+        Retourne les choix possibles d'un lancé : (score, dés gardés, dés à relancer), dans
+        l'ordre de lookup_combinations ; les dés à relancer valent 6 après un hot dice
+        """
+        key = tuple(sorted(dice_values))
+        entry = self.keeps_table.get(key)
+        if entry is None:
+            entry = self._compute_keeps(key, self.lookup_combinations(key))
+        return entry
+
+    def score_step(self) -> int:
+        """Plus grand pas commun à tous les scores de combinaison (tout score de tour en est un multiple)"""
+        step = 0
+        for combinations in self.combinations_table.values():
+            for score, _ in combinations:
+                step = gcd(step, score)
+        return step or 1
+
+    def get_possible_combinations(self, dice_values: List[int]) -> List[Tuple[int, List[int]]]:
+        """Retourne les combinaisons de dés conservables, triées par score décroissant"""
+        return [(score, list(combo)) for score, combo in self.lookup_combinations(dice_values)]
+
+    def is_farkle(self, dice_values: List[int]) -> bool:
+        """Vérifie si c'est un Farkle (aucun dé ne peut être conservé)"""
+        entry = self.score_table.get(tuple(sorted(dice_values)))
+        if entry is None:
+            entry = self.compute_score(dice_values)
+        return entry[0] == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Exporte les règles vers un dictionnaire (pour les sauvegardes)"""
+        return {
+            'target_score': self.target_score,
+            'entry_threshold': self.entry_threshold,
+            'single_scores': {str(value): points for value, points in self.single_scores.items()},
+            'triple_scores': {str(value): points for value, points in self.triple_scores.items()},
+            'extra_dice_multiplier': self.extra_dice_multiplier,
+            'straight_score': self.straight_score,
+            'three_pairs_score': self.three_pairs_score,
+            'straight_enabled': self.straight_enabled,
+            'three_pairs_enabled': self.three_pairs_enabled,
+            'piggy_back_enabled': self.piggy_back_enabled,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any] = None) -> 'FarkleRules':
+        """Recrée des règles depuis un dictionnaire (règles par défaut si absent)"""
+        if not data:
+            return DEFAULT_RULES
+        data = dict(data)
+        for field in ('single_scores', 'triple_scores'):
+            if field in data:
+                data[field] = {int(value): points for value, points in data[field].items()}
+        return cls(**data)
+
+    def __reduce__(self):
+        # Transmis aux processus de travail sous forme de paramètres, les tables sont relues ou recompilées (une fois) sur place
+        return (FarkleRules.from_dict, (self.to_dict(),))
+
+    def __eq__(self, other):
+        return isinstance(other, FarkleRules) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self.scoring_key(), self.target_score, self.entry_threshold, self.piggy_back_enabled))
+
+    def __repr__(self):
+        return (f"FarkleRules(target_score={self.target_score}, entry_threshold={self.entry_threshold}, "
+                f"piggy_back_enabled={self.piggy_back_enabled})")
+
+
+DEFAULT_RULES = FarkleRules()
+
+
+def render_frozen_tables(rules: FarkleRules = None) -> str:
+    """Source du module des tables figées (barème par défaut), calculées sans le module existant"""
+    rules = rules or DEFAULT_RULES
+    # Recalcule les tables plutôt que de relire celles du module qu'on régénère
+    score_table = {(): (0, ())}
+    for multiset in all_multisets():
+        score_table[multiset] = rules.compute_score(multiset)
+    keeps_table = {(): ()}
+    for multiset in all_multisets():
+        combinations = rules._compute_combinations(multiset, score_table.__getitem__)
+        keeps_table[multiset] = rules._compute_keeps(multiset, combinations)
+        if score_table[multiset] != (combinations[0] if combinations else (0, ())):
+            raise ValueError(f"Score du lancé {multiset} différent de sa meilleure combinaison")
+
+    lines = [
+        '# Généré par « python main.py opening-tables » (model.rules.write_frozen_tables), ne pas modifier',
+        '# Barème par défaut : pour chaque lancé trié de 1 à 6 dés (dont les 462 lancés de 6 dés), les',
+        '# combinaisons conservables (score, dés gardés, dés à relancer, 6 après un hot dice) par score décroissant',
+        '',
+        f'SCORING_KEY = {rules.scoring_key()!r}',
+        '',
+        'KEEPS_TABLE = {',
+    ]
+    lines.extend(f'    {multiset!r}: {keeps!r},' for multiset, keeps in keeps_table.items())
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_frozen_tables(filepath: str = FROZEN_TABLES_PATH, check: bool = False) -> bool:
+    """
+    Régénère le module des tables figées
+
+    Args:
+        filepath: Module à écrire
+        check: Vérifie seulement que le module est à jour, sans l'écrire
+
+    Returns:
+        True si le module était déjà à jour
+    """
+    source = render_frozen_tables()
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            up_to_date = f.read() == source
+    except FileNotFoundError:
+        up_to_date = False
+    if not up_to_date and not check:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(source)
+    return up_to_date
@@ -0,0 +1,105 @@
+import copy
+import random
+import time
+from typing import Any, Callable, Dict, List, Sequence
+from model.game import FarkleGame
+from model.rules import FarkleRules
+
+
+def sample_positions(count: int = 200, players: int = 3, seed: int = None,
+                     rules: FarkleRules = None) -> List[FarkleGame]:
+    """
+    Positions de parties réelles : parties aléatoires arrêtées à un lancé au hasard
+
+    Chaque position est une partie en cours dont le dernier lancé n'est pas un Farkle
+    (une combinaison peut être gardée).
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = FarkleGame([f"Joueur {index + 1}" for index in range(players)], seed=rng.getrandbits(32), rules=rules)
+        stop_after = rng.randint(1, 300)
+        for _ in range(stop_after):
+            game.roll_dice()
+            if game.is_farkle():
+                game.farkle()
+            else:
+                _, dice_to_bank = rng.choice(game.get_possible_actions())
+                game.bank_dice(list(dice_to_bank))
+                if game.get_current_player().turn_score >= 350 and game.can_stop_turn():
+                    game.stop_turn()
+            if game.game_over:
+                break
+        if game.game_over:
+            continue
+        game.roll_dice()
+        if not game.is_farkle():
+            positions.append(game)
+    return positions
+
+
+def _time_per_call(function: Callable[[Any], Any], items: Sequence[Any], repeat: int) -> float:
+    """Meilleur temps moyen par appel (microsecondes) sur repeat passages"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, (time.perf_counter() - start) / len(items))
+    return best * 1e6
+
+
+def run_clone_benchmark(positions: int = 200, players: int = 3, repeat: int = 5, seed: int = 0,
+                        rules: FarkleRules = None) -> Dict[str, Any]:
+    """
+    Compare la copie profonde d'une partie aux instantanés immuables (state.persistent)
+
+    Opérations mesurées, sur les mêmes positions :
+    - snapshot : figer l'état (copie profonde / GameSnapshot)
+    - branch   : nouvelle branche après avoir gardé une combinaison, l'original restant intact
+                 (copie profonde puis bank_dice / GameSnapshot.apply)
+    - restore  : revenir à un état figé dans la partie (copie profonde à nouveau, comme le
+                 ferait un annuler naïf / FarkleGame.restore)
+    - clone    : partie jouable indépendante (copie profonde / FarkleGame.clone)
+
+    La copie profonde partage les règles (tables compilées) : seul l'état de la partie est copié.
+
+    Returns:
+        Rapport {opération: {'deepcopy_us', 'snapshot_us', 'speedup'}} et configuration
+    """
+    games = sample_positions(positions, players, seed, rules)
+    snapshots = [game.snapshot() for game in games]
+    choices = [(game, snapshot, list(game.get_possible_actions()[0][1])) for game, snapshot in zip(games, snapshots)]
+
+    def deepcopy(game: FarkleGame) -> FarkleGame:
+        return copy.deepcopy(game, {id(game.rules): game.rules})
+
+    def deepcopy_branch(choice):
+        branch = deepcopy(choice[0])
+        branch.bank_dice(choice[2])
+        return branch
+
+    def deepcopy_restore(game: FarkleGame):
+        # Un annuler naïf garde une copie profonde et en refait une pour ne pas l'abîmer
+        return deepcopy(game)
+
+    def restore(choice):
+        choice[0].restore(choice[1])
+
+    measures = {
+        'snapshot': (_time_per_call(deepcopy, games, repeat),
+                     _time_per_call(FarkleGame.snapshot, games, repeat)),
+        'branch': (_time_per_call(deepcopy_branch, choices, repeat),
+                   _time_per_call(lambda choice: choice[1].apply(('K', choice[2])), choices, repeat)),
+        'restore': (_time_per_call(deepcopy_restore, games, repeat),
+                    _time_per_call(restore, choices, repeat)),
+        'clone': (_time_per_call(deepcopy, games, repeat),
+                  _time_per_call(FarkleGame.clone, games, repeat)),
+    }
+    return {
+        'config': {'positions': len(games), 'players': players, 'repeat': repeat, 'seed': seed},
+        'operations': {
+            operation: {'deepcopy_us': deep, 'snapshot_us': persistent, 'speedup': deep / persistent}
+            for operation, (deep, persistent) in measures.items()
+        },
+    }
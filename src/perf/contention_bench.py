@@ -0,0 +1,189 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List
+import numpy as np
+from model.game import FarkleGame
+from model.rules import FarkleRules
+from service.shared_game import SharedGame, TableView
+from state.persistent import GameSnapshot
+
+
+# Lecture de l'état dans chaque mode : publiée sans verrou, ou calculée sous le verrou de la partie
+# (comme le faisait GameService avant SharedGame)
+MODES = ('shared', 'locked')
+
+
+def _locked_view(game: FarkleGame) -> TableView:
+    return TableView(game.state_version, game.snapshot(), game.get_game_status(),
+                     game.action_log[-1] if game.action_log else None)
+
+
+def _roll(game: FarkleGame):
+    game.roll_dice()
+    if game.is_farkle():
+        game.farkle()
+
+
+def _log_matches_state(game: FarkleGame) -> bool:
+    """L'historique rejoué depuis la graine redonne exactement l'état de la partie"""
+    start = FarkleGame(seed=game.seed, rules=game.rules)
+    start.setup_players(list(game.initial_player_names))
+    replayed = start.snapshot().apply_all(game.action_log, random.Random(game.seed))
+    current = game.snapshot()
+    return (replayed.players == current.players and replayed.game_over == current.game_over
+            and replayed.current_player_index == current.current_player_index)
+
+
+def _consistency_errors(view: TableView) -> List[str]:
+    """Incohérences entre l'instantané et l'état publiés ensemble (aucune attendue)"""
+    status, snapshot = view.status, view.snapshot
+    errors = []
+    if status['current_player_index'] != snapshot.current_player_index:
+        errors.append('current_player_index')
+    if status['remaining_dice_count'] != 6 - len(status['shared_banked_dice']):
+        errors.append('remaining_dice_count')
+    if status['last_dice_roll'] != list(snapshot.last_dice_roll):
+        errors.append('last_dice_roll')
+    for entry, record in zip(status['players'], snapshot.players):
+        if entry['total_score'] != record.total_score or entry['turn_score'] != record.turn_score:
+            errors.append('players')
+            break
+    return errors
+
+
+def run_contention_mode(mode: str = 'shared', seats: int = 3, agents_per_seat: int = 2, readers: int = 4,
+                        read_interval: float = 0.001, duration: float = 2.0, bank_at: int = 350, seed: int = 0,
+                        rules: FarkleRules = None) -> Dict[str, Any]:
+    """
+    Une partie partagée, jouée et observée en même temps par plusieurs threads
+
+    Chaque siège est joué par agents_per_seat threads (un joueur et ses bots d'assistance) qui
+    décident sur l'état qu'ils viennent de lire et soumettent l'action avec cette version :
+    quand deux agents d'un même siège décident sur la même version, un seul passe, l'autre
+    est refusé (conflit). Une partie terminée est vérifiée (l'historique rejoué redonne l'état)
+    puis remise à zéro par le premier agent qui la voit.
+
+    Les lecteurs sont des spectateurs qui rafraîchissent l'affichage à intervalle régulier et
+    vérifient que chaque état lu est cohérent. Sans pause, des lecteurs sans verrou garderaient
+    le GIL et ralentiraient les agents sans que la partie y soit pour rien.
+
+    Args:
+        mode: 'shared' (lectures sans verrou) ou 'locked' (lectures sous le verrou de la partie)
+        seats: Joueurs de la partie
+        agents_per_seat: Threads qui jouent chaque siège
+        readers: Threads spectateurs
+        read_interval: Pause entre deux lectures d'un spectateur (secondes, 0 = en continu)
+        duration: Durée de la mesure (secondes)
+        bank_at: Score de tour à partir duquel les agents s'arrêtent
+        seed: Graine de la première partie
+        rules: Règles de la partie
+
+    Returns:
+        Débits (actions et lectures par seconde), conflits, refus, parties jouées,
+        incohérences observées, latences des actions et des lectures des spectateurs (µs)
+    """
+    if mode not in MODES:
+        raise ValueError(f"Mode inconnu: {mode} (disponibles : {', '.join(MODES)})")
+    table = SharedGame(FarkleGame([f"Joueur {seat + 1}" for seat in range(seats)], seed=seed, rules=rules))
+    if mode == 'shared':
+        read: Callable[[], TableView] = table.view
+    else:
+        read = lambda: table.locked(_locked_view)
+    stop_event = threading.Event()
+    results: List[Dict[str, Any]] = []
+    results_lock = threading.Lock()
+
+    def submit(counters: Dict[str, Any], player, action, version: int):
+        start = time.perf_counter()
+        try:
+            result = table.act(player, action, version)
+        except ValueError as e:
+            counters['conflicts' if 'version' in str(e) else 'rejected'] += 1
+            return None
+        counters['latencies'].append(time.perf_counter() - start)
+        counters['actions'] += 1
+        return result
+
+    def finish_game(game: FarkleGame) -> bool:
+        matches = _log_matches_state(game)
+        game.reset_game()
+        return matches
+
+    def agent(seat: int):
+        counters = {'actions': 0, 'conflicts': 0, 'rejected': 0, 'games': 0, 'violations': 0, 'latencies': []}
+        while not stop_event.is_set():
+            view = read()
+            snapshot: GameSnapshot = view.snapshot
+            if snapshot.game_over:
+                matches = submit(counters, None, finish_game, view.version)
+                if matches is not None:
+                    counters['games'] += 1
+                    counters['violations'] += not matches
+                continue
+            if snapshot.current_player_index != seat:
+                time.sleep(0)  # Pas notre tour : laisser jouer les autres
+                continue
+            if view.last_action is not None and view.last_action[0] == 'R':
+                score = snapshot.get_possible_actions()[0][0]
+                stop = snapshot.current_player.turn_score + score >= bank_at
+                submit(counters, seat, lambda game: game.apply_decision(0, stop), view.version)
+            else:
+                submit(counters, seat, _roll, view.version)
+        with results_lock:
+            results.append(counters)
+
+    def reader():
+        counters = {'reads': 0, 'violations': 0, 'regressions': 0, 'read_latencies': []}
+        last_version = -1
+        while not stop_event.is_set():
+            start = time.perf_counter()
+            view = read()
+            counters['read_latencies'].append(time.perf_counter() - start)
+            counters['reads'] += 1
+            counters['violations'] += bool(_consistency_errors(view))
+            counters['regressions'] += view.version < last_version
+            last_version = view.version
+            if read_interval:
+                time.sleep(read_interval)
+        with results_lock:
+            results.append(counters)
+
+    threads = [threading.Thread(target=agent, args=(seat,)) for seat in range(seats) for _ in range(agents_per_seat)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop_event.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    totals = {key: sum(counters.get(key, 0) for counters in results)
+              for key in ('actions', 'reads', 'conflicts', 'rejected', 'games', 'violations', 'regressions')}
+    report = {'mode': mode, 'actions_per_s': totals['actions'] / elapsed, 'reads_per_s': totals['reads'] / elapsed}
+    for prefix, key in (('', 'latencies'), ('read_', 'read_latencies')):
+        latencies = np.asarray([value for counters in results for value in counters.get(key, ())]) * 1e6
+        for percentile in (50, 99):
+            report[f'{prefix}p{percentile}_us'] = float(np.percentile(latencies, percentile)) if len(latencies) else 0.0
+    report.update(totals)
+    return report
+
+
+def run_contention_benchmark(seats: int = 3, agents_per_seat: int = 2, readers: int = 4, read_interval: float = 0.001,
+                             duration: float = 2.0, bank_at: int = 350, seed: int = 0,
+                             rules: FarkleRules = None) -> Dict[str, Any]:
+    """
+    Compare les lectures sans verrou de SharedGame aux lectures sous verrou, à charge égale
+
+    Returns:
+        Rapport {mode: résultats de run_contention_mode} et configuration
+    """
+    return {
+        'config': {'seats': seats, 'agents_per_seat': agents_per_seat, 'readers': readers,
+                   'read_interval': read_interval, 'duration': duration},
+        'modes': {mode: run_contention_mode(mode, seats, agents_per_seat, readers, read_interval, duration, bank_at,
+                                            seed, rules)
+                  for mode in MODES},
+    }
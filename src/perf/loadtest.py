@@ -0,0 +1,310 @@
+import asyncio
+import json
+import multiprocessing
+import random
+import time
+from typing import Any, Dict, List
+import numpy as np
+from model.rules import FarkleRules
+from service.game_service import GameService, run_server
+
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyRecorder:
+    """Latences des actions, par type d'action, et attente avant traitement quand elle est connue"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.queueing: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, action: str, seconds: float, ok: bool = True, queued: float = None):
+        """
+        Args:
+            action: Type d'action
+            seconds: Latence de l'action (traitement par le service)
+            ok: L'action a réussi
+            queued: Attente du client avant le traitement (boucle d'événements, pool de threads)
+        """
+        self.latencies.setdefault(action, []).append(seconds)
+        if queued is not None:
+            self.queueing.setdefault(action, []).append(queued)
+        if not ok:
+            self.errors[action] = self.errors.get(action, 0) + 1
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Nombre, erreurs, moyenne, percentiles et maximum (en millisecondes) par action, attente comprise"""
+        report = {}
+        for action, values in sorted(self.latencies.items()):
+            entry = {'count': len(values), 'errors': self.errors.get(action, 0)}
+            entry.update(self._summary(values))
+            if action in self.queueing:
+                entry.update(self._summary(self.queueing[action], 'queue_'))
+            report[action] = entry
+        return report
+
+    @staticmethod
+    def _summary(values: List[float], prefix: str = '') -> Dict[str, float]:
+        milliseconds = np.asarray(values) * 1000
+        summary = {f'{prefix}mean_ms': float(milliseconds.mean())}
+        for percentile, value in zip(PERCENTILES, np.percentile(milliseconds, PERCENTILES)):
+            summary[f'{prefix}p{percentile}_ms'] = float(value)
+        summary[f'{prefix}max_ms'] = float(milliseconds.max())
+        return summary
+
+
+class InProcessTransport:
+    """
+    Appelle directement le service du même processus (dans un pool de threads si demandé)
+
+    Le temps de traitement de la dernière requête (service.handle seul) est gardé dans
+    service_time : le reste de la latence vue par le client est de l'attente (tour dans la
+    boucle d'événements, place dans le pool de threads).
+    """
+
+    def __init__(self, service: GameService, threaded: bool = False):
+        self.service = service
+        self.threaded = threaded
+        self.service_time = None
+
+    def _handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        response = self.service.handle(request)
+        self.service_time = time.perf_counter() - start
+        return response
+
+    async def call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if self.threaded:
+            return await asyncio.get_running_loop().run_in_executor(None, self._handle, request)
+        # Rendre la main à la boucle : les clients s'entrelacent comme face à un vrai service
+        await asyncio.sleep(0)
+        return self._handle(request)
+
+    async def close(self):
+        pass
+
+
+class SocketTransport:
+    """Une connexion TCP par client vers un serveur local (JSON Lines) : latence aller-retour"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+        self.service_time = None  # Inconnu côté client : la latence est l'aller-retour complet
+
+    async def call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, limit=1 << 20)
+        self.writer.write(json.dumps(request, separators=(',', ':')).encode('utf-8') + b'\n')
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Connexion fermée par le serveur")
+        return json.loads(line)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+class SimulatedClient:
+    """
+    Client simulé : crée une table et y joue des parties complètes, comme un front-end
+
+    Chaque client a son propre profil (seuil de stop, goût du risque) : après un lancé, il garde
+    le plus souvent la meilleure combinaison de get_possible_actions, parfois une plus petite
+    pour garder des dés, stoppe au-delà de son seuil, rafraîchit l'état (delta depuis sa version)
+    après chaque tour et sauvegarde régulièrement la partie.
+    """
+
+    def __init__(self, client_id: int, transport, recorder: LatencyRecorder, players: int = 2,
+                 seed: int = None, think_time: float = 0.0, save_every: int = 10):
+        self.client_id = client_id
+        self.transport = transport
+        self.recorder = recorder
+        self.players = players
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.think_time = think_time
+        self.save_every = save_every
+        self.bank_at = self.rng.choice(range(300, 1050, 50))
+        self.small_keep_rate = self.rng.uniform(0.0, 0.3)
+        self.version = 0
+        self.actions = 0
+        self.games = 0
+        self.max_turns = 1000
+
+    async def call(self, action: str, **request) -> Dict[str, Any]:
+        """Envoie une requête et enregistre sa latence (traitement et attente séparés quand c'est possible)"""
+        if self.think_time:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think_time))
+        request['op'] = action
+        start = time.perf_counter()
+        response = await self.transport.call(request)
+        elapsed = time.perf_counter() - start
+        service_time = self.transport.service_time
+        if service_time is None:
+            self.recorder.record(action, elapsed, response.get('ok', False))
+        else:
+            self.recorder.record(action, service_time, response.get('ok', False), max(elapsed - service_time, 0.0))
+        self.actions += 1
+        return response
+
+    async def play_game(self, game_index: int):
+        """Joue une partie complète sur une nouvelle table"""
+        names = [f"c{self.client_id}-p{seat + 1}" for seat in range(self.players)]
+        seed = None if self.seed is None else self.seed * 1000 + game_index
+        response = await self.call('new', players=names, seed=seed)
+        if not response['ok']:
+            return
+        table = response['table']
+        self.version = response['version']
+
+        turns = 0
+        game_over = False
+        while not game_over and turns < self.max_turns * self.players:
+            # Chaque tour se termine par un stop ou un Farkle : les sièges jouent à tour de rôle
+            game_over = await self.play_turn(table, turns % self.players)
+            turns += 1
+            delta = await self.call('status', table=table, since=self.version)
+            if delta['ok']:
+                self.version = delta['delta']['version']
+            if self.save_every and turns % self.save_every == 0:
+                await self.call('save', table=table, filename=f"loadtest_{table}")
+
+        await self.call('save', table=table, filename=f"loadtest_{table}")
+        await self.call('close', table=table)
+        self.games += 1
+
+    async def play_turn(self, table: str, seat: int) -> bool:
+        """Joue le tour d'un siège, retourne True si la partie est terminée"""
+        while True:
+            response = await self.call('roll', table=table, player=seat)
+            if not response['ok']:
+                return True  # Table en erreur : la partie est abandonnée
+            if response['farkle']:
+                return response['game_over']
+
+            actions = response['actions']
+            index = 0
+            if len(actions) > 1 and self.rng.random() < self.small_keep_rate:
+                index = self.rng.randrange(1, len(actions))
+            response = await self.call('keep', table=table, player=seat, index=index)
+            if not response['ok']:
+                return True
+
+            if response['turn_score'] >= self.bank_at:
+                response = await self.call('stop', table=table, player=seat)
+                # Stop refusé (seuil d'entrée pas atteint) : le joueur relance
+                if response['ok'] and response['stopped']:
+                    return response['game_over']
+
+    async def run(self, games: int):
+        try:
+            for game_index in range(games):
+                await self.play_game(game_index)
+        finally:
+            await self.transport.close()
+
+
+async def _run_clients(clients: List[SimulatedClient], games: int, concurrency: int):
+    """Lance les clients, au plus concurrency à la fois"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(client: SimulatedClient):
+        async with semaphore:
+            await client.run(games)
+
+    await asyncio.gather(*(run(client) for client in clients))
+
+
+def run_load_test(clients: int = 1000, games: int = 1, players: int = 2, target: str = None,
+                  spawn_server: bool = False, threaded: bool = False, seed: int = None,
+                  think_time: float = 0.0, save_every: int = 10, save_dir: str = 'loadtest_saves',
+                  concurrency: int = None, rules: FarkleRules = None) -> Dict[str, Any]:
+    """
+    Lance un test de charge et retourne son rapport
+
+    Args:
+        clients: Nombre de clients simulés (une table chacun)
+        games: Parties jouées par client
+        players: Joueurs par table
+        target: Adresse 'hôte:port' d'un serveur local (service du même processus sinon)
+        spawn_server: Démarre le serveur cible dans un processus séparé
+        threaded: En mode local, traite les requêtes dans un pool de threads (verrous par table sollicités)
+        seed: Graine des profils de clients et des parties (aléatoire sinon)
+        think_time: Temps de réflexion moyen d'un client entre deux actions (secondes)
+        save_every: Sauvegarde toutes les save_every tours (0 = seulement en fin de partie)
+        save_dir: Dossier des sauvegardes du service
+        concurrency: Nombre maximum de clients actifs en même temps (tous par défaut)
+    """
+    server_process = None
+    if spawn_server:
+        host, port = _parse_target(target or '127.0.0.1:8765')
+        ready = multiprocessing.Event()
+        server_process = multiprocessing.Process(target=run_server, args=(host, port, save_dir, rules, ready),
+                                                 daemon=True)
+        server_process.start()
+        if not ready.wait(10):
+            server_process.terminate()
+            raise RuntimeError("Le serveur n'a pas démarré")
+        target = f'{host}:{port}'
+
+    service = None
+    if target is None:
+        service = GameService(save_dir, rules)
+
+    def transport():
+        if service is not None:
+            return InProcessTransport(service, threaded)
+        return SocketTransport(*_parse_target(target))
+
+    recorder = LatencyRecorder()
+    client_seeds = random.Random(seed)
+    simulated = [SimulatedClient(client_id, transport(), recorder, players,
+                                 client_seeds.getrandbits(32) if seed is not None else None,
+                                 think_time, save_every)
+                 for client_id in range(clients)]
+
+    start = time.perf_counter()
+    try:
+        asyncio.run(_run_clients(simulated, games, concurrency or clients))
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.join()
+    duration = time.perf_counter() - start
+
+    actions = sum(client.actions for client in simulated)
+    games_completed = sum(client.games for client in simulated)
+    return {
+        'config': {
+            'mode': 'in-process' if target is None else 'socket',
+            'target': target,
+            'threaded': threaded,
+            'clients': clients,
+            'games_per_client': games,
+            'players': players,
+            'think_time_s': think_time,
+            'save_every': save_every,
+            'concurrency': concurrency or clients,
+            'seed': seed,
+        },
+        'duration_s': duration,
+        'actions': actions,
+        'games_completed': games_completed,
+        'throughput': {
+            'actions_per_s': actions / duration if duration else None,
+            'games_per_s': games_completed / duration if duration else None,
+        },
+        'latency': recorder.report(),
+    }
+
+
+def _parse_target(target: str):
+    host, _, port = target.rpartition(':')
+    return host or '127.0.0.1', int(port)
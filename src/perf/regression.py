@@ -0,0 +1,275 @@
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+from model.dice import Dice
+from model.game import FarkleGame
+from model.rules import FarkleRules, DEFAULT_RULES, all_multisets
+from state.game_state import GameState
+
+
+# Baseline versionnée avec le code, à régénérer (--update) quand un ralentissement est assumé
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+BASELINE_VERSION = 1
+
+# Écart relatif toléré au minimum, quel que soit le bruit mesuré : la calibration corrige la dérive
+# d'ensemble d'une exécution à l'autre, pas celle qui ne touche que certaines charges (caches, mémoire)
+MIN_THRESHOLD = 0.15
+# Nombre d'erreurs-types (bruit des deux mesures combiné) tolérées
+NOISE_FACTOR = 3.0
+# Facteur entre la MAD et l'écart-type pour une distribution normale
+MAD_TO_STD = 1.4826
+# Erreur-type du premier quartile d'une loi normale, en écarts-types, pour un échantillon (/ racine de n)
+QUARTILE_STANDARD_ERROR = 1.36
+
+
+class Workload:
+    """
+    Charge de travail mesurée par la porte de performance
+
+    setup() prépare les données (hors mesure) et retourne la fonction mesurée ; un appel
+    de cette fonction est une opération, répétée autant de fois que nécessaire par échantillon.
+    """
+
+    def __init__(self, name: str, description: str, setup: Callable[[FarkleRules], Callable[[], Any]]):
+        self.name = name
+        self.description = description
+        self.setup = setup
+
+
+def _score_multisets(rules: FarkleRules) -> Callable[[], Any]:
+    multisets = [list(multiset) for multiset in all_multisets()]
+
+    def run():
+        for multiset in multisets:
+            Dice.calculate_score(multiset, rules)
+    return run
+
+
+def _enumerate_combinations(rules: FarkleRules) -> Callable[[], Any]:
+    rolls = [list(multiset) for multiset in all_multisets()]
+
+    def run():
+        for roll in rolls:
+            rules.get_possible_combinations(roll)
+    return run
+
+
+def _headless_games(rules: FarkleRules) -> Callable[[], Any]:
+    from bot.simulation import simulate_game
+    from bot.strategy import TableStrategy, threshold_policy
+    strategy = TableStrategy.from_callable(threshold_policy(350), rules=rules)
+    names = ['Joueur 1', 'Joueur 2', 'Joueur 3']
+
+    def run():
+        # Mêmes graines à chaque opération : le travail mesuré est identique d'une exécution à l'autre
+        for seed in range(10):
+            simulate_game(names, [strategy] * 3, seed, rules)
+    return run
+
+
+def _save_load(rules: FarkleRules) -> Callable[[], Any]:
+    game = FarkleGame(['Alice', 'Bob', 'Charlie'], seed=1, rules=rules)
+    for _ in range(120):
+        game.roll_dice()
+        if game.is_farkle():
+            game.farkle()
+        else:
+            game.apply_decision(0, game.get_current_player().turn_score >= 350)
+    directory = tempfile.mkdtemp(prefix='farkle_perf_')
+    game.game_state = GameState(directory)
+
+    def run():
+        game.save_game('perf_gate')
+        restored = FarkleGame(seed=0, rules=rules)
+        restored.game_state = game.game_state
+        restored.load_game('perf_gate')
+    run.cleanup = lambda: shutil.rmtree(directory, ignore_errors=True)
+    return run
+
+
+def _calibration(rules: FarkleRules) -> Callable[[], Any]:
+    def run():
+        total = 0
+        for value in range(20000):
+            total += value % 7
+        return total
+    return run
+
+
+# Référence indépendante du moteur, toujours mesurée : sa variation est celle de la machine
+CALIBRATION = Workload('calibration', "Boucle Python de référence (vitesse de la machine)", _calibration)
+
+WORKLOADS = [
+    Workload('score_multisets', "Dice.calculate_score sur tous les lancés distincts (1 à 6 dés)", _score_multisets),
+    Workload('combinations', "get_possible_combinations sur tous les lancés distincts", _enumerate_combinations),
+    Workload('headless_games', "10 parties complètes à 3 joueurs (stratégie en table)", _headless_games),
+    Workload('save_load', "Sauvegarde puis chargement d'une partie via GameState", _save_load),
+]
+
+
+def calibrate(function: Callable[[], Any], sample_time: float = 0.05) -> int:
+    """Échauffement, puis nombre d'opérations pour qu'un échantillon dure environ sample_time"""
+    function()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= sample_time / 2 or loops >= 1 << 20:
+            break
+        loops *= 2
+    return max(1, round(loops * sample_time / max(elapsed, 1e-9)))
+
+
+def sample(function: Callable[[], Any], loops: int) -> float:
+    """Temps moyen par opération (secondes) sur loops opérations"""
+    start = time.perf_counter()
+    for _ in range(loops):
+        function()
+    return (time.perf_counter() - start) / loops
+
+
+def summarize(times: List[float], loops: int) -> Dict[str, Any]:
+    """
+    Statistiques d'une série d'échantillons
+
+    Les interférences (autres processus, fréquence du processeur) ne font que ralentir une
+    mesure : la comparaison porte sur le quantile bas (best_s, premier quartile), bien plus
+    stable que la moyenne ; la dispersion est estimée par la MAD autour de la médiane.
+    """
+    ordered = sorted(times)
+    median = statistics.median(ordered)
+    return {
+        'best_s': ordered[(len(ordered) - 1) // 4],
+        'median_s': median,
+        'mad_s': statistics.median(abs(value - median) for value in ordered),
+        'samples': len(ordered),
+        'loops': loops,
+    }
+
+
+def run_workloads(names: List[str] = None, samples: int = 50, sample_time: float = 0.05,
+                  rules: FarkleRules = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Mesure les charges de travail (toutes, ou celles nommées)
+
+    Les échantillons sont pris à tour de rôle (un par charge et par tour) : un ralentissement
+    passager de la machine touche toutes les charges au lieu d'en fausser une seule.
+    La charge de calibration est toujours mesurée avec les autres.
+    """
+    rules = rules or DEFAULT_RULES
+    unknown = set(names or ()) - {workload.name for workload in WORKLOADS}
+    if unknown:
+        raise ValueError(f"Charges de travail inconnues: {', '.join(sorted(unknown))}")
+    selected = [CALIBRATION] + [workload for workload in WORKLOADS if names is None or workload.name in names]
+
+    functions = {}
+    try:
+        for workload in selected:
+            functions[workload.name] = workload.setup(rules)
+        loops = {name: calibrate(function, sample_time) for name, function in functions.items()}
+        times: Dict[str, List[float]] = {name: [] for name in functions}
+        for _ in range(samples):
+            for name, function in functions.items():
+                times[name].append(sample(function, loops[name]))
+        return {name: summarize(times[name], loops[name]) for name in functions}
+    finally:
+        for function in functions.values():
+            cleanup = getattr(function, 'cleanup', None)
+            if cleanup:
+                cleanup()
+
+
+def save_baseline(results: Dict[str, Dict[str, Any]], filepath: str = DEFAULT_BASELINE) -> str:
+    """Écrit une baseline (les charges déjà présentes et non remesurées sont conservées)"""
+    baseline = load_baseline(filepath) if os.path.exists(filepath) else {'workloads': {}}
+    baseline['version'] = BASELINE_VERSION
+    baseline['machine'] = {'python': platform.python_version(), 'platform': platform.platform(),
+                           'processor': platform.processor() or platform.machine()}
+    baseline['workloads'].update(results)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return filepath
+
+
+def load_baseline(filepath: str = DEFAULT_BASELINE) -> Dict[str, Any]:
+    with open(filepath, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Version de baseline non supportée: {baseline.get('version')}")
+    return baseline
+
+
+def relative_noise(result: Dict[str, Any]) -> float:
+    """Erreur-type relative du quantile bas d'une mesure (écart-type estimé par la MAD normalisée)"""
+    if not result['best_s']:
+        return 0.0
+    deviation = MAD_TO_STD * result['mad_s'] / result['best_s']
+    return QUARTILE_STANDARD_ERROR * deviation / result['samples'] ** 0.5
+
+
+def compare(baseline: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+            min_threshold: float = MIN_THRESHOLD, noise_factor: float = NOISE_FACTOR) -> List[Dict[str, Any]]:
+    """
+    Compare des mesures à la baseline
+
+    La comparaison porte sur le quantile bas (best_s), rapporté à celui de la calibration de la
+    même exécution : un ralentissement de toute la machine ne compte pas comme une régression.
+    Le seuil de chaque charge tient compte du bruit des mesures (calibrations comprises) :
+    max(min_threshold, noise_factor * erreur-type combinée). Au-delà, un ralentissement est une
+    régression et une accélération une amélioration ; en deçà, l'écart est considéré comme du bruit.
+
+    Returns:
+        Une ligne par charge mesurée : baseline, actuel, écart relatif, seuil et statut
+        ('ok', 'regression', 'improvement' ou 'new' sans baseline)
+    """
+    speed, calibration_noise = 1.0, 0.0
+    if CALIBRATION.name in baseline and CALIBRATION.name in current:
+        speed = current[CALIBRATION.name]['best_s'] / baseline[CALIBRATION.name]['best_s']
+        calibration_noise = (relative_noise(baseline[CALIBRATION.name]) ** 2
+                             + relative_noise(current[CALIBRATION.name]) ** 2)
+
+    rows = []
+    for name, result in current.items():
+        if name == CALIBRATION.name:
+            continue
+        reference = baseline.get(name)
+        if reference is None:
+            rows.append({'workload': name, 'baseline_s': None, 'current_s': result['best_s'],
+                         'change': None, 'threshold': None, 'status': 'new', 'machine_speed': speed})
+            continue
+        noise = (relative_noise(reference) ** 2 + relative_noise(result) ** 2 + calibration_noise) ** 0.5
+        threshold = max(min_threshold, noise_factor * noise)
+        change = result['best_s'] / reference['best_s'] / speed - 1.0
+        if change > threshold:
+            status = 'regression'
+        elif change < -threshold:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'workload': name, 'baseline_s': reference['best_s'], 'current_s': result['best_s'],
+                     'change': change, 'threshold': threshold, 'status': status, 'machine_speed': speed})
+    return rows
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Tableau des écarts, temps par opération en millisecondes"""
+    lines = [f"{'charge':<16} {'baseline (ms)':>14} {'actuel (ms)':>12} {'écart':>8} {'seuil':>7}  statut"]
+    for row in rows:
+        baseline = f"{row['baseline_s'] * 1000:.3f}" if row['baseline_s'] is not None else '-'
+        change = f"{row['change']:+.1%}" if row['change'] is not None else '-'
+        threshold = f"{row['threshold']:.1%}" if row['threshold'] is not None else '-'
+        lines.append(f"{row['workload']:<16} {baseline:>14} {row['current_s'] * 1000:>12.3f} {change:>8} "
+                     f"{threshold:>7}  {row['status'].upper() if row['status'] == 'regression' else row['status']}")
+    return '\n'.join(lines)
+
+
+def has_regression(rows: List[Dict[str, Any]]) -> bool:
+    return any(row['status'] == 'regression' for row in rows)
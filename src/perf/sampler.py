@@ -0,0 +1,482 @@
+import atexit
+import html
+import json
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from multiprocessing import util
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Racine des sources : les fichiers du projet sont nommés par leur chemin relatif (model/game.py)
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLOCKS = ('cpu', 'wall')
+DEFAULT_INTERVAL = 0.01
+DEFAULT_MAX_OVERHEAD = 0.05
+# Intervalle de bascule du GIL pendant un profilage en temps réel (voir SamplingProfiler)
+WALL_SWITCH_INTERVAL = 0.0001
+MAX_DEPTH = 256
+# Les processus de travail écrivent leurs échantillons régulièrement (et à leur sortie, SIGTERM
+# compris) : un travailleur tué autrement ne perd que ceux des dernières WORKER_FLUSH_INTERVAL secondes
+WORKER_FLUSH_INTERVAL = 0.5
+
+# Session en cours dans ce processus (suivie par les processus créés par fork)
+_active_session: Optional['ProfileSession'] = None
+_fork_hook_registered = False
+
+
+def frame_label(code, line: int = None) -> str:
+    """Nom d'une fonction dans une pile : « fonction (fichier:ligne) », sans « ; » (séparateur des piles)"""
+    filename = code.co_filename
+    if filename.startswith(SOURCE_ROOT + os.sep):
+        filename = os.path.relpath(filename, SOURCE_ROOT)
+    else:
+        filename = os.path.basename(filename)
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{name} ({filename}:{code.co_firstlineno if line is None else line})".replace(';', ',')
+
+
+class SamplingProfiler:
+    """
+    Profileur par échantillonnage des piles Python d'un processus
+
+    Le code profilé n'est pas instrumenté : une fonction très courte et très appelée
+    (calculate_score, bank_dice) n'est pas ralentie par le profilage, sa part d'échantillons
+    est sa part du temps. Deux horloges :
+
+    - 'cpu' (par défaut) : le minuteur ITIMER_PROF envoie SIGPROF toutes les `interval` secondes
+      de temps processeur consommé, le gestionnaire relève la pile du thread principal à
+      l'instruction en cours. Un processus qui attend n'est pas échantillonné.
+    - 'wall' : un thread se réveille toutes les `interval` secondes (temps réel) et relève la
+      pile du thread principal, ou de tous les threads, avec sys._current_frames. Ce thread
+      doit obtenir le GIL : l'intervalle de bascule est réduit pendant le profilage, sinon les
+      relevés tomberaient surtout sur les appels système qui relâchent le GIL.
+
+    Le surcoût est borné : un relevé (et l'écriture éventuelle des échantillons) qui prend plus
+    de max_overhead du temps écoulé allonge d'autant l'attente avant le suivant.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, max_overhead: float = DEFAULT_MAX_OVERHEAD,
+                 clock: str = 'cpu', all_threads: bool = False, lines: bool = False, role: str = 'main',
+                 on_flush: Callable[[], Any] = None, flush_interval: float = WORKER_FLUSH_INTERVAL):
+        """
+        Args:
+            interval: Intervalle minimal entre deux relevés (secondes)
+            max_overhead: Part maximale du temps consacrée aux relevés (0.05 = 5 %)
+            clock: 'cpu' (temps processeur, thread principal) ou 'wall' (temps réel)
+            all_threads: Relève tous les threads (horloge 'wall' seulement)
+            lines: Distingue les lignes d'une fonction (sinon une fonction est un seul cadre)
+            role: Premier cadre de chaque pile (processus principal ou de travail)
+            on_flush: Appelée après un relevé toutes les flush_interval secondes au plus
+        """
+        if interval <= 0:
+            raise ValueError(f"L'intervalle d'échantillonnage doit être positif: {interval}")
+        if not 0 < max_overhead < 1:
+            raise ValueError(f"Le surcoût maximal doit être entre 0 et 1: {max_overhead}")
+        if clock not in CLOCKS:
+            raise ValueError(f"Horloge inconnue: {clock} (disponibles : {', '.join(CLOCKS)})")
+        if clock == 'cpu' and not hasattr(signal, 'setitimer'):
+            raise ValueError("L'horloge 'cpu' n'est pas disponible sur ce système (utiliser 'wall')")
+        if clock == 'cpu' and all_threads:
+            raise ValueError("Le relevé de tous les threads nécessite l'horloge 'wall'")
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.clock = clock
+        self.all_threads = all_threads
+        self.lines = lines
+        self.role = role
+        self.on_flush = on_flush
+        self.flush_interval = flush_interval
+
+        self.stacks: Dict[tuple, int] = {}
+        self.samples = 0
+        self.sampling_time = 0.0  # Temps passé par le profileur (relevés et écritures)
+        self.started_at = None
+        self.stopped_at = None
+        # Réentrant : en horloge 'cpu', le gestionnaire de signal s'exécute dans le thread qui lit les piles
+        self._lock = threading.RLock()
+        self._running = False
+        self._stop = threading.Event()
+        self._thread = None
+        self._next_flush = 0.0
+        self._previous_handler = None
+        self._previous_switch_interval = None
+        self._labels: Dict[Any, str] = {}
+        self._thread_names: Dict[int, str] = {}
+
+    def start(self) -> 'SamplingProfiler':
+        self.started_at = time.perf_counter()
+        self._next_flush = self.started_at + self.flush_interval
+        self._running = True
+        if self.clock == 'cpu':
+            if threading.current_thread() is not threading.main_thread():
+                raise RuntimeError("L'horloge 'cpu' se démarre depuis le thread principal")
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._previous_switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(self._previous_switch_interval, WALL_SWITCH_INTERVAL))
+            self._thread = threading.Thread(target=self._run, name='farkle-sampler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        if self.clock == 'cpu':
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        else:
+            self._stop.set()
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+            sys.setswitchinterval(self._previous_switch_interval)
+        self.stopped_at = time.perf_counter()
+
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.stopped_at or time.perf_counter()) - self.started_at
+
+    def _next_delay(self, start: float) -> float:
+        """Fin d'un relevé : écriture éventuelle, puis attente avant le suivant pour rester sous max_overhead"""
+        if self.on_flush is not None and start >= self._next_flush:
+            self.on_flush()
+            self._next_flush = start + self.flush_interval
+        cost = time.perf_counter() - start
+        self.sampling_time += cost
+        # cost / (cost + attente) <= max_overhead
+        return max(self.interval, cost * (1 / self.max_overhead - 1))
+
+    def _on_signal(self, signum, frame):
+        if not self._running:
+            return
+        start = time.perf_counter()
+        self._record((self.role,), frame)
+        delay = self._next_delay(start)
+        if self._running and delay > self.interval:
+            # Minuteur périodique : réarmé seulement pour espacer le prochain relevé
+            signal.setitimer(signal.ITIMER_PROF, delay, self.interval)
+
+    def _run(self):
+        own = threading.get_ident()
+        main = threading.main_thread().ident
+        delay = self.interval
+        while not self._stop.wait(delay):
+            start = time.perf_counter()
+            frames = sys._current_frames()
+            if not self.all_threads:
+                frames = {main: frames.get(main)}
+            for ident, frame in frames.items():
+                if ident != own and frame is not None:
+                    self._record((self.role, self._thread_name(ident)) if self.all_threads else (self.role,), frame)
+            delay = self._next_delay(start)
+
+    def _record(self, prefix: tuple, frame):
+        """Compte la pile d'un thread, de la racine au cadre en cours"""
+        labels = self._labels
+        stack = []
+        while frame is not None and len(stack) < MAX_DEPTH:
+            code = frame.f_code
+            key = (code, frame.f_lineno) if self.lines else code
+            label = labels.get(key)
+            if label is None:
+                label = labels[key] = frame_label(code, frame.f_lineno if self.lines else None)
+            stack.append(label)
+            frame = frame.f_back
+        key = prefix + tuple(reversed(stack))
+        with self._lock:
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.samples += 1
+
+    def _thread_name(self, ident: int) -> str:
+        name = self._thread_names.get(ident)
+        if name is None:
+            self._thread_names = {thread.ident: thread.name.replace(';', ',') for thread in threading.enumerate()}
+            name = self._thread_names.get(ident, f"thread-{ident}")
+        return name
+
+    def collapsed(self) -> Dict[str, int]:
+        """Piles relevées au format replié : cadres séparés par « ; », de la racine à la fonction en cours"""
+        with self._lock:
+            # Copie d'un bloc : un relevé (signal) ne peut pas modifier le dictionnaire pendant le parcours
+            items = list(self.stacks.items())
+        return {';'.join(stack): count for stack, count in items}
+
+    def __enter__(self) -> 'SamplingProfiler':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def _write_part(profiler: SamplingProfiler, filepath: str):
+    """Écrit les échantillons d'un processus de travail (remplacement atomique, erreurs ignorées)"""
+    data = {'pid': os.getpid(), 'samples': profiler.samples, 'sampling_time': profiler.sampling_time,
+            'elapsed': profiler.elapsed(), 'stacks': profiler.collapsed()}
+    temporary = f"{filepath}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temporary, filepath)
+    except OSError:
+        # Session terminée (dossier supprimé) alors que ce processus tourne encore
+        pass
+
+
+def _after_fork_in_child():
+    session = _active_session
+    if session is not None and session.follow_workers:
+        session._start_worker()
+
+
+class ProfileSession:
+    """
+    Profilage par échantillonnage du processus principal et de ses processus de travail
+
+    Les processus créés par fork pendant la session (Pool, ProcessPoolExecutor, travailleurs
+    des simulations réparties) démarrent leur propre profileur et écrivent régulièrement leurs
+    échantillons dans un dossier temporaire ; stop() les fusionne avec ceux du processus
+    principal (piles préfixées par « main » ou « worker ») et écrit le fichier de piles repliées
+    (format de flamegraph.pl, speedscope, inferno) et un flamegraph SVG.
+    """
+
+    def __init__(self, output: str, interval: float = DEFAULT_INTERVAL, max_overhead: float = DEFAULT_MAX_OVERHEAD,
+                 clock: str = 'cpu', all_threads: bool = False, lines: bool = False, follow_workers: bool = True,
+                 flamegraph: Optional[str] = ''):
+        """
+        Args:
+            output: Fichier des piles repliées
+            interval, max_overhead, clock, all_threads, lines: Réglages des profileurs (voir SamplingProfiler)
+            follow_workers: Profile aussi les processus créés par fork pendant la session
+            flamegraph: Fichier SVG (par défaut output avec l'extension .svg, None pour ne pas l'écrire)
+        """
+        # Valide les réglages tout de suite plutôt qu'au démarrage des travailleurs ou à l'écriture
+        SamplingProfiler(interval, max_overhead, clock, all_threads)
+        if not os.path.isdir(os.path.dirname(os.path.abspath(output))):
+            raise ValueError(f"Dossier inexistant pour le profil: {output}")
+        self.output = output
+        self.flamegraph = os.path.splitext(output)[0] + '.svg' if flamegraph == '' else flamegraph
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.clock = clock
+        self.all_threads = all_threads
+        self.lines = lines
+        self.follow_workers = follow_workers
+        self.parts_dir = None
+        self.profiler: Optional[SamplingProfiler] = None
+        self.pid = None
+        self._finish_worker = None
+
+    def start(self) -> 'ProfileSession':
+        global _active_session, _fork_hook_registered
+        if _active_session is not None:
+            raise RuntimeError("Une session de profilage est déjà active dans ce processus")
+        self.pid = os.getpid()
+        self.parts_dir = tempfile.mkdtemp(prefix='farkle_profile_')
+        self.profiler = self._profiler('main')
+        _active_session = self
+        util.register_after_fork(self, ProfileSession._register_worker_exit)
+        if not _fork_hook_registered and hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_after_fork_in_child)
+            _fork_hook_registered = True
+        self.profiler.start()
+        return self
+
+    def _register_worker_exit(self):
+        """
+        Après un fork de multiprocessing (Process._bootstrap, qui vide les finaliseurs hérités) :
+        les échantillons du travailleur sont écrits à sa sortie
+        """
+        if self._finish_worker is not None:
+            util.Finalize(None, self._finish_worker, exitpriority=100)
+
+    def _profiler(self, role: str) -> SamplingProfiler:
+        return SamplingProfiler(self.interval, self.max_overhead, self.clock, self.all_threads, self.lines, role)
+
+    def _start_worker(self):
+        """
+        Dans un processus de travail qui vient d'être créé : nouveau profileur (ni le thread ni
+        le minuteur du parent ne survivent au fork), dont les échantillons sont écrits régulièrement
+        """
+        filepath = os.path.join(self.parts_dir, f"{os.getpid()}.json")
+        profiler = self.profiler = self._profiler('worker')
+        profiler.on_flush = lambda: _write_part(profiler, filepath)
+
+        def finish():
+            profiler.stop()
+            _write_part(profiler, filepath)
+
+        # Sortie d'un fork simple ; celle d'un processus multiprocessing (os._exit, sans atexit)
+        # passe par _register_worker_exit
+        self._finish_worker = finish
+        atexit.register(finish)
+        if signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+            # Pool.terminate : écrit les échantillons puis se termine comme sans gestionnaire
+            def terminate(signum, frame):
+                finish()
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                os.kill(os.getpid(), signal.SIGTERM)
+
+            signal.signal(signal.SIGTERM, terminate)
+        profiler.start()
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        Arrête le profilage, fusionne les échantillons des processus et écrit les fichiers
+
+        Returns:
+            Résumé : échantillons (processus principal et de travail), nombre de processus de travail,
+            surcoût mesuré, fichiers écrits et piles repliées fusionnées
+        """
+        global _active_session
+        if os.getpid() != self.pid:
+            return {}
+        self.profiler.stop()
+        _active_session = None
+
+        stacks = Counter(self.profiler.collapsed())
+        worker_samples, processes = 0, 0
+        sampling_time, elapsed = self.profiler.sampling_time, self.profiler.elapsed()
+        for filename in sorted(os.listdir(self.parts_dir)):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.parts_dir, filename), 'r', encoding='utf-8') as f:
+                    part = json.load(f)
+            except (OSError, ValueError):
+                continue
+            stacks.update(part['stacks'])
+            worker_samples += part['samples']
+            sampling_time += part['sampling_time']
+            elapsed += part['elapsed']
+            processes += 1
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+
+        write_collapsed(stacks, self.output)
+        if self.flamegraph:
+            with open(self.flamegraph, 'w', encoding='utf-8') as f:
+                f.write(render_flamegraph(stacks, title=f"Farkle - {sum(stacks.values())} échantillons"))
+        return {
+            'samples': {'main': self.profiler.samples, 'workers': worker_samples},
+            'worker_processes': processes,
+            'overhead': sampling_time / elapsed if elapsed else 0.0,
+            'collapsed': self.output,
+            'flamegraph': self.flamegraph,
+            'stacks': dict(stacks),
+        }
+
+    def __enter__(self) -> 'ProfileSession':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.summary = self.stop()
+
+
+def write_collapsed(stacks: Dict[str, int], filepath: str):
+    """Écrit des piles repliées : une ligne « cadre;cadre;...;cadre nombre » par pile"""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+
+def read_collapsed(filepath: str) -> Dict[str, int]:
+    stacks: Counter = Counter()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            stack, _, count = line.rstrip('\n').rpartition(' ')
+            if stack and count.isdigit():
+                stacks[stack] += int(count)
+    return dict(stacks)
+
+
+def top_functions(stacks: Dict[str, int], limit: int = 10, prefix: int = 1) -> List[Tuple[str, int, int]]:
+    """
+    Fonctions les plus présentes dans les échantillons
+
+    Args:
+        stacks: Piles repliées
+        limit: Nombre de fonctions
+        prefix: Cadres de tête à ignorer (rôle du processus, et nom du thread si tous les threads sont relevés)
+
+    Returns:
+        (fonction, échantillons où elle s'exécutait, échantillons où elle était dans la pile),
+        par échantillons propres décroissants
+    """
+    own: Counter = Counter()
+    total: Counter = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(';')[prefix:]
+        if not frames:
+            continue
+        own[frames[-1]] += count
+        for frame in set(frames):
+            total[frame] += count
+    return [(frame, samples, total[frame]) for frame, samples in own.most_common(limit)]
+
+
+def _frame_color(name: str) -> str:
+    """Couleur chaude stable pour un nom de fonction (même fonction, même couleur)"""
+    value = zlib.crc32(name.encode('utf-8'))
+    return f"rgb({205 + value % 50},{80 + (value >> 8) % 150},{(value >> 16) % 55})"
+
+
+def render_flamegraph(stacks: Dict[str, int], title: str = 'Flamegraph', width: int = 1200,
+                      frame_height: int = 16, min_width: float = 0.1) -> str:
+    """
+    Flamegraph SVG autonome des piles repliées (racine en bas, largeur proportionnelle aux échantillons)
+
+    Les cadres plus étroits que min_width pixels ne sont pas dessinés ; le survol d'un cadre
+    affiche son nom, ses échantillons et leur part du total.
+    """
+    root: Dict[str, Any] = {'count': 0, 'children': {}}
+    for stack, count in stacks.items():
+        node = root
+        node['count'] += count
+        for frame in stack.split(';'):
+            node = node['children'].setdefault(frame, {'count': 0, 'children': {}})
+            node['count'] += count
+    total = root['count'] or 1
+
+    rectangles = []
+    depth_max = 0
+    pending = [(root, 0, 0.0)]
+    while pending:
+        node, depth, x = pending.pop()
+        for name, child in sorted(node['children'].items()):
+            child_width = child['count'] / total * (width - 20)
+            if child_width >= min_width:
+                rectangles.append((name, child['count'], depth, x, child_width))
+                depth_max = max(depth_max, depth + 1)
+                pending.append((child, depth + 1, x))
+            x += child_width
+
+    height = (depth_max + 3) * frame_height
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="Verdana, sans-serif" font-size="11">',
+        f'<rect width="{width}" height="{height}" fill="#f8f8f8"/>',
+        f'<text x="{width / 2}" y="{frame_height}" text-anchor="middle" font-size="14">{html.escape(title)}</text>',
+    ]
+    for name, count, depth, x, frame_width in rectangles:
+        y = height - (depth + 1) * frame_height
+        escaped = html.escape(name)
+        lines.append(f'<g><title>{escaped} ({count} échantillons, {count / total:.2%})</title>'
+                     f'<rect x="{x + 10:.2f}" y="{y}" width="{frame_width:.2f}" height="{frame_height - 1}" '
+                     f'fill="{_frame_color(name)}" rx="2"/>')
+        characters = int(frame_width / 7)
+        if characters >= 3:
+            text = name if len(name) <= characters else name[:characters - 2] + '..'
+            lines.append(f'<text x="{x + 13:.2f}" y="{y + frame_height - 4}">{html.escape(text)}</text>')
+        lines.append('</g>')
+    lines.append('</svg>')
+    return '\n'.join(lines) + '\n'
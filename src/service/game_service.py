@@ -0,0 +1,249 @@
+import asyncio
+import json
+import threading
+from itertools import count
+from typing import Any, Dict, List, Optional, Union
+from model.game import FarkleGame
+from model.rules import FarkleRules
+from service.shared_game import SharedGame
+from state.game_state import GameState
+from state.profiles import ProfileStore
+
+
+class GameService:
+    """
+    Service de jeu : héberge des tables (une partie par table) et traite des requêtes JSON
+
+    Une requête est un dictionnaire {'op': ..., 'table': ...} ; la réponse contient 'ok'
+    et, en cas d'échec, 'error'. Chaque table est une SharedGame : les actions d'une même table
+    sont appliquées une à la fois, celles de tables différentes en parallèle, et l'état complet
+    se lit sans attendre les actions en cours.
+
+    Les actions (roll, keep, stop) doivent préciser 'player' (siège 0-based ou nom) : elles sont
+    refusées si ce n'est pas le tour de ce joueur. Le champ optionnel 'version' (state_version
+    lue par le client) refuse l'action si la partie a changé depuis.
+
+    Opérations :
+    - new     {'players': [...], 'seed': graine}   Crée une table, retourne son identifiant
+    - roll    {'table', 'player'}                  Lance les dés (le Farkle est géré comme dans la CLI)
+    - keep    {'table', 'player', 'index'}         Garde la combinaison n° index (0-based) de get_possible_actions
+    - stop    {'table', 'player'}                  Stoppe le tour
+
+    Comme dans la CLI, un tour enchaîne lancé, dés gardés, puis relance ou stop : relancer ou
+    stopper avant d'avoir gardé des dés du lancé, ou garder deux fois, est refusé.
+    - status  {'table', 'since': version}          État complet, ou delta depuis une version
+    - save    {'table', 'filename'}                Sauvegarde la partie
+    - close   {'table'}                            Ferme la table
+    - leaderboard {'metric', 'limit', 'offset'}    Classement de tous les temps (sans table)
+    - profile {'name'}                             Profil d'un joueur (sans table)
+
+    Les parties terminées mettent à jour les profils des joueurs (state.profiles), rangés avec les sauvegardes.
+
+    Les dés sont toujours tirés par le serveur. Pour les tests seulement, allow_forced_dice accepte
+    sur roll un champ 'dice' qui impose le lancé (comme 'roll d1 d2 ...' du mode script).
+    """
+
+    def __init__(self, save_dir: str = None, rules: FarkleRules = None, allow_forced_dice: bool = False):
+        self.save_dir = save_dir
+        self.rules = rules
+        self.allow_forced_dice = allow_forced_dice
+        self.tables: Dict[str, SharedGame] = {}
+        self.registry_lock = threading.Lock()
+        self.table_ids = count(1)
+        self.profiles = ProfileStore.for_directory(save_dir or GameState.SAVE_DIR)
+        self.handlers = {
+            'new': self.op_new,
+            'roll': self.op_roll,
+            'keep': self.op_keep,
+            'stop': self.op_stop,
+            'status': self.op_status,
+            'save': self.op_save,
+            'close': self.op_close,
+            'leaderboard': self.op_leaderboard,
+            'profile': self.op_profile,
+        }
+        self.global_ops = {'new', 'leaderboard', 'profile'}  # Opérations sans table
+        self.player_ops = {'roll', 'keep', 'stop'}  # Actions d'un joueur sur la partie
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Traite une requête et retourne la réponse (jamais d'exception pour une requête invalide)"""
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': f"Requête invalide: objet JSON attendu, reçu {type(request).__name__}"}
+        try:
+            handler = self.handlers.get(request.get('op')) if isinstance(request.get('op'), str) else None
+            if handler is None:
+                raise ValueError(f"Opération inconnue: {request.get('op')}")
+            if request['op'] in self.global_ops:
+                response = handler(request)
+            else:
+                table = self.tables.get(str(request.get('table')))
+                if table is None:
+                    raise KeyError(f"Table inconnue: {request.get('table')}")
+                if request['op'] in self.player_ops:
+                    response = table.act(self._player_field(request), lambda game: handler(game, request),
+                                         self._int_field(request, 'version'))
+                else:
+                    response = handler(table, request)
+            response['ok'] = True
+        except (ValueError, FileNotFoundError, KeyError, TypeError) as e:
+            response = {'ok': False, 'error': str(e)}
+        return response
+
+    def op_new(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        players = request.get('players') or []
+        if not isinstance(players, list) or not all(isinstance(name, str) for name in players):
+            raise ValueError(f"Champ 'players' invalide: liste de noms attendue, reçu {players!r}")
+        game = FarkleGame(seed=self._int_field(request, 'seed'), rules=self.rules)
+        game.game_state = GameState(self.save_dir)
+        game.profiles = self.profiles
+        game.setup_players(players)
+        shared = SharedGame(game)
+        with self.registry_lock:
+            table = str(next(self.table_ids))
+            self.tables[table] = shared
+        return {'table': table, 'seed': game.seed, 'version': shared.version}
+
+    def op_roll(self, game: FarkleGame, request: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_playing(game)
+        dice_values = list(game.roll_dice(self._dice_field(request)))
+        if game.is_farkle():
+            game.farkle()
+            # Un Farkle peut terminer la partie pendant le dernier tour
+            return {'dice': dice_values, 'farkle': True, 'game_over': game.game_over}
+        return {'dice': dice_values, 'farkle': False, 'actions': game.get_possible_actions()}
+
+    def op_keep(self, game: FarkleGame, request: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_playing(game)
+        if not game.roll_pending:
+            raise ValueError("Aucune combinaison à conserver : il faut d'abord lancer les dés")
+        actions = game.get_possible_actions()
+        index = self._int_field(request, 'index', 0)
+        if not 0 <= index < len(actions):
+            raise ValueError(f"Choix invalide: {index} (0-{len(actions) - 1})")
+        score, dice_to_bank = actions[index]
+        if not game.bank_dice(dice_to_bank):
+            raise ValueError(f"Impossible de conserver les dés {dice_to_bank}")
+        return {'score': score, 'turn_score': game.get_current_player().turn_score,
+                'remaining_dice_count': game.get_remaining_dice_count()}
+
+    def op_stop(self, game: FarkleGame, request: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_playing(game)
+        if game.roll_pending:
+            raise ValueError("Il faut garder des dés du lancé actuel avant de stopper")
+        # Un stop refusé (seuil d'entrée, score nul) n'est pas une erreur : le joueur doit relancer
+        stopped = game.stop_turn()
+        return {'stopped': stopped, 'game_over': game.game_over,
+                'winner': game.winner.name if game.winner else None}
+
+    def op_status(self, table: SharedGame, request: Dict[str, Any]) -> Dict[str, Any]:
+        if request.get('since') is not None:
+            since = self._int_field(request, 'since')
+            return {'delta': table.locked(lambda game: game.status_since(since))}
+        view = table.view()
+        return {'status': dict(view.status), 'version': view.version}
+
+    def op_save(self, table: SharedGame, request: Dict[str, Any]) -> Dict[str, Any]:
+        filename = request.get('filename')
+        if filename is not None and (not isinstance(filename, str) or not filename):
+            raise ValueError(f"Champ 'filename' invalide: nom de fichier attendu, reçu {filename!r}")
+        return {'filepath': table.locked(lambda game: game.save_game(filename))}
+
+    def op_close(self, table: SharedGame, request: Dict[str, Any]) -> Dict[str, Any]:
+        table_id = str(request.get('table'))
+        with self.registry_lock:
+            self.tables.pop(table_id, None)
+        return {'closed': table_id}
+
+    def op_leaderboard(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        metric = request.get('metric', 'wins')
+        if not isinstance(metric, str):
+            raise ValueError(f"Champ 'metric' invalide: nom de classement attendu, reçu {metric!r}")
+        limit, offset = self._int_field(request, 'limit', 10), self._int_field(request, 'offset', 0)
+        if limit < 0 or offset < 0:
+            raise ValueError("Les champs 'limit' et 'offset' doivent être positifs")
+        return {'metric': metric, 'leaderboard': self.profiles.leaderboard(metric, limit, offset)}
+
+    def op_profile(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        profile = self.profiles.profile(str(request.get('name')))
+        if profile is None:
+            raise KeyError(f"Joueur inconnu: {request.get('name')}")
+        return {'profile': profile}
+
+    @staticmethod
+    def _require_playing(game: FarkleGame):
+        if game.game_over:
+            raise ValueError("La partie est terminée")
+
+    @staticmethod
+    def _int_field(request: Dict[str, Any], name: str, default: int = None) -> Optional[int]:
+        """Champ entier d'une requête (un entier ou sa représentation décimale), default s'il est absent ou nul"""
+        value = request.get(name)
+        if value is None:
+            return default
+        if not isinstance(value, bool):
+            if isinstance(value, int):
+                return value
+            if isinstance(value, str) and value.strip().lstrip('+-').isdigit():
+                return int(value)
+        raise ValueError(f"Champ '{name}' invalide: entier attendu, reçu {value!r}")
+
+    def _dice_field(self, request: Dict[str, Any]) -> Optional[List[int]]:
+        """Lancé imposé d'une requête (les valeurs sont vérifiées par les dés), None s'il est absent"""
+        dice = request.get('dice')
+        if dice is None:
+            return None
+        if not self.allow_forced_dice:
+            raise ValueError("Champ 'dice' refusé : les dés sont tirés par le serveur")
+        if not isinstance(dice, list) or not all(isinstance(value, int) and not isinstance(value, bool)
+                                                 for value in dice):
+            raise ValueError(f"Champ 'dice' invalide: liste de valeurs de dés attendue, reçu {dice!r}")
+        return dice
+
+    @staticmethod
+    def _player_field(request: Dict[str, Any]) -> Union[int, str]:
+        """Joueur qui agit : siège (0-based) ou nom, obligatoire pour les actions"""
+        player = request.get('player')
+        if player is None:
+            raise ValueError("Champ 'player' requis : siège ou nom du joueur qui agit")
+        if isinstance(player, str) or (isinstance(player, int) and not isinstance(player, bool)):
+            return player
+        raise ValueError(f"Champ 'player' invalide: siège ou nom attendu, reçu {player!r}")
+
+
+async def handle_connection(service: GameService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Une connexion cliente : une requête JSON par ligne, une réponse JSON par ligne"""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                response = {'ok': False, 'error': f"Requête invalide: {e}"}
+            else:
+                # Les sauvegardes écrivent sur disque : le traitement ne bloque pas la boucle
+                response = await loop.run_in_executor(None, service.handle, request)
+            writer.write(json.dumps(response, separators=(',', ':')).encode('utf-8') + b'\n')
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service: GameService, host: str = '127.0.0.1', port: int = 8765, ready: threading.Event = None):
+    """Sert le service sur une socket TCP locale (JSON Lines), jusqu'à l'arrêt du processus"""
+    server = await asyncio.start_server(lambda reader, writer: handle_connection(service, reader, writer),
+                                        host, port, limit=1 << 20, backlog=4096)
+    if ready is not None:
+        ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+def run_server(host: str = '127.0.0.1', port: int = 8765, save_dir: str = None, rules: FarkleRules = None,
+               ready=None, allow_forced_dice: bool = False):
+    """Point d'entrée du serveur (utilisable comme cible d'un processus)"""
+    asyncio.run(serve(GameService(save_dir, rules, allow_forced_dice), host, port, ready))
@@ -0,0 +1,119 @@
+import threading
+from typing import Any, Callable, NamedTuple, Optional, Union
+from model.game import FarkleGame
+from state.persistent import GameSnapshot
+
+
+class TableView(NamedTuple):
+    """État publié d'une partie partagée : cohérent, immuable, lisible sans verrou"""
+    version: int
+    snapshot: GameSnapshot
+    status: dict  # get_game_status au moment de la publication (à ne pas modifier)
+    last_action: Optional[tuple]  # Dernière entrée de l'historique (None en début de partie)
+
+
+class SharedGame:
+    """
+    Partie partagée entre plusieurs threads (clients d'un serveur, bots d'assistance)
+
+    Une action modifie plusieurs champs liés de FarkleGame (dés partagés, dernier lancé, score
+    à transmettre, joueur actuel, dernier tour) : les actions passent toutes par act, qui les
+    applique une à la fois sous un verrou, après avoir vérifié que le joueur qui agit est bien
+    celui dont c'est le tour. La légalité de l'action elle-même (lancé, dés gardés, puis relance
+    ou stop) est vérifiée par FarkleGame, qui refuse une action hors de cet ordre (ValueError).
+    Une action qui échoue en cours de route est annulée (la partie revient à l'état publié avant
+    elle) ; une action refusée avant toute modification ne change pas la version.
+
+    Après chaque action, un état complet est publié (TableView : instantané immuable, état
+    de get_game_status, version) en remplaçant une seule référence : les lecteurs (view,
+    snapshot, status) ne prennent aucun verrou, ne bloquent jamais les actions et voient
+    toujours un état d'entre deux actions, jamais un état à moitié modifié.
+
+    La partie enveloppée ne doit plus être modifiée directement.
+    """
+
+    def __init__(self, game: FarkleGame):
+        self.game = game
+        self._lock = threading.Lock()
+        self._view: TableView = None
+        self._publish()
+
+    def _publish(self):
+        game = self.game
+        status = game.get_game_status()
+        self._view = TableView(game.state_version, game.snapshot(), status,
+                               game.action_log[-1] if game.action_log else None)
+
+    def view(self) -> TableView:
+        """Dernier état publié (sans verrou)"""
+        return self._view
+
+    def snapshot(self) -> GameSnapshot:
+        return self._view.snapshot
+
+    def status(self) -> dict:
+        return self._view.status
+
+    @property
+    def version(self) -> int:
+        return self._view.version
+
+    def _check_turn(self, player: Union[int, str]):
+        """Vérifie que c'est au joueur (numéro de siège ou nom) de jouer (verrou tenu)"""
+        game = self.game
+        if game.game_over:
+            raise ValueError("La partie est terminée")
+        current = game.current_player_index
+        if isinstance(player, str):
+            allowed = game.players[current].name == player
+        else:
+            allowed = player == current
+        if not allowed:
+            raise ValueError(f"Ce n'est pas le tour de {player} (tour de {game.players[current].name})")
+
+    def act(self, player: Union[int, str, None], action: Callable[[FarkleGame], Any],
+            expected_version: int = None) -> Any:
+        """
+        Applique une action sur la partie, seule et en entier
+
+        Args:
+            player: Siège (0-based) ou nom du joueur qui agit ; None pour ne pas vérifier le tour,
+                    réservé aux opérations internes (remise à zéro d'une partie terminée)
+            action: Fonction qui modifie la partie et retourne le résultat de l'action
+            expected_version: Version sur laquelle le joueur a décidé : l'action est refusée si
+                              la partie a changé depuis (un autre client du même siège a joué)
+
+        Returns:
+            Le résultat de action
+
+        Raises:
+            ValueError: Pas le tour de ce joueur, partie terminée, version dépassée ; ou toute
+                        exception de l'action, après annulation de ses effets
+        """
+        with self._lock:
+            before = self._view
+            if expected_version is not None and expected_version != before.version:
+                raise ValueError(f"La partie a changé depuis la version {expected_version} "
+                                 f"(version actuelle {before.version})")
+            if player is not None:
+                self._check_turn(player)
+            try:
+                result = action(self.game)
+            except BaseException:
+                # Une action refusée avant toute modification ne change pas la version : rien à annuler
+                if self.game.state_version != before.version:
+                    self.game.restore(before.snapshot)
+                    self._publish()
+                raise
+            self._publish()
+            return result
+
+    def locked(self, operation: Callable[[FarkleGame], Any]) -> Any:
+        """
+        Exécute une opération qui lit la partie sans la modifier, entre deux actions
+
+        Pour ce que l'état publié ne contient pas : sauvegarde, deltas de status_since
+        (qui tiennent leurs propres caches).
+        """
+        with self._lock:
+            return operation(self.game)
@@ -1,18 +1,355 @@
+import atexit
+import gzip
 import json
 import os
-from typing import Dict, List, Any
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from state.journal import Journal
+
+
+# Préfixe des sauvegardes nommées automatiquement (seules concernées par la politique de rétention)
+AUTO_PREFIX = 'farkle_save_'
+# Index des sauvegardes d'un dossier : journal d'ajouts/suppressions, une opération JSON par ligne
+# (pas d'extension .json : l'analyse des dossiers de sauvegardes ne doit pas le lire comme une partie)
+INDEX_FILE = '.saves_index'
+
+
+def _base_name(filename: str) -> str:
+    """Nom de sauvegarde sans extension (.json ou .json.gz)"""
+    for extension in ('.json.gz', '.json'):
+        if filename.endswith(extension):
+            return filename[:-len(extension)]
+    return filename
+
+
+def _read_save(filepath: str) -> Dict[str, Any]:
+    """Lit une sauvegarde, compressée (.json.gz) ou non"""
+    if filepath.endswith('.gz'):
+        with gzip.open(filepath, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _index_entry(data: Dict[str, Any], filename: str, size: int, mtime: float) -> Dict[str, Any]:
+    """Entrée d'index d'une sauvegarde : de quoi la lister et appliquer la rétention sans la relire"""
+    players = [p['name'] for p in data.get('players', [])]
+    replay = data.get('replay') or {}
+    # Une partie est identifiée par sa graine et ses joueurs de départ ; sans historique, chaque sauvegarde est isolée
+    if replay.get('seed') is not None:
+        game = f"{replay['seed']}:{','.join(replay.get('players', players))}"
+    else:
+        game = _base_name(filename)
+    saved_at = data.get('saved_at', 'Inconnu')
+    try:
+        saved_time = datetime.fromisoformat(saved_at).timestamp()
+    except (TypeError, ValueError):
+        saved_time = mtime
+    return {
+        'game': game,
+        'saved_at': saved_at,
+        'time': saved_time,
+        'bytes': size,
+        'auto': _base_name(filename).startswith(AUTO_PREFIX),
+        'current_player': data.get('current_player_index', 0),
+        'players': players,
+    }
+
+
+class RetentionPolicy:
+    """
+    Politique de rétention des sauvegardes automatiques (farkle_save_<date>)
+    
+    Les sauvegardes nommées par l'utilisateur ne sont jamais supprimées automatiquement
+    et ne comptent pas dans la limite de taille.
+    """
+    
+    def __init__(self, keep_last: int = None, max_bytes: int = None, max_age_days: float = None):
+        """
+        Args:
+            keep_last: Nombre de sauvegardes conservées par partie (les plus récentes)
+            max_bytes: Taille totale maximale des sauvegardes automatiques (les plus anciennes partent d'abord ;
+                       la plus récente est toujours conservée)
+            max_age_days: Âge maximal d'une sauvegarde, en jours
+        """
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last doit être au moins 1")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes doit être positif")
+        if max_age_days is not None and max_age_days <= 0:
+            raise ValueError("max_age_days doit être strictement positif")
+        self.keep_last = keep_last
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+    
+    def is_active(self) -> bool:
+        return self.keep_last is not None or self.max_bytes is not None or self.max_age_days is not None
+    
+    def select_expired(self, entries: Dict[str, Dict[str, Any]], now: float = None) -> List[str]:
+        """
+        Sauvegardes à supprimer d'après leurs entrées d'index
+        
+        Args:
+            entries: Entrées d'index par nom de fichier
+            now: Instant de référence pour l'âge (maintenant par défaut)
+        
+        Returns:
+            Noms des fichiers à supprimer
+        """
+        now = time.time() if now is None else now
+        # Sauvegardes automatiques, de la plus récente à la plus ancienne
+        auto = sorted(((name, entry) for name, entry in entries.items() if entry['auto']),
+                      key=lambda item: item[1]['time'], reverse=True)
+        expired = set()
+        
+        if self.max_age_days is not None:
+            limit = now - self.max_age_days * 86400
+            expired.update(name for name, entry in auto if entry['time'] < limit)
+        
+        if self.keep_last is not None:
+            kept: Dict[str, int] = {}
+            for name, entry in auto:
+                kept[entry['game']] = kept.get(entry['game'], 0) + 1
+                if kept[entry['game']] > self.keep_last:
+                    expired.add(name)
+        
+        if self.max_bytes is not None and auto:
+            total = sum(entry['bytes'] for name, entry in auto if name not in expired)
+            for name, entry in reversed(auto[1:]):
+                if total <= self.max_bytes:
+                    break
+                if name not in expired:
+                    expired.add(name)
+                    total -= entry['bytes']
+        
+        return sorted(expired)
+
+
+class SaveIndex(Journal):
+    """
+    Index des sauvegardes d'un dossier, partagé par toutes les instances de GameState de ce dossier
+    
+    L'index est un journal (INDEX_FILE, voir state.journal) : chaque sauvegarde écrite ou supprimée
+    y ajoute une ligne. Lister les sauvegardes ou choisir celles à supprimer ne demande donc ni
+    parcours du dossier ni lecture des parties. S'il n'existe pas, l'index est reconstruit une fois
+    en lisant le dossier (sauvegardes existantes).
+    
+    Le dossier n'est comparé à l'index qu'à la demande (synchronize, `saves --sync-index`) :
+    les sauvegardes copiées à la main ou écrites avant l'index sont lues et ajoutées, les fichiers
+    disparus retirés. Seuls les fichiers inconnus de l'index sont lus ; ceux qui ne sont pas des
+    sauvegardes lisibles sont notés (taille et date) et ne sont relus que s'ils changent.
+    """
+    
+    _instances: Dict[str, 'SaveIndex'] = {}
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def for_directory(cls, save_dir: str) -> 'SaveIndex':
+        """Index (unique dans le processus) du dossier de sauvegardes"""
+        key = os.path.abspath(save_dir)
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls._instances[key] = cls(key)
+            return index
+    
+    def __init__(self, save_dir: str):
+        super().__init__(os.path.join(save_dir, INDEX_FILE))
+        self.save_dir = save_dir
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.unreadable: Dict[str, List[float]] = {}  # Fichiers illisibles : [taille, date] lors de la lecture
+        # Suppression en arrière-plan : un fil par dossier, réveillé après les sauvegardes
+        self._policy: Optional[RetentionPolicy] = None
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._worker = None
+    
+    def _reset(self):
+        self.entries = {}
+        self.unreadable = {}
+    
+    def _apply(self, operation: Dict[str, Any]):
+        if 'set' in operation:
+            self.entries[operation['set']] = operation['entry']
+            self.unreadable.pop(operation['set'], None)
+        elif 'bad' in operation:
+            self.unreadable[operation['bad']] = operation['stat']
+        else:
+            self.entries.pop(operation['del'], None)
+            self.unreadable.pop(operation['del'], None)
+    
+    def _compacted(self) -> List[Dict[str, Any]]:
+        return ([{'set': name, 'entry': entry} for name, entry in self.entries.items()]
+                + [{'bad': name, 'stat': stat} for name, stat in self.unreadable.items()])
+    
+    def _live_count(self) -> int:
+        return len(self.entries) + len(self.unreadable)
+    
+    def _missing(self):
+        self._rebuild()
+    
+    def _read_entries(self, known: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], set]:
+        """
+        Lit les sauvegardes du dossier absentes de known (verrou tenu)
+        
+        Returns:
+            Opérations d'index (sauvegardes lues, fichiers illisibles) et noms des fichiers présents
+        """
+        present = set()
+        operations = []
+        with os.scandir(self.save_dir) as scan:
+            for item in scan:
+                if not (item.name.endswith('.json') or item.name.endswith('.json.gz')) or not item.is_file():
+                    continue
+                present.add(item.name)
+                if item.name in known:
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                if self.unreadable.get(item.name) == [stat.st_size, stat.st_mtime]:
+                    continue  # Déjà lu et illisible, inchangé depuis
+                try:
+                    entry = _index_entry(_read_save(item.path), item.name, stat.st_size, stat.st_mtime)
+                except (OSError, EOFError, ValueError, KeyError, TypeError):
+                    operations.append({'bad': item.name, 'stat': [stat.st_size, stat.st_mtime]})
+                    continue
+                operations.append({'set': item.name, 'entry': entry})
+        return operations, present
+    
+    def _rebuild(self):
+        """Reconstruit l'index en lisant toutes les sauvegardes du dossier (verrou tenu)"""
+        if not os.path.isdir(self.save_dir):
+            super()._missing()
+            return
+        self.unreadable = {}
+        operations, _ = self._read_entries({})
+        self._rewrite(operations)
+    
+    def rebuild(self):
+        """Reconstruit l'index depuis le contenu du dossier"""
+        with self._lock:
+            self._rebuild()
+    
+    def synchronize(self) -> Tuple[int, int]:
+        """
+        Compare l'index au dossier : ajoute les sauvegardes absentes de l'index (seules celles-ci
+        sont lues) et retire celles dont le fichier n'existe plus
+        
+        Returns:
+            (sauvegardes ajoutées, sauvegardes retirées)
+        """
+        with self._lock:
+            self._refresh()
+            if not os.path.isdir(self.save_dir):
+                return 0, 0
+            operations, present = self._read_entries(self.entries)
+            added = sum(1 for operation in operations if 'set' in operation)
+            removed = [name for name in self.entries if name not in present]
+            operations.extend({'del': name} for name in removed)
+            operations.extend({'del': name} for name in self.unreadable if name not in present)
+            if operations:
+                self._append(operations)
+            return added, len(removed)
+    
+    def current_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Entrées à jour, par nom de fichier (d'après l'index seul, sans parcourir le dossier)"""
+        with self._lock:
+            self._refresh()
+            return dict(self.entries)
+    
+    def record(self, filename: str, entry: Dict[str, Any], replaced: List[str] = ()):
+        """Enregistre une sauvegarde écrite (et les fichiers qu'elle remplace)"""
+        with self._lock:
+            self._append([{'del': name} for name in replaced] + [{'set': filename, 'entry': entry}])
+    
+    def forget(self, filenames: List[str]):
+        """Retire des sauvegardes supprimées"""
+        if filenames:
+            with self._lock:
+                self._append([{'del': name} for name in filenames])
+    
+    def prune(self, policy: RetentionPolicy) -> List[str]:
+        """Supprime les sauvegardes expirées selon la politique, d'après l'index seulement"""
+        with self._lock:
+            self._refresh()
+            expired = policy.select_expired(self.entries)
+        removed = []
+        for name in expired:
+            try:
+                os.remove(os.path.join(self.save_dir, name))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            removed.append(name)
+        self.forget(removed)
+        return removed
+    
+    def schedule_prune(self, policy: RetentionPolicy):
+        """Demande une passe de rétention au fil d'arrière-plan (les demandes rapprochées sont regroupées)"""
+        with self._lock:
+            self._policy = policy
+            self._idle.clear()
+            self._wakeup.set()
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._prune_loop, name='farkle-save-pruner', daemon=True)
+                self._worker.start()
+                # Terminer la passe en cours avant la sortie du programme
+                atexit.register(self.wait_idle, 5.0)
+    
+    def _prune_loop(self):
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                self._wakeup.clear()
+                policy = self._policy
+            try:
+                self.prune(policy)
+            except OSError:
+                pass
+            with self._lock:
+                if not self._wakeup.is_set():
+                    self._idle.set()
+    
+    def wait_idle(self, timeout: float = None) -> bool:
+        """Attend la fin des suppressions en arrière-plan ; False si le délai est écoulé"""
+        return self._idle.wait(timeout)
 
 
 class GameState:
     """Classe pour gérer la sauvegarde et le chargement de l'état du jeu"""
     
     SAVE_DIR = "saves"
+    # Réglages par défaut de toutes les instances (voir les options globales de main.py)
+    COMPRESS = False
+    RETENTION: Optional[RetentionPolicy] = None
     
-    def __init__(self):
+    def __init__(self, save_dir: str = None, compress: bool = None, retention: RetentionPolicy = None):
+        """
+        Args:
+            save_dir: Dossier des sauvegardes (SAVE_DIR par défaut)
+            compress: Écrit les sauvegardes compressées en gzip (.json.gz) ; la lecture détecte le format
+            retention: Politique de rétention appliquée en arrière-plan après chaque sauvegarde
+        """
+        if save_dir is not None:
+            self.SAVE_DIR = save_dir  # Dossier propre à cette instance (service, tests de charge)
+        if compress is not None:
+            self.COMPRESS = compress
+        if retention is not None:
+            self.RETENTION = retention
         if not os.path.exists(self.SAVE_DIR):
             os.makedirs(self.SAVE_DIR)
     
+    @property
+    def index(self) -> SaveIndex:
+        """Index du dossier (unique dans le processus, non gardé sur l'instance : elle reste copiable)"""
+        return SaveIndex.for_directory(self.SAVE_DIR)
+    
     def save_game(self, game_data: Dict[str, Any], filename: str = None) -> str:
         """
         Sauvegarde l'état du jeu dans un fichier JSON
@@ -26,45 +363,72 @@ class GameState:
         """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"farkle_save_{timestamp}.json"
+            filename = f"{AUTO_PREFIX}{timestamp}.json"
         
-        if not filename.endswith('.json'):
-            filename += '.json'
+        base = _base_name(filename)
+        filename = base + ('.json.gz' if self.COMPRESS else '.json')
+        other = base + ('.json' if self.COMPRESS else '.json.gz')
         
         filepath = os.path.join(self.SAVE_DIR, filename)
         
         # Ajouter timestamp à la sauvegarde
         game_data['saved_at'] = datetime.now().isoformat()
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(game_data, f, indent=2, ensure_ascii=False)
+        if self.COMPRESS:
+            # Indentation inutile une fois compressé : JSON compact, compression rapide
+            payload = json.dumps(game_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            with open(filepath, 'wb') as f:
+                f.write(gzip.compress(payload, compresslevel=6, mtime=0))
+        else:
+            # Sérialisé d'un bloc : json.dump écrirait le fichier morceau par morceau
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(game_data, indent=2, ensure_ascii=False))
+        
+        # Une seule version d'une sauvegarde : l'autre format est remplacé
+        replaced = []
+        other_path = os.path.join(self.SAVE_DIR, other)
+        if os.path.exists(other_path):
+            os.remove(other_path)
+            replaced.append(other)
+        
+        stat = os.stat(filepath)
+        self.index.record(filename, _index_entry(game_data, filename, stat.st_size, stat.st_mtime), replaced)
+        if self.RETENTION is not None and self.RETENTION.is_active():
+            self.index.schedule_prune(self.RETENTION)
         
         return filepath
     
+    def _find(self, filename: str) -> Optional[str]:
+        """Chemin d'une sauvegarde existante, quel que soit son format (None si absente)"""
+        base = _base_name(filename)
+        candidates = [filename] if filename.endswith('.json') or filename.endswith('.json.gz') else []
+        for candidate in candidates + [base + '.json', base + '.json.gz']:
+            filepath = os.path.join(self.SAVE_DIR, candidate)
+            if os.path.exists(filepath):
+                return filepath
+        return None
+    
     def load_game(self, filename: str) -> Dict[str, Any]:
         """
-        Charge l'état du jeu depuis un fichier JSON
+        Charge l'état du jeu depuis un fichier JSON (compressé ou non)
         
         Args:
-            filename: Nom du fichier à charger
+            filename: Nom du fichier à charger (l'extension est facultative)
         
         Returns:
             Données du jeu
         """
-        if not filename.endswith('.json'):
-            filename += '.json'
-        
-        filepath = os.path.join(self.SAVE_DIR, filename)
+        filepath = self._find(filename)
         
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Fichier de sauvegarde non trouvé: {filepath}")
+        if filepath is None:
+            expected = filename if filename.endswith('.json') or filename.endswith('.json.gz') else filename + '.json'
+            raise FileNotFoundError(f"Fichier de sauvegarde non trouvé: {os.path.join(self.SAVE_DIR, expected)}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_save(filepath)
     
     def list_saves(self) -> List[Dict[str, str]]:
         """
-        Liste toutes les sauvegardes disponibles
+        Liste toutes les sauvegardes disponibles, d'après l'index seul (voir SaveIndex.synchronize)
         
         Returns:
             Liste des informations sur les sauvegardes
@@ -74,28 +438,37 @@ class GameState:
         if not os.path.exists(self.SAVE_DIR):
             return saves
         
-        for filename in os.listdir(self.SAVE_DIR):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.SAVE_DIR, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    save_info = {
-                        'filename': filename,
-                        'filepath': filepath,
-                        'saved_at': data.get('saved_at', 'Inconnu'),
-                        'current_player': data.get('current_player_index', 0),
-                        'players': [p['name'] for p in data.get('players', [])]
-                    }
-                    saves.append(save_info)
-                except (json.JSONDecodeError, IOError):
-                    continue
+        for filename, entry in self.index.current_entries().items():
+            save_info = {
+                'filename': filename,
+                'filepath': os.path.join(self.SAVE_DIR, filename),
+                'saved_at': entry['saved_at'],
+                'current_player': entry['current_player'],
+                'players': entry['players'],
+                'bytes': entry['bytes'],
+            }
+            saves.append(save_info)
         
         # Trier par date de sauvegarde (plus récent en premier)
         saves.sort(key=lambda x: x['saved_at'], reverse=True)
         return saves
     
+    def disk_usage(self) -> int:
+        """Taille totale des sauvegardes du dossier (octets), d'après l'index"""
+        return sum(entry['bytes'] for entry in self.index.current_entries().values())
+    
+    def prune(self, retention: RetentionPolicy = None) -> List[str]:
+        """
+        Applique immédiatement une politique de rétention (celle de l'instance par défaut)
+        
+        Returns:
+            Noms des sauvegardes supprimées
+        """
+        retention = retention or self.RETENTION
+        if retention is None or not retention.is_active():
+            return []
+        return self.index.prune(retention)
+    
     def delete_save(self, filename: str) -> bool:
         """
         Supprime une sauvegarde
@@ -106,31 +479,33 @@ class GameState:
         Returns:
             True si suppression réussie, False sinon
         """
-        if not filename.endswith('.json'):
-            filename += '.json'
+        removed = []
+        base = _base_name(filename)
         
-        filepath = os.path.join(self.SAVE_DIR, filename)
+        for candidate in (base + '.json', base + '.json.gz'):
+            filepath = os.path.join(self.SAVE_DIR, candidate)
+            try:
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                    removed.append(candidate)
+            except IOError:
+                pass
         
-        try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-                return True
-        except IOError:
-            pass
-        
-        return False
+        self.index.forget(removed)
+        return bool(removed)
     
-    def export_game_data(self, game) -> Dict[str, Any]:
+    def export_game_data(self, game, include_replay: bool = True) -> Dict[str, Any]:
         """
         Exporte les données du jeu vers un dictionnaire
         
         Args:
             game: Instance du jeu à exporter
+            include_replay: Inclut la graine et l'historique des décisions (pour rejouer la partie)
         
         Returns:
             Dictionnaire contenant toutes les données du jeu
         """
-        return {
+        data = {
             'players': [
                 {
                     'name': player.name,
@@ -148,12 +523,19 @@ class GameState:
             'last_dice_roll': game.last_dice_roll,
             'shared_banked_dice': game.shared_banked_dice,
             'last_player_banked': game.last_player_banked,
+            'roll_pending': game.roll_pending,
             'turn_score_to_transfer': game.turn_score_to_transfer,
             'final_round_started': game.final_round_started,
             'final_round_triggerer': game.final_round_triggerer.name if game.final_round_triggerer else None,
             'final_round_players_remaining': game.final_round_players_remaining,
-            'version': '1.5'
+            'rules': game.rules.to_dict(),
+            'rng': {'seed': game.dice.seed_value, 'draws': game.dice.draws},
+            'version': '1.7'
         }
+        # Une partie reprise d'une sauvegarde sans historique n'a pas de graine : rien à rejouer
+        if include_replay and game.seed is not None:
+            data['replay'] = game.get_replay_data()
+        return data
     
     def import_game_data(self, data: Dict[str, Any]):
         """
@@ -163,9 +545,10 @@ class GameState:
             data: Dictionnaire contenant les données du jeu
         
         Returns:
-            Tuple (players, current_player_index, game_over, winner, turn_count, last_dice_roll, shared_banked_dice, last_player_banked, turn_score_to_transfer, final_round_started, final_round_triggerer, final_round_players_remaining)
+            Tuple (players, current_player_index, game_over, winner, turn_count, last_dice_roll, shared_banked_dice, last_player_banked, turn_score_to_transfer, final_round_started, final_round_triggerer, final_round_players_remaining, rules, replay_data, roll_pending)
         """
         from model.player import Player
+        from model.rules import FarkleRules
         
         players = []
         for player_data in data['players']:
@@ -195,4 +578,24 @@ class GameState:
         
         final_round_players_remaining = data.get('final_round_players_remaining', 0)
         
-        return players, current_player_index, game_over, winner, turn_count, last_dice_roll, shared_banked_dice, last_player_banked, turn_score_to_transfer, final_round_started, final_round_triggerer, final_round_players_remaining 
\ No newline at end of file
+        # Les sauvegardes antérieures à la version 1.6 utilisent les règles par défaut
+        rules = FarkleRules.from_dict(data.get('rules'))
+        
+        # Les sauvegardes antérieures à la version 1.7 n'ont ni graine ni historique
+        replay = data.get('replay', {})
+        rng = data.get('rng', {})
+        replay_data = {
+            'seed': replay.get('seed'),
+            'players': replay.get('players', [p['name'] for p in data['players']]),
+            'actions': [tuple(action) for action in replay.get('actions', [])],
+            'rng_seed': rng.get('seed'),
+            'rng_draws': rng.get('draws', 0),
+        }
+        
+        # Sauvegardes sans roll_pending : un lancé attend des dés gardés si c'est la dernière décision
+        roll_pending = data.get('roll_pending')
+        if roll_pending is None:
+            decisions = [action for action in replay_data['actions'] if action[0] != 'D']
+            roll_pending = not game_over and bool(decisions) and decisions[-1][0] == 'R'
+        
+        return players, current_player_index, game_over, winner, turn_count, last_dice_roll, shared_banked_dice, last_player_banked, turn_score_to_transfer, final_round_started, final_round_triggerer, final_round_players_remaining, rules, replay_data, roll_pending 
\ No newline at end of file
@@ -0,0 +1,115 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List
+
+
+# Le journal est réécrit quand il contient plus de lignes que COMPACT_FACTOR fois les enregistrements vivants
+COMPACT_FACTOR = 2
+COMPACT_MIN_LINES = 64
+
+
+class Journal:
+    """
+    Journal d'opérations JSON (une par ligne) et état en mémoire qui en découle
+
+    Chaque modification ajoute des lignes au fichier ; le journal est relu de façon incrémentale
+    (seule la fin ajoutée depuis la dernière lecture, y compris par un autre processus) et réécrit
+    sous forme compacte quand il devient trop long. Un journal remplacé par un autre processus
+    (compaction) est relu entièrement.
+
+    Les sous-classes définissent l'état : _reset (état vide), _apply (une opération),
+    _compacted (opérations qui recréent l'état actuel) et _live_count (taille de l'état).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._offset = 0  # Octets du journal déjà appliqués
+        self._inode = None
+        self._lines = 0
+        self._loaded = False
+
+    def _reset(self):
+        raise NotImplementedError
+
+    def _apply(self, operation: Dict[str, Any]):
+        raise NotImplementedError
+
+    def _compacted(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _live_count(self) -> int:
+        raise NotImplementedError
+
+    def _missing(self):
+        """Journal absent : état vide (les sous-classes peuvent le reconstruire)"""
+        self._reset()
+        self._offset, self._inode, self._lines, self._loaded = 0, None, 0, True
+
+    def _refresh(self):
+        """Applique les lignes ajoutées depuis la dernière lecture (verrou tenu)"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._missing()
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset()
+            self._offset, self._lines, self._inode = 0, 0, stat.st_ino
+        if stat.st_size == self._offset:
+            self._loaded = True
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            chunk = f.read()
+        # Une ligne en cours d'écriture par un autre processus sera lue la prochaine fois
+        end = chunk.rfind(b'\n') + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                operation = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self._apply(operation)
+            self._lines += 1
+        self._offset += end
+        self._loaded = True
+
+    def _append(self, operations: List[Dict[str, Any]]):
+        """Ajoute des opérations au journal et à l'état (verrou tenu)"""
+        if not self._loaded:
+            self._refresh()
+        payload = ''.join(json.dumps(operation, ensure_ascii=False) + '\n' for operation in operations).encode('utf-8')
+        with open(self.path, 'ab') as f:
+            f.write(payload)
+            size = f.tell()
+        if size == self._offset + len(payload):
+            # Personne d'autre n'a écrit entre-temps : inutile de relire ce qu'on vient d'ajouter
+            for operation in operations:
+                self._apply(operation)
+            self._offset = size
+            self._lines += len(operations)
+        else:
+            self._refresh()
+        if self._lines > COMPACT_MIN_LINES and self._lines > COMPACT_FACTOR * self._live_count():
+            self._rewrite(self._compacted())
+
+    def _rewrite(self, operations: List[Dict[str, Any]]):
+        """Remplace le journal (et l'état) par ces seules opérations (verrou tenu)"""
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            for operation in operations:
+                f.write(json.dumps(operation, ensure_ascii=False) + '\n')
+        os.replace(temporary, self.path)
+        self._reset()
+        for operation in operations:
+            self._apply(operation)
+        stat = os.stat(self.path)
+        self._offset, self._inode, self._lines, self._loaded = stat.st_size, stat.st_ino, len(operations), True
+
+    def refresh(self):
+        """Relit les opérations ajoutées depuis la dernière lecture"""
+        with self._lock:
+            self._refresh()
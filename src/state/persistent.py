@@ -0,0 +1,313 @@
+import random
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+
+class PlayerRecord(NamedTuple):
+    """État immuable d'un joueur dans un instantané"""
+    name: str
+    total_score: int
+    turn_score: int
+    banked_dice: Tuple[int, ...]
+    is_on_board: bool
+
+
+class ActionLog:
+    """
+    Historique des décisions partagé entre instantanés
+
+    La base est la liste action_log d'une partie, dont seuls les length premiers éléments
+    appartiennent à l'instantané (la partie ne fait qu'y ajouter des actions ou la remplacer,
+    jamais la tronquer sur place). Les actions appliquées ensuite forment une liste chaînée
+    immuable : ajouter une action est en O(1) et les branches partagent leur préfixe.
+    """
+
+    __slots__ = ('base', 'length', 'tail', 'size')
+
+    def __init__(self, base: Sequence[tuple] = (), length: int = None, tail: tuple = None, size: int = None):
+        self.base = base
+        self.length = len(base) if length is None else length
+        self.tail = tail  # (action, maillon précédent) ou None
+        self.size = self.length if size is None else size
+
+    def append(self, action: tuple) -> 'ActionLog':
+        return ActionLog(self.base, self.length, (action, self.tail), self.size + 1)
+
+    def to_list(self) -> List[tuple]:
+        added = []
+        link = self.tail
+        while link is not None:
+            added.append(link[0])
+            link = link[1]
+        added.reverse()
+        return list(self.base[:self.length]) + added
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class GameSnapshot:
+    """
+    État de partie immuable, à structure partagée
+
+    Prendre un instantané ne copie que les quelques champs scalaires et un enregistrement
+    par joueur ; apply retourne un nouvel état qui partage avec l'ancien les joueurs non
+    modifiés, les règles et l'historique. Les instantanés ne doivent pas être modifiés :
+    ils peuvent être gardés sans copie (annuler/rétablir, points de reprise du rejeu)
+    et servir de base à autant de branches que voulu (recherche, analyse « et si »).
+
+    Actions (même format que FarkleGame.action_log) :
+    - ('R', dés)  lancé de dés imposé (('R',) tire les dés avec le générateur passé à apply)
+    - ('K', dés)  dés conservés
+    - ('S',)      stop
+    - ('F',)      Farkle
+    - ('D', graine) nouvelle graine des dés
+    """
+
+    __slots__ = ('rules', 'players', 'current_player_index', 'turn_count', 'game_over', 'winner_index',
+                 'last_dice_roll', 'shared_banked_dice', 'last_player_banked', 'roll_pending',
+                 'turn_score_to_transfer', 'final_round_started', 'final_round_triggerer_index',
+                 'final_round_players_remaining',
+                 'seed', 'initial_player_names', 'log', 'dice_seed', 'dice_draws', 'rng_state')
+
+    @classmethod
+    def from_game(cls, game, rng_state: bool = False) -> 'GameSnapshot':
+        """
+        Instantané d'une partie en cours
+
+        Args:
+            game: Partie (FarkleGame)
+            rng_state: Garde aussi l'état complet du générateur des dés (restauration sans rejouer
+                       les tirages depuis la graine, mais environ 10 µs de plus)
+        """
+        snapshot = cls.__new__(cls)
+        players = game.players
+        snapshot.rules = game.rules
+        snapshot.players = tuple([PlayerRecord(player.name, player.total_score, player.turn_score,
+                                               tuple(player.banked_dice), player.is_on_board)
+                                  for player in players])
+        snapshot.current_player_index = game.current_player_index
+        snapshot.turn_count = game.turn_count
+        snapshot.game_over = game.game_over
+        snapshot.winner_index = _index_of(players, game.winner)
+        snapshot.last_dice_roll = tuple(game.last_dice_roll)
+        snapshot.shared_banked_dice = tuple(game.shared_banked_dice)
+        snapshot.last_player_banked = game.last_player_banked
+        snapshot.roll_pending = game.roll_pending
+        snapshot.turn_score_to_transfer = game.turn_score_to_transfer
+        snapshot.final_round_started = game.final_round_started
+        snapshot.final_round_triggerer_index = _index_of(players, game.final_round_triggerer)
+        snapshot.final_round_players_remaining = game.final_round_players_remaining
+        snapshot.seed = game.seed
+        snapshot.initial_player_names = tuple(game.initial_player_names)
+        snapshot.log = ActionLog(game.action_log)
+        snapshot.dice_seed = game.dice.seed_value
+        snapshot.dice_draws = game.dice.draws
+        snapshot.rng_state = game.dice.rng.getstate() if rng_state else None
+        return snapshot
+
+    def _evolve(self) -> 'GameSnapshot':
+        """Copie superficielle, à compléter par apply avant d'être publiée"""
+        snapshot = GameSnapshot.__new__(GameSnapshot)
+        for name in GameSnapshot.__slots__:
+            setattr(snapshot, name, getattr(self, name))
+        return snapshot
+
+    @property
+    def action_log(self) -> List[tuple]:
+        return self.log.to_list()
+
+    @property
+    def current_player(self) -> PlayerRecord:
+        return self.players[self.current_player_index]
+
+    @property
+    def winner(self) -> Optional[PlayerRecord]:
+        return None if self.winner_index is None else self.players[self.winner_index]
+
+    def get_remaining_dice_count(self) -> int:
+        return 6 - len(self.shared_banked_dice)
+
+    def get_possible_actions(self) -> List[Tuple[int, List[int]]]:
+        return self.rules.get_possible_combinations(list(self.last_dice_roll))
+
+    def is_farkle(self) -> bool:
+        return self.rules.is_farkle(list(self.last_dice_roll))
+
+    def can_stop_turn(self) -> bool:
+        """Mêmes conditions que FarkleGame.can_stop_turn"""
+        if self.roll_pending:
+            return False
+        player = self.players[self.current_player_index]
+        if player.turn_score == 0:
+            return False
+        if not player.is_on_board and player.turn_score < self.rules.entry_threshold:
+            return False
+        return not self.last_player_banked
+
+    def apply(self, action: Sequence, rng: random.Random = None) -> 'GameSnapshot':
+        """
+        Applique une action et retourne le nouvel état (self n'est pas modifié)
+
+        Args:
+            action: Action au format de l'historique, ('R', dés), ('K', dés), ('S',), ('F',) ou ('D', graine)
+            rng: Générateur utilisé pour un lancé sans dés imposés ; le lancé est alors enregistré
+                 avec ses dés, comme un lancé imposé
+
+        Returns:
+            Nouvel instantané
+
+        Raises:
+            ValueError: Action invalide dans cet état (les mêmes que refuse FarkleGame)
+        """
+        if self.game_over:
+            raise ValueError("La partie est terminée")
+        kind = action[0]
+        if kind == 'R':
+            return self._roll(action[1] if len(action) > 1 and action[1] is not None else None, rng)
+        if kind == 'K':
+            return self._keep(action[1])
+        if kind == 'S':
+            return self._stop()
+        if kind == 'F':
+            return self._farkle()
+        if kind == 'D':
+            state = self._evolve()
+            state.dice_seed, state.dice_draws, state.rng_state = action[1], 0, None
+            state.log = self.log.append(('D', action[1]))
+            return state
+        raise ValueError(f"Action inconnue: {action}")
+
+    def apply_all(self, actions: Sequence[Sequence], rng: random.Random = None) -> 'GameSnapshot':
+        """Applique une suite d'actions et retourne l'état final"""
+        state = self
+        for action in actions:
+            state = state.apply(action, rng)
+        return state
+
+    def _roll(self, dice: Optional[Sequence[int]], rng: Optional[random.Random]) -> 'GameSnapshot':
+        if self.roll_pending:
+            raise ValueError("Il faut garder des dés du lancé actuel avant de relancer")
+        remaining_dice = 6 - len(self.shared_banked_dice)
+        hot_dice = remaining_dice == 0
+        if hot_dice:
+            remaining_dice = 6  # Hot dice - relancer tous les dés
+        if dice is None:
+            if rng is None:
+                raise ValueError("Un lancé sans dés imposés demande un générateur")
+            randint = rng.randint
+            dice = [randint(1, 6) for _ in range(remaining_dice)]
+        elif len(dice) != remaining_dice:
+            raise ValueError(f"Le lancé imposé doit contenir {remaining_dice} dés, reçu {len(dice)}")
+        elif any(value not in (1, 2, 3, 4, 5, 6) for value in dice):
+            raise ValueError(f"Valeurs de dés invalides: {list(dice)}")
+
+        state = self._evolve()
+        if hot_dice:
+            state.shared_banked_dice = ()
+        state.last_player_banked = False
+        # Piggy-back : seul un joueur sur le plateau récupère le score hérité
+        if self.turn_score_to_transfer > 0:
+            player = self.players[self.current_player_index]
+            if player.is_on_board:
+                state.players = _replace_player(self.players, self.current_player_index,
+                                                player._replace(turn_score=player.turn_score
+                                                                + self.turn_score_to_transfer))
+            state.turn_score_to_transfer = 0
+        state.last_dice_roll = tuple(dice)
+        state.roll_pending = True
+        state.log = self.log.append(('R', list(dice)))
+        return state
+
+    def _keep(self, dice_to_bank: Sequence[int]) -> 'GameSnapshot':
+        if not self.roll_pending:
+            raise ValueError("Aucune combinaison à conserver : il faut d'abord lancer les dés")
+        dice_to_bank = list(dice_to_bank)
+        score, used_dice = self.rules.calculate_score(dice_to_bank)
+        if score == 0 or sorted(dice_to_bank) != sorted(used_dice):
+            raise ValueError(f"Impossible de conserver les dés {dice_to_bank}")
+        available_dice = list(self.last_dice_roll)
+        for die in dice_to_bank:
+            if die not in available_dice:
+                raise ValueError(f"Impossible de conserver les dés {dice_to_bank}")
+            available_dice.remove(die)
+
+        player = self.players[self.current_player_index]
+        state = self._evolve()
+        state.players = _replace_player(self.players, self.current_player_index,
+                                        player._replace(turn_score=player.turn_score + score,
+                                                        banked_dice=player.banked_dice + tuple(dice_to_bank)))
+        state.shared_banked_dice = self.shared_banked_dice + tuple(dice_to_bank)
+        state.last_dice_roll = tuple(available_dice)
+        state.roll_pending = False
+        state.log = self.log.append(('K', dice_to_bank))
+        return state
+
+    def _stop(self) -> 'GameSnapshot':
+        if not self.can_stop_turn():
+            raise ValueError("Impossible de stopper le tour")
+        index = self.current_player_index
+        player = self.players[index]
+        total_score = player.total_score + player.turn_score
+        is_on_board = player.is_on_board or player.turn_score >= self.rules.entry_threshold
+
+        state = self._evolve()
+        state.players = _replace_player(self.players, index, PlayerRecord(player.name, total_score, 0, (),
+                                                                          is_on_board))
+        if not self.final_round_started and total_score >= self.rules.target_score:
+            state.final_round_started = True
+            state.final_round_triggerer_index = index
+            state.final_round_players_remaining = len(self.players) - 1
+        state.turn_score_to_transfer = player.turn_score if self.rules.piggy_back_enabled else 0
+        state.last_player_banked = True
+        state.log = self.log.append(('S',))
+        state._end_turn()
+        return state
+
+    def _farkle(self) -> 'GameSnapshot':
+        index = self.current_player_index
+        player = self.players[index]
+        state = self._evolve()
+        if player.turn_score or player.banked_dice:
+            state.players = _replace_player(self.players, index, player._replace(turn_score=0, banked_dice=()))
+        state.shared_banked_dice = ()
+        state.last_player_banked = False
+        state.roll_pending = False
+        state.turn_score_to_transfer = 0
+        state.log = self.log.append(('F',))
+        state._end_turn()
+        return state
+
+    def _end_turn(self):
+        """Fin de partie à l'issue du dernier tour, sinon joueur suivant (sur un état en construction)"""
+        if self.final_round_started and self.final_round_players_remaining <= 0:
+            self.game_over = True
+            # Premier joueur au score le plus élevé, comme max() dans FarkleGame.end_game
+            self.winner_index = max(range(len(self.players)), key=lambda i: self.players[i].total_score)
+            return
+        if self.final_round_started and self.final_round_players_remaining > 0:
+            self.final_round_players_remaining -= 1
+        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        if self.current_player_index == 0:
+            self.turn_count += 1
+
+    def to_game(self, game_state=None):
+        """Recrée une partie (FarkleGame) indépendante à partir de l'instantané"""
+        from model.game import FarkleGame
+        game = FarkleGame(seed=self.dice_seed, rules=self.rules)
+        if game_state is not None:
+            game.game_state = game_state
+        game.restore(self)
+        return game
+
+
+def _index_of(players: list, player) -> Optional[int]:
+    if player is None:
+        return None
+    for index, candidate in enumerate(players):
+        if candidate is player:
+            return index
+    return None
+
+
+def _replace_player(players: Tuple[PlayerRecord, ...], index: int, player: PlayerRecord) -> Tuple[PlayerRecord, ...]:
+    return players[:index] + (player,) + players[index + 1:]
@@ -0,0 +1,305 @@
+import hashlib
+import json
+import os
+import random
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from model.rules import FarkleRules
+from state.journal import Journal
+
+
+# Journal des profils, dans le dossier des sauvegardes (sans extension .json, comme l'index)
+PROFILES_FILE = '.player_profiles'
+
+# Compteurs cumulés d'un profil (best_turn est un maximum, les autres des sommes)
+COUNTERS = ('games', 'wins', 'score_total', 'turns', 'farkles')
+
+# Classements tenus à jour : statistique -> True si plus grand est meilleur
+LEADERBOARDS = {
+    'wins': True,
+    'games': True,
+    'win_rate': True,
+    'average_score': True,
+    'best_turn': True,
+    'farkle_rate': False,
+}
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {'games': 0, 'wins': 0, 'score_total': 0, 'turns': 0, 'farkles': 0, 'best_turn': 0, 'last_played': None}
+
+
+def derived_statistics(stats: Dict[str, Any]) -> Dict[str, float]:
+    """Statistiques calculées d'un profil : taux de victoire, score final moyen, taux de Farkle"""
+    games = stats['games']
+    return {
+        'win_rate': stats['wins'] / games if games else 0.0,
+        'average_score': stats['score_total'] / games if games else 0.0,
+        'farkle_rate': stats['farkles'] / stats['turns'] if stats['turns'] else 0.0,
+        'best_turn': stats['best_turn'],
+        'wins': stats['wins'],
+        'games': games,
+    }
+
+
+def game_statistics(seed: int, player_names: Sequence[str], actions: Sequence[Sequence],
+                    rules: FarkleRules = None) -> Optional[Dict[str, Dict[str, int]]]:
+    """
+    Statistiques de chaque joueur sur une partie, en rejouant ses décisions sur des instantanés
+
+    Un tour compte à chaque stop ou Farkle ; le meilleur tour est le plus gros score banké
+    (score hérité compris).
+
+    Args:
+        seed: Graine de la partie
+        player_names: Joueurs, dans l'ordre des sièges
+        actions: Décisions de la partie (FarkleGame.action_log)
+        rules: Règles de la partie
+
+    Returns:
+        Statistiques par joueur (games, wins, score_total, turns, farkles, best_turn),
+        ou None si la partie n'est pas terminée
+    """
+    from model.game import FarkleGame
+    start = FarkleGame(seed=seed, rules=rules)
+    start.setup_players(list(player_names))
+    state = start.snapshot()
+    # Mêmes tirages que les dés de la partie pour les lancés non imposés
+    rng = random.Random(seed)
+
+    seats = [{'turns': 0, 'farkles': 0, 'best_turn': 0} for _ in player_names]
+    for action in actions:
+        kind = action[0]
+        seat = state.current_player_index
+        if kind == 'S':
+            banked = state.players[seat].turn_score
+            seats[seat]['turns'] += 1
+            seats[seat]['best_turn'] = max(seats[seat]['best_turn'], banked)
+        elif kind == 'F':
+            seats[seat]['turns'] += 1
+            seats[seat]['farkles'] += 1
+        elif kind == 'D':
+            rng.seed(action[1])
+        state = state.apply(action, rng)
+    if not state.game_over:
+        return None
+
+    statistics = {}
+    for seat, player in enumerate(state.players):
+        stats = statistics.setdefault(player.name, {'games': 0, 'wins': 0, 'score_total': 0, 'turns': 0,
+                                                    'farkles': 0, 'best_turn': 0})
+        stats['games'] += 1
+        stats['wins'] += int(seat == state.winner_index)
+        stats['score_total'] += player.total_score
+        stats['turns'] += seats[seat]['turns']
+        stats['farkles'] += seats[seat]['farkles']
+        stats['best_turn'] = max(stats['best_turn'], seats[seat]['best_turn'])
+    return statistics
+
+
+class ProfileStore(Journal):
+    """
+    Profils des joueurs, toutes parties confondues, identifiés par leur nom
+
+    Chaque partie terminée ajoute une ligne au journal (les statistiques de la partie par joueur) ;
+    les profils en mémoire sont mis à jour par addition, sans relire les parties précédentes.
+    Un classement trié est tenu pour chaque statistique de LEADERBOARDS : lire les N premiers
+    ne coûte que N, et le rang d'un joueur une recherche dichotomique. Les joueurs modifiés
+    sont replacés dans les classements à la requête suivante (tout est retrié d'un coup
+    après un chargement ou de nombreuses parties).
+    """
+
+    _instances: Dict[str, 'ProfileStore'] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_directory(cls, save_dir: str) -> 'ProfileStore':
+        """Profils (uniques dans le processus) associés à un dossier de sauvegardes"""
+        key = os.path.abspath(save_dir)
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                os.makedirs(key, exist_ok=True)
+                store = cls._instances[key] = cls(os.path.join(key, PROFILES_FILE))
+            return store
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self._boards: Dict[str, List[Tuple[float, str]]] = {}
+        self._keys: Dict[str, Dict[str, float]] = {}  # Clé de tri actuelle de chaque joueur, par classement
+        self._stale = set()  # Joueurs modifiés, pas encore replacés dans les classements
+        self._reset()
+
+    def _reset(self):
+        self.profiles = {}
+        self._boards = {metric: [] for metric in LEADERBOARDS}
+        self._keys = {}
+        self._stale = set()
+
+    def _apply(self, operation: Dict[str, Any]):
+        if 'profile' in operation:
+            self.profiles[operation['profile']] = dict(operation['stats'])
+            self._stale.add(operation['profile'])
+            return
+        for name, delta in operation['game'].items():
+            stats = self.profiles.get(name)
+            if stats is None:
+                stats = self.profiles[name] = _empty_stats()
+            for counter in COUNTERS:
+                stats[counter] += delta[counter]
+            stats['best_turn'] = max(stats['best_turn'], delta['best_turn'])
+            stats['last_played'] = operation.get('at')
+            self._stale.add(name)
+
+    def _sync_boards(self):
+        """Replace les joueurs modifiés dans les classements (verrou tenu)"""
+        if not self._stale:
+            return
+        if len(self._stale) * 8 > len(self.profiles):
+            self._keys = {}
+            boards = {metric: [] for metric in LEADERBOARDS}
+            for name, stats in self.profiles.items():
+                values = derived_statistics(stats)
+                keys = self._keys[name] = {}
+                for metric, descending in LEADERBOARDS.items():
+                    key = keys[metric] = -values[metric] if descending else values[metric]
+                    boards[metric].append((key, name))
+            for board in boards.values():
+                board.sort()
+            self._boards = boards
+        else:
+            for name in self._stale:
+                self._reindex(name)
+        self._stale = set()
+
+    def _reindex(self, name: str):
+        """Replace un joueur dans chaque classement"""
+        values = derived_statistics(self.profiles[name])
+        keys = self._keys.setdefault(name, {})
+        for metric, descending in LEADERBOARDS.items():
+            board = self._boards[metric]
+            old = keys.get(metric)
+            if old is not None:
+                del board[bisect_left(board, (old, name))]
+            key = -values[metric] if descending else values[metric]
+            insort(board, (key, name))
+            keys[metric] = key
+
+    def _compacted(self) -> List[Dict[str, Any]]:
+        return [{'profile': name, 'stats': stats} for name, stats in self.profiles.items()]
+
+    def _live_count(self) -> int:
+        return len(self.profiles)
+
+    def record_statistics(self, statistics: Dict[str, Dict[str, int]], played_at: str = None):
+        """Ajoute les statistiques d'une partie terminée (voir game_statistics) aux profils"""
+        with self._lock:
+            self._append([{'game': statistics, 'at': played_at or datetime.now().isoformat()}])
+
+    def record_game(self, game) -> bool:
+        """
+        Ajoute une partie terminée (FarkleGame) aux profils de ses joueurs
+
+        Returns:
+            False si la partie n'est pas terminée ou ne peut pas être rejouée (rien n'est enregistré)
+        """
+        if game.seed is None:
+            return False  # Reprise d'une sauvegarde sans historique
+        statistics = game_statistics(game.seed, game.initial_player_names, game.action_log, game.rules)
+        if statistics is None:
+            return False
+        self.record_statistics(statistics)
+        return True
+
+    def profile(self, name: str) -> Optional[Dict[str, Any]]:
+        """Profil d'un joueur (compteurs, statistiques calculées et rangs), None s'il est inconnu"""
+        with self._lock:
+            self._refresh()
+            self._sync_boards()
+            stats = self.profiles.get(name)
+            if stats is None:
+                return None
+            profile = dict(stats)
+            profile.update(derived_statistics(stats))
+            profile['name'] = name
+            profile['ranks'] = {metric: bisect_left(self._boards[metric], (self._keys[name][metric], name)) + 1
+                                for metric in LEADERBOARDS}
+            return profile
+
+    def leaderboard(self, metric: str = 'wins', limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Classement de tous les temps
+
+        Args:
+            metric: Statistique de classement (voir LEADERBOARDS)
+            limit: Nombre de joueurs
+            offset: Rang de départ (0 = premier)
+
+        Returns:
+            Joueurs classés : rang, nom, valeur de la statistique, parties jouées
+        """
+        if metric not in LEADERBOARDS:
+            raise ValueError(f"Classement inconnu: {metric} (disponibles : {', '.join(LEADERBOARDS)})")
+        with self._lock:
+            self._refresh()
+            self._sync_boards()
+            board = self._boards[metric]
+            return [{'rank': offset + position + 1, 'name': name,
+                     'value': -key if LEADERBOARDS[metric] else key,
+                     'games': self.profiles[name]['games']}
+                    for position, (key, name) in enumerate(board[offset:offset + limit])]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self.profiles)
+
+    def rebuild_from_saves(self, save_dir: str) -> int:
+        """
+        Recalcule tous les profils depuis les parties terminées d'un dossier de sauvegardes
+
+        Les profils existants sont remplacés. Chaque partie (graine, joueurs et décisions)
+        n'est comptée qu'une fois, même sauvegardée plusieurs fois.
+
+        Returns:
+            Nombre de parties comptées
+        """
+        from state.game_state import GameState, _read_save
+        rules_cache: Dict[str, FarkleRules] = {}
+        seen = set()
+        totals: Dict[str, Dict[str, Any]] = {}
+        game_state = GameState(save_dir)
+        game_state.index.synchronize()  # Recalcul à la demande : les sauvegardes copiées à la main comptent aussi
+        for save in game_state.list_saves():
+            try:
+                data = _read_save(save['filepath'])
+            except (OSError, EOFError, ValueError):
+                continue
+            replay = data.get('replay')
+            if not data.get('game_over') or not replay or replay.get('seed') is None:
+                continue
+            # Deux parties de même graine et mêmes joueurs peuvent avoir autant de décisions : on compare tout l'historique
+            actions_digest = hashlib.sha256(json.dumps(replay['actions'], separators=(',', ':')).encode()).hexdigest()
+            key = (replay['seed'], tuple(replay['players']), actions_digest)
+            if key in seen:
+                continue
+            seen.add(key)
+            rules_key = repr(sorted((replay.get('rules') or {}).items()))
+            if rules_key not in rules_cache:
+                rules_cache[rules_key] = FarkleRules.from_dict(replay.get('rules'))
+            statistics = game_statistics(replay['seed'], replay['players'], replay['actions'], rules_cache[rules_key])
+            if statistics is None:
+                continue
+            for name, delta in statistics.items():
+                stats = totals.setdefault(name, _empty_stats())
+                for counter in COUNTERS:
+                    stats[counter] += delta[counter]
+                stats['best_turn'] = max(stats['best_turn'], delta['best_turn'])
+                if stats['last_played'] is None or data.get('saved_at', '') > stats['last_played']:
+                    stats['last_played'] = data.get('saved_at')
+        with self._lock:
+            self._rewrite([{'profile': name, 'stats': stats} for name, stats in totals.items()])
+        return len(seen)
@@ -0,0 +1,119 @@
+from bisect import bisect_right
+from typing import Any, Dict, List, Tuple
+from model.game import FarkleGame
+from model.rules import FarkleRules
+from state.game_state import GameState
+from state.persistent import GameSnapshot
+
+
+class GameReplay:
+    """
+    Rejoue une partie de façon déterministe à partir de sa graine et de ses décisions
+
+    Un premier passage complet enregistre des points de reprise (état du jeu et du générateur)
+    tous les checkpoint_interval tours : atteindre le tour N ne rejoue ensuite que les actions
+    depuis le point de reprise précédent, pas toute la partie.
+    """
+
+    def __init__(self, replay_data: Dict[str, Any], checkpoint_interval: int = 10, lazy: bool = False):
+        if replay_data.get('seed') is None:
+            raise ValueError("Partie sans graine enregistrée : impossible de la rejouer")
+        self.seed = replay_data['seed']
+        self.player_names = list(replay_data['players'])
+        self.rules = FarkleRules.from_dict(replay_data.get('rules'))
+        self.actions = [tuple(action) for action in replay_data['actions']]
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.checkpoints: List[Tuple[int, GameSnapshot]] = []  # (index d'action, instantané)
+        self.checkpoint_indexes: List[int] = []
+        self.turn_starts: Dict[int, int] = {}  # tour -> index de la première action de ce tour
+        if not lazy:
+            self.build_checkpoints()
+
+    @classmethod
+    def from_game(cls, game: FarkleGame, checkpoint_interval: int = 10) -> 'GameReplay':
+        """Prépare le rejeu d'une partie en mémoire"""
+        return cls(game.get_replay_data(), checkpoint_interval)
+
+    @classmethod
+    def from_save(cls, filename: str, checkpoint_interval: int = 10) -> 'GameReplay':
+        """Prépare le rejeu d'une partie sauvegardée"""
+        data = GameState().load_game(filename)
+        if 'replay' not in data:
+            raise ValueError(f"La sauvegarde {filename} ne contient pas d'historique (version {data.get('version')})")
+        return cls(data['replay'], checkpoint_interval)
+
+    def new_game(self) -> FarkleGame:
+        """Recrée la partie dans son état initial"""
+        game = FarkleGame(seed=self.seed, rules=self.rules)
+        game.setup_players(self.player_names)
+        return game
+
+    @staticmethod
+    def apply(game: FarkleGame, action: Tuple) -> None:
+        """Applique une décision enregistrée"""
+        kind = action[0]
+        if kind == 'R':
+            game.roll_dice(action[1] if len(action) > 1 else None)
+        elif kind == 'K':
+            if not game.bank_dice(list(action[1])):
+                raise ValueError(f"Rejeu divergent : impossible de garder {action[1]}")
+        elif kind == 'S':
+            if not game.stop_turn():
+                raise ValueError("Rejeu divergent : impossible de stopper le tour")
+        elif kind == 'F':
+            game.farkle()
+        elif kind == 'D':
+            game.reseed(action[1])
+        else:
+            raise ValueError(f"Action inconnue: {action}")
+
+    @staticmethod
+    def snapshot(game: FarkleGame) -> GameSnapshot:
+        """Instantané de la partie et de l'état complet du générateur"""
+        return game.snapshot(rng_state=True)
+
+    def restore(self, snapshot: GameSnapshot, action_index: int) -> FarkleGame:
+        """Recrée une partie depuis un instantané pris à l'action action_index"""
+        game = snapshot.to_game()
+        game.seed = self.seed
+        game.initial_player_names = list(self.player_names)
+        game.action_log = self.actions[:action_index]
+        return game
+
+    def build_checkpoints(self):
+        """Rejoue toute la partie une fois pour poser les points de reprise"""
+        game = self.new_game()
+        self.checkpoints = [(0, self.snapshot(game))]
+        self.turn_starts = {game.turn_count: 0}
+        for index, action in enumerate(self.actions):
+            self.apply(game, action)
+            if game.turn_count not in self.turn_starts:
+                self.turn_starts[game.turn_count] = index + 1
+                if game.turn_count % self.checkpoint_interval == 0:
+                    self.checkpoints.append((index + 1, self.snapshot(game)))
+        self.checkpoint_indexes = [index for index, _ in self.checkpoints]
+
+    def state_at(self, action_index: int) -> FarkleGame:
+        """Retourne la partie telle qu'elle était après action_index actions"""
+        if not 0 <= action_index <= len(self.actions):
+            raise ValueError(f"Index d'action invalide: {action_index} (0-{len(self.actions)})")
+        if not self.checkpoints:
+            self.build_checkpoints()
+        position = bisect_right(self.checkpoint_indexes, action_index) - 1
+        checkpoint_index, snapshot = self.checkpoints[position]
+        game = self.restore(snapshot, checkpoint_index)
+        for action in self.actions[checkpoint_index:action_index]:
+            self.apply(game, action)
+        return game
+
+    def seek_turn(self, turn: int) -> FarkleGame:
+        """Retourne la partie au début du tour de table turn"""
+        if not self.checkpoints:
+            self.build_checkpoints()
+        if turn not in self.turn_starts:
+            raise ValueError(f"Tour invalide: {turn} (1-{max(self.turn_starts)})")
+        return self.state_at(self.turn_starts[turn])
+
+    def final_state(self) -> FarkleGame:
+        """Retourne la partie après toutes les décisions enregistrées"""
+        return self.state_at(len(self.actions))
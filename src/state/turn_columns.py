@@ -0,0 +1,86 @@
+from typing import Any, Dict, List, Sequence
+from model.rules import DEFAULT_RULES, FarkleRules
+
+
+# Colonnes par tour écrites avec les sorties de simulation (analyses) : une valeur par tour joué
+TURN_COLUMNS = ('seat', 'player_turn', 'banked', 'farkle', 'inherited_gained', 'inherited_lost', 'entered')
+
+
+def turn_columns(actions: Sequence[Sequence], num_players: int, rules: FarkleRules = None) -> Dict[str, Any]:
+    """
+    Résumé de chaque tour joué, en colonnes, calculé en un passage sur les décisions
+
+    Les lancés ne sont pas rejoués : le score d'un tour ne dépend que des dés gardés ('K'),
+    et le joueur actuel avance d'un siège à chaque stop ou Farkle. Le score hérité (piggy-back)
+    est gagné au premier lancé d'un joueur sur le plateau ; il est perdu si le joueur n'est pas
+    sur le plateau, ou s'il fait Farkle dans le tour où il l'a récupéré.
+
+    Args:
+        actions: Décisions de la partie (FarkleGame.action_log), depuis le début
+        num_players: Nombre de joueurs
+        rules: Règles de la partie
+
+    Returns:
+        Colonnes TURN_COLUMNS (listes d'entiers, farkle et entered valant 0 ou 1) et 'winner',
+        siège du gagnant (-1 si la partie n'est pas terminée)
+    """
+    rules = rules or DEFAULT_RULES
+    columns: Dict[str, List[int]] = {field: [] for field in TURN_COLUMNS}
+    seat_column, turn_column, banked_column = columns['seat'], columns['player_turn'], columns['banked']
+    farkle_column, gained_column, lost_column = columns['farkle'], columns['inherited_gained'], columns['inherited_lost']
+    entered_column = columns['entered']
+    score_table = rules.score_table
+
+    totals = [0] * num_players
+    on_board = [False] * num_players
+    player_turns = [0] * num_players
+    seat = 0
+    transfer = 0
+    turn_score = gained = lost = 0
+    turn_start = True
+    final_round_remaining = None  # None tant que le dernier tour n'a pas commencé
+    winner = -1
+
+    for action in actions:
+        kind = action[0]
+        if kind == 'R':
+            if turn_start:
+                # Le score hérité est récupéré (ou perdu) au premier lancé du tour
+                gained, lost = (transfer, 0) if on_board[seat] else (0, transfer)
+                turn_score, transfer, turn_start = gained, 0, False
+        elif kind == 'K':
+            entry = score_table.get(tuple(sorted(action[1])))
+            turn_score += entry[0] if entry is not None else rules.compute_score(action[1])[0]
+        elif kind == 'S' or kind == 'F':
+            stopped = kind == 'S'
+            entered = False
+            if stopped:
+                totals[seat] += turn_score
+                if not on_board[seat] and turn_score >= rules.entry_threshold:
+                    on_board[seat] = entered = True
+                if final_round_remaining is None and totals[seat] >= rules.target_score:
+                    final_round_remaining = num_players - 1
+                transfer = turn_score if rules.piggy_back_enabled else 0
+            else:
+                transfer = 0
+            player_turns[seat] += 1
+            seat_column.append(seat)
+            turn_column.append(player_turns[seat])
+            banked_column.append(turn_score if stopped else 0)
+            farkle_column.append(0 if stopped else 1)
+            gained_column.append(gained if stopped else 0)
+            lost_column.append(lost if stopped else lost + gained)
+            entered_column.append(1 if entered else 0)
+            turn_score = gained = lost = 0
+            turn_start = True
+
+            if final_round_remaining is not None and final_round_remaining <= 0:
+                best = max(totals)
+                winner = totals.index(best)
+                break
+            if final_round_remaining is not None:
+                final_round_remaining -= 1
+            seat = (seat + 1) % num_players
+
+    columns['winner'] = winner
+    return columns
@@ -0,0 +1,196 @@
+import json
+import shlex
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+from model.game import FarkleGame
+from model.rules import FarkleRules
+
+
+class FarkleBatch:
+    """
+    Mode script non interactif : exécute une suite de commandes sur une partie,
+    sans input() ni effacement d'écran, et produit les transitions d'état.
+
+    Commandes reconnues (une par ligne, '#' pour les commentaires):
+    - new <joueur1> <joueur2> ...   Nouvelle partie
+    - load <fichier>                Charge une sauvegarde
+    - seed <graine>                 Réinitialise le générateur aléatoire
+    - roll [d1 d2 ...]              Lance les dés (résultat imposé optionnel)
+    - keep <index>                  Garde la combinaison n° index (1-based, comme dans la CLI)
+    - stop                          Stoppe le tour
+    - save [fichier]                Sauvegarde la partie
+
+    Comme dans la CLI, un lancé doit être suivi de dés gardés avant de relancer ou de stopper :
+    une ligne qui ne respecte pas cet ordre est refusée (échec), sans modifier la partie.
+    """
+
+    def __init__(self, seed: int = None, include_status: bool = True, rules: FarkleRules = None):
+        self.game = FarkleGame(seed=seed, rules=rules)
+        self.include_status = include_status
+        self.commands = {
+            'new': self.cmd_new,
+            'load': self.cmd_load,
+            'seed': self.cmd_seed,
+            'roll': self.cmd_roll,
+            'keep': self.cmd_keep,
+            'stop': self.cmd_stop,
+            'save': self.cmd_save,
+        }
+
+    def cmd_new(self, args: List[str]) -> Dict[str, Any]:
+        """Démarre une nouvelle partie"""
+        self.game.setup_players(args)
+        return {'event': 'new_game', 'players': args}
+
+    def cmd_load(self, args: List[str]) -> Dict[str, Any]:
+        """Charge une partie sauvegardée"""
+        if len(args) != 1:
+            raise ValueError("Usage: load <fichier>")
+        self.game.load_game(args[0])
+        return {'event': 'loaded', 'filename': args[0]}
+
+    def cmd_seed(self, args: List[str]) -> Dict[str, Any]:
+        """Réinitialise le générateur aléatoire des dés"""
+        if len(args) != 1:
+            raise ValueError("Usage: seed <graine>")
+        self.game.reseed(int(args[0]))
+        return {'event': 'seeded', 'seed': int(args[0])}
+
+    def cmd_roll(self, args: List[str]) -> Dict[str, Any]:
+        """Lance les dés, et gère le Farkle comme la CLI"""
+        self._require_game()
+        if self.game.roll_pending:
+            raise ValueError(f"Lancé {self.game.last_dice_roll} en attente : gardez des dés avant de relancer")
+        forced_values = [int(value) for value in args] if args else None
+        dice_values = list(self.game.roll_dice(forced_values))
+
+        if self.game.is_farkle():
+            self.game.farkle()
+            return {'event': 'farkle', 'dice': dice_values}
+
+        return {'event': 'rolled', 'dice': dice_values, 'actions': self.game.get_possible_actions()}
+
+    def cmd_keep(self, args: List[str]) -> Dict[str, Any]:
+        """Garde une des combinaisons proposées par get_possible_actions"""
+        self._require_game()
+        if len(args) != 1:
+            raise ValueError("Usage: keep <index>")
+        if not self.game.roll_pending:
+            raise ValueError("Aucun lancé en attente : lancez les dés avant de garder")
+        actions = self.game.get_possible_actions()
+        choice = int(args[0])
+        if not 1 <= choice <= len(actions):
+            raise ValueError(f"Choix invalide: {choice} (1-{len(actions)})")
+        score, dice_to_bank = actions[choice - 1]
+        if not self.game.bank_dice(dice_to_bank):
+            raise ValueError(f"Impossible de conserver les dés {dice_to_bank}")
+        return {'event': 'kept', 'dice': dice_to_bank, 'score': score}
+
+    def cmd_stop(self, args: List[str]) -> Dict[str, Any]:
+        """Stoppe le tour du joueur actuel"""
+        self._require_game()
+        if self.game.roll_pending:
+            raise ValueError(f"Lancé {self.game.last_dice_roll} en attente : gardez des dés avant de stopper")
+        player = self.game.get_current_player()
+        score_to_transfer = player.turn_score
+        if not self.game.stop_turn():
+            raise ValueError(f"{player.name} ne peut pas stopper son tour")
+        return {'event': 'stopped', 'player': player.name, 'score': score_to_transfer}
+
+    def cmd_save(self, args: List[str]) -> Dict[str, Any]:
+        """Sauvegarde la partie actuelle"""
+        self._require_game()
+        filepath = self.game.save_game(args[0] if args else None)
+        return {'event': 'saved', 'filepath': filepath}
+
+    def _require_game(self):
+        if not self.game.players:
+            raise ValueError("Aucune partie en cours (utilisez 'new' ou 'load')")
+        if self.game.game_over:
+            raise ValueError("La partie est terminée")
+
+    def execute(self, line: str, line_number: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Exécute une ligne de commande
+
+        Args:
+            line: Ligne du script
+            line_number: Numéro de la ligne (pour les messages d'erreur)
+
+        Returns:
+            Transition d'état produite, ou None pour une ligne vide/commentaire
+        """
+        tokens = shlex.split(line, comments=True)
+        if not tokens:
+            return None
+
+        command, args = tokens[0].lower(), tokens[1:]
+        result = {'line': line_number, 'command': command}
+        handler = self.commands.get(command)
+
+        try:
+            if handler is None:
+                raise ValueError(f"Commande inconnue: {command}")
+            result.update(handler(args))
+            result['ok'] = True
+        except (ValueError, FileNotFoundError, KeyError) as e:
+            result['ok'] = False
+            result['error'] = str(e)
+
+        if self.include_status and self.game.players:
+            result['status'] = self.game.get_game_status()
+        return result
+
+    def run(self, lines: Iterable[str], stop_on_error: bool = False) -> Iterable[Dict[str, Any]]:
+        """
+        Exécute un script complet et produit les transitions d'état au fil de l'eau
+
+        Args:
+            lines: Lignes du script
+            stop_on_error: Arrête le script à la première commande en erreur
+        """
+        for line_number, line in enumerate(lines, 1):
+            result = self.execute(line, line_number)
+            if result is None:
+                continue
+            yield result
+            if stop_on_error and not result['ok']:
+                return
+
+
+def run_script_file(filepath: str, seed: int = None, include_status: bool = True,
+                    stop_on_error: bool = False, rules: FarkleRules = None) -> List[Dict[str, Any]]:
+    """Exécute un fichier de script et retourne toutes ses transitions (utilisable dans un pool de processus)"""
+    batch = FarkleBatch(seed=seed, include_status=include_status, rules=rules)
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return list(batch.run(f, stop_on_error))
+
+
+def run_script_files(filepaths: List[str], workers: int = None, seed: int = None,
+                     include_status: bool = True, stop_on_error: bool = False,
+                     rules: FarkleRules = None) -> Iterable[tuple]:
+    """
+    Exécute plusieurs scripts en parallèle, chacun dans sa propre partie
+
+    Returns:
+        Itérateur de tuples (fichier, transitions), dans l'ordre des fichiers
+    """
+    if workers == 1 or len(filepaths) <= 1:
+        for filepath in filepaths:
+            yield filepath, run_script_file(filepath, seed, include_status, stop_on_error, rules)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_script_file, filepath, seed, include_status, stop_on_error, rules)
+                   for filepath in filepaths]
+        for filepath, future in zip(filepaths, futures):
+            yield filepath, future.result()
+
+
+def write_transitions(transitions: Iterable[Dict[str, Any]], output: TextIO = sys.stdout, script: str = None):
+    """Écrit les transitions au format JSON Lines"""
+    for transition in transitions:
+        if script is not None:
+            transition['script'] = script
+        output.write(json.dumps(transition, ensure_ascii=False) + '\n')
@@ -1,9 +1,14 @@
 import os
 import sys
-from typing import List, Optional
+from typing import Dict, List, Optional
 from colorama import init, Fore, Back, Style
 from model.game import FarkleGame
+from model.rules import FarkleRules
+from bot.endgame import get_solver
+from bot.strategy import Strategy
 from state.game_state import GameState
+from state.persistent import GameSnapshot
+from state.profiles import ProfileStore
 
 
 # Initialiser colorama
@@ -13,9 +18,16 @@ init()
 class FarkleCLI:
     """Interface en ligne de commande pour le jeu Farkle"""
     
-    def __init__(self):
-        self.game = FarkleGame()
+    def __init__(self, rules: FarkleRules = None, bot_time_budget: float = 0.05, bot_workers: int = 1):
+        self.game = FarkleGame(rules=rules)
         self.game_state = GameState()
+        self.game.profiles = ProfileStore.for_directory(self.game_state.SAVE_DIR)
+        self.bot_time_budget = bot_time_budget  # Temps de réflexion par décision des ordinateurs (secondes)
+        self.bot_workers = bot_workers
+        self.bots: Dict[str, Strategy] = {}  # Joueurs contrôlés par l'ordinateur, par nom
+        # Instantanés pris avant chaque action d'un joueur humain (annuler) et annulés (rétablir)
+        self.undo_stack: List[GameSnapshot] = []
+        self.redo_stack: List[GameSnapshot] = []
     
     def clear_screen(self):
         """Efface l'écran"""
@@ -63,8 +75,9 @@ class FarkleCLI:
         if status['final_round_started']:
             remaining_players = status['final_round_players_remaining']
             if remaining_players > 0:
-                print(f"{Fore.RED}{Style.BRIGHT}🚨 DERNIER TOUR - {status['final_round_triggerer']} a atteint 10,000 points!{Style.RESET_ALL}")
+                print(f"{Fore.RED}{Style.BRIGHT}🚨 DERNIER TOUR - {status['final_round_triggerer']} a atteint {self.game.rules.target_score:,} points!{Style.RESET_ALL}")
                 print(f"{Fore.YELLOW}   Joueurs restants: {remaining_players}{Style.RESET_ALL}")
+                self.print_endgame_analysis()
             else:
                 print(f"{Fore.RED}{Style.BRIGHT}🏁 DERNIER TOUR TERMINÉ - Calcul du gagnant...{Style.RESET_ALL}")
             print(f"{Fore.CYAN}Tour {status['turn_count']} - Joueur: {Fore.YELLOW}{status['current_player']}{Style.RESET_ALL}")
@@ -77,7 +90,7 @@ class FarkleCLI:
         # Afficher le score de tous les joueurs
         print(f"\n{Fore.GREEN}📊 SCORES:{Style.RESET_ALL}")
         for player_info in status['players']:
-            board_status = "" if player_info['is_on_board'] else "✗ pas encore dans le jeu (-800)"
+            board_status = "" if player_info['is_on_board'] else f"✗ pas encore dans le jeu (-{self.game.rules.entry_threshold})"
             color = Fore.GREEN if player_info['name'] == status['current_player'] else Fore.WHITE
             
             # Marquer le joueur qui a déclenché le dernier tour
@@ -113,15 +126,25 @@ class FarkleCLI:
         if status['last_player_banked']:
             print(f"\n{Fore.MAGENTA}💰 Dernier joueur a stoppé (doit lancer avant de restopper){Style.RESET_ALL}")
     
-    def print_possible_actions(self, actions: List[tuple]):
-        """Affiche les actions possibles"""
-        if not actions:
+    def print_endgame_analysis(self):
+        """Affiche le score minimum pour gagner et la probabilité exacte de l'atteindre (dernier tour)"""
+        analysis = get_solver(self.game.rules).analyze(self.game)
+        if analysis['required_turn_score'] == 0:
+            print(f"{Fore.GREEN}   🎯 Vous êtes déjà en tête : il suffit de finir votre tour.{Style.RESET_ALL}")
+            return
+        print(f"{Fore.YELLOW}   🎯 Score minimum à garder ce tour pour gagner: {analysis['required_turn_score']} points "
+              f"(probabilité: {analysis['win_probability']:.1%}){Style.RESET_ALL}")
+    
+    def print_possible_actions(self, keeps: List[tuple]):
+        """Affiche les actions possibles (rules.lookup_keeps : score, dés gardés, dés à relancer)"""
+        if not keeps:
             print(f"{Fore.RED}💥 FARKLE! Aucun dé ne peut être conservé.{Style.RESET_ALL}")
             return
         
         print(f"\n{Fore.BLUE}🎯 Actions possibles:{Style.RESET_ALL}")
-        for i, (score, dice) in enumerate(actions, 1):
-            print(f"{Fore.BLUE}  {i}. Garder {dice} → {score} points{Style.RESET_ALL}")
+        for i, (score, dice, next_dice) in enumerate(keeps, 1):
+            after = "hot dice, 6 dés à relancer" if len(dice) == len(self.game.last_dice_roll) else f"{next_dice} dé(s) à relancer"
+            print(f"{Fore.BLUE}  {i}. Garder {list(dice)} → {score} points ({after}){Style.RESET_ALL}")
     
     def get_player_names(self) -> List[str]:
         """Demande les noms des joueurs"""
@@ -135,8 +158,18 @@ class FarkleCLI:
             except ValueError:
                 print(f"{Fore.RED}Veuillez entrer un nombre valide.{Style.RESET_ALL}")
         
+        while True:
+            try:
+                num_bots = int(input(f"{Fore.CYAN}Dont ordinateurs (0-{num_players}): {Style.RESET_ALL}") or 0)
+                if 0 <= num_bots <= num_players:
+                    break
+                else:
+                    print(f"{Fore.RED}Le nombre d'ordinateurs doit être entre 0 et {num_players}.{Style.RESET_ALL}")
+            except ValueError:
+                print(f"{Fore.RED}Veuillez entrer un nombre valide.{Style.RESET_ALL}")
+        
         player_names = []
-        for i in range(num_players):
+        for i in range(num_players - num_bots):
             while True:
                 name = input(f"{Fore.CYAN}Nom du joueur {i+1}: {Style.RESET_ALL}").strip()
                 if name and name not in player_names:
@@ -147,8 +180,30 @@ class FarkleCLI:
                 else:
                     print(f"{Fore.RED}Veuillez entrer un nom valide.{Style.RESET_ALL}")
         
+        # Les ordinateurs occupent les sièges restants
+        self.close_bots()
+        for i in range(num_bots):
+            name = f"Ordinateur {i + 1}"
+            while name in player_names:
+                name += "'"
+            player_names.append(name)
+            self.bots[name] = self.create_bot(i)
+        
         return player_names
     
+    def create_bot(self, index: int) -> Strategy:
+        """Crée un ordinateur MCTS avec le budget de temps par décision de la CLI"""
+        from bot.mcts import MCTSStrategy
+        return MCTSStrategy(time_budget=self.bot_time_budget, workers=self.bot_workers,
+                            rules=self.game.rules, name=f"mcts_{index + 1}")
+    
+    def close_bots(self):
+        """Libère les ordinateurs de la partie précédente (processus de recherche)"""
+        for bot in self.bots.values():
+            if hasattr(bot, 'close'):
+                bot.close()
+        self.bots = {}
+    
     def show_main_menu(self):
         """Affiche le menu principal"""
         self.clear_screen()
@@ -158,15 +213,16 @@ class FarkleCLI:
         print(f"{Fore.WHITE}1. Nouvelle partie{Style.RESET_ALL}")
         print(f"{Fore.WHITE}2. Charger une partie{Style.RESET_ALL}")
         print(f"{Fore.WHITE}3. Règles du jeu{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}4. Quitter{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}4. Profils et classements{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}5. Quitter{Style.RESET_ALL}")
         
         while True:
             try:
                 choice = int(input(f"\n{Fore.YELLOW}Votre choix: {Style.RESET_ALL}"))
-                if 1 <= choice <= 4:
+                if 1 <= choice <= 5:
                     return choice
                 else:
-                    print(f"{Fore.RED}Choix invalide. Veuillez choisir entre 1 et 4.{Style.RESET_ALL}")
+                    print(f"{Fore.RED}Choix invalide. Veuillez choisir entre 1 et 5.{Style.RESET_ALL}")
             except ValueError:
                 print(f"{Fore.RED}Veuillez entrer un nombre valide.{Style.RESET_ALL}")
     
@@ -176,53 +232,87 @@ class FarkleCLI:
         self.print_title()
         
         print(f"\n{Fore.CYAN}📋 RÈGLES DU FARKLE{Style.RESET_ALL}")
+        rules = self.game.rules
+        
         print(f"\n{Fore.YELLOW}🎯 Objectif:{Style.RESET_ALL}")
-        print("  Être le premier à atteindre 10 000 points")
+        print(f"  Être le premier à atteindre {rules.target_score:,} points".replace(',', ' '))
         
         print(f"\n{Fore.YELLOW}🎲 Scoring:{Style.RESET_ALL}")
-        print("  • 1 = 100 points")
-        print("  • 5 = 50 points")
-        print("  • Trois 1 = 1000 points")
-        print("  • Trois 2 = 200 points")
-        print("  • Trois 3 = 300 points")
-        print("  • Trois 4 = 400 points")
-        print("  • Trois 5 = 500 points")
-        print("  • Trois 6 = 600 points")
-        print("  • Pour chaque nombre au-delà de trois identiques, doublez le montant (par exemple, trois 6 = 600, quatre 6 = 1200, cinq 6 = 2400, six 6 = 4800).")
-        print("  • Straight (1, 2, 3, 4, 5, 6) = 1000 points")
-        print("  • Trois paires = 1000 points")
+        for value, points in sorted(rules.single_scores.items()):
+            print(f"  • {value} = {points} points")
+        for value, points in sorted(rules.triple_scores.items()):
+            print(f"  • Trois {value} = {points} points")
+        print(f"  • Pour chaque nombre au-delà de trois identiques, multipliez le montant par {rules.extra_dice_multiplier} (par exemple, trois 6 = 600, quatre 6 = 1200, cinq 6 = 2400, six 6 = 4800 avec les règles par défaut).")
+        if rules.straight_enabled:
+            print(f"  • Straight (1, 2, 3, 4, 5, 6) = {rules.straight_score} points")
+        if rules.three_pairs_enabled:
+            print(f"  • Trois paires = {rules.three_pairs_score} points")
         print("  Note : Trois d'une sorte doivent tous être lancés ensemble. Lancer un 1, puis un autre 1 et encore un 1 vaut 300. Lancer 3 1 d'un coup vaut 1000.")
         
         print(f"\n{Fore.YELLOW}🎮 Déroulement:{Style.RESET_ALL}")
         print("  • Lancez 6 dés")
         print("  • Conservez des dés qui rapportent des points")
         print("  • FARKLE = aucun dé ne peut être conservé → perte du tour")
-        print("  • Il faut 'payer' 800 points pour entrer 'sur le plateau'")
+        print(f"  • Il faut 'payer' {rules.entry_threshold} points pour entrer 'sur le plateau'")
         
         print(f"\n{Fore.YELLOW}💰 Stopper le tour:{Style.RESET_ALL}")
         print("  • Garde votre score du tour et l'ajoute à votre total")
-        print("  • Transfère aussi ce score au joueur suivant (piggy-back)")
+        if rules.piggy_back_enabled:
+            print("  • Transfère aussi ce score au joueur suivant (piggy-back)")
         print("  • Conditions pour stopper :")
         print("    - Soit être déjà sur le plateau")
-        print("    - Soit avoir 800+ points ce tour (pour entrer sur le plateau)")
+        print(f"    - Soit avoir {rules.entry_threshold}+ points ce tour (pour entrer sur le plateau)")
         
-        print(f"\n{Fore.YELLOW}🎁 Système Piggy-Back:{Style.RESET_ALL}")
-        print("  • Quand un joueur stoppe, son score est transféré au suivant")
-        print("  • MAIS seuls les joueurs sur le plateau peuvent récupérer les points hérités")
-        print("  • Si le joueur suivant n'est pas sur le plateau → points perdus")
-        print("  • En cas de FARKLE, le joueur perd tout (y compris le score hérité)")
-        print("  • Le score hérité est ajouté dès que le joueur lance les dés")
+        if rules.piggy_back_enabled:
+            print(f"\n{Fore.YELLOW}🎁 Système Piggy-Back:{Style.RESET_ALL}")
+            print("  • Quand un joueur stoppe, son score est transféré au suivant")
+            print("  • MAIS seuls les joueurs sur le plateau peuvent récupérer les points hérités")
+            print("  • Si le joueur suivant n'est pas sur le plateau → points perdus")
+            print("  • En cas de FARKLE, le joueur perd tout (y compris le score hérité)")
+            print("  • Le score hérité est ajouté dès que le joueur lance les dés")
         
         print(f"\n{Fore.YELLOW}🏁 Dernier Tour:{Style.RESET_ALL}")
-        print("  • Dès qu'un joueur atteint/dépasse 10,000 points, le dernier tour commence")
+        print(f"  • Dès qu'un joueur atteint/dépasse {rules.target_score:,} points, le dernier tour commence")
         print("  • Tous les autres joueurs ont droit à un tour supplémentaire")
         print("  • Le dernier tour ne se déclenche qu'une seule fois")
-        print("  • Même si plusieurs joueurs dépassent 10,000 pendant le dernier tour")
+        print(f"  • Même si plusieurs joueurs dépassent {rules.target_score:,} pendant le dernier tour")
         print("  • À la fin du dernier tour, le joueur avec le score le plus élevé gagne")
         print("  • Les joueurs peuvent se rattraper grâce au piggy-back!")
         
         input(f"\n{Fore.CYAN}Appuyez sur Entrée pour continuer...{Style.RESET_ALL}")
     
+    def show_profiles(self):
+        """Affiche les classements de tous les temps et, sur demande, le profil d'un joueur"""
+        self.clear_screen()
+        self.print_title()
+        profiles = self.game.profiles
+        
+        print(f"\n{Fore.CYAN}🏅 CLASSEMENTS DE TOUS LES TEMPS{Style.RESET_ALL}")
+        if not len(profiles):
+            print(f"{Fore.YELLOW}Aucune partie terminée pour le moment.{Style.RESET_ALL}")
+            input(f"\n{Fore.CYAN}Appuyez sur Entrée pour continuer...{Style.RESET_ALL}")
+            return
+        
+        titles = {'wins': "Victoires", 'average_score': "Score final moyen", 'best_turn': "Meilleur tour"}
+        for metric, title in titles.items():
+            print(f"\n{Fore.YELLOW}{title}:{Style.RESET_ALL}")
+            for entry in profiles.leaderboard(metric, 5):
+                print(f"  {entry['rank']}. {entry['name']}: {entry['value']:.0f} ({entry['games']} parties)")
+        
+        name = input(f"\n{Fore.CYAN}Nom d'un joueur pour voir son profil (Entrée pour revenir): {Style.RESET_ALL}").strip()
+        if name:
+            profile = profiles.profile(name)
+            if profile is None:
+                print(f"{Fore.RED}Joueur inconnu: {name}{Style.RESET_ALL}")
+            else:
+                print(f"\n{Fore.GREEN}{profile['name']}{Style.RESET_ALL}")
+                print(f"  Parties jouées : {profile['games']} (rang {profile['ranks']['games']})")
+                print(f"  Victoires : {profile['wins']} ({profile['win_rate']:.0%}, rang {profile['ranks']['wins']})")
+                print(f"  Score final moyen : {profile['average_score']:.0f} (rang {profile['ranks']['average_score']})")
+                print(f"  Taux de Farkle : {profile['farkle_rate']:.0%} (rang {profile['ranks']['farkle_rate']})")
+                print(f"  Meilleur tour : {profile['best_turn']} (rang {profile['ranks']['best_turn']})")
+            input(f"\n{Fore.CYAN}Appuyez sur Entrée pour continuer...{Style.RESET_ALL}")
+    
     def show_load_menu(self):
         """Affiche le menu de chargement"""
         saves = self.game_state.list_saves()
@@ -266,19 +356,23 @@ class FarkleCLI:
             print(f"{Fore.YELLOW}2. Stopper le tour (⚠️ aucun point à transférer){Style.RESET_ALL}")
         elif current_player.is_on_board:
             print(f"{Fore.WHITE}2. Stopper le tour (garder + transférer {current_player.turn_score} pts){Style.RESET_ALL}")
-        elif current_player.turn_score >= 800:
+        elif current_player.turn_score >= self.game.rules.entry_threshold:
             print(f"{Fore.WHITE}2. Stopper le tour (entrer sur le plateau + transférer {current_player.turn_score} pts){Style.RESET_ALL}")
         else:
-            print(f"{Fore.YELLOW}2. Stopper le tour (⚠️ besoin de 800 pts, vous avez {current_player.turn_score}){Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}2. Stopper le tour (⚠️ besoin de {self.game.rules.entry_threshold} pts, vous avez {current_player.turn_score}){Style.RESET_ALL}")
         
         print(f"{Fore.WHITE}3. Sauvegarder{Style.RESET_ALL}")
         print(f"{Fore.WHITE}4. Voir le classement{Style.RESET_ALL}")
         print(f"{Fore.WHITE}5. Quitter{Style.RESET_ALL}")
+        if self.undo_stack:
+            print(f"{Fore.WHITE}6. Annuler la dernière action ({len(self.undo_stack)} possible(s)){Style.RESET_ALL}")
+        if self.redo_stack:
+            print(f"{Fore.WHITE}7. Rétablir ({len(self.redo_stack)} possible(s)){Style.RESET_ALL}")
         
         while True:
             try:
                 choice = int(input(f"\n{Fore.YELLOW}Votre choix: {Style.RESET_ALL}"))
-                if 1 <= choice <= 5:
+                if 1 <= choice <= 5 or (choice == 6 and self.undo_stack) or (choice == 7 and self.redo_stack):
                     return choice
                 else:
                     print(f"{Fore.RED}Choix invalide.{Style.RESET_ALL}")
@@ -287,7 +381,10 @@ class FarkleCLI:
     
     def handle_dice_roll(self):
         """Gère le lancé de dés et la sélection des dés à conserver"""
-        dice_values = self.game.roll_dice()
+        if self.game.roll_pending:
+            dice_values = list(self.game.last_dice_roll)  # Partie reprise après un lancé : il reste à garder des dés
+        else:
+            dice_values = self.game.roll_dice()
         self.print_dice(dice_values)
         
         # Vérifier si c'est un Farkle
@@ -299,7 +396,7 @@ class FarkleCLI:
         
         # Afficher les actions possibles
         actions = self.game.get_possible_actions()
-        self.print_possible_actions(actions)
+        self.print_possible_actions(self.game.rules.lookup_keeps(dice_values))
         
         # Demander au joueur de choisir une action
         while True:
@@ -317,6 +414,53 @@ class FarkleCLI:
             except ValueError:
                 print(f"{Fore.RED}Veuillez entrer un nombre valide.{Style.RESET_ALL}")
     
+    def play_bot_turn(self, bot: Strategy):
+        """Joue le tour d'un ordinateur en affichant ses lancés et ses décisions"""
+        current_player = self.game.get_current_player()
+        # Le score hérité n'est récupéré que par un joueur sur le plateau, au premier lancé
+        inherited_score = self.game.turn_score_to_transfer if current_player.is_on_board else 0
+        print(f"\n{Fore.CYAN}🤖 {current_player.name} réfléchit...{Style.RESET_ALL}")
+        
+        while True:
+            dice_values = list(self.game.last_dice_roll) if self.game.roll_pending else self.game.roll_dice()
+            self.print_dice(dice_values)
+            if self.game.is_farkle():
+                print(f"{Fore.RED}💥 FARKLE! {current_player.name} perd son tour.{Style.RESET_ALL}")
+                self.game.farkle()
+                break
+            
+            keep_index, stop = bot.choose(self.game, inherited_score)
+            actions = self.game.get_possible_actions()
+            score, dice_to_bank = actions[keep_index]
+            print(f"{Fore.GREEN}✓ {current_player.name} garde {dice_to_bank} → +{score} points{Style.RESET_ALL}")
+            turn_score = current_player.turn_score + score
+            if self.game.apply_decision(keep_index, stop):
+                print(f"{Fore.GREEN}✓ {current_player.name} stoppe avec {turn_score} points{Style.RESET_ALL}")
+                break
+        
+        input(f"{Fore.CYAN}Appuyez sur Entrée pour continuer...{Style.RESET_ALL}")
+    
+    def record_undo(self):
+        """Mémorise l'état avant une action humaine ; une nouvelle action efface les actions annulées"""
+        self.undo_stack.append(self.game.snapshot())
+        self.redo_stack.clear()
+    
+    def undo(self):
+        """
+        Revient avant la dernière action humaine (les tours des ordinateurs joués depuis sont annulés aussi)
+        
+        Le générateur des dés est restauré avec la partie : relancer redonne les mêmes dés.
+        """
+        self.redo_stack.append(self.game.snapshot())
+        self.game.restore(self.undo_stack.pop())
+        print(f"{Fore.GREEN}↶ Action annulée.{Style.RESET_ALL}")
+    
+    def redo(self):
+        """Rejoue la dernière action annulée"""
+        self.undo_stack.append(self.game.snapshot())
+        self.game.restore(self.redo_stack.pop())
+        print(f"{Fore.GREEN}↷ Action rétablie.{Style.RESET_ALL}")
+    
     def show_leaderboard(self):
         """Affiche le classement"""
         leaderboard = self.game.get_leaderboard()
@@ -346,6 +490,8 @@ class FarkleCLI:
     def play_game(self):
         """Boucle principale du jeu"""
         final_round_message_shown = False
+        self.undo_stack.clear()
+        self.redo_stack.clear()
         
         while not self.game.game_over:
             self.clear_screen()
@@ -354,7 +500,7 @@ class FarkleCLI:
             # Afficher un message spécial quand le dernier tour commence
             if self.game.final_round_started and not final_round_message_shown:
                 print(f"\n{Fore.RED}{Style.BRIGHT}🚨 DERNIER TOUR DÉCLENCHÉ!{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}   {self.game.final_round_triggerer.name} a atteint 10,000 points!{Style.RESET_ALL}")
+                print(f"{Fore.YELLOW}   {self.game.final_round_triggerer.name} a atteint {self.game.rules.target_score:,} points!{Style.RESET_ALL}")
                 print(f"{Fore.YELLOW}   Tous les autres joueurs ont droit à un tour pour le rattraper.{Style.RESET_ALL}")
                 print(f"{Fore.CYAN}   Attention: Le dernier tour ne se déclenchera qu'une seule fois!{Style.RESET_ALL}")
                 input(f"\n{Fore.CYAN}Appuyez sur Entrée pour continuer...{Style.RESET_ALL}")
@@ -363,6 +509,9 @@ class FarkleCLI:
             self.print_game_status()
             
             current_player = self.game.get_current_player()
+            if current_player.name in self.bots:
+                self.play_bot_turn(self.bots[current_player.name])
+                continue
             
             # Vérifier si le joueur peut continuer son tour
             if current_player.turn_score > 0 and self.game.get_remaining_dice_count() == 0:
@@ -372,14 +521,17 @@ class FarkleCLI:
             choice = self.show_turn_menu()
             
             if choice == 1:  # Lancer les dés
+                self.record_undo()
                 self.handle_dice_roll()
             elif choice == 2:  # Stopper le tour
                 current_player = self.game.get_current_player()
                 if not self.game.can_stop_turn():
-                    if current_player.turn_score == 0:
+                    if self.game.roll_pending:
+                        print(f"{Fore.RED}❌ Vous devez d'abord garder des dés du lancé!{Style.RESET_ALL}")
+                    elif current_player.turn_score == 0:
                         print(f"{Fore.RED}❌ Vous devez garder au moins un dé avant de pouvoir stopper!{Style.RESET_ALL}")
-                    elif not current_player.is_on_board and current_player.turn_score < 800:
-                        print(f"{Fore.RED}❌ Vous devez faire au moins 800 points EN UN SEUL TOUR pour entrer sur le plateau!{Style.RESET_ALL}")
+                    elif not current_player.is_on_board and current_player.turn_score < self.game.rules.entry_threshold:
+                        print(f"{Fore.RED}❌ Vous devez faire au moins {self.game.rules.entry_threshold} points EN UN SEUL TOUR pour entrer sur le plateau!{Style.RESET_ALL}")
                         print(f"{Fore.RED}   Votre score actuel du tour: {current_player.turn_score} points{Style.RESET_ALL}")
                     elif self.game.last_player_banked:
                         print(f"{Fore.RED}❌ Vous ne pouvez pas stopper immédiatement après qu'un joueur ait stoppé!{Style.RESET_ALL}")
@@ -390,11 +542,12 @@ class FarkleCLI:
                     score_to_transfer = current_player.turn_score
                     total_score_before = current_player.total_score
                     
+                    self.record_undo()
                     if self.game.stop_turn():
                         # Vérifier si le joueur vient de déclencher le dernier tour
                         if self.game.final_round_started and self.game.final_round_triggerer == current_player and not final_round_message_shown:
                             print(f"{Fore.GREEN}✓ Tour stoppé! Score gardé: {score_to_transfer} points{Style.RESET_ALL}")
-                            print(f"{Fore.RED}{Style.BRIGHT}🎉 FÉLICITATIONS! Vous avez atteint 10,000 points!{Style.RESET_ALL}")
+                            print(f"{Fore.RED}{Style.BRIGHT}🎉 FÉLICITATIONS! Vous avez atteint {self.game.rules.target_score:,} points!{Style.RESET_ALL}")
                             print(f"{Fore.RED}   Votre score final: {current_player.total_score} points{Style.RESET_ALL}")
                             print(f"{Fore.YELLOW}   Le dernier tour commence maintenant!{Style.RESET_ALL}")
                         else:
@@ -411,6 +564,14 @@ class FarkleCLI:
                 confirm = input(f"{Fore.YELLOW}Voulez-vous vraiment quitter? (o/n): {Style.RESET_ALL}")
                 if confirm.lower() in ['o', 'oui', 'y', 'yes']:
                     return
+            elif choice in (6, 7):  # Annuler / Rétablir
+                if choice == 6:
+                    self.undo()
+                else:
+                    self.redo()
+                # Le message du dernier tour est réaffiché s'il a été annulé puis rejoué
+                final_round_message_shown = final_round_message_shown and self.game.final_round_started
+                input(f"{Fore.CYAN}Appuyez sur Entrée pour continuer...{Style.RESET_ALL}")
         
         # Fin de partie - Affichage du classement final
         self.clear_screen()
@@ -457,6 +618,8 @@ class FarkleCLI:
                 if filename:
                     try:
                         self.game.load_game(filename)
+                        # Les ordinateurs ne sont pas sauvegardés : tous les sièges sont joués à la main
+                        self.close_bots()
                         print(f"{Fore.GREEN}✓ Partie rechargée avec succès!{Style.RESET_ALL}")
                         input(f"{Fore.CYAN}Appuyez sur Entrée pour continuer...{Style.RESET_ALL}")
                         self.play_game()
@@ -465,6 +628,8 @@ class FarkleCLI:
                         input(f"{Fore.CYAN}Appuyez sur Entrée pour continuer...{Style.RESET_ALL}")
             elif choice == 3:  # Règles
                 self.show_game_rules()
-            elif choice == 4:  # Quitter
+            elif choice == 4:  # Profils
+                self.show_profiles()
+            elif choice == 5:  # Quitter
                 print(f"{Fore.CYAN}Merci d'avoir joué au Farkle ! A tout bientôt chez Badger !{Style.RESET_ALL}")
                 sys.exit(0) 
\ No newline at end of file